@@ -116,7 +116,7 @@ class Array(list):
                     RaggedArray.to_stream(instance, stream, context, arg, template, shape, dtype)
                 # or if there is a vectorized write method
                 elif callable(getattr(dtype, 'write_array', None)):
-                    dtype.write_array(instance, stream)
+                    dtype.write_array(instance, stream, context, arg, template)
                 # must be an instance of Array that has the write function on itself
                 else:
                     # todo - maybe change the API for Array.write to include the arguments?
@@ -244,6 +244,9 @@ class Array(list):
 
     @classmethod
     def get_size(cls, instance, context, arg, template, shape, dtype):
+        # structs that are stored as numpy arrays have a fixed size per element
+        if isinstance(instance, np.ndarray) and callable(getattr(dtype, 'get_array_size', None)):
+            return dtype.get_array_size(instance, context, arg, template)
         size = 0
         for field_name, field_type, arguments, _ in cls._get_filtered_attribute_list(instance, dtype, include_abstract=False):
             size += field_type.get_size(cls.get_field(instance, field_name), context, *arguments)
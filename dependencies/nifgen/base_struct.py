@@ -43,6 +43,28 @@ class DummyInstance:
         self.template = template
 
 
+def is_normalized(f_type):
+    """Checks if f_type is a float type that is stored as a normalized integer"""
+    return callable(getattr(f_type, "from_function", None)) and hasattr(getattr(f_type, "storage", None), "np_dtype")
+
+
+def is_np_compatible(f_type, arguments):
+    """Checks if a field of f_type with arguments can be a member of a numpy structured dtype"""
+    if f_type is Array:
+        # only arrays of fixed size can be represented as a sub-array
+        shape, f_type = arguments[2:4]
+        if not all(isinstance(dim, int) for dim in shape):
+            return False
+    return callable(getattr(f_type, "get_np_dtype", None)) or getattr(f_type, "np_dtype", None) or is_normalized(f_type)
+
+
+def get_np_field(array, path):
+    """Returns a view of the (nested) field at path of a structured array"""
+    for f_name in path:
+        array = array[f_name]
+    return array
+
+
 class struct_record(np.record):
 
     def __getattribute__(self, attr):
@@ -50,7 +72,8 @@ class struct_record(np.record):
         if attr in ('setfield', 'getfield', 'dtype'):
             return value
         field_type = self.dtype.fields.get(attr, None)
-        if field_type:
+        # only nested structs need to be viewed as their record type, sub-arrays are returned as they are
+        if field_type and field_type[0].names:
             return value.view(field_type[0])
         else:
             return value
@@ -260,7 +283,7 @@ class BaseStruct(metaclass=StructMetaClass):
         if getattr(cls, "_attribute_list", ()):
             attribute_list = cls._attribute_list
             # for convenience, sort the attribute list into continuous lists
-            attr_names, attr_types, _, _, attr_conds = zip(*attribute_list)
+            attr_names, attr_types, attr_arguments, _, attr_conds = zip(*attribute_list)
             if all(all(cond is None for cond in cond_tuple) for cond_tuple in attr_conds) \
                and all(attr_type is not None for attr_type in attr_types):
                 # all fields are static
@@ -299,31 +322,49 @@ class BaseStruct(metaclass=StructMetaClass):
                             return instance
                         cls.from_value = from_value
             # check if all of the class's attributes have a from_value function
+            # check if the class allows numpy arrays and all of its fields can be part of a numpy dtype
             if getattr(cls, "allow_np", False) and all(
-                    # check for a struct with get_np_dtype and flag set to True
-                    callable(getattr(attr_type, "get_np_dtype", None)) or
-                    # or a basic numeric type
-                    getattr(attr_type, "np_dtype", None)
-                    for attr_type in attr_types):
+                    is_np_compatible(attr_type, attr_args) for attr_type, attr_args in zip(attr_types, attr_arguments)):
                 if free_function("create_array"):
                     def create_array(shape, default=None, context=None, arg=0, template=None):
                         np_dtype = cls.get_np_dtype(context, arg, template)
-                        return np.zeros(shape, dtype=np_dtype)
+                        array = np.zeros(shape, dtype=np_dtype)
+                        if default is not None:
+                            array[...] = tuple(default)
+                        else:
+                            # apply the per-field defaults, as the struct's __init__ would have
+                            for f_name, f_default in cls.get_np_defaults(context, arg, template):
+                                array[f_name] = f_default
+                        return array
                     cls.create_array = create_array
                 if free_function("read_array"):
                     def read_array(stream, shape, context=None, arg=0, template=None):
-                        np_dtype = cls.get_np_dtype(context, arg, template)
+                        np_dtype = cls.get_np_dtype(context, arg, template, storage=True)
                         array = np.empty(shape, dtype=np_dtype)
                         stream.readinto(array)
-                        return array
+                        return cls.from_np_storage(array, context, arg, template)
                     cls.read_array = read_array
                 if free_function("write_array"):
-                    def write_array(instance, stream):
-                        # todo - do type conversion, cf. basic.py
-                        assert isinstance(instance, np.ndarray)
-                        # np_dtype = cls.get_np_dtype(context, arg, template)
-                        stream.write(instance.tobytes())
+                    def write_array(instance, stream, context=None, arg=0, template=None):
+                        # dtype of the current context, as endianness may have changed since creation
+                        np_dtype = cls.get_np_dtype(context, arg, template)
+                        if not isinstance(instance, np.ndarray):
+                            # list of struct instances or tuples
+                            instance = np.array([tuple(member) for member in instance], dtype=np_dtype)
+                        elif instance.dtype != np_dtype:
+                            instance = instance.astype(np_dtype)
+                        stream.write(cls.to_np_storage(instance, context, arg, template).tobytes())
                     cls.write_array = write_array
+                if free_function("get_array_size"):
+                    def get_array_size(instance, context=None, arg=0, template=None):
+                        return instance.size * cls.get_np_dtype(context, arg, template, storage=True).itemsize
+                    cls.get_array_size = get_array_size
+                if free_function("validate_array"):
+                    def validate_array(instance, context=None, arg=0, template=None, shape=()):
+                        assert isinstance(instance, np.ndarray)
+                        assert instance.shape == shape
+                        assert instance.dtype.names == cls.get_np_dtype(context, arg, template).names
+                    cls.validate_array = validate_array
 
     @classmethod
     def _get_attribute_list(cls):
@@ -413,28 +454,86 @@ class BaseStruct(metaclass=StructMetaClass):
             raise
 
     @classmethod
-    def get_np_sig(cls, instance):
+    def get_np_sig(cls, instance, storage=False):
         res = []
         for f_name, f_type, arguments, _ in cls._get_filtered_attribute_list(instance, include_abstract=False):
+            shape = ()
             if f_type == Array:
-                raise AttributeError(f"Can't cast structs containing arrays to numpy")
+                shape, f_type = arguments[2:4]
+                if not all(isinstance(dim, int) for dim in shape):
+                    raise AttributeError(f"Can't cast structs containing variable size arrays to numpy")
             if f_type is not None:
                 # numeric basic types have np_dtype set on the class
                 if hasattr(f_type, "np_dtype"):
-                    res.append((f_name, f_type.np_dtype))
+                    f_sig = f_type.np_dtype
+                # normalized types are read as integers, but are converted to floats after reading
+                elif is_normalized(f_type):
+                    f_sig = f_type.storage.np_dtype if storage else np.dtype(float)
                 # structs may be able to get a structured dtype
                 else:
                     # instance is fake anyway so don't try to get a child struct
-                    res.append((f_name, f_type.get_np_sig(instance)))
+                    f_sig = f_type.get_np_sig(instance, storage)
+                res.append((f_name, f_sig, shape) if shape else (f_name, f_sig))
         # dynamically subclass to get np.record behavior
         # it does not work when dtype is not a subclass of struct_record
-        record = type(f"{cls.__name__}Record", (cls, struct_record), {})
+        # the record type is created once per class, so that all arrays of a struct share the same scalar type
+        record = cls.__dict__.get("_np_record")
+        if record is None:
+            # BaseStruct's repr relies on instance attributes that records don't have
+            record = type(f"{cls.__name__}Record", (cls, struct_record), {"__repr__": struct_record.__repr__})
+            cls._np_record = record
         return record, res
 
     @classmethod
-    def get_np_dtype(cls, context, arg=0, template=None):
+    def get_np_defaults(cls, context, arg=0, template=None):
+        """Yields (field name, default) for all fields of the numpy dtype that have a non-zero default"""
+        fake_inst = DummyInstance(context, arg, template)
+        for f_name, f_type, arguments, (optional, default) in cls._get_filtered_attribute_list(fake_inst, include_abstract=False):
+            if default:
+                yield f_name, default
+
+    @classmethod
+    def get_np_normalized_fields(cls, instance):
+        """Yields (field path, normalized type) for all fields of the numpy dtype that are normalized on reading"""
+        for f_name, f_type, arguments, _ in cls._get_filtered_attribute_list(instance, include_abstract=False):
+            if f_type == Array:
+                f_type = arguments[3]
+            if is_normalized(f_type):
+                yield (f_name,), f_type
+            elif callable(getattr(f_type, "get_np_normalized_fields", None)):
+                for path, n_type in f_type.get_np_normalized_fields(instance):
+                    yield (f_name, *path), n_type
+
+    @classmethod
+    def get_np_dtype(cls, context, arg=0, template=None, storage=False):
+        """Returns the numpy dtype of this struct, or the dtype it has on disk if storage is True"""
         # fake an instance to be able to get version-dependent fields
         fake_inst = DummyInstance(context, arg, template)
-        np_sig = cls.get_np_sig(fake_inst)
+        np_sig = cls.get_np_sig(fake_inst, storage)
         return np.dtype(np_sig)
 
+    @classmethod
+    def from_np_storage(cls, array, context=None, arg=0, template=None):
+        """Converts an array with the storage dtype to the numpy dtype of this struct"""
+        normalized = tuple(cls.get_np_normalized_fields(DummyInstance(context, arg, template)))
+        if not normalized:
+            return array
+        # all other fields are the same, so they can be cast by position
+        converted = array.astype(cls.get_np_dtype(context, arg, template))
+        for path, n_type in normalized:
+            get_np_field(converted, path)[...] = n_type.from_function(get_np_field(array, path))
+        return converted
+
+    @classmethod
+    def to_np_storage(cls, array, context=None, arg=0, template=None):
+        """Converts an array with the numpy dtype of this struct to the storage dtype"""
+        normalized = tuple(cls.get_np_normalized_fields(DummyInstance(context, arg, template)))
+        if not normalized:
+            return array
+        # the normalized fields are overwritten afterwards, so ignore warnings from casting them directly
+        with np.errstate(invalid="ignore"):
+            converted = array.astype(cls.get_np_dtype(context, arg, template, storage=True))
+        for path, n_type in normalized:
+            get_np_field(converted, path)[...] = n_type.to_function(get_np_field(array, path))
+        return converted
+
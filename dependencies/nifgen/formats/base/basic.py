@@ -50,7 +50,7 @@ def class_from_struct(struct, from_value_func):
 			return array
 
 		@staticmethod
-		def write_array(instance, stream):
+		def write_array(instance, stream, context=None, arg=0, template=None):
 			# check that it is a numpy array
 			if not isinstance(instance, np.ndarray):
 				instance = np.array(instance, dtype)
@@ -179,7 +179,7 @@ class UNormClass:
 		- to_function: converts the float to the rounded float value
 		Both from_function and to_function must work for single values as well as numpy arrays
 	Assumptions:
-		- storage class has np_type class variable for associated numpy dtype
+		- storage class has np_dtype class variable for associated numpy dtype
 		- storage class returns np.ndarray for array reading/writing
 	"""
 
@@ -226,13 +226,13 @@ class UNormClass:
 		return cls.from_function(cls.storage.read_array(stream, shape, context, arg, template).astype(float))
 
 	@classmethod
-	def write_array(cls, stream, instance):
+	def write_array(cls, instance, stream, context=None, arg=0, template=None):
 		# check that it is a numpy array
 		if not isinstance(instance, np.ndarray):
 			instance = np.array(instance, float)
 		# don't need to cast specifically to float, but do need to convert to byte for writing
-		instance = cls.to_function(instance).astype(cls.storage.np_type)
-		cls.storage.write_array(stream, instance)
+		instance = cls.to_function(instance).astype(cls.storage.np_dtype)
+		cls.storage.write_array(instance, stream)
 
 
 class NormClass(UNormClass):
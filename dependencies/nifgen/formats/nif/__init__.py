@@ -2,11 +2,13 @@ from nifgen.formats.nif.imports import name_type_map
 from importlib import import_module
 from io import BytesIO
 from itertools import chain
+import hashlib
 import logging
 import os
 import re
 
-from nifgen.formats.nif.imports import name_type_map
+from nifgen.formats.nif import imports
+from nifgen.formats.nif.imports import name_type_map, type_module_name_map, LazyTypeMap
 from nifgen.array import Array
 from nifgen.formats.nif.basic import Uint, FileVersion, Ulittle32, LineString, HeaderString, switchable_endianness, Ref, Ptr, NiFixedString, basic_map
 from nifgen.formats.nif.bsmain.structs.BSStreamHeader import BSStreamHeader
@@ -22,19 +24,16 @@ from nifgen.formats.nif.nimain.structs.String import String
 from nifgen.formats.nif.versions import has_bs_ver, available_versions
 
 
-class _attr_dict(dict):
+class _attr_dict(LazyTypeMap):
 
 	def __getattr__(self, key):
 		return self[key]
 
 
 def create_niclasses_map():
-	"""Goes through the entire directory of the nif format to find all defined
-	classes and put them in a map of {local_name: class}"""
-	niclasses_map = _attr_dict()
-	for name, class_object in name_type_map.items():
-		niclasses_map[name] = class_object
-	return niclasses_map
+	"""Map all defined classes of the nif format as {local_name: class}. Classes are
+	loaded when they are first looked up."""
+	return _attr_dict(type_module_name_map, name_type_map.__getitem__)
 
 
 def safe_decode(b: bytes, encodings=('ascii', 'utf8', 'latin1', 'shift-jis')) -> str:
@@ -91,6 +90,22 @@ def class_post_processor(defined_class, processed_classes):
 	return defined_class
 
 
+def index_link_fields(defined_class):
+	"""Store the fields of defined_class that may contain links as _link_fields, so references can be resolved without
+	filtering the fields of every instance. Must be run after class_post_processor, so that _has_links is final.
+	Each entry is (field name, type, is_array), with a type of None for fields that use the template of the instance."""
+	link_fields = {}
+	for f_name, f_type, args, *_ in getattr(defined_class, "_attribute_list", None) or ():
+		is_array = isinstance(f_type, type) and issubclass(f_type, Array)
+		if is_array:
+			f_type = args[3]
+		# fields with the same name have the same type, even if their conditions differ
+		if f_name not in link_fields and (f_type is None or f_type._has_links):
+			link_fields[f_name] = (f_name, f_type, is_array)
+	defined_class._link_fields = tuple(link_fields.values())
+	return defined_class
+
+
 def djb1_hash(type_name):
 	hash_val = 0
 	for x in type_name:
@@ -115,13 +130,122 @@ ARCHIVE_CLASSES = [] # link to the actual bsa format once done
 # used for comparing floats
 EPSILON = 0.0001
 
+TYPE_CACHE_PATH = os.path.join(os.path.dirname(__file__), "type_cache.py")
+
+
+def get_type_source_paths():
+	"""Yield the relative paths of nif.xml and of all modules of this package, except the type cache, in a fixed
+	order"""
+	package_dir = os.path.dirname(__file__)
+	yield "nif.xml"
+	for dir_path, dir_names, file_names in os.walk(package_dir):
+		dir_names[:] = sorted(dir_name for dir_name in dir_names if dir_name != "__pycache__")
+		for file_name in sorted(file_names):
+			if file_name.endswith(".py"):
+				file_path = os.path.relpath(os.path.join(dir_path, file_name), package_dir).replace(os.sep, "/")
+				if file_path != "type_cache.py":
+					yield file_path
+
+
+def get_type_source_hash():
+	"""Hash of the files that the classes and their flags come from, which a type cache must match to be used. This
+	includes the class modules, so hand edits of their attributes invalidate the cache."""
+	package_dir = os.path.dirname(__file__)
+	source_hash = hashlib.md5()
+	for file_path in get_type_source_paths():
+		source_hash.update(file_path.encode())
+		with open(os.path.join(package_dir, file_path), "rb") as f:
+			# ignore line endings, which git may convert on checkout
+			source_hash.update(f.read().replace(b"\r\n", b"\n"))
+	return source_hash.hexdigest()
+
+
+def load_type_cache():
+	"""Return the type cache module, or None if it is missing, unreadable or was made for other sources"""
+	try:
+		from nifgen.formats.nif import type_cache
+		if type_cache.source_hash == get_type_source_hash():
+			return type_cache
+	except Exception as err:
+		# a damaged cache only costs the time to process all classes
+		logging.getLogger(__name__).warning(f"Could not load nif type cache: {err}")
+	return None
+
+
+def write_type_cache(file_path=TYPE_CACHE_PATH):
+	"""Write the results of class_post_processor for all classes, and the names of all NiObjects, to a module that
+	lets later imports skip loading every class. Requires all classes to be loaded and processed.
+
+	This is a build step, run by the makezip scripts and after editing nif.xml or the class modules:
+
+		python -c "from nifgen.formats.nif import write_type_cache; write_type_cache()"
+
+	Importing this package never writes the cache; without a matching one it processes all classes instead."""
+	lines = [
+		"# generated by nifgen.formats.nif.write_type_cache, do not edit",
+		"",
+		f"source_hash = {get_type_source_hash()!r}",
+		"",
+		"# type name: (_has_links, _has_refs, _has_strings)",
+		"type_flags = {"]
+	for type_name, defined_class in classes.items():
+		flags = (defined_class._has_links, defined_class._has_refs, defined_class._has_strings)
+		lines.append(f"\t{type_name!r}: {flags!r},")
+	lines.extend((
+		"}",
+		"",
+		"# NiObject name: type name",
+		"niobject_names = {"))
+	for type_name, defined_class in classes.items():
+		if issubclass(defined_class, NiObject):
+			lines.append(f"\t{defined_class.__name__!r}: {type_name!r},")
+	lines.extend(("}", ""))
+	# write next to the target and replace it in one step, so that no import sees a partial file
+	temp_path = f"{file_path}.{os.getpid()}.tmp"
+	try:
+		with open(temp_path, "w", newline="\n") as f:
+			f.write("\n".join(lines))
+		os.replace(temp_path, file_path)
+	finally:
+		if os.path.exists(temp_path):
+			os.remove(temp_path)
+
+
+def post_process_from_cache(loaded):
+	"""Set the flags of lazily loaded classes from the type cache, then index their link fields"""
+	for type_name, defined_class in loaded:
+		if defined_class in processed_classes:
+			continue
+		flags = type_cache.type_flags.get(type_name)
+		if flags is None:
+			class_post_processor(defined_class, processed_classes)
+		else:
+			defined_class._has_links, defined_class._has_refs, defined_class._has_strings = flags
+			processed_classes.add(defined_class)
+	for type_name, defined_class in loaded:
+		index_link_fields(defined_class)
+
+
 classes = create_niclasses_map()
 classes.update(basic_map)
 processed_classes = set()
-for defined_class in classes.values():
-	class_post_processor(defined_class, processed_classes)
-niobject_map = {niclass.__name__: niclass for niclass in classes.values() if issubclass(niclass, NiObject)}
-hash_name_map = {djb1_hash(name): name for name in niobject_map.keys()}
+type_cache = load_type_cache()
+if type_cache is None:
+	# no usable cache, so load and process all classes
+	for defined_class in classes.values():
+		class_post_processor(defined_class, processed_classes)
+	for defined_class in processed_classes:
+		index_link_fields(defined_class)
+	niobject_names = {niclass.__name__: type_name for type_name, niclass in classes.items() if issubclass(niclass, NiObject)}
+else:
+	# the classes imported directly above are used without being looked up, so load them now
+	for type_name in ("Header", "Footer", "SizedString", "FilePath", "String", "BSStreamHeader", "NiObject"):
+		classes[type_name]
+	post_process_from_cache(list(chain(dict.items(name_type_map), basic_map.items())))
+	imports.post_processors.append(post_process_from_cache)
+	niobject_names = type_cache.niobject_names
+niobject_map = LazyTypeMap(niobject_names, lambda name: classes[niobject_names[name]])
+hash_name_map = {djb1_hash(name): name for name in niobject_names}
 
 
 # exceptions
@@ -429,39 +553,80 @@ class NifFile(Header):
 	def resolve_references(self):
 		# go through every NiObject and replace references and pointers with the
 		# actual object they're pointing to
-		def field_has_links(attr_def):
-			if issubclass(attr_def[1], Array):
-				f_type = attr_def[2][3]
-			else:
-				f_type = attr_def[1]
-			return f_type._has_links
-		is_ref = lambda attribute: issubclass(attribute[1], (Ref, Ptr))
-		for block in self.blocks:
-			for parent_type, parent_instance, attribute in self.get_condition_attributes_recursive(type(block), block, is_ref, enter_condition=field_has_links):
-				block_index = parent_type.get_field(parent_instance, attribute[0])
-				if isinstance(block_index, int):
-					if self.version >= 0x0303000D:
-						if block_index == -1:
-							resolved_ref = None
-						else:
-							try:
-								resolved_ref = self.blocks[block_index]
-							except IndexError:
-								raise IndexError(f"block index {block_index} exceeds limit {len(self.blocks)} of block list."
-						               f"Field '{attribute[0]}' of {parent_type} in block {self.blocks.index(block)}")
-					else:
-						if block_index == 0:
-							resolved_ref = None
-						else:
-							try:
-								resolved_ref = self._block_dct[block_index]
-							except KeyError:
-								raise IndexError(f"block index {block_index} not found in block map {list(self._block_dct.keys())}."
-						               f"Field '{attribute[0]}' of {parent_type} in block {self.blocks.index(block)}")
-
-					parent_type.set_field(parent_instance, attribute[0], resolved_ref)
-
-	def _makeBlockList(self, root, block_index_dct, block_type_list, block_type_dct):
+		if self.version >= 0x0303000D:
+			num_blocks = len(self.blocks)
+			# -1 is a null reference and gets the None at the end
+			lookup = self.blocks + [None]
+
+			def get_block(block_index):
+				if -1 <= block_index < num_blocks:
+					return lookup[block_index]
+				raise IndexError(f"block index {block_index} exceeds limit {num_blocks} of block list.")
+
+			def get_blocks(block_indices):
+				if block_indices and (min(block_indices) < -1 or max(block_indices) >= num_blocks):
+					raise IndexError(f"block indices {block_indices} exceed limit {num_blocks} of block list.")
+				return [lookup[block_index] for block_index in block_indices]
+		else:
+			block_dct = {**self._block_dct, 0: None}
+
+			def get_block(block_index):
+				try:
+					return block_dct[block_index]
+				except KeyError:
+					raise IndexError(f"block index {block_index} not found in block map {list(self._block_dct.keys())}.")
+
+			def get_blocks(block_indices):
+				return [get_block(block_index) for block_index in block_indices]
+
+		for i, block in enumerate(self.blocks):
+			try:
+				self._resolve_links(block, get_block, get_blocks)
+			except IndexError as err:
+				raise IndexError(f"{err} In block {i}") from err
+
+	@classmethod
+	def _resolve_links(cls, instance, get_block, get_blocks):
+		"""Replace the block indices in the link fields of instance and its nested structs"""
+		for f_name, f_type, is_array in type(instance)._link_fields:
+			if f_type is None:
+				f_type = instance.template
+				if not getattr(f_type, "_has_links", False):
+					continue
+			value = getattr(instance, f_name)
+			try:
+				if is_array:
+					cls._resolve_array_links(value, f_type, get_block, get_blocks)
+				elif issubclass(f_type, (Ref, Ptr)):
+					if isinstance(value, int):
+						setattr(instance, f_name, get_block(value))
+				elif value is not None:
+					cls._resolve_links(value, get_block, get_blocks)
+			except IndexError as err:
+				raise IndexError(f"{err} Field '{f_name}' of {type(instance)}") from err
+
+	@classmethod
+	def _resolve_array_links(cls, array, dtype, get_block, get_blocks):
+		# arrays stored as numpy arrays can't contain links
+		if not isinstance(array, list) or not array:
+			return
+		# nested and ragged arrays
+		if isinstance(array[0], list):
+			for sub_array in array:
+				cls._resolve_array_links(sub_array, dtype, get_block, get_blocks)
+		elif issubclass(dtype, (Ref, Ptr)):
+			# Ref arrays are read as lists of block indices, resolve them in one go
+			if all(isinstance(block_index, int) for block_index in array):
+				array[:] = get_blocks(array)
+		else:
+			# all members share their type and template, so if the first has no links, neither do the others
+			if not any(f_type is not None or getattr(array[0].template, "_has_links", False)
+					   for _, f_type, _ in type(array[0])._link_fields):
+				return
+			for member in array:
+				cls._resolve_links(member, get_block, get_blocks)
+
+	def _makeBlockList(self, root, block_index_dct, block_type_indices, block_type_dct):
 		"""This is a helper function for write to set up the list of all blocks,
 		the block index map, and the block type map.
 
@@ -471,8 +636,9 @@ class NifFile(Header):
 		:param block_index_dct: Dictionary mapping blocks in self.blocks to
 			their block index.
 		:type block_index_dct: dict
-		:param block_type_list: List of all block types.
-		:type block_type_list: list of str
+		:param block_type_indices: Dictionary mapping all block types to
+			their block type index, in order of appearance.
+		:type block_type_indices: dict
 		:param block_type_dct: Dictionary mapping blocks in self.blocks to
 			their block type index.
 		:type block_type_dct: dict
@@ -491,7 +657,7 @@ class NifFile(Header):
 					and not isinstance(block, niobject_map["bhkConstraint"]))
 
 		# block already listed? if so, return
-		if root in self.blocks:
+		if root in block_index_dct:
 			return
 
 		# add block type to block type dictionary
@@ -499,25 +665,21 @@ class NifFile(Header):
 		# special case: NiDataStream stores part of data in block type list
 		if block_type == "NiDataStream":
 			block_type = f"NiDataStream\x01{int(root.usage)}\x01{int(root.access)}"
-		try:
-			block_type_dct[root] = block_type_list.index(block_type)
-		except ValueError:
-			block_type_dct[root] = len(block_type_list)
-			block_type_list.append(block_type)
+		block_type_dct[root] = block_type_indices.setdefault(block_type, len(block_type_indices))
 
 		# special case: add bhkConstraint entities before bhkConstraint
 		# (these are actually links, not refs)
 		if isinstance(root, niobject_map["bhkConstraint"]):
 			for entity in root.entities:
 				if entity is not None:
-					self._makeBlockList(entity, block_index_dct, block_type_list, block_type_dct)
+					self._makeBlockList(entity, block_index_dct, block_type_indices, block_type_dct)
 
 		children_left = []
 		# add children that come before the block
 		# store any remaining children in children_left (processed later)
 		for child in root.get_refs():
 			if _blockChildBeforeParent(child):
-				self._makeBlockList(child, block_index_dct, block_type_list, block_type_dct)
+				self._makeBlockList(child, block_index_dct, block_type_indices, block_type_dct)
 			else:
 				children_left.append(child)
 
@@ -529,7 +691,7 @@ class NifFile(Header):
 		self.blocks.append(root)
 
 		for child in children_left:
-			self._makeBlockList(child, block_index_dct, block_type_list, block_type_dct)
+			self._makeBlockList(child, block_index_dct, block_type_indices, block_type_dct)
 
 	@classmethod
 	def read_fields(cls, stream, instance):
@@ -578,12 +740,12 @@ class NifFile(Header):
 		# set up index and type dictionary
 		instance.blocks = [] # list of all blocks to be written
 		instance._block_index_dct = {} # maps block to block index
-		block_type_list = [] # list of all block type strings
+		block_type_indices = {} # maps block type string to block type string index
 		block_type_dct = {} # maps block to block type string index
 		instance._string_list = []
 		# create/update the block list before anything else
 		for root in instance.roots:
-			instance._makeBlockList(root, instance._block_index_dct, block_type_list, block_type_dct)
+			instance._makeBlockList(root, instance._block_index_dct, block_type_indices, block_type_dct)
 			if instance.version >= 0x14010001:
 				instance._string_list.extend(instance.get_recursive_strings(root))
 # 			recursive strings (at least for test maplestory 2 (30.2.0.3) nif) is more true to base game order
@@ -591,13 +753,21 @@ class NifFile(Header):
 # 			for block in cls.tree(root):
 # 				instance._string_list.extend(cls.get_strings(block))
 		instance._string_list = list({string: None for string in instance._string_list})  # ensure unique elements
+		# maps string to its index in the header's string list, for writing NiFixedString
+		instance._string_index_dct = {string: i for i, string in enumerate(instance._string_list)}
+		block_type_list = list(block_type_indices)
 
 		instance.num_blocks = len(instance.blocks)
-		instance.num_block_types = len(block_type_list)
-		instance.reset_field("block_types")
-		instance.block_types[:] = block_type_list
-		instance.reset_field("block_type_index")
-		instance.block_type_index[:] = [block_type_dct[block] for block in instance.blocks]
+		if instance.version >= 0x05000001:
+			instance.num_block_types = len(block_type_list)
+			if instance.version == 0x14030102:
+				instance.reset_field("block_type_hashes")
+				instance.block_type_hashes[:] = [djb1_hash(block_type) for block_type in block_type_list]
+			else:
+				instance.reset_field("block_types")
+				instance.block_types[:] = block_type_list
+			instance.reset_field("block_type_index")
+			instance.block_type_index[:] = [block_type_dct[block] for block in instance.blocks]
 		if instance.version >= 0x14010001:
 			instance.num_strings = len(instance._string_list)
 			if instance._string_list:
@@ -606,12 +776,16 @@ class NifFile(Header):
 				instance.max_string_length = 0
 			instance.reset_field("strings")
 			instance.strings[:] = instance._string_list
-		if instance.version >= 0x14020005:
-			instance.reset_field("block_size")
-			instance.block_size[:] = [type(block).get_size(block, instance, 0, None) for block in instance.blocks]
 
 		# update the basics before doing any writing
 		cls.update_globals(instance)
+		if instance.version >= 0x14020005:
+			# the header stores the size of every block, so write the blocks to a buffer first to measure them
+			block_stream = BytesIO()
+			block_stream.context = instance
+			cls._write_blocks(instance, block_stream, block_type_list, block_type_dct)
+			instance.reset_field("block_size")
+			instance.block_size[:] = [block.io_size for block in instance.blocks]
 		# write the header (instance)
 		logger.debug("Writing header")
 		instance.io_start = stream.tell()
@@ -619,9 +793,30 @@ class NifFile(Header):
 		instance.io_size = stream.tell() - instance.io_start
 
 		# write the blocks
+		if instance.version >= 0x14020005:
+			blocks_start = stream.tell()
+			stream.write(block_stream.getbuffer())
+			# make the block offsets relative to the actual stream
+			for block in instance.blocks:
+				block.io_start += blocks_start
+		else:
+			cls._write_blocks(instance, stream, block_type_list, block_type_dct)
+
+		# write the Footer
+		ftr = Footer(instance)
+		ftr.num_roots = len(instance.roots)
+		ftr.roots[:] = instance.roots
+		Footer.to_stream(ftr, stream, instance)
+		return instance
+
+	@staticmethod
+	def _write_blocks(instance, stream, block_type_list, block_type_dct):
+		"""Write all blocks in instance.blocks, including the per-block data of older versions."""
+		logger = logging.getLogger("generated.formats.nif")
+		roots = set(instance.roots)
 		for block in instance.blocks:
 			# signal top level object if block is a root object
-			if instance.version < 0x0303000D and block in instance.roots:
+			if instance.version < 0x0303000D and block in roots:
 				SizedString.to_stream("Top Level Object", stream, instance)
 			if instance.version >= 0x05000001:
 				if instance.version <= 0x0A01006A:
@@ -640,13 +835,6 @@ class NifFile(Header):
 		if instance.version < 0x0303000D:
 			SizedString.to_stream("End Of File", stream, instance)
 
-		# write the Footer
-		ftr = Footer(instance)
-		ftr.num_roots = len(instance.roots)
-		ftr.roots[:] = instance.roots
-		Footer.to_stream(ftr, stream, instance)
-		return instance
-
 	def validate(self):
 		type(self).validate_instance(self, self, 0, None)
 		for root in self.roots:
@@ -74,7 +74,7 @@ def ve_class_from_struct(le_struct, from_value_func, name=''):
 			return array
 
 		@classmethod
-		def write_array(cls, instance, stream):
+		def write_array(cls, instance, stream, context=None, arg=0, template=None):
 			# check that it is a numpy array
 			if not isinstance(instance, np.ndarray):
 				instance = np.array(instance, cls.np_dtype)
@@ -219,7 +219,7 @@ class UNormClass:
 		- to_function: converts the float to the rounded float value
 		Both from_function and to_function must work for single values as well as numpy arrays
 	Assumptions:
-		- storage class has np_type class variable for associated numpy dtype
+		- storage class has np_dtype class variable for associated numpy dtype
 		- storage class returns np.ndarray for array reading/writing
 	"""
 
@@ -266,13 +266,13 @@ class UNormClass:
 		return cls.from_function(cls.storage.read_array(stream, shape, context, arg, template).astype(float))
 
 	@classmethod
-	def write_array(cls, stream, instance):
+	def write_array(cls, instance, stream, context=None, arg=0, template=None):
 		# check that it is a numpy array
 		if not isinstance(instance, np.ndarray):
 			instance = np.array(instance, float)
 		# don't need to cast specifically to float, but do need to convert to byte for writing
-		instance = cls.to_function(instance).astype(cls.storage.np_type)
-		cls.storage.write_array(stream, instance)
+		instance = cls.to_function(instance).astype(cls.storage.np_dtype)
+		cls.storage.write_array(instance, stream)
 
 
 class NormClass(UNormClass):
@@ -502,6 +502,13 @@ class Ptr:
 		"""Return an int - conversion to the linked NiObject will happen after the complete file is read"""
 		return Int.from_stream(stream, context, arg, template)
 
+	@classmethod
+	def read_array(cls, stream, shape, context=None, arg=0, template=None):
+		"""Read all block indices in one go, they are resolved in bulk after the complete file is read"""
+		block_indices = iter(Int.read_array(stream, shape, context).ravel().tolist())
+		array = Array(context, arg, template, shape, cls, set_default=False)
+		return array.fill(block_indices.__next__)
+
 	@classmethod
 	def to_stream(cls, instance, stream, context, arg=0, template=None):
 		if instance is None:
@@ -535,6 +542,13 @@ class Ref:
 		"""Return an int - conversion to the linked NiObject will happen after the complete file is read"""
 		return Int.from_stream(stream, context, arg, template)
 
+	@classmethod
+	def read_array(cls, stream, shape, context=None, arg=0, template=None):
+		"""Read all block indices in one go, they are resolved in bulk after the complete file is read"""
+		block_indices = iter(Int.read_array(stream, shape, context).ravel().tolist())
+		array = Array(context, arg, template, shape, cls, set_default=False)
+		return array.fill(block_indices.__next__)
+
 	@classmethod
 	def to_stream(cls, instance, stream, context, arg=0, template=None):
 		if instance is None:
@@ -577,11 +591,7 @@ class NiFixedString:
 
 	@staticmethod
 	def to_stream(instance, stream, context, arg=0, template=None):
-		index = -1
-		for i, string in enumerate(context.strings):
-			if instance == string:
-				index = i
-				break
+		index = context._string_index_dct.get(instance, -1)
 		Int.to_stream(index, stream, context)
 
 	@staticmethod
@@ -1,6 +1,6 @@
 import logging
 
-from nifgen.utils.mopp import getMopperCredits, getMopperOriginScaleCodeWelding
+from nifgen.utils.mopp import compileMoppOriginScaleCodeWelding, getMopperCredits, getMopperOriginScaleCodeWelding
 import nifgen.formats.nif as NifFormat
 from nifgen.array import Array
 from nifgen.formats.nif.bshavok.niobjects.BhkBvTreeShape import BhkBvTreeShape
@@ -58,58 +58,58 @@ class BhkMoppBvTreeShape(BhkBvTreeShape):
 		self.update_mopp_welding()
 
 	def update_mopp_welding(self):
-		"""Update the MOPP data, scale, and origin, and welding info."""
+		"""Update the MOPP data, scale, and origin, and welding info.
+
+		Shapes with a single sub shape are compiled in process. The in process compiler does not encode the sub
+		shapes, and so the materials, of the triangles, so shapes with several sub shapes fall back on mopper.exe,
+		which runs through wine outside of Windows. If that fails as well, a simple mopp is made."""
 		logger = logging.getLogger("generated.formats.nif.mopp")
 		# check type of shape
 		if not isinstance(self.shape, NifFormat.classes.BhkPackedNiTriStripsShape):
 			raise ValueError(
 				"expected bhkPackedNiTriStripsShape on mopp"
 				" but got %s instead" % self.shape.__class__.__name__)
-		# first try with generated.utils.mopp
+		vertices = [vert.as_tuple() for vert in self.shape.data.vertices]
+		triangles = [(hktri.triangle.v_1, hktri.triangle.v_2, hktri.triangle.v_3)
+					 for hktri in self.shape.data.triangles]
+		sub_shapes = self.shape.get_sub_shapes()
 		failed = False
 		try:
-			print(getMopperCredits())
-		except (OSError, RuntimeError):
-			failed = True
-		else:
-			# find material indices per triangle
-			material_per_vertex = []
-			for subshape in self.shape.get_sub_shapes():
-				material_per_vertex += (
-					[subshape.material] * subshape.num_vertices)
-			material_per_triangle = [
-				material_per_vertex[hktri.triangle.v_1]
-				for hktri in self.shape.data.triangles]
-			# compute havok info
-			try:
+			if len(sub_shapes) > 1:
+				# the compiler does not encode the materials of the sub shapes, so leave those mopps to havok's mopper
+				logger.info(
+					"Shape has %i sub shapes, which the mopp compiler cannot encode, "
+					"falling back on mopper.exe." % len(sub_shapes))
+				print(getMopperCredits())
+				# find material indices per triangle
+				material_per_vertex = []
+				for subshape in sub_shapes:
+					material_per_vertex += (
+						[subshape.material] * subshape.num_vertices)
+				material_per_triangle = [
+					material_per_vertex[hktri.triangle.v_1]
+					for hktri in self.shape.data.triangles]
 				origin, scale, mopp, welding_infos \
 				= getMopperOriginScaleCodeWelding(
-					[vert.as_tuple() for vert in self.shape.data.vertices],
-					[(hktri.triangle.v_1,
-					  hktri.triangle.v_2,
-					  hktri.triangle.v_3)
-					 for hktri in self.shape.data.triangles],
-					material_per_triangle)
-			except (OSError, RuntimeError):
-				failed = True
+					vertices, triangles, material_per_triangle)
 			else:
-				# must use calculated scale and origin
-				origin_scale = self.mopp_code.offset
-				origin_scale.w = scale
-				origin_scale.x = origin[0]
-				origin_scale.y = origin[1]
-				origin_scale.z = origin[2]
-		# if havok's mopper failed, do a simple mopp
+				# compile the mopp in process
+				origin, scale, mopp, welding_infos \
+				= compileMoppOriginScaleCodeWelding(vertices, triangles)
+		except (ValueError, OSError, RuntimeError):
+			failed = True
+		else:
+			# must use calculated scale and origin
+			origin_scale = self.mopp_code.offset
+			origin_scale.w = scale
+			origin_scale.x = origin[0]
+			origin_scale.y = origin[1]
+			origin_scale.z = origin[2]
+		# if the mopp compiler failed, do a simple mopp
 		if failed:
 			logger.exception(
-				"Havok mopp generator failed, falling back on simple mopp "
-				"(but collisions may be flawed in-game!)."
-				"If you are using the PyFFI that was shipped with Blender, "
-				"and you are on Windows, then you may wish to install the "
-				"full version of PyFFI from "
-				"https://github.com/niftools/pyffi "
-				"instead, which includes the (closed source) "
-				"Havok mopp generator.")
+				"Mopp compiler failed, falling back on simple mopp "
+				"(but collisions may be flawed in-game!).")
 			self.update_origin_scale()
 			mopp = self._makeSimpleMopp()
 			# no welding info
@@ -296,7 +296,8 @@ class BhkMoppBvTreeShape(BhkBvTreeShape):
 				self.logger.error(self.msg)
 				self.msg = ""
 
-		mopp = self.mopp_code.data # shortcut notation
+		# shortcut notation, with python ints so that multi-byte offsets do not overflow
+		mopp = [int(b) for b in self.mopp_code.data]
 		ids = [] # indices of bytes processed
 		tris = [] # triangle indices
 		i = start # current index
@@ -383,6 +384,13 @@ class BhkMoppBvTreeShape(BhkBvTreeShape):
 				ids.extend([i,i+1,i+2])
 				i += 3+jump
 
+			elif code in [ 0x07 ]:
+				# 24 bit jump
+				jump = mopp[i+1]*256*256 + mopp[i+2]*256 + mopp[i+3]
+				msg.append('[ jump -> %i: ]'%(i+4+jump))
+				ids.extend([i,i+1,i+2,i+3])
+				i += 4+jump
+
 			elif code in [0x10,0x11,0x12, 0x13,0x14,0x15, 0x16,0x17,0x18, 0x19, 0x1A, 0x1B, 0x1C]:
 				# compact if-then-else with two arguments
 				msg.append(mopp[i+1], mopp[i+2])
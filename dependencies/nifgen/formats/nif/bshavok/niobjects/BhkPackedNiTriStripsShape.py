@@ -1,5 +1,7 @@
 from itertools import repeat, chain
 
+import numpy as np
+
 from nifgen.array import Array
 import nifgen.formats.nif as NifFormat
 from nifgen.utils.inertia import get_mass_center_inertia_polyhedron
@@ -114,7 +116,9 @@ class BhkPackedNiTriStripsShape(BhkShapeCollection):
 			tdata.normal.y = n[1]
 			tdata.normal.z = n[2]
 		data.num_vertices += len(vertices)
-		data.vertices.extend(Array(data.vertices.context, shape=len(vertices), dtype=data.vertices.dtype))
+		# vertices are a numpy record array, so they can't be extended in place
+		new_vertices = name_type_map['Vector3'].create_array((len(vertices),))
+		data.vertices = np.concatenate((data.vertices, new_vertices), dtype=new_vertices.dtype)
 		for vdata, v in zip(data.vertices[firstvertex:], vertices):
 			vdata.x = v[0] / self.context.havok_scale
 			vdata.y = v[1] / self.context.havok_scale
@@ -11,6 +11,11 @@ class BSVertexData(BaseStruct):
 
 	__name__ = 'BSVertexData'
 
+	allow_np = True
+
+	# numpy dtypes by (vertex descriptor, storage)
+	_np_dtypes = {}
+
 
 	def __init__(self, context, arg=0, template=None, set_default=True):
 		super().__init__(context, arg, template, set_default=False)
@@ -81,3 +86,13 @@ class BSVertexData(BaseStruct):
 			yield 'bone_indices', Array, (0, None, (4,), name_type_map['Byte']), (False, None)
 		if (instance.arg & 256) != 0:
 			yield 'eye_data', name_type_map['Float'], (0, None), (False, None)
+
+	@classmethod
+	def get_np_dtype(cls, context, arg=0, template=None, storage=False):
+		# the fields only depend on the vertex descriptor passed as arg, and Bethesda nifs are always little endian,
+		# so every vertex data array with the same descriptor can share its dtype
+		key = (arg, storage)
+		np_dtype = cls._np_dtypes.get(key)
+		if np_dtype is None:
+			np_dtype = cls._np_dtypes[key] = super().get_np_dtype(context, arg, template, storage)
+		return np_dtype
@@ -893,9 +893,87 @@ type_module_name_map = {
 	'MdlManCAnimationDataEntry': 'nifgen.formats.nif.niobjects.MdlManCAnimationDataEntry',
 }
 
-name_type_map = {}
-for type_name, module in type_module_name_map.items():
-	name_type_map[type_name] = getattr(import_module(module), type_name)
-for class_object in name_type_map.values():
-	if callable(getattr(class_object, 'init_attributes', None)):
-		class_object.init_attributes()
+
+class LazyTypeMap(dict):
+	"""Maps type names to classes, loading each class with load(type_name) when it is first looked up.
+
+	Looking up a loaded class is a plain dict lookup. Iterating the map loads all classes."""
+
+	def __init__(self, module_map, load):
+		super().__init__()
+		self.module_map = module_map
+		self.load = load
+
+	def __missing__(self, type_name):
+		if type_name not in self.module_map:
+			raise KeyError(type_name)
+		class_object = self.load(type_name)
+		self[type_name] = class_object
+		return class_object
+
+	def __contains__(self, type_name):
+		return type_name in self.module_map or super().__contains__(type_name)
+
+	def get(self, type_name, default=None):
+		if type_name in self:
+			return self[type_name]
+		return default
+
+	def load_all(self):
+		for type_name in self.module_map:
+			self[type_name]
+		return self
+
+	def __iter__(self):
+		return iter(self.keys())
+
+	def __len__(self):
+		return super(LazyTypeMap, self.load_all()).__len__()
+
+	def keys(self):
+		return dict.keys(self.load_all())
+
+	def values(self):
+		return dict.values(self.load_all())
+
+	def items(self):
+		return dict.items(self.load_all())
+
+
+# functions called with the (type name, class) pairs of every batch of newly loaded classes, once their attributes
+# are initialized
+post_processors = []
+# classes that share a module with others are basics, which have no struct parents to load
+_module_type_name_map = {module: type_name for type_name, module in type_module_name_map.items()}
+_loaded = []
+_load_depth = 0
+
+
+def load_type(type_name):
+	"""Import a class and initialize its attributes. Post processing waits until the outermost load is done, as the
+	attributes of a class load the types of its fields, which may in turn refer back to classes still loading."""
+	global _load_depth
+	_load_depth += 1
+	try:
+		class_object = getattr(import_module(type_module_name_map[type_name]), type_name)
+		# store it before initializing, so that fields that refer back to it find it
+		dict.__setitem__(name_type_map, type_name, class_object)
+		_loaded.append((type_name, class_object))
+		# parents were imported directly by the module, so load them as well
+		for parent in class_object.__mro__[1:]:
+			parent_name = _module_type_name_map.get(parent.__module__)
+			if parent_name is not None and not dict.__contains__(name_type_map, parent_name):
+				name_type_map[parent_name]
+		if callable(getattr(class_object, 'init_attributes', None)):
+			class_object.init_attributes()
+	finally:
+		_load_depth -= 1
+	if _load_depth == 0:
+		loaded = _loaded[:]
+		_loaded.clear()
+		for post_processor in post_processors:
+			post_processor(loaded)
+	return class_object
+
+
+name_type_map = LazyTypeMap(type_module_name_map, load_type)
@@ -58,6 +58,21 @@ class NiBSplineCompTransformInterpolator(NiBSplineTransformInterpolator):
 									 self.scale_offset, self.scale_half_range):
 			yield key[0]
 
+	def get_translation_control_points(self):
+		"""Return the decompressed translation control points as an (n, 3) array, or None."""
+		return self._getCompControlPoints(self.translation_handle, 3,
+										 self.translation_offset, self.translation_half_range)
+
+	def get_rotation_control_points(self):
+		"""Return the decompressed rotation control points as an (n, 4) array, or None."""
+		return self._getCompControlPoints(self.rotation_handle, 4,
+										 self.rotation_offset, self.rotation_half_range)
+
+	def get_scale_control_points(self):
+		"""Return the decompressed scale control points as an (n, 1) array, or None."""
+		return self._getCompControlPoints(self.scale_handle, 1,
+										 self.scale_offset, self.scale_half_range)
+
 	def apply_scale(self, scale):
 		"""Apply scale factor on data."""
 		super().apply_scale(scale)
@@ -1,4 +1,7 @@
 import itertools
+
+import numpy as np
+
 from nifgen.array import Array
 from nifgen.formats.nif.imports import name_type_map
 from nifgen.formats.nif.nimain.niobjects.NiObject import NiObject
@@ -82,6 +85,14 @@ class NiBSplineData(NiObject):
 				controlpoints[offset + element * element_size + index]
 				for index in range(element_size))
 
+	def _getArray(self, offset, num_elements, element_size, controlpoints):
+		"""Helper function for get_float_array and get_comp_array. For internal
+		use only."""
+		values = np.asarray(controlpoints[offset:offset + num_elements * element_size], dtype=float)
+		if len(values) != num_elements * element_size:
+			raise ValueError("control points out of range")
+		return values.reshape(num_elements, element_size)
+
 	def _appendData(self, data, controlpoints):
 		"""Helper function for append_float_data and append_short_data. For internal
 		use only."""
@@ -132,6 +143,14 @@ class NiBSplineData(NiObject):
 		for key in self.get_short_data(offset, num_elements, element_size):
 			yield tuple(bias + x * multiplier / 32767.0 for x in key)
 
+	def get_comp_array(self, offset, num_elements, element_size, bias, multiplier):
+		"""Like L{get_comp_data}, but decode all elements at once.
+
+		:return: A (C{num_elements}, C{element_size}) float array.
+		"""
+		shorts = self._getArray(offset, num_elements, element_size, self.compact_control_points)
+		return bias + shorts * (multiplier / 32767.0)
+
 	def append_short_data(self, data):
 		"""Append data.
 
@@ -178,6 +197,13 @@ class NiBSplineData(NiObject):
 		return self._getData(
 			offset, num_elements, element_size, self.float_control_points)
 
+	def get_float_array(self, offset, num_elements, element_size):
+		"""Like L{get_float_data}, but get all elements at once.
+
+		:return: A (C{num_elements}, C{element_size}) float array.
+		"""
+		return self._getArray(offset, num_elements, element_size, self.float_control_points)
+
 	def append_float_data(self, data):
 		"""Append data.
 
@@ -1,5 +1,8 @@
+import numpy as np
+
 from nifgen.formats.nif.imports import name_type_map
 from nifgen.formats.nif.nianimation.niobjects.NiInterpolator import NiInterpolator
+from nifgen.utils import bspline
 
 
 class NiBSplineInterpolator(NiInterpolator):
@@ -86,3 +89,34 @@ class NiBSplineInterpolator(NiInterpolator):
 											   bias, multiplier):
 			yield key
 
+	def get_sample_times(self, fps):
+		"""Return an array of times from the start to the stop time, C{fps}
+		samples per second, including both ends."""
+		num_samples = max(int(round((self.stop_time - self.start_time) * fps)), 1) + 1
+		return np.linspace(self.start_time, self.stop_time, num_samples)
+
+	def _getFloatControlPoints(self, offset, element_size):
+		"""Helper function to get an array of control points, or None if there
+		are no keys. Internal use only."""
+		if offset == 65535 or not self.basis_data or not self.spline_data:
+			return None
+		return self.spline_data.get_float_array(offset, self.basis_data.num_control_points, element_size)
+
+	def _getCompControlPoints(self, offset, element_size, bias, multiplier):
+		"""Helper function to get an array of decompressed control points, or
+		None if there are no keys. Internal use only."""
+		if offset == 65535 or not self.basis_data or not self.spline_data:
+			return None
+		return self.spline_data.get_comp_array(offset, self.basis_data.num_control_points, element_size, bias, multiplier)
+
+	def _sample(self, control_points, times):
+		"""Evaluate the spline through the control points at the given times.
+		Returns None if there are no control points. Internal use only."""
+		if control_points is None:
+			return None
+		duration = self.stop_time - self.start_time
+		if duration > 0:
+			parameters = (np.asarray(times, dtype=float) - self.start_time) / duration
+		else:
+			parameters = np.zeros(len(times))
+		return bspline.evaluate(control_points, parameters)
@@ -1,3 +1,5 @@
+import numpy as np
+
 from nifgen.formats.nif.imports import name_type_map
 from nifgen.formats.nif.nianimation.niobjects.NiBSplineInterpolator import NiBSplineInterpolator
 
@@ -55,6 +57,38 @@ class NiBSplineTransformInterpolator(NiBSplineInterpolator):
 		for key in self._getFloatKeys(self.scale_handle, 1):
 			yield key[0]
 
+	def get_translation_control_points(self):
+		"""Return the translation control points as an (n, 3) array, or None."""
+		return self._getFloatControlPoints(self.translation_handle, 3)
+
+	def get_rotation_control_points(self):
+		"""Return the rotation control points as an (n, 4) array, or None."""
+		return self._getFloatControlPoints(self.rotation_handle, 4)
+
+	def get_scale_control_points(self):
+		"""Return the scale control points as an (n, 1) array, or None."""
+		return self._getFloatControlPoints(self.scale_handle, 1)
+
+	def sample_translations(self, times):
+		"""Return the translations at the given times as an (n, 3) array, or
+		None if the translation is not animated."""
+		return self._sample(self.get_translation_control_points(), times)
+
+	def sample_rotations(self, times):
+		"""Return the rotations at the given times as an (n, 4) array of
+		normalized quaternions, or None if the rotation is not animated."""
+		rotations = self._sample(self.get_rotation_control_points(), times)
+		if rotations is not None:
+			norms = np.linalg.norm(rotations, axis=1, keepdims=True)
+			rotations = np.divide(rotations, norms, out=rotations, where=norms > 0)
+		return rotations
+
+	def sample_scales(self, times):
+		"""Return the scales at the given times as an array, or None if the
+		scale is not animated."""
+		scales = self._sample(self.get_scale_control_points(), times)
+		return None if scales is None else scales[:, 0]
+
 	def apply_scale(self, scale):
 		"""Apply scale factor on data."""
 		super().apply_scale(scale)
@@ -13,6 +13,8 @@ class NiAVObject(NiObjectNET):
 
 	__name__ = 'NiAVObject'
 
+	# incremented whenever the transform of any NiAVObject changes, see nifgen.utils.scenegraph
+	transform_generation = 0
 
 	def __init__(self, context, arg=0, template=None, set_default=True):
 		super().__init__(context, arg, template, set_default=False)
@@ -262,6 +264,7 @@ class NiAVObject(NiObjectNET):
 		"""Set rotation, translation, and scale, from a 4x4 matrix.
 
 		:param m: The matrix to which the transform should be set."""
+		NiAVObject.transform_generation += 1
 		scale, rotation, translation = m.get_scale_rotation_translation()
 
 		self.scale = scale
@@ -285,6 +288,7 @@ class NiAVObject(NiObjectNET):
 
 		:param scale: The scale factor."""
 		super().apply_scale(scale)
+		NiAVObject.transform_generation += 1
 		# apply scale on translation
 		self.translation.x *= scale
 		self.translation.y *= scale
@@ -1,10 +1,14 @@
 import logging
 import warnings
 
+import numpy as np
+
 import nifgen.formats.nif as NifFormat
 from nifgen.array import Array
 from nifgen.formats.nif.imports import name_type_map
 from nifgen.formats.nif.nimain.niobjects.NiAVObject import NiAVObject
+from nifgen.utils import skinning
+from nifgen.utils.scenegraph import SceneGraphIndex
 
 
 class NiGeometry(NiAVObject):
@@ -273,71 +277,50 @@ class NiGeometry(NiAVObject):
 	# * b.get_transform(skelroot)	   # apply animation, by multiplying with all bone matrices in the chain down to the skeleton root; the vertex is now in skeleton root space
 	# * skindata.transform			 # transforms vertex from skeleton root space back to geometry space
 	def get_skin_deformation(self):
-		"""Returns a list of vertices and normals in their final position after
-		skinning, in geometry space."""
+		"""Returns arrays of vertices and normals in their final position after
+		skinning, in geometry space, as (n, 3) float arrays."""
 
-		if not self.data: return [], []
+		if not self.data: return np.empty((0, 3)), np.empty((0, 3))
 
-		if not self.is_skin(): return self.data.vertices, self.data.normals
+		vertices = skinning.as_vectors(self.data.vertices)
+		normals = skinning.as_vectors(self.data.normals) if self.data.has_normals else np.zeros_like(vertices)
+		if not self.is_skin(): return vertices, normals
 
 		self._validate_skin()
 		skininst = self.skin_instance
 		skindata = skininst.data
 		skelroot = skininst.skeleton_root
 
-		vertices = [ NifFormat.classes.Vector3() for i in range(self.data.num_vertices) ]
-		normals = [ NifFormat.classes.Vector3() for i in range(self.data.num_vertices) ]
-		sumweights = [ 0.0 for i in range(self.data.num_vertices) ]
 		skin_offset = skindata.get_transform()
+		scene_graph = SceneGraphIndex(skelroot)
 		# store one transform & rotation per bone
-		bone_transforms = []
+		transforms = np.empty((len(skininst.bones), 4, 4))
+		rotations = np.empty((len(skininst.bones), 3, 3))
 		for i, bone_block in enumerate(skininst.bones):
 			bonedata = skindata.bone_list[i]
 			bone_offset = bonedata.get_transform()
-			bone_matrix = bone_block.get_transform(skelroot)
+			bone_matrix = scene_graph.get_transform(bone_block)
 			transform = bone_offset * bone_matrix * skin_offset
 			scale, rotation, translation = transform.get_scale_rotation_translation()
-			bone_transforms.append( (transform, rotation) )
-		
+			transforms[i] = transform.as_list()
+			rotations[i] = rotation.as_list()
+
 		# the usual case
 		if skindata.has_vertex_weights:
-			for i, bone_block in enumerate(skininst.bones):
-				bonedata = skindata.bone_list[i]
-				transform, rotation = bone_transforms[i]
-				for skinweight in bonedata.vertex_weights:
-					index = skinweight.index
-					weight = skinweight.weight
-					vertices[index] += weight * (self.data.vertices[index] * transform)
-					if self.data.has_normals:
-						normals[index] += weight * (self.data.normals[index] * rotation)
-					sumweights[index] += weight
+			influences = skinning.get_bone_list_influences(skindata.bone_list)
 		# we must get weights from the partition
 		else:
-			skinpartition = skininst.skin_partition
-			for block in skinpartition.partitions:
-				# get transforms for this block
-				block_bone_transforms = [bone_transforms[i] for i in block.bones]
-
-				# go over each vert in this block
-				for vert_index, vertex_weights, bone_indices in zip(block.vertex_map,
-																	block.vertex_weights,
-																	block.bone_indices):
-					# skip verts that were already processed in an earlier block
-					if sumweights[vert_index] != 0.0:
-						continue
-					# go over all 4 weight / bone pairs and transform this vert
-					for weight, b_i in zip(vertex_weights, bone_indices):
-						if weight > 0.0:
-							transform, rotation = block_bone_transforms[b_i]
-							vertices[vert_index] += weight * (self.data.vertices[vert_index] * transform)
-							if self.data.has_normals:
-								normals[vert_index] += weight * (self.data.normals[vert_index] * rotation)
-							sumweights[vert_index] += weight
-
-		for i, s in enumerate(sumweights):
-			if abs(s - 1.0) > 0.01: 
-				logging.getLogger("generated.nif.nigeometry").warn(
-					"vertex %i has weights not summing to one" % i)
+			influences = skinning.get_partition_influences(skininst.skin_partition.partitions, len(vertices))
+
+		vertices, skinned_normals, sumweights = skinning.skin(
+			vertices, transforms, *influences,
+			normals=normals if self.data.has_normals else None, rotations=rotations)
+		if skinned_normals is not None:
+			normals = skinned_normals
+
+		for i in np.flatnonzero(np.abs(sumweights - 1.0) > 0.01):
+			logging.getLogger("generated.nif.nigeometry").warn(
+				"vertex %i has weights not summing to one" % i)
 
 		return vertices, normals
 
@@ -318,19 +318,19 @@ class NiGeometryData(NiObject):
 		vcolfactor = 10 ** vcolprecision
 		for i in range(self.num_vertices):
 			h = []
-			if verts:
+			if verts is not None:
 				h.extend([float_to_int(x * vertexfactor)
 						 for x in [verts[i].x, verts[i].y, verts[i].z]])
-			if norms:
+			if norms is not None:
 				h.extend([float_to_int(x * normalfactor)
 						  for x in [norms[i].x, norms[i].y, norms[i].z]])
-			if uvsets:
+			if uvsets is not None:
 				for uvset in uvsets:
 					# uvs sometimes have NaN, for example:
 					# oblivion/meshes/architecture/anvil/anvildooruc01.nif
 					h.extend([float_to_int(x * uvfactor)
 							  for x in [uvset[i].u, uvset[i].v]])
-			if vcols:
+			if vcols is not None:
 				h.extend([float_to_int(x * vcolfactor)
 						  for x in [vcols[i].r, vcols[i].g,
 									vcols[i].b, vcols[i].a]])
@@ -64,10 +64,19 @@ class NiMaterialProperty(NiProperty):
 		yield 'alpha', name_type_map['Float'], (0, None), (False, 1.0)
 		if instance.context.bs_header.bs_version > 21:
 			yield 'emissive_mult', name_type_map['Float'], (0, None), (False, 1.0)
+	specialnames = (b"envmap2", b"envmap", b"skin", b"hair",
+					b"dynalpha", b"hidesecret", b"lava")
+
+	def get_interchangeable_hash(self):
+		"""Hash of the material, without the name unless it is a special name."""
+		if self.name.lower() in self.specialnames:
+			return self.__class__, self.get_hash()
+		else:
+			return self.__class__, self.get_hash()[1:]
+
 	def is_interchangeable(self, other):
 		"""Are the two material blocks interchangeable?"""
-		specialnames = (b"envmap2", b"envmap", b"skin", b"hair",
-						b"dynalpha", b"hidesecret", b"lava")
+		specialnames = self.specialnames
 		if self.__class__ is not other.__class__:
 			return False
 		if (self.name.lower() in specialnames
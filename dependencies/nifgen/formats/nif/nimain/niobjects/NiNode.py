@@ -4,6 +4,7 @@ import nifgen.formats.nif as NifFormat
 from nifgen.array import Array
 from nifgen.formats.nif.imports import name_type_map
 from nifgen.formats.nif.nimain.niobjects.NiAVObject import NiAVObject
+from nifgen.utils.scenegraph import SceneGraphIndex
 
 
 class NiNode(NiAVObject):
@@ -356,6 +357,8 @@ class NiNode(NiAVObject):
 		bone_bind_transform = {}
 		# find all skinned geometries with self as skeleton root
 		geoms = list(self.get_skinned_geometries())
+		# transforms relative to self, without searching the tree for every geometry
+		scene_graph = SceneGraphIndex(self)
 		# sort geometries by bone level
 		# this ensures that "parent" geometries serve as reference for "child"
 		# geometries
@@ -386,7 +389,7 @@ class NiNode(NiAVObject):
 					# (see explanation below)
 					diff = (bonedata.get_transform()
 							* bone_bind_transform[bonenode.name]
-							* geom.get_transform(self).get_inverse(fast=False))
+							* scene_graph.get_transform(geom).get_inverse(fast=False))
 					break
 
 			if diff.is_identity():
@@ -437,7 +440,7 @@ class NiNode(NiAVObject):
 					continue
 				bone_bind_transform[bonenode.name] = (
 					bonedata.get_transform().get_inverse(fast=False)
-					* geom.get_transform(self))
+					* scene_graph.get_transform(geom))
 
 		# validation: check that bones share bind position
 		bone_bind_transform = {}
@@ -454,7 +457,7 @@ class NiNode(NiAVObject):
 				if bonenode.name in bone_bind_transform:
 					# calculate difference
 					diff = ((bonedata.get_transform().get_inverse(fast=False)
-							 * geom.get_transform(self))
+							 * scene_graph.get_transform(geom))
 							- bone_bind_transform[bonenode.name])
 					# calculate error (sup norm)
 					error = max(error,
@@ -463,7 +466,7 @@ class NiNode(NiAVObject):
 				else:
 					bone_bind_transform[bonenode.name] = (
 						bonedata.get_transform().get_inverse(fast=False)
-						* geom.get_transform(self))
+						* scene_graph.get_transform(geom))
 
 		logger.debug("Geometry bind position error is %f" % error)
 		if error > 1e-3:
@@ -618,6 +621,8 @@ class NiNode(NiAVObject):
 		bonelist = []
 		error = 0.0
 		geoms = list(self.get_skinned_geometries())
+		# transforms relative to self, the cache is refreshed when the bones are moved
+		scene_graph = SceneGraphIndex(self)
 		for geom in geoms:
 			skininst = geom.skin_instance
 			skindata = skininst.data
@@ -630,11 +635,11 @@ class NiNode(NiAVObject):
 					if bonenode is otherbonenode:
 						diff = ((otherbonedata.get_transform().get_inverse(fast=False)
 								 *
-								 othergeom.get_transform(self))
+								 scene_graph.get_transform(othergeom))
 								-
 								(bonedata.get_transform().get_inverse(fast=False)
 								 *
-								 geom.get_transform(self)))
+								 scene_graph.get_transform(geom)))
 						if diff.sup_norm() > 1e-3:
 							logger.warning("Geometries %s and %s do not share the same bind position: bone %s will be sent to a position matching only one of these" % (geom.name, othergeom.name, bonenode.name))
 						# break the loop
@@ -669,9 +674,9 @@ class NiNode(NiAVObject):
 			# calculate desired transform relative to skeleton root
 			# transform is DIFF * PARENT
 			transform = (bonedata.get_transform().get_inverse(fast=False)
-						 * geom.get_transform(self))
+						 * scene_graph.get_transform(geom))
 			# calculate difference
-			diff = transform * bonenode.get_transform(self).get_inverse(fast=False)
+			diff = transform * scene_graph.get_transform(bonenode).get_inverse(fast=False)
 			if not diff.is_identity():
 				logger.info("Sending %s to bind position"
 							% bonenode.name)
@@ -693,7 +698,7 @@ class NiNode(NiAVObject):
 			skininst = geom.skin_instance
 			skindata = skininst.data
 			# calculate geometry transform
-			geomtransform = geom.get_transform(self)
+			geomtransform = scene_graph.get_transform(geom)
 			# check skin data fields (also see NiGeometry.update_bind_position)
 			for i, bone in enumerate(skininst.bones):
 				# bone can be None; see pyffi issue #3114079
@@ -701,7 +706,7 @@ class NiNode(NiAVObject):
 					continue
 				diff = ((skindata.bone_list[i].get_transform().get_inverse(fast=False)
 						 * geomtransform)
-						- bone.get_transform(self))
+						- scene_graph.get_transform(bone))
 				# calculate error (sup norm)
 				diff_error = max(max(abs(elem) for elem in row)
 								 for row in diff.as_list())
@@ -169,6 +169,15 @@ class NiObject(BaseStruct):
 				raise ValueError('cyclic references detected')
 			children.append(child)
 
+	def get_interchangeable_hash(self):
+		"""Return a hash that is equal for interchangeable blocks, so that candidates for is_interchangeable can be
+		looked up in a dict instead of compared one by one. Returns None if the block is only interchangeable with
+		itself."""
+		if isinstance(self, (NifFormat.classes.NiProperty, NifFormat.classes.NiSourceTexture)):
+			return self.__class__, self.get_hash()
+		else:
+			return None
+
 	def is_interchangeable(self, other):
 		"""Are the two blocks interchangeable?
 
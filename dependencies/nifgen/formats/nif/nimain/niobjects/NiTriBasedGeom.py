@@ -47,11 +47,11 @@ class NiTriBasedGeom(NiGeometry):
 		if self.data.num_vertices == 0:
 			return ()
 
-		if not self.data.normals:
+		if len(self.data.normals) == 0:
 			#raise ValueError('geometry has no normals')
 			return None
 
-		if (not self.data.tangents) or (not self.data.bitangents):
+		if len(self.data.tangents) == 0 or len(self.data.bitangents) == 0:
 			# no tangents and bitangents at the usual location
 			# perhaps there is Oblivion style data?
 			for extra in self.get_extra_datas():
@@ -29,6 +29,12 @@ class NiTriBasedGeomData(NiGeometryData):
 	def _get_filtered_attribute_list(cls, instance, include_abstract=True):
 		yield from super()._get_filtered_attribute_list(instance, include_abstract)
 		yield 'num_triangles', name_type_map['Ushort'], (0, None), (False, None)
+	def get_interchangeable_hash(self):
+		"""Hash of the fields that is_interchangeable requires to be equal, apart from the vertices and triangles."""
+		return (self.__class__,) + tuple(getattr(self, attribute, None) for attribute in (
+			"num_vertices", "keep_flags", "compress_flags", "has_vertices",
+			"num_uv_sets", "has_normals", "has_vertex_colors", "has_uv", "consistency_flags"))
+
 	def is_interchangeable(self, other):
 		"""Heuristically checks if two NiTriBasedGeomData blocks describe
 		the same geometry, that is, if they can be used interchangeably in
@@ -1,3 +1,5 @@
+import numpy as np
+
 from nifgen.utils.vertex_cache import stripify
 from nifgen.utils.tristrip import triangulate
 from nifgen.array import Array
@@ -76,7 +78,7 @@ class NiTriShapeData(NiTriBasedGeomData):
 	[(0, 2, 1), (1, 2, 3), (2, 4, 3)]
 	"""
 	def get_triangles(self):
-		return [(t.v_1, t.v_2, t.v_3) for t in self.triangles]
+		return self.triangles.tolist()
 
 	def set_triangles(self, triangles, stitchstrips = False):
 		# note: the stitchstrips argument is ignored - only present to ensure
@@ -89,9 +91,11 @@ class NiTriShapeData(NiTriBasedGeomData):
 		self.has_triangles = (n > 0)
 		self.reset_field("triangles")
 
-		# set triangles to triangles array
-		for dst_t, src_t in zip(self.triangles, triangles):
-			dst_t.v_1, dst_t.v_2, dst_t.v_3 = src_t
+		# set triangles to triangles array, one field at a time
+		if n:
+			src_t = np.asarray(triangles).reshape((n, 3))
+			for i, f_name in enumerate(self.triangles.dtype.names):
+				self.triangles[f_name] = src_t[:, i]
 
 	def get_strips(self):
 		return stripify(self.get_triangles())
@@ -10,6 +10,7 @@ class Color4(BaseStruct):
 
 	__name__ = 'Color4'
 
+	allow_np = True
 
 	@classmethod
 	def _get_attribute_list(cls):
@@ -11,6 +11,7 @@ class TexCoord(BaseStruct):
 
 	__name__ = 'TexCoord'
 
+	allow_np = True
 
 	@classmethod
 	def _get_attribute_list(cls):
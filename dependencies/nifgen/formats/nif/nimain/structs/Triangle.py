@@ -10,6 +10,7 @@ class Triangle(BaseStruct):
 
 	__name__ = 'Triangle'
 
+	allow_np = True
 
 	def __init__(self, context, arg=0, template=None, set_default=True):
 		super().__init__(context, arg, template, set_default=False)
@@ -13,6 +13,7 @@ class Vector3(BaseStruct):
 
 	__name__ = 'Vector3'
 
+	allow_np = True
 
 	@classmethod
 	def _get_attribute_list(cls):
@@ -0,0 +1,1458 @@
+# generated by nifgen.formats.nif.write_type_cache, do not edit
+
+source_hash = '0f0e3d07dc1cc1527bd8680bbd505a22'
+
+# type name: (_has_links, _has_refs, _has_strings)
+type_flags = {
+	'Uint64': (False, False, False),
+	'Int64': (False, False, False),
+	'Ulittle32': (False, False, False),
+	'Uint': (False, False, False),
+	'Int': (False, False, False),
+	'Ushort': (False, False, False),
+	'Short': (False, False, False),
+	'Char': (False, False, False),
+	'Byte': (False, False, False),
+	'Normbyte': (False, False, False),
+	'Bool': (False, False, False),
+	'BlockTypeIndex': (False, False, False),
+	'FileVersion': (False, False, False),
+	'Float': (False, False, False),
+	'Hfloat': (False, False, False),
+	'HeaderString': (False, False, False),
+	'LineString': (False, False, False),
+	'Ptr': (True, False, False),
+	'Ref': (True, True, False),
+	'Sbyte': (False, False, False),
+	'Normsbyte': (False, False, False),
+	'StringOffset': (False, False, False),
+	'NiFixedString': (False, False, True),
+	'AccumFlags': (False, False, False),
+	'ApplyMode': (False, False, False),
+	'TexType': (False, False, False),
+	'KeyType': (False, False, False),
+	'OblivionHavokMaterial': (False, False, False),
+	'Fallout3HavokMaterial': (False, False, False),
+	'SkyrimHavokMaterial': (False, False, False),
+	'OblivionLayer': (False, False, False),
+	'Fallout3Layer': (False, False, False),
+	'SkyrimLayer': (False, False, False),
+	'BipedPart': (False, False, False),
+	'HkMoppCodeBuildType': (False, False, False),
+	'PlatformID': (False, False, False),
+	'RendererID': (False, False, False),
+	'PixelFormat': (False, False, False),
+	'PixelTiling': (False, False, False),
+	'PixelComponent': (False, False, False),
+	'PixelRepresentation': (False, False, False),
+	'PixelLayout': (False, False, False),
+	'MipMapFormat': (False, False, False),
+	'AlphaFormat': (False, False, False),
+	'TexClampMode': (False, False, False),
+	'TexFilterMode': (False, False, False),
+	'SourceVertexMode': (False, False, False),
+	'LightingMode': (False, False, False),
+	'CycleType': (False, False, False),
+	'FieldType': (False, False, False),
+	'BillboardMode': (False, False, False),
+	'StencilTestFunc': (False, False, False),
+	'StencilAction': (False, False, False),
+	'StencilDrawMode': (False, False, False),
+	'TestFunction': (False, False, False),
+	'AlphaFunction': (False, False, False),
+	'HkMotionType': (False, False, False),
+	'HkDeactivatorType': (False, False, False),
+	'HkSolverDeactivation': (False, False, False),
+	'HkQualityType': (False, False, False),
+	'ForceType': (False, False, False),
+	'TransformMember': (False, False, False),
+	'DecayType': (False, False, False),
+	'SymmetryType': (False, False, False),
+	'VelocityType': (False, False, False),
+	'EmitFrom': (False, False, False),
+	'TextureType': (False, False, False),
+	'CoordGenType': (False, False, False),
+	'EndianType': (False, False, False),
+	'MaterialColor': (False, False, False),
+	'LightColor': (False, False, False),
+	'ConsistencyType': (False, False, False),
+	'SortingMode': (False, False, False),
+	'PropagationMode': (False, False, False),
+	'CollisionMode': (False, False, False),
+	'BoundVolumeType': (False, False, False),
+	'HkResponseType': (False, False, False),
+	'BSDismemberBodyPartType': (False, False, False),
+	'BSLightingShaderType': (False, False, False),
+	'BSShaderType155': (False, False, False),
+	'EffectShaderControlledVariable': (False, False, False),
+	'EffectShaderControlledColor': (False, False, False),
+	'LightingShaderControlledFloat': (False, False, False),
+	'LightingShaderControlledUShort': (False, False, False),
+	'LightingShaderControlledColor': (False, False, False),
+	'HkConstraintType': (False, False, False),
+	'FogFunction': (False, False, False),
+	'AnimType': (False, False, False),
+	'DitherFlags': (False, False, False),
+	'ShadeFlags': (False, False, False),
+	'SpecularFlags': (False, False, False),
+	'WireframeFlags': (False, False, False),
+	'GeomMorpherFlags': (False, False, False),
+	'TimeControllerFlags': (False, False, False),
+	'AlphaFlags': (False, False, False),
+	'FogFlags': (False, False, False),
+	'StencilFlags': (False, False, False),
+	'TexturingFlags': (False, False, False),
+	'TexturingMapFlags': (False, False, False),
+	'VertexColorFlags': (False, False, False),
+	'ZBufferFlags': (False, False, False),
+	'AGDConsistencyType': (False, False, False),
+	'NiAGDDataStreamFlags': (False, False, False),
+	'NiNBTMethod': (False, False, False),
+	'NiGeometryDataFlags': (False, False, False),
+	'BSGeometryDataFlags': (False, False, False),
+	'CollisionFilterFlags': (False, False, False),
+	'SizedString': (False, False, False),
+	'SizedString16': (False, False, False),
+	'String': (False, False, True),
+	'NiTFixedStringMapItem': (True, True, True),
+	'NiTFixedStringMap': (True, True, True),
+	'ByteArray': (False, False, False),
+	'ByteMatrix': (False, False, False),
+	'Color3': (False, False, False),
+	'ByteColor3': (False, False, False),
+	'Color4': (False, False, False),
+	'HalfColor4': (False, False, False),
+	'ByteColor4': (False, False, False),
+	'FilePath': (False, False, True),
+	'Footer': (True, True, False),
+	'LODRange': (False, False, False),
+	'MatchGroup': (False, False, False),
+	'Vector3': (False, False, False),
+	'HalfVector3': (False, False, False),
+	'UshortVector3': (False, False, False),
+	'ByteVector3': (False, False, False),
+	'SbyteVector3': (False, False, False),
+	'Vector4': (False, False, False),
+	'Quaternion': (False, False, False),
+	'HkQuaternion': (False, False, False),
+	'Matrix22': (False, False, False),
+	'Matrix33': (False, False, False),
+	'Matrix34': (False, False, False),
+	'Matrix44': (False, False, False),
+	'HkMatrix3': (False, False, False),
+	'MipMap': (False, False, False),
+	'NodeSet': (True, False, False),
+	'ExportString': (False, False, False),
+	'SkinInfo': (True, True, False),
+	'SkinInfoSet': (True, True, False),
+	'BoneVertData': (False, False, False),
+	'BoneVertDataHalf': (False, False, False),
+	'AVObject': (True, False, False),
+	'ControlledBlock': (True, True, True),
+	'BSStreamHeader': (False, False, False),
+	'Header': (False, False, False),
+	'StringPalette': (False, False, False),
+	'Tbc': (False, False, False),
+	'Key': (True, True, True),
+	'KeyGroup': (True, True, True),
+	'QuatKey': (True, True, True),
+	'TexCoord': (False, False, False),
+	'HalfTexCoord': (False, False, False),
+	'TransformMethod': (False, False, False),
+	'TexDesc': (True, True, False),
+	'ShaderTexDesc': (True, True, False),
+	'Triangle': (False, False, False),
+	'VertexAttribute': (False, False, False),
+	'BSVertexDesc': (False, False, False),
+	'BSVertexData': (False, False, False),
+	'BSVertexDataSSE': (False, False, False),
+	'SkinPartition': (False, False, False),
+	'NiPlane': (False, False, False),
+	'NiBoundAABB': (False, False, False),
+	'NiBound': (False, False, False),
+	'NiCurve3': (False, False, False),
+	'NiQuatTransform': (False, False, False),
+	'NiTransform': (False, False, False),
+	'FurnitureEntryPoints': (False, False, False),
+	'AnimationType': (False, False, False),
+	'FurniturePosition': (False, False, False),
+	'BhkWeldInfo': (False, False, False),
+	'TriangleData': (False, False, False),
+	'Morph': (True, True, True),
+	'NiParticleInfo': (False, False, False),
+	'BoneData': (False, False, False),
+	'HavokFilter': (False, False, False),
+	'HavokMaterial': (False, False, False),
+	'HkSubPartData': (False, False, False),
+	'HkAabb': (False, False, False),
+	'ConstraintPriority': (False, False, False),
+	'BhkConstraintCInfo': (True, False, False),
+	'BhkConstraintChainCInfo': (True, False, False),
+	'BhkPositionConstraintMotor': (False, False, False),
+	'BhkVelocityConstraintMotor': (False, False, False),
+	'BhkSpringDamperConstraintMotor': (False, False, False),
+	'HkMotorType': (False, False, False),
+	'BhkConstraintMotorCInfo': (False, False, False),
+	'BhkRagdollConstraintCInfo': (False, False, False),
+	'BhkLimitedHingeConstraintCInfo': (False, False, False),
+	'BhkHingeConstraintCInfo': (False, False, False),
+	'BhkBallAndSocketConstraintCInfo': (False, False, False),
+	'BhkPrismaticConstraintCInfo': (False, False, False),
+	'BhkStiffSpringConstraintCInfo': (False, False, False),
+	'OldSkinData': (False, False, False),
+	'ImageType': (False, False, False),
+	'BoxBV': (False, False, False),
+	'CapsuleBV': (False, False, False),
+	'HalfSpaceBV': (False, False, False),
+	'BoundingVolume': (False, False, False),
+	'UnionBV': (False, False, False),
+	'MorphWeight': (True, True, False),
+	'BoneTransform': (False, False, False),
+	'BonePose': (False, False, False),
+	'DecalVectorArray': (False, False, False),
+	'BSPartFlag': (False, False, False),
+	'BodyPartList': (False, False, False),
+	'BoneLOD': (False, False, True),
+	'BhkMeshMaterial': (False, False, False),
+	'BhkCMSBigTri': (False, False, False),
+	'BhkQsTransform': (False, False, False),
+	'BhkCMSChunk': (False, False, False),
+	'BhkMalleableConstraintCInfo': (True, False, False),
+	'BhkWrappedConstraintData': (True, False, False),
+	'NiObject': (False, False, False),
+	'Ni3DsAlphaAnimator': (True, True, False),
+	'Ni3DsAnimationNode': (True, True, False),
+	'Ni3DsColorAnimator': (False, False, False),
+	'Ni3DsMorphShape': (False, False, False),
+	'Ni3DsParticleSystem': (False, False, False),
+	'Ni3DsPathController': (False, False, False),
+	'NiParticleModifier': (True, True, False),
+	'NiPSysCollider': (True, True, False),
+	'BroadPhaseType': (False, False, False),
+	'BhkRefObject': (False, False, False),
+	'BhkSerializable': (False, False, False),
+	'BhkWorldObjCInfoProperty': (False, False, False),
+	'BhkWorldObjectCInfo': (False, False, False),
+	'BhkWorldObject': (True, True, False),
+	'BhkPhantom': (True, True, False),
+	'BhkAabbPhantom': (True, True, False),
+	'BhkShapePhantom': (True, True, False),
+	'BhkSimpleShapePhantom': (True, True, False),
+	'BhkEntityCInfo': (False, False, False),
+	'BhkEntity': (True, True, False),
+	'BhkRigidBodyCInfo550660': (False, False, False),
+	'BhkRigidBodyCInfo2010': (False, False, False),
+	'BhkRigidBodyCInfo2014': (False, False, False),
+	'BhkRigidBody': (True, True, False),
+	'BhkRigidBodyT': (True, True, False),
+	'BhkAction': (False, False, False),
+	'BhkUnaryAction': (True, False, False),
+	'BhkBinaryAction': (True, False, False),
+	'BhkConstraint': (True, False, False),
+	'BhkLimitedHingeConstraint': (True, False, False),
+	'BhkMalleableConstraint': (True, False, False),
+	'BhkStiffSpringConstraint': (True, False, False),
+	'BhkRagdollConstraint': (True, False, False),
+	'BhkPrismaticConstraint': (True, False, False),
+	'BhkHingeConstraint': (True, False, False),
+	'BhkBallAndSocketConstraint': (True, False, False),
+	'BhkBallSocketConstraintChain': (True, False, False),
+	'BhkShape': (False, False, False),
+	'BhkTransformShape': (True, True, False),
+	'BhkConvexShapeBase': (False, False, False),
+	'BhkSphereRepShape': (False, False, False),
+	'BhkConvexShape': (False, False, False),
+	'BhkHeightFieldShape': (False, False, False),
+	'BhkPlaneShape': (False, False, False),
+	'BhkSphereShape': (False, False, False),
+	'BhkCylinderShape': (False, False, False),
+	'BhkCapsuleShape': (False, False, False),
+	'BhkBoxShape': (False, False, False),
+	'BhkConvexVerticesShape': (False, False, False),
+	'BhkConvexTransformShape': (True, True, False),
+	'BhkConvexSweepShape': (True, True, False),
+	'BhkMultiSphereShape': (False, False, False),
+	'BhkBvTreeShape': (True, True, False),
+	'HkpMoppCode': (False, False, False),
+	'BhkMoppBvTreeShape': (True, True, False),
+	'BhkShapeCollection': (False, False, False),
+	'BhkListShape': (True, True, False),
+	'BhkMeshShape': (True, True, False),
+	'BhkPackedNiTriStripsShape': (True, True, False),
+	'BhkNiTriStripsShape': (True, True, False),
+	'NiExtraData': (True, True, True),
+	'NiInterpolator': (False, False, False),
+	'NiKeyBasedInterpolator': (False, False, False),
+	'NiColorInterpolator': (True, True, False),
+	'NiFloatInterpolator': (True, True, False),
+	'NiTransformInterpolator': (True, True, False),
+	'NiPoint3Interpolator': (True, True, False),
+	'PathFlags': (False, False, False),
+	'NiPathInterpolator': (True, True, False),
+	'NiBoolInterpolator': (True, True, False),
+	'NiBoolTimelineInterpolator': (True, True, False),
+	'InterpBlendFlags': (False, False, False),
+	'InterpBlendItem': (True, True, False),
+	'NiBlendInterpolator': (True, True, False),
+	'NiBSplineInterpolator': (True, True, False),
+	'LegacyExtraData': (False, False, False),
+	'NiObjectNET': (True, True, True),
+	'NiCollisionObject': (True, False, False),
+	'NiCollisionData': (True, False, False),
+	'BhkCOFlags': (False, False, False),
+	'BhkNiCollisionObject': (True, True, False),
+	'BhkCollisionObject': (True, True, False),
+	'BhkBlendCollisionObject': (True, True, False),
+	'BhkPCollisionObject': (True, True, False),
+	'BhkSPCollisionObject': (True, True, False),
+	'NiAVObject': (True, True, True),
+	'NiDynamicEffect': (True, True, True),
+	'NiLight': (True, True, True),
+	'NiProperty': (True, True, True),
+	'NiTransparentProperty': (True, True, True),
+	'NiPSysModifierOrder': (False, False, False),
+	'NiPSysModifier': (True, False, True),
+	'NiPSysEmitter': (True, False, True),
+	'NiPSysVolumeEmitter': (True, False, True),
+	'NiTimeController': (True, True, False),
+	'NiInterpController': (True, True, False),
+	'NiMultiTargetTransformController': (True, True, False),
+	'NiGeomMorpherController': (True, True, False),
+	'NiMorphController': (True, True, False),
+	'NiMorpherController': (True, True, False),
+	'NiSingleInterpController': (True, True, False),
+	'NiKeyframeController': (True, True, False),
+	'NiTransformController': (True, True, False),
+	'NiPSysModifierCtlr': (True, True, True),
+	'NiPSysEmitterCtlr': (True, True, True),
+	'NiPSysModifierBoolCtlr': (True, True, True),
+	'NiPSysModifierActiveCtlr': (True, True, True),
+	'NiPSysModifierFloatCtlr': (True, True, True),
+	'NiPSysEmitterDeclinationCtlr': (True, True, True),
+	'NiPSysEmitterDeclinationVarCtlr': (True, True, True),
+	'NiPSysEmitterInitialRadiusCtlr': (True, True, True),
+	'NiPSysEmitterLifeSpanCtlr': (True, True, True),
+	'NiPSysEmitterSpeedCtlr': (True, True, True),
+	'NiPSysGravityStrengthCtlr': (True, True, True),
+	'NiFloatInterpController': (True, True, False),
+	'NiFlipController': (True, True, False),
+	'NiAlphaController': (True, True, False),
+	'NiTextureTransformController': (True, True, False),
+	'NiLightDimmerController': (True, True, False),
+	'NiBoolInterpController': (True, True, False),
+	'NiVisController': (True, True, False),
+	'NiPoint3InterpController': (True, True, False),
+	'NiMaterialColorController': (True, True, False),
+	'NiLightColorController': (True, True, False),
+	'NiExtraDataController': (True, True, True),
+	'NiColorExtraDataController': (True, True, True),
+	'NiFloatExtraDataController': (True, True, True),
+	'NiFloatsExtraDataController': (True, True, True),
+	'NiFloatsExtraDataPoint3Controller': (True, True, True),
+	'NiBoneLODController': (True, True, False),
+	'NiBSBoneLODController': (True, True, False),
+	'MaterialData': (False, False, True),
+	'NiGeometry': (True, True, True),
+	'NiTriBasedGeom': (True, True, True),
+	'NiGeometryData': (True, True, False),
+	'AbstractAdditionalGeometryData': (False, False, False),
+	'NiTriBasedGeomData': (True, True, False),
+	'BhkBlendController': (True, True, False),
+	'BSBound': (True, True, True),
+	'BSFurnitureMarker': (True, True, True),
+	'BSParentVelocityModifier': (True, False, True),
+	'BSPSysArrayEmitter': (True, False, True),
+	'BSWindModifier': (True, False, True),
+	'HkPackedNiTriStripsData': (False, False, False),
+	'NiAlphaProperty': (True, True, True),
+	'NiAmbientLight': (True, True, True),
+	'AspectFlags': (False, False, False),
+	'NiParticlesData': (True, True, False),
+	'NiRotatingParticlesData': (True, True, False),
+	'NiAutoNormalParticlesData': (True, True, False),
+	'NiPSysData': (True, True, False),
+	'NiMeshPSysData': (True, True, False),
+	'NiBinaryExtraData': (True, True, True),
+	'NiBinaryVoxelExtraData': (True, True, True),
+	'NiBinaryVoxelData': (False, False, False),
+	'NiBlendBoolInterpolator': (True, True, False),
+	'NiBlendFloatInterpolator': (True, True, False),
+	'NiBlendPoint3Interpolator': (True, True, False),
+	'NiBlendTransformInterpolator': (True, True, False),
+	'NiBoolData': (True, True, True),
+	'NiBooleanExtraData': (True, True, True),
+	'NiBSplineBasisData': (False, False, False),
+	'NiBSplineFloatInterpolator': (True, True, False),
+	'NiBSplineCompFloatInterpolator': (True, True, False),
+	'NiBSplinePoint3Interpolator': (True, True, False),
+	'NiBSplineCompPoint3Interpolator': (True, True, False),
+	'NiBSplineTransformInterpolator': (True, True, False),
+	'NiBSplineCompTransformInterpolator': (True, True, False),
+	'BSRotAccumTransfInterpolator': (True, True, False),
+	'NiBSplineData': (False, False, False),
+	'NiCamera': (True, True, True),
+	'NiColorData': (True, True, True),
+	'NiColorExtraData': (True, True, True),
+	'NiControllerManager': (True, True, False),
+	'NiSequence': (True, True, True),
+	'NiControllerSequence': (True, True, True),
+	'NiAVObjectPalette': (False, False, False),
+	'NiDefaultAVObjectPalette': (True, False, False),
+	'NiDirectionalLight': (True, True, True),
+	'NiDitherProperty': (True, True, True),
+	'NiRollController': (True, True, False),
+	'NiFloatData': (True, True, True),
+	'NiFloatExtraData': (True, True, True),
+	'NiFloatsExtraData': (True, True, True),
+	'NiFogProperty': (True, True, True),
+	'NiGravity': (True, True, False),
+	'NiIntegerExtraData': (True, True, True),
+	'BSXFlags': (True, True, True),
+	'NiIntegersExtraData': (True, True, True),
+	'BSKeyframeController': (True, True, False),
+	'NiKeyframeData': (True, True, True),
+	'LookAtFlags': (False, False, False),
+	'NiLookAtController': (True, True, False),
+	'NiLookAtInterpolator': (True, True, True),
+	'NiMaterialProperty': (True, True, True),
+	'NiMorphData': (True, True, True),
+	'NiNode': (True, True, True),
+	'NiBone': (True, True, True),
+	'NiCollisionSwitch': (True, True, True),
+	'AvoidNode': (True, True, True),
+	'FxWidget': (True, True, True),
+	'FxButton': (True, True, True),
+	'FxRadioButton': (True, True, True),
+	'NiBillboardNode': (True, True, True),
+	'NiBSAnimationNode': (True, True, True),
+	'NiBSParticleNode': (True, True, True),
+	'NiSwitchFlags': (False, False, False),
+	'NiSwitchNode': (True, True, True),
+	'NiLODNode': (True, True, True),
+	'NiPalette': (False, False, False),
+	'NiParticleBomb': (True, True, False),
+	'NiParticleColorModifier': (True, True, False),
+	'NiParticleGrowFade': (True, True, False),
+	'NiParticleMeshModifier': (True, True, False),
+	'NiParticleRotation': (True, True, False),
+	'NiParticles': (True, True, True),
+	'NiAutoNormalParticles': (True, True, True),
+	'NiParticleMeshes': (True, True, True),
+	'NiParticleMeshesData': (True, True, False),
+	'NiParticleSystem': (True, True, True),
+	'NiMeshParticleSystem': (True, True, True),
+	'NiEmitterModifier': (True, True, False),
+	'NiParticleSystemController': (True, True, False),
+	'NiBSPArrayController': (True, True, False),
+	'NiPathController': (True, True, False),
+	'PixelFormatComponent': (False, False, False),
+	'NiPixelFormat': (False, False, False),
+	'NiPersistentSrcTextureRendererData': (True, True, False),
+	'NiPixelData': (True, True, False),
+	'NiParticleCollider': (True, True, False),
+	'NiPlanarCollider': (True, True, False),
+	'NiPointLight': (True, True, True),
+	'NiPosData': (True, True, True),
+	'NiRotData': (True, True, True),
+	'NiPSysAgeDeathModifier': (True, True, True),
+	'NiPSysBombModifier': (True, False, True),
+	'NiPSysBoundUpdateModifier': (True, False, True),
+	'NiPSysBoxEmitter': (True, False, True),
+	'NiPSysColliderManager': (True, True, True),
+	'NiPSysColorModifier': (True, True, True),
+	'NiPSysCylinderEmitter': (True, False, True),
+	'NiPSysDragModifier': (True, False, True),
+	'NiPSysEmitterCtlrData': (True, True, True),
+	'NiPSysGravityModifier': (True, False, True),
+	'NiPSysGrowFadeModifier': (True, False, True),
+	'NiPSysMeshEmitter': (True, False, True),
+	'NiPSysMeshUpdateModifier': (True, True, True),
+	'BSPSysInheritVelocityModifier': (True, False, True),
+	'BSPSysHavokUpdateModifier': (True, True, True),
+	'BSPSysRecycleBoundModifier': (True, False, True),
+	'BSPSysSubTexModifier': (True, False, True),
+	'NiPSysPlanarCollider': (True, True, False),
+	'NiPSysSphericalCollider': (True, True, False),
+	'NiPSysPositionModifier': (True, False, True),
+	'NiPSysResetOnLoopCtlr': (True, True, False),
+	'NiPSysRotationModifier': (True, False, True),
+	'NiPSysSpawnModifier': (True, False, True),
+	'NiPSysPartSpawnModifier': (True, True, True),
+	'NiPSysSphereEmitter': (True, False, True),
+	'NiPSysUpdateCtlr': (True, True, False),
+	'NiPSysFieldModifier': (True, True, True),
+	'NiPSysVortexFieldModifier': (True, True, True),
+	'NiPSysGravityFieldModifier': (True, True, True),
+	'NiPSysDragFieldModifier': (True, True, True),
+	'NiPSysTurbulenceFieldModifier': (True, True, True),
+	'BSPSysLODModifier': (True, False, True),
+	'BSPSysScaleModifier': (True, False, True),
+	'NiPSysFieldMagnitudeCtlr': (True, True, True),
+	'NiPSysFieldAttenuationCtlr': (True, True, True),
+	'NiPSysFieldMaxDistanceCtlr': (True, True, True),
+	'NiPSysAirFieldAirFrictionCtlr': (True, True, True),
+	'NiPSysAirFieldInheritVelocityCtlr': (True, True, True),
+	'NiPSysAirFieldSpreadCtlr': (True, True, True),
+	'NiPSysInitialRotSpeedCtlr': (True, True, True),
+	'NiPSysInitialRotSpeedVarCtlr': (True, True, True),
+	'NiPSysInitialRotAngleCtlr': (True, True, True),
+	'NiPSysInitialRotAngleVarCtlr': (True, True, True),
+	'NiPSysEmitterPlanarAngleCtlr': (True, True, True),
+	'NiPSysEmitterPlanarAngleVarCtlr': (True, True, True),
+	'NiPSysAirFieldModifier': (True, True, True),
+	'NiPSysTrailEmitter': (True, False, True),
+	'NiLightIntensityController': (True, True, False),
+	'NiPSysRadialFieldModifier': (True, True, True),
+	'NiLODData': (False, False, False),
+	'NiRangeLODData': (False, False, False),
+	'NiScreenLODData': (False, False, False),
+	'NiRotatingParticles': (True, True, True),
+	'NiSequenceStreamHelper': (True, True, True),
+	'NiShadeProperty': (True, True, True),
+	'NiSkinData': (True, True, False),
+	'NiSkinInstance': (True, True, False),
+	'NiTriShapeSkinController': (True, True, False),
+	'NiSkinPartition': (False, False, False),
+	'NiTexture': (True, True, True),
+	'FormatPrefs': (False, False, False),
+	'NiSourceTexture': (True, True, True),
+	'NiSpecularProperty': (True, True, True),
+	'NiSphericalCollider': (True, True, False),
+	'NiSpotLight': (True, True, True),
+	'NiStencilProperty': (True, True, True),
+	'NiStringExtraData': (True, True, True),
+	'NiStringPalette': (False, False, False),
+	'NiStringsExtraData': (True, True, True),
+	'NiTextKeyExtraData': (True, True, True),
+	'NiTextureEffect': (True, True, True),
+	'NiTextureModeProperty': (True, True, True),
+	'NiImage': (True, True, True),
+	'NiTextureProperty': (True, True, True),
+	'NiTexturingProperty': (True, True, True),
+	'NiMultiTextureProperty': (True, True, True),
+	'NiTransformData': (True, True, True),
+	'NiTriShape': (True, True, True),
+	'NiTriShapeData': (True, True, False),
+	'NiTriStrips': (True, True, True),
+	'NiTriStripsData': (True, True, False),
+	'NiEnvMappedTriShape': (True, True, True),
+	'NiEnvMappedTriShapeData': (True, True, False),
+	'NiBezierTriangle4': (False, False, False),
+	'NiBezierMesh': (True, True, True),
+	'NiClod': (True, True, True),
+	'NiClodData': (True, True, False),
+	'NiClodSkinInstance': (True, True, False),
+	'NiUVController': (True, True, False),
+	'NiUVData': (True, True, True),
+	'NiVectorExtraData': (True, True, True),
+	'NiVertexColorProperty': (True, True, True),
+	'NiVertWeightsExtraData': (True, True, True),
+	'NiVisData': (True, True, True),
+	'NiWireframeProperty': (True, True, True),
+	'NiZBufferProperty': (True, True, True),
+	'RootCollisionNode': (True, True, True),
+	'NiRawImageData': (False, False, False),
+	'NiAccumulator': (False, False, False),
+	'NiSortAdjustNode': (True, True, True),
+	'NiSourceCubeMap': (True, True, True),
+	'NiPhysXScene': (True, True, True),
+	'NiSceneDescNxBroadPhaseType': (False, False, False),
+	'NiSceneDescNxHwPipelineSpec': (False, False, False),
+	'NiSceneDescNxHwSceneType': (False, False, False),
+	'NxTimeStepMethod': (False, False, False),
+	'NxSimulationType': (False, False, False),
+	'NxBroadPhaseType': (False, False, False),
+	'NxFilterOp': (False, False, False),
+	'NxThreadPriority': (False, False, False),
+	'NxPruningStructure': (False, False, False),
+	'NxCompartmentType': (False, False, False),
+	'NxDeviceCode': (False, False, False),
+	'NxBodyFlag': (False, False, False),
+	'NiPhysXMaterialDescMap': (True, True, False),
+	'NxCompartmentDescMap': (False, False, False),
+	'NiPhysXSceneDesc': (True, True, False),
+	'NiPhysXProp': (True, True, True),
+	'NiPhysXPropDesc': (True, True, True),
+	'NiPhysXActorDesc': (True, True, True),
+	'PhysXBodyStoredVels': (False, False, False),
+	'NiPhysXBodyDesc': (False, False, False),
+	'NxJointType': (False, False, False),
+	'NxD6JointMotion': (False, False, False),
+	'NxD6JointDriveType': (False, False, False),
+	'NxJointProjectionMode': (False, False, False),
+	'NiPhysXJointActor': (True, True, False),
+	'NxJointLimitSoftDesc': (False, False, False),
+	'NxJointDriveDesc': (False, False, False),
+	'NiPhysXJointLimit': (False, False, False),
+	'NiPhysXJointDesc': (True, True, True),
+	'NiPhysXD6JointDesc': (True, True, True),
+	'NxShapeType': (False, False, False),
+	'NxShapeFlag': (False, False, False),
+	'NxPlane': (False, False, False),
+	'NxCapsule': (False, False, False),
+	'NiPhysXShapeDesc': (True, True, True),
+	'NiPhysXMeshDesc': (False, False, True),
+	'NxMaterialFlag': (False, False, False),
+	'NxSpringDesc': (False, False, False),
+	'NxCombineMode': (False, False, False),
+	'NxMaterialDesc': (False, False, False),
+	'NiPhysXMaterialDesc': (False, False, False),
+	'NxClothFlag': (False, False, False),
+	'PhysXClothState': (False, False, False),
+	'PhysXClothAttachmentPosition': (False, False, False),
+	'PhysXClothAttachment': (True, True, False),
+	'NiPhysXClothDesc': (True, True, True),
+	'NiPhysXDest': (False, False, False),
+	'NiPhysXRigidBodyDest': (False, False, False),
+	'NiPhysXTransformDest': (True, False, False),
+	'NiPhysXSrc': (False, False, False),
+	'NiPhysXRigidBodySrc': (True, False, False),
+	'NiPhysXKinematicSrc': (True, False, False),
+	'NiPhysXDynamicSrc': (True, False, False),
+	'NiLines': (True, True, True),
+	'NiLinesData': (True, True, False),
+	'Polygon': (False, False, False),
+	'NiScreenElementsData': (True, True, False),
+	'NiScreenElements': (True, True, True),
+	'NiRoomGroup': (True, True, True),
+	'NiWall': (True, True, True),
+	'NiRoom': (True, True, True),
+	'NiPortal': (True, True, True),
+	'BSFadeNode': (True, True, True),
+	'BSShaderType': (False, False, False),
+	'BSShaderFlags': (False, False, False),
+	'BSShaderFlags2': (False, False, False),
+	'BSShaderProperty': (True, True, True),
+	'BSShaderLightingProperty': (True, True, True),
+	'BSShaderNoLightingProperty': (True, True, True),
+	'BSShaderPPLightingProperty': (True, True, True),
+	'BSEffectShaderPropertyFloatController': (True, True, False),
+	'BSEffectShaderPropertyColorController': (True, True, False),
+	'BSLightingShaderPropertyFloatController': (True, True, False),
+	'BSLightingShaderPropertyUShortController': (True, True, False),
+	'BSLightingShaderPropertyColorController': (True, True, False),
+	'BSNiAlphaPropertyTestRefController': (True, True, False),
+	'BSProceduralLightningController': (True, True, False),
+	'BSShaderTextureSet': (False, False, False),
+	'WaterShaderProperty': (True, True, True),
+	'SkyObjectType': (False, False, False),
+	'SkyShaderProperty': (True, True, True),
+	'TileShaderProperty': (True, True, True),
+	'DistantLODShaderProperty': (True, True, True),
+	'BSDistantTreeShaderProperty': (True, True, True),
+	'TallGrassShaderProperty': (True, True, True),
+	'VolumetricFogShaderProperty': (True, True, True),
+	'HairShaderProperty': (True, True, True),
+	'Lighting30ShaderProperty': (True, True, True),
+	'SkyrimShaderPropertyFlags1': (False, False, False),
+	'SkyrimShaderPropertyFlags2': (False, False, False),
+	'Fallout4ShaderPropertyFlags1': (False, False, False),
+	'Fallout4ShaderPropertyFlags2': (False, False, False),
+	'BSTextureArray': (False, False, False),
+	'BSShaderCRC32': (False, False, False),
+	'BSSPWetnessParams': (False, False, False),
+	'BSSPLuminanceParams': (False, False, False),
+	'BSSPTranslucencyParams': (False, False, False),
+	'BSLightingShaderProperty': (True, True, True),
+	'BSEffectShaderProperty': (True, True, True),
+	'WaterShaderPropertyFlags': (False, False, False),
+	'BSWaterShaderProperty': (True, True, True),
+	'BSSkyShaderProperty': (True, True, True),
+	'BSDismemberSkinInstance': (True, True, False),
+	'BSDecalPlacementVectorExtraData': (True, True, True),
+	'BSPSysSimpleColorModifier': (True, False, True),
+	'BSValueNodeFlags': (False, False, False),
+	'BSValueNode': (True, True, True),
+	'BSStripParticleSystem': (True, True, True),
+	'BSStripPSysData': (True, True, False),
+	'BSPSysStripUpdateModifier': (True, False, True),
+	'BSMaterialEmittanceMultController': (True, True, False),
+	'BSMasterParticleSystem': (True, True, True),
+	'BSPSysMultiTargetEmitterCtlr': (True, True, True),
+	'BSRefractionStrengthController': (True, True, False),
+	'BSOrderedNode': (True, True, True),
+	'BSRangeNode': (True, True, True),
+	'BSBlastNode': (True, True, True),
+	'BSDamageStage': (True, True, True),
+	'BSRefractionFirePeriodController': (True, True, False),
+	'BhkConvexListShape': (True, True, False),
+	'BSTreadTransform': (False, False, True),
+	'BSTreadTransfInterpolator': (True, True, True),
+	'AnimNoteType': (False, False, False),
+	'BSAnimNote': (False, False, False),
+	'BSAnimNotes': (True, True, False),
+	'BhkLiquidAction': (False, False, False),
+	'BSCPCullingType': (False, False, False),
+	'BSMultiBoundNode': (True, True, True),
+	'BSMultiBound': (True, True, False),
+	'BSMultiBoundData': (False, False, False),
+	'BSMultiBoundOBB': (False, False, False),
+	'BSMultiBoundSphere': (False, False, False),
+	'BSGeometrySubSegment': (False, False, False),
+	'BSGeometrySegmentData': (False, False, False),
+	'BSSegmentedTriShape': (True, True, True),
+	'BSMultiBoundAABB': (False, False, False),
+	'NiAGDDataStream': (False, False, False),
+	'NiAGDDataBlock': (False, False, False),
+	'NiAGDDataBlocks': (False, False, False),
+	'NiAdditionalGeometryData': (False, False, False),
+	'BSPackedAdditionalGeometryData': (False, False, False),
+	'BSWArray': (True, True, True),
+	'BSFrustumFOVController': (True, True, False),
+	'BSDebrisNode': (True, True, True),
+	'BhkBreakableConstraint': (True, False, False),
+	'BhkOrientHingedBodyAction': (True, False, False),
+	'BhkPoseArray': (False, False, True),
+	'BhkRagdollTemplate': (True, True, True),
+	'BhkRagdollTemplateData': (True, False, True),
+	'Region': (False, False, False),
+	'CloningBehavior': (False, False, False),
+	'ComponentFormat': (False, False, False),
+	'DataStreamUsage': (False, False, False),
+	'DataStreamAccess': (False, False, False),
+	'DataStreamData': (False, False, False),
+	'NiDataStream': (False, False, False),
+	'SemanticData': (False, False, True),
+	'DataStreamRef': (True, True, True),
+	'NiRenderObject': (True, True, True),
+	'MeshPrimitiveType': (False, False, False),
+	'SyncPoint': (False, False, False),
+	'NiMeshModifier': (False, False, False),
+	'MeshDataEpicMickey': (False, False, False),
+	'WeightDataEpicMickey': (False, False, False),
+	'PartitionDataEpicMickey': (False, False, False),
+	'ExtraMeshDataEpicMickey': (False, False, False),
+	'NiMesh': (True, True, True),
+	'NiMorphWeightsController': (True, True, True),
+	'ElementReference': (False, False, True),
+	'NiMorphMeshModifier': (False, False, True),
+	'NiSkinningMeshModifier': (True, False, False),
+	'NiMeshHWInstance': (True, True, True),
+	'NiInstancingMeshModifier': (True, True, False),
+	'LODInfo': (False, False, False),
+	'NiSkinningLODController': (True, True, False),
+	'PSSpawnRateKey': (False, False, False),
+	'AlignMethod': (False, False, False),
+	'NiPSParticleSystem': (True, True, True),
+	'NiPSMeshParticleSystem': (True, True, True),
+	'NiPSFacingQuadGenerator': (False, False, False),
+	'NiPSAlignedQuadGenerator': (False, False, False),
+	'NiPSSimulator': (True, True, False),
+	'NiPSSimulatorStep': (False, False, False),
+	'PSLoopBehavior': (False, False, False),
+	'NiPSSimulatorGeneralStep': (True, True, True),
+	'NiPSSimulatorForcesStep': (True, True, False),
+	'NiPSSimulatorCollidersStep': (True, True, False),
+	'NiPSSimulatorMeshAlignStep': (True, True, True),
+	'NiPSSimulatorFinalStep': (False, False, False),
+	'NiPSBoundUpdater': (False, False, False),
+	'PSForceType': (False, False, False),
+	'NiPSForce': (False, False, True),
+	'NiPSFieldForce': (True, True, True),
+	'NiPSDragForce': (True, False, True),
+	'NiPSGravityForce': (True, False, True),
+	'NiPSBombForce': (True, False, True),
+	'NiPSAirFieldForce': (True, True, True),
+	'NiPSGravityFieldForce': (True, True, True),
+	'NiPSDragFieldForce': (True, True, True),
+	'NiPSRadialFieldForce': (True, True, True),
+	'NiPSTurbulenceFieldForce': (True, True, True),
+	'NiPSVortexFieldForce': (True, True, True),
+	'NiPSEmitter': (False, False, True),
+	'NiPSVolumeEmitter': (True, False, True),
+	'NiPSBoxEmitter': (True, False, True),
+	'NiPSSphereEmitter': (True, False, True),
+	'NiPSCylinderEmitter': (True, False, True),
+	'NiPSTorusEmitter': (True, False, True),
+	'NiPSMeshEmitter': (True, False, True),
+	'NiPSCurveEmitter': (True, False, True),
+	'NiPSEmitterCtlr': (True, True, True),
+	'NiPSEmitterFloatCtlr': (True, True, True),
+	'NiPSEmitParticlesCtlr': (True, True, True),
+	'NiPSForceCtlr': (True, True, True),
+	'NiPSForceBoolCtlr': (True, True, True),
+	'NiPSForceFloatCtlr': (True, True, True),
+	'NiPSForceActiveCtlr': (True, True, True),
+	'NiPSGravityStrengthCtlr': (True, True, True),
+	'NiPSFieldAttenuationCtlr': (True, True, True),
+	'NiPSFieldMagnitudeCtlr': (True, True, True),
+	'NiPSFieldMaxDistanceCtlr': (True, True, True),
+	'NiPSEmitterSpeedCtlr': (True, True, True),
+	'NiPSEmitterRadiusCtlr': (True, True, True),
+	'NiPSEmitterDeclinationCtlr': (True, True, True),
+	'NiPSEmitterDeclinationVarCtlr': (True, True, True),
+	'NiPSEmitterPlanarAngleCtlr': (True, True, True),
+	'NiPSEmitterPlanarAngleVarCtlr': (True, True, True),
+	'NiPSEmitterRotAngleCtlr': (True, True, True),
+	'NiPSEmitterRotAngleVarCtlr': (True, True, True),
+	'NiPSEmitterRotSpeedCtlr': (True, True, True),
+	'NiPSEmitterRotSpeedVarCtlr': (True, True, True),
+	'NiPSEmitterLifeSpanCtlr': (True, True, True),
+	'NiPSResetOnLoopCtlr': (True, True, False),
+	'ColliderType': (False, False, False),
+	'NiPSCollider': (True, True, False),
+	'NiPSPlanarCollider': (True, True, False),
+	'NiPSSphericalCollider': (True, True, False),
+	'NiPSSpawner': (True, False, False),
+	'NiPhysXPSParticleSystem': (True, True, True),
+	'NiPhysXPSParticleSystemProp': (True, True, True),
+	'NiPhysXPSParticleSystemDest': (True, False, False),
+	'NiPhysXPSSimulator': (True, True, False),
+	'NiPhysXPSSimulatorInitialStep': (False, False, False),
+	'NiPhysXPSSimulatorFinalStep': (False, False, False),
+	'NiEvaluator': (False, False, True),
+	'NiKeyBasedEvaluator': (False, False, True),
+	'NiBoolEvaluator': (True, True, True),
+	'NiBoolTimelineEvaluator': (True, True, True),
+	'NiColorEvaluator': (True, True, True),
+	'NiFloatEvaluator': (True, True, True),
+	'NiPoint3Evaluator': (True, True, True),
+	'NiQuaternionEvaluator': (True, True, True),
+	'NiTransformEvaluator': (True, True, True),
+	'NiConstBoolEvaluator': (False, False, True),
+	'NiConstColorEvaluator': (False, False, True),
+	'NiConstFloatEvaluator': (False, False, True),
+	'NiConstPoint3Evaluator': (False, False, True),
+	'NiConstQuaternionEvaluator': (False, False, True),
+	'NiConstTransformEvaluator': (False, False, True),
+	'NiBSplineEvaluator': (True, True, True),
+	'NiBSplineColorEvaluator': (True, True, True),
+	'NiBSplineCompColorEvaluator': (True, True, True),
+	'NiBSplineFloatEvaluator': (True, True, True),
+	'NiBSplineCompFloatEvaluator': (True, True, True),
+	'NiBSplinePoint3Evaluator': (True, True, True),
+	'NiBSplineCompPoint3Evaluator': (True, True, True),
+	'NiBSplineTransformEvaluator': (True, True, True),
+	'NiBSplineCompTransformEvaluator': (True, True, True),
+	'NiLookAtEvaluator': (True, True, True),
+	'NiPathEvaluator': (True, True, True),
+	'NiSequenceData': (True, True, True),
+	'NiShadowGeneratorFlags': (False, False, False),
+	'NiShadowGenerator': (True, True, True),
+	'NiFurSpringController': (True, True, False),
+	'CStreamableAssetData': (True, True, False),
+	'BhkCompressedMeshShape': (True, True, False),
+	'HkWeldingType': (False, False, False),
+	'BhkCMSMatType': (False, False, False),
+	'BhkCompressedMeshShapeData': (False, False, False),
+	'BSInvMarker': (True, True, True),
+	'BSBoneLODExtraData': (True, True, True),
+	'BSBehaviorGraphExtraData': (True, True, True),
+	'BSLagBoneController': (True, True, False),
+	'BSLODTriShape': (True, True, True),
+	'BSFurnitureMarkerNode': (True, True, True),
+	'BSLeafAnimNode': (True, True, True),
+	'BSTreeNode': (True, True, True),
+	'BSTriShape': (True, True, True),
+	'BSMeshLODTriShape': (True, True, True),
+	'BSGeometryPerSegmentSharedData': (False, False, False),
+	'BSGeometrySegmentSharedData': (False, False, False),
+	'BSSubIndexTriShape': (True, True, True),
+	'BhkSystem': (False, False, False),
+	'BhkNPCollisionObject': (True, True, False),
+	'BhkPhysicsSystem': (False, False, False),
+	'BhkRagdollSystem': (False, False, False),
+	'BSExtraData': (True, True, True),
+	'BSClothExtraData': (True, True, True),
+	'BSSkinBoneTrans': (False, False, False),
+	'BSSkinInstance': (True, True, False),
+	'BSSkinBoneData': (False, False, False),
+	'BSPositionData': (True, True, True),
+	'BSConnectPoint': (False, False, False),
+	'BSConnectPointParents': (True, True, True),
+	'BSConnectPointChildren': (True, True, True),
+	'BSEyeCenterExtraData': (True, True, True),
+	'BSPackedGeomDataCombined': (False, False, False),
+	'BSPackedGeomData': (False, False, False),
+	'BSPackedSharedGeomData': (False, False, False),
+	'BSPackedGeomObject': (False, False, False),
+	'BSPackedCombinedGeomDataExtra': (True, True, True),
+	'BSPackedCombinedSharedGeomDataExtra': (True, True, True),
+	'NiLightRadiusController': (True, True, False),
+	'BSDynamicTriShape': (True, True, True),
+	'BSDistantObjectLargeRefExtraData': (True, True, True),
+	'BSDistantObjectExtraData': (True, True, True),
+	'BSResourceID': (False, False, False),
+	'BSDistantObjectUnknown': (False, False, False),
+	'BSDistantObjectInstance': (False, False, False),
+	'BSShaderTextureArray': (False, False, False),
+	'BSDistantObjectInstancedNode': (True, True, True),
+	'BSCollisionQueryProxyExtraData': (True, True, True),
+	'CsNiNode': (True, True, True),
+	'JPSJigsawNode': (True, True, True),
+	'RibbonParticleSystem': (True, True, True),
+	'RibbonQuadGenerator': (False, False, False),
+	'RibbonEmitter': (False, False, True),
+	'NiYAMaterialProperty': (True, True, True),
+	'NiRimLightProperty': (True, True, True),
+	'QQSpeedLODEntry': (False, False, False),
+	'NiProgramLODData': (False, False, False),
+	'MdlManCDataEntry': (False, False, True),
+	'MdlManCModelTemplateDataEntry': (True, True, True),
+	'MdlManCAMDataEntry': (False, False, True),
+	'MdlManCMeshDataEntry': (True, True, True),
+	'MdlManCSkeletonDataEntry': (True, True, True),
+	'MdlManCAnimationDataEntry': (True, True, True),
+}
+
+# NiObject name: type name
+niobject_names = {
+	'NiObject': 'NiObject',
+	'Ni3dsAlphaAnimator': 'Ni3DsAlphaAnimator',
+	'Ni3dsAnimationNode': 'Ni3DsAnimationNode',
+	'Ni3dsColorAnimator': 'Ni3DsColorAnimator',
+	'Ni3dsMorphShape': 'Ni3DsMorphShape',
+	'Ni3dsParticleSystem': 'Ni3DsParticleSystem',
+	'Ni3dsPathController': 'Ni3DsPathController',
+	'NiParticleModifier': 'NiParticleModifier',
+	'NiPSysCollider': 'NiPSysCollider',
+	'bhkRefObject': 'BhkRefObject',
+	'bhkSerializable': 'BhkSerializable',
+	'bhkWorldObject': 'BhkWorldObject',
+	'bhkPhantom': 'BhkPhantom',
+	'bhkAabbPhantom': 'BhkAabbPhantom',
+	'bhkShapePhantom': 'BhkShapePhantom',
+	'bhkSimpleShapePhantom': 'BhkSimpleShapePhantom',
+	'bhkEntity': 'BhkEntity',
+	'bhkRigidBody': 'BhkRigidBody',
+	'bhkRigidBodyT': 'BhkRigidBodyT',
+	'bhkAction': 'BhkAction',
+	'bhkUnaryAction': 'BhkUnaryAction',
+	'bhkBinaryAction': 'BhkBinaryAction',
+	'bhkConstraint': 'BhkConstraint',
+	'bhkLimitedHingeConstraint': 'BhkLimitedHingeConstraint',
+	'bhkMalleableConstraint': 'BhkMalleableConstraint',
+	'bhkStiffSpringConstraint': 'BhkStiffSpringConstraint',
+	'bhkRagdollConstraint': 'BhkRagdollConstraint',
+	'bhkPrismaticConstraint': 'BhkPrismaticConstraint',
+	'bhkHingeConstraint': 'BhkHingeConstraint',
+	'bhkBallAndSocketConstraint': 'BhkBallAndSocketConstraint',
+	'bhkBallSocketConstraintChain': 'BhkBallSocketConstraintChain',
+	'bhkShape': 'BhkShape',
+	'bhkTransformShape': 'BhkTransformShape',
+	'bhkConvexShapeBase': 'BhkConvexShapeBase',
+	'bhkSphereRepShape': 'BhkSphereRepShape',
+	'bhkConvexShape': 'BhkConvexShape',
+	'bhkHeightFieldShape': 'BhkHeightFieldShape',
+	'bhkPlaneShape': 'BhkPlaneShape',
+	'bhkSphereShape': 'BhkSphereShape',
+	'bhkCylinderShape': 'BhkCylinderShape',
+	'bhkCapsuleShape': 'BhkCapsuleShape',
+	'bhkBoxShape': 'BhkBoxShape',
+	'bhkConvexVerticesShape': 'BhkConvexVerticesShape',
+	'bhkConvexTransformShape': 'BhkConvexTransformShape',
+	'bhkConvexSweepShape': 'BhkConvexSweepShape',
+	'bhkMultiSphereShape': 'BhkMultiSphereShape',
+	'bhkBvTreeShape': 'BhkBvTreeShape',
+	'bhkMoppBvTreeShape': 'BhkMoppBvTreeShape',
+	'bhkShapeCollection': 'BhkShapeCollection',
+	'bhkListShape': 'BhkListShape',
+	'bhkMeshShape': 'BhkMeshShape',
+	'bhkPackedNiTriStripsShape': 'BhkPackedNiTriStripsShape',
+	'bhkNiTriStripsShape': 'BhkNiTriStripsShape',
+	'NiExtraData': 'NiExtraData',
+	'NiInterpolator': 'NiInterpolator',
+	'NiKeyBasedInterpolator': 'NiKeyBasedInterpolator',
+	'NiColorInterpolator': 'NiColorInterpolator',
+	'NiFloatInterpolator': 'NiFloatInterpolator',
+	'NiTransformInterpolator': 'NiTransformInterpolator',
+	'NiPoint3Interpolator': 'NiPoint3Interpolator',
+	'NiPathInterpolator': 'NiPathInterpolator',
+	'NiBoolInterpolator': 'NiBoolInterpolator',
+	'NiBoolTimelineInterpolator': 'NiBoolTimelineInterpolator',
+	'NiBlendInterpolator': 'NiBlendInterpolator',
+	'NiBSplineInterpolator': 'NiBSplineInterpolator',
+	'NiObjectNET': 'NiObjectNET',
+	'NiCollisionObject': 'NiCollisionObject',
+	'NiCollisionData': 'NiCollisionData',
+	'bhkNiCollisionObject': 'BhkNiCollisionObject',
+	'bhkCollisionObject': 'BhkCollisionObject',
+	'bhkBlendCollisionObject': 'BhkBlendCollisionObject',
+	'bhkPCollisionObject': 'BhkPCollisionObject',
+	'bhkSPCollisionObject': 'BhkSPCollisionObject',
+	'NiAVObject': 'NiAVObject',
+	'NiDynamicEffect': 'NiDynamicEffect',
+	'NiLight': 'NiLight',
+	'NiProperty': 'NiProperty',
+	'NiTransparentProperty': 'NiTransparentProperty',
+	'NiPSysModifier': 'NiPSysModifier',
+	'NiPSysEmitter': 'NiPSysEmitter',
+	'NiPSysVolumeEmitter': 'NiPSysVolumeEmitter',
+	'NiTimeController': 'NiTimeController',
+	'NiInterpController': 'NiInterpController',
+	'NiMultiTargetTransformController': 'NiMultiTargetTransformController',
+	'NiGeomMorpherController': 'NiGeomMorpherController',
+	'NiMorphController': 'NiMorphController',
+	'NiMorpherController': 'NiMorpherController',
+	'NiSingleInterpController': 'NiSingleInterpController',
+	'NiKeyframeController': 'NiKeyframeController',
+	'NiTransformController': 'NiTransformController',
+	'NiPSysModifierCtlr': 'NiPSysModifierCtlr',
+	'NiPSysEmitterCtlr': 'NiPSysEmitterCtlr',
+	'NiPSysModifierBoolCtlr': 'NiPSysModifierBoolCtlr',
+	'NiPSysModifierActiveCtlr': 'NiPSysModifierActiveCtlr',
+	'NiPSysModifierFloatCtlr': 'NiPSysModifierFloatCtlr',
+	'NiPSysEmitterDeclinationCtlr': 'NiPSysEmitterDeclinationCtlr',
+	'NiPSysEmitterDeclinationVarCtlr': 'NiPSysEmitterDeclinationVarCtlr',
+	'NiPSysEmitterInitialRadiusCtlr': 'NiPSysEmitterInitialRadiusCtlr',
+	'NiPSysEmitterLifeSpanCtlr': 'NiPSysEmitterLifeSpanCtlr',
+	'NiPSysEmitterSpeedCtlr': 'NiPSysEmitterSpeedCtlr',
+	'NiPSysGravityStrengthCtlr': 'NiPSysGravityStrengthCtlr',
+	'NiFloatInterpController': 'NiFloatInterpController',
+	'NiFlipController': 'NiFlipController',
+	'NiAlphaController': 'NiAlphaController',
+	'NiTextureTransformController': 'NiTextureTransformController',
+	'NiLightDimmerController': 'NiLightDimmerController',
+	'NiBoolInterpController': 'NiBoolInterpController',
+	'NiVisController': 'NiVisController',
+	'NiPoint3InterpController': 'NiPoint3InterpController',
+	'NiMaterialColorController': 'NiMaterialColorController',
+	'NiLightColorController': 'NiLightColorController',
+	'NiExtraDataController': 'NiExtraDataController',
+	'NiColorExtraDataController': 'NiColorExtraDataController',
+	'NiFloatExtraDataController': 'NiFloatExtraDataController',
+	'NiFloatsExtraDataController': 'NiFloatsExtraDataController',
+	'NiFloatsExtraDataPoint3Controller': 'NiFloatsExtraDataPoint3Controller',
+	'NiBoneLODController': 'NiBoneLODController',
+	'NiBSBoneLODController': 'NiBSBoneLODController',
+	'NiGeometry': 'NiGeometry',
+	'NiTriBasedGeom': 'NiTriBasedGeom',
+	'NiGeometryData': 'NiGeometryData',
+	'AbstractAdditionalGeometryData': 'AbstractAdditionalGeometryData',
+	'NiTriBasedGeomData': 'NiTriBasedGeomData',
+	'bhkBlendController': 'BhkBlendController',
+	'BSBound': 'BSBound',
+	'BSFurnitureMarker': 'BSFurnitureMarker',
+	'BSParentVelocityModifier': 'BSParentVelocityModifier',
+	'BSPSysArrayEmitter': 'BSPSysArrayEmitter',
+	'BSWindModifier': 'BSWindModifier',
+	'hkPackedNiTriStripsData': 'HkPackedNiTriStripsData',
+	'NiAlphaProperty': 'NiAlphaProperty',
+	'NiAmbientLight': 'NiAmbientLight',
+	'NiParticlesData': 'NiParticlesData',
+	'NiRotatingParticlesData': 'NiRotatingParticlesData',
+	'NiAutoNormalParticlesData': 'NiAutoNormalParticlesData',
+	'NiPSysData': 'NiPSysData',
+	'NiMeshPSysData': 'NiMeshPSysData',
+	'NiBinaryExtraData': 'NiBinaryExtraData',
+	'NiBinaryVoxelExtraData': 'NiBinaryVoxelExtraData',
+	'NiBinaryVoxelData': 'NiBinaryVoxelData',
+	'NiBlendBoolInterpolator': 'NiBlendBoolInterpolator',
+	'NiBlendFloatInterpolator': 'NiBlendFloatInterpolator',
+	'NiBlendPoint3Interpolator': 'NiBlendPoint3Interpolator',
+	'NiBlendTransformInterpolator': 'NiBlendTransformInterpolator',
+	'NiBoolData': 'NiBoolData',
+	'NiBooleanExtraData': 'NiBooleanExtraData',
+	'NiBSplineBasisData': 'NiBSplineBasisData',
+	'NiBSplineFloatInterpolator': 'NiBSplineFloatInterpolator',
+	'NiBSplineCompFloatInterpolator': 'NiBSplineCompFloatInterpolator',
+	'NiBSplinePoint3Interpolator': 'NiBSplinePoint3Interpolator',
+	'NiBSplineCompPoint3Interpolator': 'NiBSplineCompPoint3Interpolator',
+	'NiBSplineTransformInterpolator': 'NiBSplineTransformInterpolator',
+	'NiBSplineCompTransformInterpolator': 'NiBSplineCompTransformInterpolator',
+	'BSRotAccumTransfInterpolator': 'BSRotAccumTransfInterpolator',
+	'NiBSplineData': 'NiBSplineData',
+	'NiCamera': 'NiCamera',
+	'NiColorData': 'NiColorData',
+	'NiColorExtraData': 'NiColorExtraData',
+	'NiControllerManager': 'NiControllerManager',
+	'NiSequence': 'NiSequence',
+	'NiControllerSequence': 'NiControllerSequence',
+	'NiAVObjectPalette': 'NiAVObjectPalette',
+	'NiDefaultAVObjectPalette': 'NiDefaultAVObjectPalette',
+	'NiDirectionalLight': 'NiDirectionalLight',
+	'NiDitherProperty': 'NiDitherProperty',
+	'NiRollController': 'NiRollController',
+	'NiFloatData': 'NiFloatData',
+	'NiFloatExtraData': 'NiFloatExtraData',
+	'NiFloatsExtraData': 'NiFloatsExtraData',
+	'NiFogProperty': 'NiFogProperty',
+	'NiGravity': 'NiGravity',
+	'NiIntegerExtraData': 'NiIntegerExtraData',
+	'BSXFlags': 'BSXFlags',
+	'NiIntegersExtraData': 'NiIntegersExtraData',
+	'BSKeyframeController': 'BSKeyframeController',
+	'NiKeyframeData': 'NiKeyframeData',
+	'NiLookAtController': 'NiLookAtController',
+	'NiLookAtInterpolator': 'NiLookAtInterpolator',
+	'NiMaterialProperty': 'NiMaterialProperty',
+	'NiMorphData': 'NiMorphData',
+	'NiNode': 'NiNode',
+	'NiBone': 'NiBone',
+	'NiCollisionSwitch': 'NiCollisionSwitch',
+	'AvoidNode': 'AvoidNode',
+	'FxWidget': 'FxWidget',
+	'FxButton': 'FxButton',
+	'FxRadioButton': 'FxRadioButton',
+	'NiBillboardNode': 'NiBillboardNode',
+	'NiBSAnimationNode': 'NiBSAnimationNode',
+	'NiBSParticleNode': 'NiBSParticleNode',
+	'NiSwitchNode': 'NiSwitchNode',
+	'NiLODNode': 'NiLODNode',
+	'NiPalette': 'NiPalette',
+	'NiParticleBomb': 'NiParticleBomb',
+	'NiParticleColorModifier': 'NiParticleColorModifier',
+	'NiParticleGrowFade': 'NiParticleGrowFade',
+	'NiParticleMeshModifier': 'NiParticleMeshModifier',
+	'NiParticleRotation': 'NiParticleRotation',
+	'NiParticles': 'NiParticles',
+	'NiAutoNormalParticles': 'NiAutoNormalParticles',
+	'NiParticleMeshes': 'NiParticleMeshes',
+	'NiParticleMeshesData': 'NiParticleMeshesData',
+	'NiParticleSystem': 'NiParticleSystem',
+	'NiMeshParticleSystem': 'NiMeshParticleSystem',
+	'NiEmitterModifier': 'NiEmitterModifier',
+	'NiParticleSystemController': 'NiParticleSystemController',
+	'NiBSPArrayController': 'NiBSPArrayController',
+	'NiPathController': 'NiPathController',
+	'NiPixelFormat': 'NiPixelFormat',
+	'NiPersistentSrcTextureRendererData': 'NiPersistentSrcTextureRendererData',
+	'NiPixelData': 'NiPixelData',
+	'NiParticleCollider': 'NiParticleCollider',
+	'NiPlanarCollider': 'NiPlanarCollider',
+	'NiPointLight': 'NiPointLight',
+	'NiPosData': 'NiPosData',
+	'NiRotData': 'NiRotData',
+	'NiPSysAgeDeathModifier': 'NiPSysAgeDeathModifier',
+	'NiPSysBombModifier': 'NiPSysBombModifier',
+	'NiPSysBoundUpdateModifier': 'NiPSysBoundUpdateModifier',
+	'NiPSysBoxEmitter': 'NiPSysBoxEmitter',
+	'NiPSysColliderManager': 'NiPSysColliderManager',
+	'NiPSysColorModifier': 'NiPSysColorModifier',
+	'NiPSysCylinderEmitter': 'NiPSysCylinderEmitter',
+	'NiPSysDragModifier': 'NiPSysDragModifier',
+	'NiPSysEmitterCtlrData': 'NiPSysEmitterCtlrData',
+	'NiPSysGravityModifier': 'NiPSysGravityModifier',
+	'NiPSysGrowFadeModifier': 'NiPSysGrowFadeModifier',
+	'NiPSysMeshEmitter': 'NiPSysMeshEmitter',
+	'NiPSysMeshUpdateModifier': 'NiPSysMeshUpdateModifier',
+	'BSPSysInheritVelocityModifier': 'BSPSysInheritVelocityModifier',
+	'BSPSysHavokUpdateModifier': 'BSPSysHavokUpdateModifier',
+	'BSPSysRecycleBoundModifier': 'BSPSysRecycleBoundModifier',
+	'BSPSysSubTexModifier': 'BSPSysSubTexModifier',
+	'NiPSysPlanarCollider': 'NiPSysPlanarCollider',
+	'NiPSysSphericalCollider': 'NiPSysSphericalCollider',
+	'NiPSysPositionModifier': 'NiPSysPositionModifier',
+	'NiPSysResetOnLoopCtlr': 'NiPSysResetOnLoopCtlr',
+	'NiPSysRotationModifier': 'NiPSysRotationModifier',
+	'NiPSysSpawnModifier': 'NiPSysSpawnModifier',
+	'NiPSysPartSpawnModifier': 'NiPSysPartSpawnModifier',
+	'NiPSysSphereEmitter': 'NiPSysSphereEmitter',
+	'NiPSysUpdateCtlr': 'NiPSysUpdateCtlr',
+	'NiPSysFieldModifier': 'NiPSysFieldModifier',
+	'NiPSysVortexFieldModifier': 'NiPSysVortexFieldModifier',
+	'NiPSysGravityFieldModifier': 'NiPSysGravityFieldModifier',
+	'NiPSysDragFieldModifier': 'NiPSysDragFieldModifier',
+	'NiPSysTurbulenceFieldModifier': 'NiPSysTurbulenceFieldModifier',
+	'BSPSysLODModifier': 'BSPSysLODModifier',
+	'BSPSysScaleModifier': 'BSPSysScaleModifier',
+	'NiPSysFieldMagnitudeCtlr': 'NiPSysFieldMagnitudeCtlr',
+	'NiPSysFieldAttenuationCtlr': 'NiPSysFieldAttenuationCtlr',
+	'NiPSysFieldMaxDistanceCtlr': 'NiPSysFieldMaxDistanceCtlr',
+	'NiPSysAirFieldAirFrictionCtlr': 'NiPSysAirFieldAirFrictionCtlr',
+	'NiPSysAirFieldInheritVelocityCtlr': 'NiPSysAirFieldInheritVelocityCtlr',
+	'NiPSysAirFieldSpreadCtlr': 'NiPSysAirFieldSpreadCtlr',
+	'NiPSysInitialRotSpeedCtlr': 'NiPSysInitialRotSpeedCtlr',
+	'NiPSysInitialRotSpeedVarCtlr': 'NiPSysInitialRotSpeedVarCtlr',
+	'NiPSysInitialRotAngleCtlr': 'NiPSysInitialRotAngleCtlr',
+	'NiPSysInitialRotAngleVarCtlr': 'NiPSysInitialRotAngleVarCtlr',
+	'NiPSysEmitterPlanarAngleCtlr': 'NiPSysEmitterPlanarAngleCtlr',
+	'NiPSysEmitterPlanarAngleVarCtlr': 'NiPSysEmitterPlanarAngleVarCtlr',
+	'NiPSysAirFieldModifier': 'NiPSysAirFieldModifier',
+	'NiPSysTrailEmitter': 'NiPSysTrailEmitter',
+	'NiLightIntensityController': 'NiLightIntensityController',
+	'NiPSysRadialFieldModifier': 'NiPSysRadialFieldModifier',
+	'NiLODData': 'NiLODData',
+	'NiRangeLODData': 'NiRangeLODData',
+	'NiScreenLODData': 'NiScreenLODData',
+	'NiRotatingParticles': 'NiRotatingParticles',
+	'NiSequenceStreamHelper': 'NiSequenceStreamHelper',
+	'NiShadeProperty': 'NiShadeProperty',
+	'NiSkinData': 'NiSkinData',
+	'NiSkinInstance': 'NiSkinInstance',
+	'NiTriShapeSkinController': 'NiTriShapeSkinController',
+	'NiSkinPartition': 'NiSkinPartition',
+	'NiTexture': 'NiTexture',
+	'NiSourceTexture': 'NiSourceTexture',
+	'NiSpecularProperty': 'NiSpecularProperty',
+	'NiSphericalCollider': 'NiSphericalCollider',
+	'NiSpotLight': 'NiSpotLight',
+	'NiStencilProperty': 'NiStencilProperty',
+	'NiStringExtraData': 'NiStringExtraData',
+	'NiStringPalette': 'NiStringPalette',
+	'NiStringsExtraData': 'NiStringsExtraData',
+	'NiTextKeyExtraData': 'NiTextKeyExtraData',
+	'NiTextureEffect': 'NiTextureEffect',
+	'NiTextureModeProperty': 'NiTextureModeProperty',
+	'NiImage': 'NiImage',
+	'NiTextureProperty': 'NiTextureProperty',
+	'NiTexturingProperty': 'NiTexturingProperty',
+	'NiMultiTextureProperty': 'NiMultiTextureProperty',
+	'NiTransformData': 'NiTransformData',
+	'NiTriShape': 'NiTriShape',
+	'NiTriShapeData': 'NiTriShapeData',
+	'NiTriStrips': 'NiTriStrips',
+	'NiTriStripsData': 'NiTriStripsData',
+	'NiEnvMappedTriShape': 'NiEnvMappedTriShape',
+	'NiEnvMappedTriShapeData': 'NiEnvMappedTriShapeData',
+	'NiBezierTriangle4': 'NiBezierTriangle4',
+	'NiBezierMesh': 'NiBezierMesh',
+	'NiClod': 'NiClod',
+	'NiClodData': 'NiClodData',
+	'NiClodSkinInstance': 'NiClodSkinInstance',
+	'NiUVController': 'NiUVController',
+	'NiUVData': 'NiUVData',
+	'NiVectorExtraData': 'NiVectorExtraData',
+	'NiVertexColorProperty': 'NiVertexColorProperty',
+	'NiVertWeightsExtraData': 'NiVertWeightsExtraData',
+	'NiVisData': 'NiVisData',
+	'NiWireframeProperty': 'NiWireframeProperty',
+	'NiZBufferProperty': 'NiZBufferProperty',
+	'RootCollisionNode': 'RootCollisionNode',
+	'NiRawImageData': 'NiRawImageData',
+	'NiAccumulator': 'NiAccumulator',
+	'NiSortAdjustNode': 'NiSortAdjustNode',
+	'NiSourceCubeMap': 'NiSourceCubeMap',
+	'NiPhysXScene': 'NiPhysXScene',
+	'NiPhysXSceneDesc': 'NiPhysXSceneDesc',
+	'NiPhysXProp': 'NiPhysXProp',
+	'NiPhysXPropDesc': 'NiPhysXPropDesc',
+	'NiPhysXActorDesc': 'NiPhysXActorDesc',
+	'NiPhysXBodyDesc': 'NiPhysXBodyDesc',
+	'NiPhysXJointDesc': 'NiPhysXJointDesc',
+	'NiPhysXD6JointDesc': 'NiPhysXD6JointDesc',
+	'NiPhysXShapeDesc': 'NiPhysXShapeDesc',
+	'NiPhysXMeshDesc': 'NiPhysXMeshDesc',
+	'NiPhysXMaterialDesc': 'NiPhysXMaterialDesc',
+	'NiPhysXClothDesc': 'NiPhysXClothDesc',
+	'NiPhysXDest': 'NiPhysXDest',
+	'NiPhysXRigidBodyDest': 'NiPhysXRigidBodyDest',
+	'NiPhysXTransformDest': 'NiPhysXTransformDest',
+	'NiPhysXSrc': 'NiPhysXSrc',
+	'NiPhysXRigidBodySrc': 'NiPhysXRigidBodySrc',
+	'NiPhysXKinematicSrc': 'NiPhysXKinematicSrc',
+	'NiPhysXDynamicSrc': 'NiPhysXDynamicSrc',
+	'NiLines': 'NiLines',
+	'NiLinesData': 'NiLinesData',
+	'NiScreenElementsData': 'NiScreenElementsData',
+	'NiScreenElements': 'NiScreenElements',
+	'NiRoomGroup': 'NiRoomGroup',
+	'NiWall': 'NiWall',
+	'NiRoom': 'NiRoom',
+	'NiPortal': 'NiPortal',
+	'BSFadeNode': 'BSFadeNode',
+	'BSShaderProperty': 'BSShaderProperty',
+	'BSShaderLightingProperty': 'BSShaderLightingProperty',
+	'BSShaderNoLightingProperty': 'BSShaderNoLightingProperty',
+	'BSShaderPPLightingProperty': 'BSShaderPPLightingProperty',
+	'BSEffectShaderPropertyFloatController': 'BSEffectShaderPropertyFloatController',
+	'BSEffectShaderPropertyColorController': 'BSEffectShaderPropertyColorController',
+	'BSLightingShaderPropertyFloatController': 'BSLightingShaderPropertyFloatController',
+	'BSLightingShaderPropertyUShortController': 'BSLightingShaderPropertyUShortController',
+	'BSLightingShaderPropertyColorController': 'BSLightingShaderPropertyColorController',
+	'BSNiAlphaPropertyTestRefController': 'BSNiAlphaPropertyTestRefController',
+	'BSProceduralLightningController': 'BSProceduralLightningController',
+	'BSShaderTextureSet': 'BSShaderTextureSet',
+	'WaterShaderProperty': 'WaterShaderProperty',
+	'SkyShaderProperty': 'SkyShaderProperty',
+	'TileShaderProperty': 'TileShaderProperty',
+	'DistantLODShaderProperty': 'DistantLODShaderProperty',
+	'BSDistantTreeShaderProperty': 'BSDistantTreeShaderProperty',
+	'TallGrassShaderProperty': 'TallGrassShaderProperty',
+	'VolumetricFogShaderProperty': 'VolumetricFogShaderProperty',
+	'HairShaderProperty': 'HairShaderProperty',
+	'Lighting30ShaderProperty': 'Lighting30ShaderProperty',
+	'BSLightingShaderProperty': 'BSLightingShaderProperty',
+	'BSEffectShaderProperty': 'BSEffectShaderProperty',
+	'BSWaterShaderProperty': 'BSWaterShaderProperty',
+	'BSSkyShaderProperty': 'BSSkyShaderProperty',
+	'BSDismemberSkinInstance': 'BSDismemberSkinInstance',
+	'BSDecalPlacementVectorExtraData': 'BSDecalPlacementVectorExtraData',
+	'BSPSysSimpleColorModifier': 'BSPSysSimpleColorModifier',
+	'BSValueNode': 'BSValueNode',
+	'BSStripParticleSystem': 'BSStripParticleSystem',
+	'BSStripPSysData': 'BSStripPSysData',
+	'BSPSysStripUpdateModifier': 'BSPSysStripUpdateModifier',
+	'BSMaterialEmittanceMultController': 'BSMaterialEmittanceMultController',
+	'BSMasterParticleSystem': 'BSMasterParticleSystem',
+	'BSPSysMultiTargetEmitterCtlr': 'BSPSysMultiTargetEmitterCtlr',
+	'BSRefractionStrengthController': 'BSRefractionStrengthController',
+	'BSOrderedNode': 'BSOrderedNode',
+	'BSRangeNode': 'BSRangeNode',
+	'BSBlastNode': 'BSBlastNode',
+	'BSDamageStage': 'BSDamageStage',
+	'BSRefractionFirePeriodController': 'BSRefractionFirePeriodController',
+	'bhkConvexListShape': 'BhkConvexListShape',
+	'BSTreadTransfInterpolator': 'BSTreadTransfInterpolator',
+	'BSAnimNote': 'BSAnimNote',
+	'BSAnimNotes': 'BSAnimNotes',
+	'bhkLiquidAction': 'BhkLiquidAction',
+	'BSMultiBoundNode': 'BSMultiBoundNode',
+	'BSMultiBound': 'BSMultiBound',
+	'BSMultiBoundData': 'BSMultiBoundData',
+	'BSMultiBoundOBB': 'BSMultiBoundOBB',
+	'BSMultiBoundSphere': 'BSMultiBoundSphere',
+	'BSSegmentedTriShape': 'BSSegmentedTriShape',
+	'BSMultiBoundAABB': 'BSMultiBoundAABB',
+	'NiAdditionalGeometryData': 'NiAdditionalGeometryData',
+	'BSPackedAdditionalGeometryData': 'BSPackedAdditionalGeometryData',
+	'BSWArray': 'BSWArray',
+	'BSFrustumFOVController': 'BSFrustumFOVController',
+	'BSDebrisNode': 'BSDebrisNode',
+	'bhkBreakableConstraint': 'BhkBreakableConstraint',
+	'bhkOrientHingedBodyAction': 'BhkOrientHingedBodyAction',
+	'bhkPoseArray': 'BhkPoseArray',
+	'bhkRagdollTemplate': 'BhkRagdollTemplate',
+	'bhkRagdollTemplateData': 'BhkRagdollTemplateData',
+	'NiDataStream': 'NiDataStream',
+	'NiRenderObject': 'NiRenderObject',
+	'NiMeshModifier': 'NiMeshModifier',
+	'NiMesh': 'NiMesh',
+	'NiMorphWeightsController': 'NiMorphWeightsController',
+	'NiMorphMeshModifier': 'NiMorphMeshModifier',
+	'NiSkinningMeshModifier': 'NiSkinningMeshModifier',
+	'NiMeshHWInstance': 'NiMeshHWInstance',
+	'NiInstancingMeshModifier': 'NiInstancingMeshModifier',
+	'NiSkinningLODController': 'NiSkinningLODController',
+	'NiPSParticleSystem': 'NiPSParticleSystem',
+	'NiPSMeshParticleSystem': 'NiPSMeshParticleSystem',
+	'NiPSFacingQuadGenerator': 'NiPSFacingQuadGenerator',
+	'NiPSAlignedQuadGenerator': 'NiPSAlignedQuadGenerator',
+	'NiPSSimulator': 'NiPSSimulator',
+	'NiPSSimulatorStep': 'NiPSSimulatorStep',
+	'NiPSSimulatorGeneralStep': 'NiPSSimulatorGeneralStep',
+	'NiPSSimulatorForcesStep': 'NiPSSimulatorForcesStep',
+	'NiPSSimulatorCollidersStep': 'NiPSSimulatorCollidersStep',
+	'NiPSSimulatorMeshAlignStep': 'NiPSSimulatorMeshAlignStep',
+	'NiPSSimulatorFinalStep': 'NiPSSimulatorFinalStep',
+	'NiPSBoundUpdater': 'NiPSBoundUpdater',
+	'NiPSForce': 'NiPSForce',
+	'NiPSFieldForce': 'NiPSFieldForce',
+	'NiPSDragForce': 'NiPSDragForce',
+	'NiPSGravityForce': 'NiPSGravityForce',
+	'NiPSBombForce': 'NiPSBombForce',
+	'NiPSAirFieldForce': 'NiPSAirFieldForce',
+	'NiPSGravityFieldForce': 'NiPSGravityFieldForce',
+	'NiPSDragFieldForce': 'NiPSDragFieldForce',
+	'NiPSRadialFieldForce': 'NiPSRadialFieldForce',
+	'NiPSTurbulenceFieldForce': 'NiPSTurbulenceFieldForce',
+	'NiPSVortexFieldForce': 'NiPSVortexFieldForce',
+	'NiPSEmitter': 'NiPSEmitter',
+	'NiPSVolumeEmitter': 'NiPSVolumeEmitter',
+	'NiPSBoxEmitter': 'NiPSBoxEmitter',
+	'NiPSSphereEmitter': 'NiPSSphereEmitter',
+	'NiPSCylinderEmitter': 'NiPSCylinderEmitter',
+	'NiPSTorusEmitter': 'NiPSTorusEmitter',
+	'NiPSMeshEmitter': 'NiPSMeshEmitter',
+	'NiPSCurveEmitter': 'NiPSCurveEmitter',
+	'NiPSEmitterCtlr': 'NiPSEmitterCtlr',
+	'NiPSEmitterFloatCtlr': 'NiPSEmitterFloatCtlr',
+	'NiPSEmitParticlesCtlr': 'NiPSEmitParticlesCtlr',
+	'NiPSForceCtlr': 'NiPSForceCtlr',
+	'NiPSForceBoolCtlr': 'NiPSForceBoolCtlr',
+	'NiPSForceFloatCtlr': 'NiPSForceFloatCtlr',
+	'NiPSForceActiveCtlr': 'NiPSForceActiveCtlr',
+	'NiPSGravityStrengthCtlr': 'NiPSGravityStrengthCtlr',
+	'NiPSFieldAttenuationCtlr': 'NiPSFieldAttenuationCtlr',
+	'NiPSFieldMagnitudeCtlr': 'NiPSFieldMagnitudeCtlr',
+	'NiPSFieldMaxDistanceCtlr': 'NiPSFieldMaxDistanceCtlr',
+	'NiPSEmitterSpeedCtlr': 'NiPSEmitterSpeedCtlr',
+	'NiPSEmitterRadiusCtlr': 'NiPSEmitterRadiusCtlr',
+	'NiPSEmitterDeclinationCtlr': 'NiPSEmitterDeclinationCtlr',
+	'NiPSEmitterDeclinationVarCtlr': 'NiPSEmitterDeclinationVarCtlr',
+	'NiPSEmitterPlanarAngleCtlr': 'NiPSEmitterPlanarAngleCtlr',
+	'NiPSEmitterPlanarAngleVarCtlr': 'NiPSEmitterPlanarAngleVarCtlr',
+	'NiPSEmitterRotAngleCtlr': 'NiPSEmitterRotAngleCtlr',
+	'NiPSEmitterRotAngleVarCtlr': 'NiPSEmitterRotAngleVarCtlr',
+	'NiPSEmitterRotSpeedCtlr': 'NiPSEmitterRotSpeedCtlr',
+	'NiPSEmitterRotSpeedVarCtlr': 'NiPSEmitterRotSpeedVarCtlr',
+	'NiPSEmitterLifeSpanCtlr': 'NiPSEmitterLifeSpanCtlr',
+	'NiPSResetOnLoopCtlr': 'NiPSResetOnLoopCtlr',
+	'NiPSCollider': 'NiPSCollider',
+	'NiPSPlanarCollider': 'NiPSPlanarCollider',
+	'NiPSSphericalCollider': 'NiPSSphericalCollider',
+	'NiPSSpawner': 'NiPSSpawner',
+	'NiPhysXPSParticleSystem': 'NiPhysXPSParticleSystem',
+	'NiPhysXPSParticleSystemProp': 'NiPhysXPSParticleSystemProp',
+	'NiPhysXPSParticleSystemDest': 'NiPhysXPSParticleSystemDest',
+	'NiPhysXPSSimulator': 'NiPhysXPSSimulator',
+	'NiPhysXPSSimulatorInitialStep': 'NiPhysXPSSimulatorInitialStep',
+	'NiPhysXPSSimulatorFinalStep': 'NiPhysXPSSimulatorFinalStep',
+	'NiEvaluator': 'NiEvaluator',
+	'NiKeyBasedEvaluator': 'NiKeyBasedEvaluator',
+	'NiBoolEvaluator': 'NiBoolEvaluator',
+	'NiBoolTimelineEvaluator': 'NiBoolTimelineEvaluator',
+	'NiColorEvaluator': 'NiColorEvaluator',
+	'NiFloatEvaluator': 'NiFloatEvaluator',
+	'NiPoint3Evaluator': 'NiPoint3Evaluator',
+	'NiQuaternionEvaluator': 'NiQuaternionEvaluator',
+	'NiTransformEvaluator': 'NiTransformEvaluator',
+	'NiConstBoolEvaluator': 'NiConstBoolEvaluator',
+	'NiConstColorEvaluator': 'NiConstColorEvaluator',
+	'NiConstFloatEvaluator': 'NiConstFloatEvaluator',
+	'NiConstPoint3Evaluator': 'NiConstPoint3Evaluator',
+	'NiConstQuaternionEvaluator': 'NiConstQuaternionEvaluator',
+	'NiConstTransformEvaluator': 'NiConstTransformEvaluator',
+	'NiBSplineEvaluator': 'NiBSplineEvaluator',
+	'NiBSplineColorEvaluator': 'NiBSplineColorEvaluator',
+	'NiBSplineCompColorEvaluator': 'NiBSplineCompColorEvaluator',
+	'NiBSplineFloatEvaluator': 'NiBSplineFloatEvaluator',
+	'NiBSplineCompFloatEvaluator': 'NiBSplineCompFloatEvaluator',
+	'NiBSplinePoint3Evaluator': 'NiBSplinePoint3Evaluator',
+	'NiBSplineCompPoint3Evaluator': 'NiBSplineCompPoint3Evaluator',
+	'NiBSplineTransformEvaluator': 'NiBSplineTransformEvaluator',
+	'NiBSplineCompTransformEvaluator': 'NiBSplineCompTransformEvaluator',
+	'NiLookAtEvaluator': 'NiLookAtEvaluator',
+	'NiPathEvaluator': 'NiPathEvaluator',
+	'NiSequenceData': 'NiSequenceData',
+	'NiShadowGenerator': 'NiShadowGenerator',
+	'NiFurSpringController': 'NiFurSpringController',
+	'CStreamableAssetData': 'CStreamableAssetData',
+	'bhkCompressedMeshShape': 'BhkCompressedMeshShape',
+	'bhkCompressedMeshShapeData': 'BhkCompressedMeshShapeData',
+	'BSInvMarker': 'BSInvMarker',
+	'BSBoneLODExtraData': 'BSBoneLODExtraData',
+	'BSBehaviorGraphExtraData': 'BSBehaviorGraphExtraData',
+	'BSLagBoneController': 'BSLagBoneController',
+	'BSLODTriShape': 'BSLODTriShape',
+	'BSFurnitureMarkerNode': 'BSFurnitureMarkerNode',
+	'BSLeafAnimNode': 'BSLeafAnimNode',
+	'BSTreeNode': 'BSTreeNode',
+	'BSTriShape': 'BSTriShape',
+	'BSMeshLODTriShape': 'BSMeshLODTriShape',
+	'BSSubIndexTriShape': 'BSSubIndexTriShape',
+	'bhkSystem': 'BhkSystem',
+	'bhkNPCollisionObject': 'BhkNPCollisionObject',
+	'bhkPhysicsSystem': 'BhkPhysicsSystem',
+	'bhkRagdollSystem': 'BhkRagdollSystem',
+	'BSExtraData': 'BSExtraData',
+	'BSClothExtraData': 'BSClothExtraData',
+	'BSSkin::Instance': 'BSSkinInstance',
+	'BSSkin::BoneData': 'BSSkinBoneData',
+	'BSPositionData': 'BSPositionData',
+	'BSConnectPoint::Parents': 'BSConnectPointParents',
+	'BSConnectPoint::Children': 'BSConnectPointChildren',
+	'BSEyeCenterExtraData': 'BSEyeCenterExtraData',
+	'BSPackedCombinedGeomDataExtra': 'BSPackedCombinedGeomDataExtra',
+	'BSPackedCombinedSharedGeomDataExtra': 'BSPackedCombinedSharedGeomDataExtra',
+	'NiLightRadiusController': 'NiLightRadiusController',
+	'BSDynamicTriShape': 'BSDynamicTriShape',
+	'BSDistantObjectLargeRefExtraData': 'BSDistantObjectLargeRefExtraData',
+	'BSDistantObjectExtraData': 'BSDistantObjectExtraData',
+	'BSDistantObjectInstancedNode': 'BSDistantObjectInstancedNode',
+	'BSCollisionQueryProxyExtraData': 'BSCollisionQueryProxyExtraData',
+	'CsNiNode': 'CsNiNode',
+	'JPSJigsawNode': 'JPSJigsawNode',
+	'RibbonParticleSystem': 'RibbonParticleSystem',
+	'RibbonQuadGenerator': 'RibbonQuadGenerator',
+	'RibbonEmitter': 'RibbonEmitter',
+	'NiYAMaterialProperty': 'NiYAMaterialProperty',
+	'NiRimLightProperty': 'NiRimLightProperty',
+	'NiProgramLODData': 'NiProgramLODData',
+	'MdlMan::CDataEntry': 'MdlManCDataEntry',
+	'MdlMan::CModelTemplateDataEntry': 'MdlManCModelTemplateDataEntry',
+	'MdlMan::CAMDataEntry': 'MdlManCAMDataEntry',
+	'MdlMan::CMeshDataEntry': 'MdlManCMeshDataEntry',
+	'MdlMan::CSkeletonDataEntry': 'MdlManCSkeletonDataEntry',
+	'MdlMan::CAnimationDataEntry': 'MdlManCAnimationDataEntry',
+}
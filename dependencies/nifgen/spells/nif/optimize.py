@@ -164,8 +164,10 @@ class SpellMergeDuplicates(pyffi.spells.nif.NifSpell):
 
     def __init__(self, *args, **kwargs):
         pyffi.spells.nif.NifSpell.__init__(self, *args, **kwargs)
-        # list of all branches visited so far
-        self.branches = []
+        # branches visited so far, indexed by their interchangeable hash
+        self.branches = {}
+        # memoized interchangeable hash of every branch
+        self.branch_hashes = {}
 
     def datainspect(self):
         # see MadCat221's metstaff.nif:
@@ -185,8 +187,31 @@ class SpellMergeDuplicates(pyffi.spells.nif.NifSpell):
         return isinstance(branch, (NifFormat.NiObjectNET,
                                    NifFormat.NiGeometryData))
 
+    def get_branch_hash(self, branch):
+        """Return the memoized interchangeable hash of branch."""
+        try:
+            return self.branch_hashes[branch]
+        except KeyError:
+            # interchangeable blocks always have the same class, so that
+            # is the hash for blocks that cannot provide a better one
+            get_hash = getattr(branch, "get_interchangeable_hash", None)
+            branch_hash = get_hash() if get_hash else branch.__class__
+            try:
+                hash(branch_hash)
+            except TypeError:
+                # a field without a hashable value
+                branch_hash = branch.__class__
+            self.branch_hashes[branch] = branch_hash
+            return branch_hash
+
     def branchentry(self, branch):
-        for otherbranch in self.branches:
+        branch_hash = self.get_branch_hash(branch)
+        if branch_hash is None:
+            # only interchangeable with itself
+            return True
+        # only branches with the same hash can be interchangeable
+        candidates = self.branches.setdefault(branch_hash, [])
+        for otherbranch in candidates:
             if (branch is not otherbranch and
                 branch.is_interchangeable(otherbranch)):
                 # skip properties that have controllers (the
@@ -201,12 +226,15 @@ class SpellMergeDuplicates(pyffi.spells.nif.NifSpell):
                 # interchangeable branch found!
                 self.toaster.msg("removing duplicate branch")
                 self.data.replace_global_node(branch, otherbranch)
+                # the hashes of blocks that linked to branch may be stale
+                # now, but any hash match is confirmed by is_interchangeable
+                del self.branch_hashes[branch]
                 self.changed = True
                 # branch has been replaced, so no need to recurse further
                 return False
         else:
             # no duplicate found, add to list of visited branches
-            self.branches.append(branch)
+            candidates.append(branch)
             # continue recursion
             return True
 
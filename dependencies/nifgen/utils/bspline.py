@@ -0,0 +1,92 @@
+"""Evaluate the open uniform B-splines of NiBSplineInterpolator blocks, using numpy.
+
+Gamebryo stores the control points of a degree 3 B-spline whose knots are spread
+uniformly between the start and stop time of the interpolator, and clamped at both
+ends so that the curve passes through the first and last control point.
+"""
+
+# ***** BEGIN LICENSE BLOCK *****
+# 
+# Copyright © 2013, NIF File Format Library and Tools contributors.
+# All rights reserved.
+# 
+# Redistribution and use in source and binary forms, with or without
+# modification, are permitted provided that the following conditions
+# are met:
+# 
+#    * Redistributions of source code must retain the above copyright
+#      notice, this list of conditions and the following disclaimer.
+# 
+#    * Redistributions in binary form must reproduce the above
+#      copyright notice, this list of conditions and the following
+#      disclaimer in the documentation and/or other materials provided
+#      with the distribution.
+# 
+#    * Neither the name of the NIF File Format Library and Tools
+#      project nor the names of its contributors may be used to endorse
+#      or promote products derived from this software without specific
+#      prior written permission.
+# 
+# THIS SOFTWARE IS PROVIDED BY THE COPYRIGHT HOLDERS AND CONTRIBUTORS
+# "AS IS" AND ANY EXPRESS OR IMPLIED WARRANTIES, INCLUDING, BUT NOT
+# LIMITED TO, THE IMPLIED WARRANTIES OF MERCHANTABILITY AND FITNESS
+# FOR A PARTICULAR PURPOSE ARE DISCLAIMED. IN NO EVENT SHALL THE
+# COPYRIGHT OWNER OR CONTRIBUTORS BE LIABLE FOR ANY DIRECT, INDIRECT,
+# INCIDENTAL, SPECIAL, EXEMPLARY, OR CONSEQUENTIAL DAMAGES (INCLUDING,
+# BUT NOT LIMITED TO, PROCUREMENT OF SUBSTITUTE GOODS OR SERVICES;
+# LOSS OF USE, DATA, OR PROFITS; OR BUSINESS INTERRUPTION) HOWEVER
+# CAUSED AND ON ANY THEORY OF LIABILITY, WHETHER IN CONTRACT, STRICT
+# LIABILITY, OR TORT (INCLUDING NEGLIGENCE OR OTHERWISE) ARISING IN
+# ANY WAY OUT OF THE USE OF THIS SOFTWARE, EVEN IF ADVISED OF THE
+# POSSIBILITY OF SUCH DAMAGE.
+#
+# ***** END LICENSE BLOCK *****
+
+import numpy as np
+
+DEGREE = 3
+
+
+def get_knots(num_control_points, degree=DEGREE):
+    """Return the open uniform knot vector for the given number of control points."""
+    return np.clip(np.arange(num_control_points + degree + 1) - degree, 0, num_control_points - degree).astype(float)
+
+
+def get_basis(num_control_points, parameters, degree=DEGREE):
+    """Return the value of every basis function at every parameter.
+
+    :param num_control_points: The number of control points of the spline.
+    :param parameters: Array of curve parameters, from 0 at the start to 1 at the end of the curve.
+    :param degree: The degree of the spline, lowered if there are too few control points.
+    :return: A (len(parameters), num_control_points) array.
+    """
+    degree = max(min(degree, num_control_points - 1), 0)
+    knots = get_knots(num_control_points, degree)
+    t = np.clip(np.asarray(parameters, dtype=float), 0.0, 1.0) * (num_control_points - degree)
+    # degree 0: the indicator function of every knot span, with the end of the curve in the last span
+    span = np.minimum(np.searchsorted(knots, t, side="right") - 1, num_control_points - 1)
+    basis = np.zeros((len(t), len(knots) - 1))
+    basis[np.arange(len(t)), span] = 1.0
+    # raise the degree with the Cox-de Boor recursion, where empty spans contribute nothing
+    for p in range(1, degree + 1):
+        left = knots[:-p - 1]
+        left_width = knots[p:-1] - left
+        right = knots[p + 1:]
+        right_width = right - knots[1:-p]
+        with np.errstate(divide="ignore", invalid="ignore"):
+            rising = np.where(left_width > 0, (t[:, None] - left) / left_width, 0.0)
+            falling = np.where(right_width > 0, (right - t[:, None]) / right_width, 0.0)
+        basis = rising * basis[:, :-1] + falling * basis[:, 1:]
+    return basis
+
+
+def evaluate(control_points, parameters, degree=DEGREE):
+    """Evaluate a B-spline at the given parameters.
+
+    :param control_points: A (num_control_points, dimension) array.
+    :param parameters: Array of curve parameters, from 0 at the start to 1 at the end of the curve.
+    :param degree: The degree of the spline.
+    :return: A (len(parameters), dimension) array.
+    """
+    control_points = np.asarray(control_points, dtype=float)
+    return get_basis(len(control_points), parameters, degree) @ control_points
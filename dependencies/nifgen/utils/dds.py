@@ -0,0 +1,305 @@
+"""Encode RGBA images to DDS textures with a full mipmap chain, using numpy only.
+
+Supports the DXT1, DXT3 and DXT5 block compressed formats and uncompressed R8G8B8A8_UNORM.
+"""
+
+# ***** BEGIN LICENSE BLOCK *****
+# 
+# Copyright © 2013, NIF File Format Library and Tools contributors.
+# All rights reserved.
+# 
+# Redistribution and use in source and binary forms, with or without
+# modification, are permitted provided that the following conditions
+# are met:
+# 
+#    * Redistributions of source code must retain the above copyright
+#      notice, this list of conditions and the following disclaimer.
+# 
+#    * Redistributions in binary form must reproduce the above
+#      copyright notice, this list of conditions and the following
+#      disclaimer in the documentation and/or other materials provided
+#      with the distribution.
+# 
+#    * Neither the name of the NIF File Format Library and Tools
+#      project nor the names of its contributors may be used to endorse
+#      or promote products derived from this software without specific
+#      prior written permission.
+# 
+# THIS SOFTWARE IS PROVIDED BY THE COPYRIGHT HOLDERS AND CONTRIBUTORS
+# "AS IS" AND ANY EXPRESS OR IMPLIED WARRANTIES, INCLUDING, BUT NOT
+# LIMITED TO, THE IMPLIED WARRANTIES OF MERCHANTABILITY AND FITNESS
+# FOR A PARTICULAR PURPOSE ARE DISCLAIMED. IN NO EVENT SHALL THE
+# COPYRIGHT OWNER OR CONTRIBUTORS BE LIABLE FOR ANY DIRECT, INDIRECT,
+# INCIDENTAL, SPECIAL, EXEMPLARY, OR CONSEQUENTIAL DAMAGES (INCLUDING,
+# BUT NOT LIMITED TO, PROCUREMENT OF SUBSTITUTE GOODS OR SERVICES;
+# LOSS OF USE, DATA, OR PROFITS; OR BUSINESS INTERRUPTION) HOWEVER
+# CAUSED AND ON ANY THEORY OF LIABILITY, WHETHER IN CONTRACT, STRICT
+# LIABILITY, OR TORT (INCLUDING NEGLIGENCE OR OTHERWISE) ARISING IN
+# ANY WAY OUT OF THE USE OF THIS SOFTWARE, EVEN IF ADVISED OF THE
+# POSSIBILITY OF SUCH DAMAGE.
+#
+# ***** END LICENSE BLOCK *****
+
+import struct
+from concurrent.futures import ProcessPoolExecutor
+from itertools import repeat
+
+import numpy as np
+
+# bytes per 4x4 block of the block compressed formats
+BLOCK_SIZES = {'DXT1': 8, 'DXT3': 16, 'DXT5': 16}
+FORMATS = tuple(BLOCK_SIZES) + ('R8G8B8A8_UNORM',)
+
+DDSD_CAPS = 0x1
+DDSD_HEIGHT = 0x2
+DDSD_WIDTH = 0x4
+DDSD_PITCH = 0x8
+DDSD_PIXELFORMAT = 0x1000
+DDSD_MIPMAPCOUNT = 0x20000
+DDSD_LINEARSIZE = 0x80000
+DDPF_FOURCC = 0x4
+DDSCAPS_COMPLEX = 0x8
+DDSCAPS_TEXTURE = 0x1000
+DDSCAPS_MIPMAP = 0x400000
+DXGI_FORMAT_R8G8B8A8_UNORM = 28
+D3D10_RESOURCE_DIMENSION_TEXTURE2D = 3
+
+# weight of the first endpoint of each palette entry, in four and three colour mode
+FOUR_COLOUR_WEIGHTS = np.array([1.0, 0.0, 2.0 / 3.0, 1.0 / 3.0], dtype=np.float32)
+THREE_COLOUR_WEIGHTS = np.array([1.0, 0.0, 0.5, 0.0], dtype=np.float32)
+# weight of the first endpoint of each palette entry of interpolated alpha, in sevenths
+ALPHA_STEPS = np.array([7, 0, 6, 5, 4, 3, 2, 1], dtype=np.int32)
+
+
+def get_mipmaps(pixels):
+    """Return the mipmap chain of an image down to 1x1, box filtering each level from the previous one.
+
+    :param pixels: array of shape (height, width, channels)
+    :return: list of float32 arrays, starting with the image itself
+    """
+    mipmap = np.asarray(pixels, dtype=np.float32)
+    mipmaps = [mipmap]
+    while mipmap.shape[0] > 1 or mipmap.shape[1] > 1:
+        height, width, channels = mipmap.shape
+        # an odd last row or column is dropped, as each level is max(1, size // 2) in size
+        if height > 1:
+            mipmap = mipmap[:height // 2 * 2].reshape(height // 2, 2, width, channels).mean(axis=1)
+        if width > 1:
+            mipmap = mipmap[:, :width // 2 * 2].reshape(-1, width // 2, 2, channels).mean(axis=2)
+        mipmaps.append(mipmap)
+    return mipmaps
+
+
+def get_blocks(rgba):
+    """Split a (height, width, 4) image into (n, 16, 4) blocks of 4x4 pixels in row major order,
+    repeating the edge pixels of images whose size is not a multiple of 4"""
+    height, width = rgba.shape[:2]
+    rgba = np.pad(rgba, ((0, -height % 4), (0, -width % 4), (0, 0)), mode='edge')
+    rows, columns = rgba.shape[0] // 4, rgba.shape[1] // 4
+    return rgba.reshape(rows, 4, columns, 4, 4).swapaxes(1, 2).reshape(-1, 16, 4)
+
+
+def _pack_565(colours):
+    """Quantize (n, 3) colours in [0, 255] to 16 bit RGB565"""
+    colours = np.clip(colours, 0.0, 255.0)
+    r = np.rint(colours[:, 0] * (31 / 255)).astype(np.uint16)
+    g = np.rint(colours[:, 1] * (63 / 255)).astype(np.uint16)
+    b = np.rint(colours[:, 2] * (31 / 255)).astype(np.uint16)
+    return (r << 11) | (g << 5) | b
+
+
+def _unpack_565(packed):
+    """Expand 16 bit RGB565 to (n, 3) colours in [0, 255], like the decoder does"""
+    r = (packed >> 11) & 31
+    g = (packed >> 5) & 63
+    b = packed & 31
+    return np.stack(((r << 3) | (r >> 2), (g << 2) | (g >> 4), (b << 3) | (b >> 2)), axis=-1).astype(np.float32)
+
+
+def _get_endpoints(colours, mask):
+    """Return the extremes of the masked colours of each block along their principal axis, slightly inset"""
+    weights = mask[:, :, None].astype(np.float32)
+    count = np.maximum(mask.sum(axis=1), 1)[:, None]
+    mean = (colours * weights).sum(axis=1) / count
+    centred = (colours - mean[:, None]) * weights
+    covariance = np.einsum('nki,nkj->nij', centred, centred)
+    # power iteration, starting from the row of the channel with the largest variance
+    diagonal = np.einsum('nii->ni', covariance)
+    axis = np.take_along_axis(covariance, diagonal.argmax(axis=1)[:, None, None], axis=1)[:, 0]
+    for i in range(8):
+        axis /= np.maximum(np.linalg.norm(axis, axis=1, keepdims=True), 1e-12)
+        axis = np.einsum('nij,nj->ni', covariance, axis)
+    axis /= np.maximum(np.linalg.norm(axis, axis=1, keepdims=True), 1e-12)
+    projection = np.einsum('nki,ni->nk', centred, axis)
+    low = np.where(mask, projection, np.inf).min(axis=1)
+    high = np.where(mask, projection, -np.inf).max(axis=1)
+    empty = ~mask.any(axis=1)
+    low[empty] = 0.0
+    high[empty] = 0.0
+    inset = (high - low) / 16
+    return mean + axis * (high - inset)[:, None], mean + axis * (low + inset)[:, None]
+
+
+def _refine_endpoints(colours, indices, weights, mask, colour0, colour1):
+    """Return the endpoints that fit the masked colours best in the least squares sense for the given indices,
+    keeping the old endpoints of blocks that do not determine them"""
+    w0 = np.take_along_axis(weights, indices, axis=1) * mask
+    w1 = (1.0 - np.take_along_axis(weights, indices, axis=1)) * mask
+    a00 = (w0 * w0).sum(axis=1)
+    a01 = (w0 * w1).sum(axis=1)
+    a11 = (w1 * w1).sum(axis=1)
+    b0 = (w0[:, :, None] * colours).sum(axis=1)
+    b1 = (w1[:, :, None] * colours).sum(axis=1)
+    determinant = a00 * a11 - a01 * a01
+    solvable = (determinant > 1e-6)[:, None]
+    determinant = np.where(solvable[:, 0], determinant, 1.0)[:, None]
+    refined0 = (b0 * a11[:, None] - b1 * a01[:, None]) / determinant
+    refined1 = (b1 * a00[:, None] - b0 * a01[:, None]) / determinant
+    return np.where(solvable, refined0, colour0), np.where(solvable, refined1, colour1)
+
+
+def _fit_colour_blocks(colours, transparent, three_colour, weights, colour0, colour1):
+    """Quantize the endpoints and pick the nearest palette entry for every pixel.
+
+    :return: packed endpoints, indices, and squared error per block
+    """
+    c0 = _pack_565(colour0)
+    c1 = _pack_565(colour1)
+    # four colour mode is selected by c0 > c1, three colour mode by c0 <= c1
+    swap = np.where(three_colour, c0 > c1, c0 < c1)
+    c0, c1 = np.where(swap, c1, c0), np.where(swap, c0, c1)
+    palette = weights[:, :, None] * _unpack_565(c0)[:, None] + (1.0 - weights[:, :, None]) * _unpack_565(c1)[:, None]
+    distances = ((colours[:, :, None] - palette[:, None]) ** 2).sum(axis=3)
+    # the last entry is transparent in three colour mode
+    distances[:, :, 3] = np.where(three_colour[:, None], np.inf, distances[:, :, 3])
+    indices = distances.argmin(axis=2)
+    error = np.where(transparent, 0.0, np.take_along_axis(distances, indices[:, :, None], axis=2)[:, :, 0]).sum(axis=1)
+    indices[transparent] = 3
+    # equal endpoints always decode in three colour mode
+    indices = np.where((c0 == c1)[:, None] & ~transparent, 0, indices)
+    return c0, c1, indices, error
+
+
+def _encode_colour_blocks(blocks, punch_through):
+    """Encode the colours of (n, 16, 4) uint8 blocks to 8 byte BC1 blocks.
+
+    :param punch_through: use three colour mode with transparent pixels for blocks with alpha below 128
+    """
+    colours = blocks[:, :, :3].astype(np.float32)
+    if punch_through:
+        transparent = blocks[:, :, 3] < 128
+    else:
+        transparent = np.zeros(colours.shape[:2], dtype=bool)
+    opaque = ~transparent
+    three_colour = transparent.any(axis=1)
+    weights = np.where(three_colour[:, None], THREE_COLOUR_WEIGHTS, FOUR_COLOUR_WEIGHTS)
+    colour0, colour1 = _get_endpoints(colours, opaque)
+    c0, c1, indices, error = _fit_colour_blocks(colours, transparent, three_colour, weights, colour0, colour1)
+    # one least squares pass, kept for the blocks it improves
+    colour0, colour1 = _refine_endpoints(colours, indices, weights, opaque, colour0, colour1)
+    refined = _fit_colour_blocks(colours, transparent, three_colour, weights, colour0, colour1)
+    better = refined[3] < error
+    c0 = np.where(better, refined[0], c0)
+    c1 = np.where(better, refined[1], c1)
+    indices = np.where(better[:, None], refined[2], indices)
+
+    encoded = np.empty(len(blocks), dtype=[('c0', '<u2'), ('c1', '<u2'), ('bits', '<u4')])
+    encoded['c0'] = c0
+    encoded['c1'] = c1
+    encoded['bits'] = (indices.astype(np.uint32) << (2 * np.arange(16, dtype=np.uint32))).sum(axis=1, dtype=np.uint32)
+    return encoded
+
+
+def _encode_explicit_alpha(alpha):
+    """Encode (n, 16) uint8 alpha to 8 byte BC2 alpha blocks of 4 bits per pixel"""
+    alpha4 = (alpha.astype(np.uint64) * 15 + 127) // 255
+    return (alpha4 << (4 * np.arange(16, dtype=np.uint64))).sum(axis=1, dtype=np.uint64).astype('<u8')
+
+
+def _encode_interpolated_alpha(alpha):
+    """Encode (n, 16) uint8 alpha to 8 byte BC3 alpha blocks, interpolating eight values between the extremes"""
+    alpha = alpha.astype(np.int32)
+    a0 = alpha.max(axis=1)
+    a1 = alpha.min(axis=1)
+    palette = (ALPHA_STEPS * a0[:, None] + (7 - ALPHA_STEPS) * a1[:, None] + 3) // 7
+    indices = np.abs(alpha[:, :, None] - palette[:, None]).argmin(axis=2).astype(np.uint64)
+    bits = (indices << (3 * np.arange(16, dtype=np.uint64))).sum(axis=1, dtype=np.uint64)
+    return (a0.astype(np.uint64) | (a1.astype(np.uint64) << np.uint64(8)) | (bits << np.uint64(16))).astype('<u8')
+
+
+def encode_image(rgba, fourcc):
+    """Encode a single (height, width, 4) uint8 image, and return its bytes"""
+    if fourcc == 'R8G8B8A8_UNORM':
+        return np.ascontiguousarray(rgba).tobytes()
+    blocks = get_blocks(rgba)
+    colour = _encode_colour_blocks(blocks, punch_through=(fourcc == 'DXT1'))
+    if fourcc == 'DXT1':
+        return colour.tobytes()
+    if fourcc == 'DXT3':
+        alpha = _encode_explicit_alpha(blocks[:, :, 3])
+    else:
+        alpha = _encode_interpolated_alpha(blocks[:, :, 3])
+    return np.hstack((alpha.view(np.uint8).reshape(-1, 8), colour.view(np.uint8).reshape(-1, 8))).tobytes()
+
+
+def get_dds_header(width, height, mip_count, fourcc):
+    """Return the DDS file header for an image of the given size, number of mipmaps and format"""
+    flags = DDSD_CAPS | DDSD_HEIGHT | DDSD_WIDTH | DDSD_PIXELFORMAT
+    caps = DDSCAPS_TEXTURE
+    if mip_count > 1:
+        flags |= DDSD_MIPMAPCOUNT
+        caps |= DDSCAPS_COMPLEX | DDSCAPS_MIPMAP
+    if fourcc in BLOCK_SIZES:
+        flags |= DDSD_LINEARSIZE
+        pitch = max(1, (width + 3) // 4) * max(1, (height + 3) // 4) * BLOCK_SIZES[fourcc]
+        pixel_format = struct.pack('<II4s5I', 32, DDPF_FOURCC, fourcc.encode('ascii'), 0, 0, 0, 0, 0)
+        extension = b''
+    else:
+        # uncompressed rgba is named by the DXGI format of the DX10 extension header
+        flags |= DDSD_PITCH
+        pitch = width * 4
+        pixel_format = struct.pack('<II4s5I', 32, DDPF_FOURCC, b'DX10', 0, 0, 0, 0, 0)
+        extension = struct.pack('<5I', DXGI_FORMAT_R8G8B8A8_UNORM, D3D10_RESOURCE_DIMENSION_TEXTURE2D, 0, 1, 0)
+    header = struct.pack('<4s7I44x', b'DDS ', 124, flags, height, width, pitch, 0, mip_count)
+    return header + pixel_format + struct.pack('<4I4x', caps, 0, 0, 0) + extension
+
+
+def encode_dds(pixels, fourcc='DXT1', mipmaps=True):
+    """Encode an image to the bytes of a DDS file.
+
+    :param pixels: array of shape (height, width, 3 or 4), the first row being the top of the image,
+        of floats in [0, 1] or of 8 bit integers
+    :param fourcc: one of FORMATS
+    :param mipmaps: whether to add the full mipmap chain, or store the image only
+    """
+    if fourcc not in FORMATS:
+        raise ValueError(f"Unsupported DDS format '{fourcc}'")
+    pixels = np.asarray(pixels)
+    if pixels.ndim != 3 or pixels.shape[2] not in (3, 4) or not pixels.shape[0] or not pixels.shape[1]:
+        raise ValueError(f"Expected an image of shape (height, width, 3 or 4), got {pixels.shape}")
+    if np.issubdtype(pixels.dtype, np.integer):
+        pixels = pixels / 255.0
+    pixels = pixels.astype(np.float32)
+    if pixels.shape[2] == 3:
+        pixels = np.concatenate((pixels, np.ones(pixels.shape[:2] + (1,), dtype=np.float32)), axis=2)
+    levels = get_mipmaps(pixels) if mipmaps else [pixels]
+    height, width = pixels.shape[:2]
+    payload = [encode_image(np.rint(np.clip(level, 0.0, 1.0) * 255.0).astype(np.uint8), fourcc) for level in levels]
+    return get_dds_header(width, height, len(levels), fourcc) + b''.join(payload)
+
+
+def encode_dds_batch(images, fourcc='DXT1', mipmaps=True, max_workers=None, mp_context=None):
+    """Encode several images with encode_dds, spreading them over a pool of processes.
+
+    :param images: sequence of pixel arrays, as accepted by encode_dds
+    :param fourcc: format of all images, or a sequence with the format of each image
+    :param max_workers: number of processes, None for one per cpu, 1 to encode in this process
+    :param mp_context: multiprocessing context that starts the processes, None for the default one
+    :return: list with the bytes of the DDS file of each image
+    """
+    images = list(images)
+    fourccs = repeat(fourcc, len(images)) if isinstance(fourcc, str) else fourcc
+    if max_workers == 1 or len(images) < 2:
+        return [encode_dds(image, image_fourcc, mipmaps) for image, image_fourcc in zip(images, fourccs)]
+    with ProcessPoolExecutor(max_workers=max_workers, mp_context=mp_context) as executor:
+        return list(executor.map(encode_dds, images, fourccs, repeat(mipmaps)))
@@ -0,0 +1,340 @@
+"""Extraction of the transform keys of keyframe animations into plain arrays.
+
+The extracted keys do not reference any blocks, so they can be pickled. This allows kf files
+to be parsed in worker processes, which only send the keys back to the process that creates
+the animations from them.
+"""
+
+# ***** BEGIN LICENSE BLOCK *****
+# 
+# Copyright © 2013, NIF File Format Library and Tools contributors.
+# All rights reserved.
+# 
+# Redistribution and use in source and binary forms, with or without
+# modification, are permitted provided that the following conditions
+# are met:
+# 
+#    * Redistributions of source code must retain the above copyright
+#      notice, this list of conditions and the following disclaimer.
+# 
+#    * Redistributions in binary form must reproduce the above
+#      copyright notice, this list of conditions and the following
+#      disclaimer in the documentation and/or other materials provided
+#      with the distribution.
+# 
+#    * Neither the name of the NIF File Format Library and Tools
+#      project nor the names of its contributors may be used to endorse
+#      or promote products derived from this software without specific
+#      prior written permission.
+# 
+# THIS SOFTWARE IS PROVIDED BY THE COPYRIGHT HOLDERS AND CONTRIBUTORS
+# "AS IS" AND ANY EXPRESS OR IMPLIED WARRANTIES, INCLUDING, BUT NOT
+# LIMITED TO, THE IMPLIED WARRANTIES OF MERCHANTABILITY AND FITNESS
+# FOR A PARTICULAR PURPOSE ARE DISCLAIMED. IN NO EVENT SHALL THE
+# COPYRIGHT OWNER OR CONTRIBUTORS BE LIABLE FOR ANY DIRECT, INDIRECT,
+# INCIDENTAL, SPECIAL, EXEMPLARY, OR CONSEQUENTIAL DAMAGES (INCLUDING,
+# BUT NOT LIMITED TO, PROCUREMENT OF SUBSTITUTE GOODS OR SERVICES;
+# LOSS OF USE, DATA, OR PROFITS; OR BUSINESS INTERRUPTION) HOWEVER
+# CAUSED AND ON ANY THEORY OF LIABILITY, WHETHER IN CONTRACT, STRICT
+# LIABILITY, OR TORT (INCLUDING NEGLIGENCE OR OTHERWISE) ARISING IN
+# ANY WAY OUT OF THE USE OF THIS SOFTWARE, EVEN IF ADVISED OF THE
+# POSSIBILITY OF SUCH DAMAGE.
+#
+# ***** END LICENSE BLOCK *****
+
+import numbers
+from bisect import bisect_left
+
+import numpy as np
+
+import nifgen.formats.nif as NifFormat
+from nifgen.spells.nif import NifToaster
+from nifgen.spells.nif.fix import SpellScale
+
+
+class TransformKeys:
+    """The transform keys that a controller stores for a single node."""
+
+    def __init__(self, node_name):
+        self.node_name = node_name
+        # nodes whose controller has no keys are kept in their bind pose
+        self.has_keys = False
+        # false for controllers whose keys are not transforms, eg. NiBSplineCompFloatInterpolator
+        self.is_supported = True
+        # the flags of older controllers, which store the extrapolation per controller
+        self.flags = None
+        # 'QUATERNION' or 'XYZ' for euler rotation keys, None if the keys say nothing about rotations
+        self.rotation_mode = None
+        # tuples of channel ('translation', 'rotation', 'euler' or 'scale'), times, values and KeyType
+        self.channels = []
+
+
+class SequenceKeys:
+    """The transform keys of all nodes animated by a kf root block."""
+
+    def __init__(self, kf_root):
+        self.name = kf_root.name
+        self.root_type = type(kf_root).__name__
+        # false for kf roots that can not be imported
+        self.is_supported = True
+        # CycleType of the sequence, None if the root block does not store it
+        self.cycle_type = None
+        # (time, value) tuples of the text keys, None if there are no text keys
+        self.text_keys = None
+        # TransformKeys of all controlled nodes
+        self.targets = []
+
+
+def get_controller_data(ctrl):
+    """Return data for ctrl, look in interpolator (for newer games) or directly on ctrl"""
+    if hasattr(ctrl, 'interpolator') and ctrl.interpolator:
+        data = ctrl.interpolator.data
+    else:
+        # interpolators such as the B-spline ones hold their data themselves
+        data = getattr(ctrl, 'data', None)
+    # these have their data set as a KeyGroup on data
+    if isinstance(data, (NifFormat.classes.NiBoolData, NifFormat.classes.NiFloatData, NifFormat.classes.NiPosData)):
+        return data.data
+    return data
+
+
+def get_key_arrays(keys):
+    """Return the times and values of keys as float arrays, with one row per key for vector values."""
+    times = np.array([key.time for key in keys], dtype=float)
+    values = [key.value for key in keys]
+    if values and not isinstance(values[0], numbers.Real):
+        values = [tuple(value) for value in values]
+    return times, np.array(values, dtype=float)
+
+
+def interpolate(x_out, x_in, y_in):
+    """
+    sample (x_in I y_in) at x coordinates x_out
+    """
+    y_out = []
+    intervals = zip(x_in, x_in[1:], y_in, y_in[1:])
+    slopes = [(y2 - y1) / (x2 - x1) for x1, x2, y1, y2 in intervals]
+    # if we had just one input, slope will be 0 for constant extrapolation
+    if not slopes:
+        slopes = [0, ]
+    for x in x_out:
+        i = bisect_left(x_in, x) - 1
+        # clamp to valid range
+        i = max(min(i, len(slopes) - 1), 0)
+        y_out.append(y_in[i] + slopes[i] * (x - x_in[i]))
+    return y_out
+
+
+def has_keys(n_kfc):
+    """Check if a controller or interpolator has any transform keys."""
+    n_kfd = get_controller_data(n_kfc)
+    if isinstance(n_kfd, NifFormat.classes.NiKeyframeData):
+        return (n_kfd.num_rotation_keys > 0 or
+                (hasattr(n_kfd.translations, 'num_keys') and n_kfd.translations.num_keys > 0) or
+                (hasattr(n_kfd.scales, 'num_keys') and n_kfd.scales.num_keys > 0))
+    elif isinstance(n_kfc, NifFormat.classes.NiBSplineInterpolator):
+        return bool(n_kfc.basis_data and n_kfc.spline_data)
+    return False
+
+
+def get_transform_keys(n_kfc, node_name, fps):
+    """Extract the transform keys of a keyframe controller or interpolator.
+
+    :param n_kfc: The controller or interpolator.
+    :param node_name: The name of the node that it animates.
+    :param fps: The frame rate at which B-spline curves are sampled.
+    :return: The TransformKeys of the node.
+    """
+    transform_keys = TransformKeys(node_name)
+    transform_keys.has_keys = has_keys(n_kfc)
+    if not transform_keys.has_keys:
+        return transform_keys
+
+    if isinstance(n_kfc, NifFormat.classes.NiBSplineInterpolator):
+        if not isinstance(n_kfc, NifFormat.classes.NiBSplineTransformInterpolator):
+            # NiBSplineCompFloatInterpolator is used by WLP2 (tiger.kf), but only for non-LocRotScale data
+            # eg. bone stretching - see controlledblock.get_variable_1()
+            transform_keys.is_supported = False
+            return transform_keys
+        # the control points are not keys, so sample the curves at every frame
+        times = n_kfc.get_sample_times(fps)
+        transform_keys.rotation_mode = "QUATERNION"
+        for channel, values in (("translation", n_kfc.sample_translations(times)),
+                                ("rotation", n_kfc.sample_rotations(times)),
+                                ("scale", n_kfc.sample_scales(times))):
+            if values is not None:
+                transform_keys.channels.append((channel, times, values, int(NifFormat.classes.KeyType.LINEAR_KEY)))
+        return transform_keys
+    elif isinstance(n_kfc, NifFormat.classes.NiMultiTargetTransformController):
+        # not sure what this is used for
+        transform_keys.is_supported = False
+        return transform_keys
+
+    # ZT2 - get extrapolation for every kfc
+    if isinstance(n_kfc, NifFormat.classes.NiKeyframeController):
+        transform_keys.flags = int(n_kfc.flags)
+    n_kfd = get_controller_data(n_kfc)
+    if n_kfd.rotation_type == 4:
+        transform_keys.rotation_mode = "XYZ"
+        # euler keys need not be sampled at the same time in KFs
+        # but we need complete key sets to do the space conversion
+        # so perform linear interpolation to import all keys properly
+
+        # get all the times and keys for each coordinate
+        times_keys = [([key.time for key in euler.keys], [key.value for key in euler.keys])
+                      for euler in n_kfd.xyz_rotations]
+        # the unique time stamps we have to sample all curves at
+        times_all = sorted(set(times_keys[0][0] + times_keys[1][0] + times_keys[2][0]))
+        # todo - this assumes that all three channels are keyframed, but it seems like this need not be the case
+        # resample each coordinate for all times
+        keys_res = [interpolate(times_all, times, keys) for times, keys in times_keys]
+        # for eulers, the actual interpolation type is apparently stored per channel
+        transform_keys.channels.append(("euler", np.array(times_all, dtype=float), np.column_stack(keys_res),
+                                        int(n_kfd.xyz_rotations[0].interpolation)))
+    else:
+        transform_keys.rotation_mode = "QUATERNION"
+        transform_keys.channels.append(("rotation", *get_key_arrays(n_kfd.quaternion_keys), int(n_kfd.rotation_type)))
+    transform_keys.channels.append(("scale", *get_key_arrays(n_kfd.scales.keys), int(n_kfd.scales.interpolation)))
+    transform_keys.channels.append(("translation", *get_key_arrays(n_kfd.translations.keys),
+                                    int(n_kfd.translations.interpolation)))
+    return transform_keys
+
+
+def get_text_keys(txk):
+    """Return the (time, value) tuples of a NiTextKeyExtraData, or None if there is none."""
+    if txk:
+        return [(key.time, key.value) for key in txk.text_keys]
+
+
+def get_sequence_keys(kf_root, fps):
+    """Extract the transform keys of all nodes that a kf root block animates.
+
+    :param kf_root: A NiControllerSequence, NiSequenceStreamHelper or NiSequenceData.
+    :param fps: The frame rate at which B-spline curves are sampled.
+    :return: The SequenceKeys of the root.
+    """
+    sequence = SequenceKeys(kf_root)
+    if isinstance(kf_root, NifFormat.classes.NiControllerSequence):
+        for controlledblock in kf_root.controlled_blocks:
+            # get bone name
+            # todo [pyffi] fixed get_node_name() is up, make release and clean up here
+            # ZT2 - old way is not supported by pyffi's get_node_name()
+            n_name = controlledblock.target_name
+            # fallout (node_name) & Loki (StringPalette)
+            if not n_name:
+                n_name = controlledblock.get_node_name()
+            # fallout, Loki
+            kfc = controlledblock.interpolator
+            if not kfc:
+                # ZT2
+                kfc = controlledblock.controller
+            if kfc:
+                sequence.targets.append(get_transform_keys(kfc, n_name, fps))
+        sequence.text_keys = get_text_keys(kf_root.text_keys)
+        if hasattr(kf_root, 'cycle_type'):
+            sequence.cycle_type = int(kf_root.cycle_type)
+    elif isinstance(kf_root, NifFormat.classes.NiSequenceStreamHelper):
+        # import parallel trees of extra datas and keyframe controllers
+        extra = kf_root.extra_data
+        controller = kf_root.controller
+        textkeys = None
+        while extra and controller:
+            # textkeys in the stack do not specify node names, import as markers
+            while isinstance(extra, NifFormat.classes.NiTextKeyExtraData):
+                textkeys = extra
+                extra = extra.next_extra_data
+
+            # grabe the node name from string data
+            if isinstance(extra, NifFormat.classes.NiStringExtraData):
+                sequence.targets.append(get_transform_keys(controller, extra.string_data, fps))
+            # grab next pair of extra and controller
+            extra = extra.next_extra_data
+            controller = controller.next_controller
+        sequence.text_keys = get_text_keys(textkeys)
+    elif isinstance(kf_root, NifFormat.classes.NiSequenceData):
+        for evaluator in kf_root.evaluators:
+            sequence.targets.append(get_transform_keys(evaluator, evaluator.node_name, fps))
+        sequence.text_keys = get_text_keys(kf_root.find(block_type=NifFormat.classes.NiTextKeyExtraData))
+        sequence.cycle_type = int(kf_root.cycle_type)
+    else:
+        sequence.is_supported = False
+    return sequence
+
+
+def get_key_times(roots):
+    """Return the times of all keys in the trees of roots."""
+    key_times = []
+    for root in roots:
+        for kfd in root.tree(block_type=NifFormat.classes.NiKeyframeData):
+            key_times.extend(key.time for key in kfd.translations.keys)
+            key_times.extend(key.time for key in kfd.scales.keys)
+            key_times.extend(key.time for key in kfd.quaternion_keys)
+            for dimension in kfd.xyz_rotations:
+                key_times.extend(key.time for key in dimension.keys)
+
+        for kfi in root.tree(block_type=NifFormat.classes.NiBSplineInterpolator):
+            if not kfi.basis_data:
+                # skip bsplines without basis data (eg bowidle.kf in Oblivion)
+                continue
+            key_times.extend(
+                point * (kfi.stop_time - kfi.start_time)
+                / (kfi.basis_data.num_control_points - 2)
+                for point in range(kfi.basis_data.num_control_points - 2))
+
+        for uv_data in root.tree(block_type=NifFormat.classes.NiUVData):
+            for uv_group in uv_data.uv_groups:
+                key_times.extend(key.time for key in uv_group.keys)
+    return key_times
+
+
+def get_frames_per_second(roots, fps):
+    """Find the common frame rate that places the keys in the trees of roots closest to whole frames.
+
+    :param roots: The root blocks.
+    :param fps: The current frame rate, which is kept unless another one fits the keys better.
+    :return: The frame rate, or None if nothing is animated.
+    """
+    key_times = get_key_times(roots)
+    # not animated
+    if not key_times:
+        return None
+
+    key_times = sorted(set(key_times))
+    lowest_diff = sum(abs(int(time * fps + 0.5) - (time * fps)) for time in key_times)
+
+    # for test_fps in range(1,120): #disabled, used for testing
+    for test_fps in [20, 24, 25, 30, 35]:
+        diff = sum(abs(int(time * test_fps + 0.5) - (time * test_fps)) for time in key_times)
+        if diff < lowest_diff:
+            lowest_diff = diff
+            fps = test_fps
+    return fps
+
+
+def load_kf(file_path, scale=1.0, fps=30):
+    """Read a kf file, scale it and extract the transform keys of all its roots.
+
+    This only depends on nifgen, so it can run in worker processes.
+
+    :param file_path: The path of the kf file.
+    :param scale: The scale correction to apply to the file.
+    :param fps: The frame rate to use if no other one fits the keys better.
+    :return: The frame rate of the keys, or None if nothing is animated, the SequenceKeys of all roots, and the number
+        of blocks in the file.
+    """
+    with open(file_path, "rb") as kf_stream:
+        modification, (version, user_version, bs_version) = NifFormat.NifFile.inspect_version_only(kf_stream)
+        if version == -1:
+            raise ValueError("Unsupported NIF version.")
+        elif version < 0:
+            raise ValueError("Not a NIF file.")
+        data = NifFormat.NifFile.from_stream(kf_stream)
+
+    if scale != 1.0:
+        toaster = NifToaster()
+        toaster.scale = scale
+        SpellScale(data=data, toaster=toaster).recurse()
+
+    key_fps = get_frames_per_second(data.roots, fps)
+    sequences = [get_sequence_keys(kf_root, fps if key_fps is None else key_fps) for kf_root in data.roots]
+    return key_fps, sequences, len(data.blocks)
@@ -1,4 +1,4 @@
-"""Create mopps using mopper.exe"""
+"""Create mopps, either with the native compiler of this module for geometry with a single sub shape, or using mopper.exe"""
 
 # ***** BEGIN LICENSE BLOCK *****
 #
@@ -37,11 +37,29 @@
 #
 # ***** END LICENSE BLOCK *****
 
+import math
 import os.path
 import tempfile
 import subprocess
 import sys
 
+import numpy as np
+
+# margin around the geometry, in the units of the vertices
+MOPP_MARGIN = 0.01
+# number of steps of the quantized mopp coordinates that span the geometry
+MOPP_RESOLUTION = 254
+
+# mopp opcodes
+MOPP_JUMP8 = 0x05
+MOPP_JUMP16 = 0x06
+MOPP_JUMP24 = 0x07
+MOPP_SPLIT_X = 0x10
+MOPP_BOUND_X = 0x26
+MOPP_TERM4 = 0x30
+MOPP_TERM8 = 0x50
+MOPP_TERM16 = 0x51
+
 def _skip_terminal_chars(stream):
     """Skip initial terminal characters (happens when mopper runs via wine)."""
     firstline = stream.readline()
@@ -193,6 +211,194 @@ def getMopperOriginScaleCodeWelding(vertices, triangles, material_indices=None):
         outfile.close()
     return origin, scale, moppcode, welding_info
 
+def _get_welding_info(vertices, triangles):
+    """Return the welding info of each triangle: for each of its edges, the angle
+    to the triangle across that edge, in steps of 12 degrees, packed in 5 bits.
+
+    A flat edge is 15, a convex edge of a cube is 22, and an open edge is 30.
+    """
+    # merge coincident vertices, so edges are found across duplicated vertices
+    _, vertex_ids = np.unique(vertices, axis=0, return_inverse=True)
+    vertex_ids = vertex_ids.reshape(-1)[triangles]
+    corners = vertices[triangles]
+    normals = np.cross(corners[:, 1] - corners[:, 0], corners[:, 2] - corners[:, 0])
+    normals /= np.maximum(np.linalg.norm(normals, axis=1, keepdims=True), 1e-12)
+    # edge i of a triangle runs from its vertex i to vertex i + 1
+    num_vertices = len(vertices)
+    starts = vertex_ids.astype(np.int64)
+    ends = np.roll(starts, -1, axis=1)
+    keys = (starts * num_vertices + ends).reshape(-1)
+    reverse_keys = (ends * num_vertices + starts).reshape(-1)
+    # the neighbour across an edge runs along the same edge in the opposite direction
+    key_order = np.argsort(keys, kind="stable")
+    sorted_keys = keys[key_order]
+    positions = np.minimum(np.searchsorted(sorted_keys, reverse_keys), len(keys) - 1)
+    found = sorted_keys[positions] == reverse_keys
+    neighbours = key_order[positions] // 3
+    edges = (np.roll(corners, -1, axis=1) - corners).reshape(-1, 3)
+    edges /= np.maximum(np.linalg.norm(edges, axis=1, keepdims=True), 1e-12)
+    own_normals = np.repeat(normals, 3, axis=0)
+    other_normals = normals[neighbours]
+    # signed angle between the normals around the edge, positive when convex
+    angles = np.arctan2(
+        np.einsum("ij,ij->i", np.cross(own_normals, other_normals), edges),
+        np.einsum("ij,ij->i", own_normals, other_normals))
+    codes = np.clip(np.floor((angles + math.pi) * 15 / math.pi + 1e-4), 0, 30).astype(np.int64)
+    codes[~found] = 30
+    codes = codes.reshape(-1, 3)
+    return (codes[:, 0] | (codes[:, 1] << 5) | (codes[:, 2] << 10)).tolist()
+
+def _get_mopp_tree(centres, tri_lo, tri_hi):
+    """Sort the triangles into a balanced binary tree, splitting every node at
+    the median of the triangle centres along the axis where they spread most.
+    All nodes of a level are split at once.
+
+    :return: The triangle indices in tree order, and a dict mapping the
+        (start, end) range of each node in that order to the quantized
+        lower and upper bounds of its triangles.
+    """
+    num_triangles = len(centres)
+    order = np.arange(num_triangles)
+    starts = np.zeros(1, dtype=np.int64)
+    bounds = {}
+    while True:
+        ends = np.append(starts[1:], num_triangles)
+        sizes = ends - starts
+        segments = np.repeat(np.arange(len(starts)), sizes)
+        node_centres = centres[order]
+        spread = np.maximum.reduceat(node_centres, starts) - np.minimum.reduceat(node_centres, starts)
+        axes = spread.argmax(axis=1)[segments]
+        order = order[np.lexsort((node_centres[np.arange(num_triangles), axes], segments))]
+        node_lo = np.minimum.reduceat(tri_lo[order], starts)
+        node_hi = np.maximum.reduceat(tri_hi[order], starts)
+        bounds.update(zip(zip(starts.tolist(), ends.tolist()),
+                          zip(node_lo.tolist(), node_hi.tolist())))
+        if sizes.max() == 1:
+            return order.tolist(), bounds
+        starts = np.sort(np.concatenate((starts, ((starts + ends) // 2)[sizes > 1])))
+
+def _get_mopp_terminal(triangle):
+    """Return the mopp code that reports a triangle."""
+    if triangle < 32:
+        return [MOPP_TERM4 + triangle]
+    elif triangle < 256:
+        return [MOPP_TERM8, triangle]
+    elif triangle < 65536:
+        return [MOPP_TERM16, triangle >> 8, triangle & 255]
+    raise ValueError("cannot create a mopp for more than 65536 triangles")
+
+def _get_mopp_jump(length):
+    """Return the mopp code that skips the given number of bytes."""
+    if length < 256:
+        return [MOPP_JUMP8, length]
+    elif length < 65536:
+        return [MOPP_JUMP16, length >> 8, length & 255]
+    return [MOPP_JUMP24, length >> 16, (length >> 8) & 255, length & 255]
+
+def _get_mopp_code(order, bounds, start, end, region_lo, region_hi):
+    """Return the mopp code of the node of the tree spanning start to end,
+    within the region that the tests of its parents leave for it."""
+    lo, hi = bounds[start, end]
+    mopp = []
+    # bound checks on the axes where the node is smaller than its region,
+    # z first like mopper
+    for axis in (2, 1, 0):
+        if lo[axis] > region_lo[axis] or hi[axis] < region_hi[axis]:
+            mopp.extend((MOPP_BOUND_X + axis, lo[axis], hi[axis]))
+    if end - start == 1:
+        mopp.extend(_get_mopp_terminal(order[start]))
+        return mopp
+    middle = (start + end) // 2
+    left_hi = bounds[start, middle][1]
+    right_lo = bounds[middle, end][0]
+    # test the axis along which the two halves overlap least
+    axis = max(range(3), key=lambda i: right_lo[i] - left_hi[i])
+    left_region_hi = list(hi)
+    left_region_hi[axis] = left_hi[axis]
+    right_region_lo = list(lo)
+    right_region_lo[axis] = right_lo[axis]
+    left = _get_mopp_code(order, bounds, start, middle, lo, left_region_hi)
+    right = _get_mopp_code(order, bounds, middle, end, right_region_lo, hi)
+    mopp.extend((MOPP_SPLIT_X + axis, left_hi[axis], right_lo[axis]))
+    if len(left) < 256:
+        mopp.append(len(left))
+        mopp.extend(left)
+        mopp.extend(right)
+    else:
+        # the jump offset of the first branch is a single byte, so put the
+        # long branch last, and reach it by jumping over the short one
+        jump = _get_mopp_jump(len(right))
+        mopp.append(len(jump))
+        mopp.extend(jump)
+        mopp.extend(right)
+        mopp.extend(left)
+    return mopp
+
+def compileMoppOriginScaleCodeWelding(vertices, triangles, material_indices=None):
+    """Generate mopp code and welding info for given geometry, in process, as a
+    drop in replacement of L{getMopperOriginScaleCodeWelding}. Raises
+    ValueError if the geometry cannot be represented by a mopp.
+
+    The mopp is a binary tree of median splits along the x, y, and z axes,
+    with bound checks wherever a node is smaller than the region its parents
+    leave for it, and a single triangle at each leaf, as a mopp terminal
+    reports one triangle and ends its branch. This takes about 11 to 14
+    bytes of code per triangle on large meshes.
+
+    The triangles are reported by their index alone, without the sub shape
+    that their material comes from, so this only replaces mopper.exe for
+    geometry with a single sub shape.
+
+    For example, creating a mopp for the standard cube:
+
+    >>> orig, scale, moppcode, welding_info = compileMoppOriginScaleCodeWelding(
+    ...     [(1, 1, 1), (0, 0, 0), (0, 0, 1), (0, 1, 0),
+    ...      (1, 0, 1), (0, 1, 1), (1, 1, 0), (1, 0, 0)],
+    ...     [(0, 4, 6), (1, 6, 7), (2, 1, 4), (3, 1, 2),
+    ...      (0, 2, 4), (4, 1, 7), (6, 4, 7), (3, 0, 6),
+    ...      (0, 3, 5), (3, 2, 5), (2, 0, 5), (1, 3, 6)])
+    >>> round(scale)
+    16319749
+    >>> ["%6.3f" % value for value in orig]
+    ['-0.010', '-0.010', '-0.010']
+    >>> moppcode[:9]
+    [40, 0, 254, 39, 0, 254, 38, 0, 254]
+    >>> welding_info
+    [23030, 23247, 23030, 16086, 23247, 23247, 23247, 23247, 23247, 23247, 23247, 16086]
+
+    :raise ``ValueError``: If there is no geometry, or too many triangles.
+    :param vertices: List of vertices.
+    :type vertices: list of tuples of floats
+    :param triangles: List of triangles (indices referring back to vertex list).
+    :type triangles: list of tuples of ints
+    :param material_indices: Ignored, accepted for compatibility with
+        L{getMopperOriginScaleCodeWelding}. The mopp does not encode
+        materials, so use the mopper for geometry with several sub shapes.
+    :return: The origin as a tuple of floats, the mopp scale as a float,
+        the mopp code as a list of ints, and the welding info as a list of
+        ints.
+    """
+    vertices = np.asarray(vertices, dtype=np.float64).reshape(-1, 3)
+    triangles = np.asarray(triangles, dtype=np.int64).reshape(-1, 3)
+    if not len(vertices) or not len(triangles):
+        raise ValueError("cannot create a mopp without triangles")
+    if len(triangles) > 65536:
+        raise ValueError("cannot create a mopp for more than 65536 triangles")
+    origin = vertices.min(axis=0) - MOPP_MARGIN
+    size = (vertices.max(axis=0) - vertices.min(axis=0)).max() + 2 * MOPP_MARGIN
+    # a mopp coordinate is the high byte of the 24 bit integer coordinates,
+    # which are obtained by multiplying with the scale
+    scale = 256 * 256 * MOPP_RESOLUTION / size
+    step = size / MOPP_RESOLUTION
+    corners = vertices[triangles]
+    tri_lo = np.clip(np.floor((corners.min(axis=1) - MOPP_MARGIN - origin) / step), 0, 255).astype(np.int64)
+    tri_hi = np.clip(np.ceil((corners.max(axis=1) + MOPP_MARGIN - origin) / step), 0, 255).astype(np.int64)
+    order, bounds = _get_mopp_tree(corners.mean(axis=1), tri_lo, tri_hi)
+    # the root always checks all bounds
+    moppcode = _get_mopp_code(order, bounds, 0, len(order), [-1, -1, -1], [256, 256, 256])
+    welding_info = _get_welding_info(vertices, triangles)
+    return tuple(origin.tolist()), float(scale), moppcode, welding_info
+
 if __name__ == "__main__":
     import doctest
     doctest.testmod()
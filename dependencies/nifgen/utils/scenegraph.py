@@ -0,0 +1,134 @@
+"""Parent index of a NiAVObject tree, with memoized transforms relative to its root.
+
+NiAVObject.get_transform searches the tree from the root block on every call. This index
+walks the tree once, records the parent of every NiAVObject in it, and caches the transform
+of each block relative to the root, so the transforms of all blocks resolve in one pass.
+"""
+
+# ***** BEGIN LICENSE BLOCK *****
+# 
+# Copyright © 2013, NIF File Format Library and Tools contributors.
+# All rights reserved.
+# 
+# Redistribution and use in source and binary forms, with or without
+# modification, are permitted provided that the following conditions
+# are met:
+# 
+#    * Redistributions of source code must retain the above copyright
+#      notice, this list of conditions and the following disclaimer.
+# 
+#    * Redistributions in binary form must reproduce the above
+#      copyright notice, this list of conditions and the following
+#      disclaimer in the documentation and/or other materials provided
+#      with the distribution.
+# 
+#    * Neither the name of the NIF File Format Library and Tools
+#      project nor the names of its contributors may be used to endorse
+#      or promote products derived from this software without specific
+#      prior written permission.
+# 
+# THIS SOFTWARE IS PROVIDED BY THE COPYRIGHT HOLDERS AND CONTRIBUTORS
+# "AS IS" AND ANY EXPRESS OR IMPLIED WARRANTIES, INCLUDING, BUT NOT
+# LIMITED TO, THE IMPLIED WARRANTIES OF MERCHANTABILITY AND FITNESS
+# FOR A PARTICULAR PURPOSE ARE DISCLAIMED. IN NO EVENT SHALL THE
+# COPYRIGHT OWNER OR CONTRIBUTORS BE LIABLE FOR ANY DIRECT, INDIRECT,
+# INCIDENTAL, SPECIAL, EXEMPLARY, OR CONSEQUENTIAL DAMAGES (INCLUDING,
+# BUT NOT LIMITED TO, PROCUREMENT OF SUBSTITUTE GOODS OR SERVICES;
+# LOSS OF USE, DATA, OR PROFITS; OR BUSINESS INTERRUPTION) HOWEVER
+# CAUSED AND ON ANY THEORY OF LIABILITY, WHETHER IN CONTRACT, STRICT
+# LIABILITY, OR TORT (INCLUDING NEGLIGENCE OR OTHERWISE) ARISING IN
+# ANY WAY OUT OF THE USE OF THIS SOFTWARE, EVEN IF ADVISED OF THE
+# POSSIBILITY OF SUCH DAMAGE.
+#
+# ***** END LICENSE BLOCK *****
+
+import nifgen.formats.nif as NifFormat
+
+
+class SceneGraphIndex:
+    """The parents of all NiAVObject blocks under a root block, in topological order.
+
+    The cached transforms are dropped as soon as any NiAVObject's transform is changed through
+    set_transform or apply_scale. The parents are not updated, so build a new index after
+    adding, removing or moving blocks.
+    """
+
+    def __init__(self, root):
+        """Index the tree under root, following the same first found chains as find_chain.
+
+        :param root: The block relative to which transforms are calculated.
+        """
+        self.root = root
+        # maps each NiAVObject to its parent, the root has None
+        self.parents = {}
+        # all indexed blocks, parents before their children
+        self.order = []
+        self._transforms = {}
+        self._generation = NifFormat.classes.NiAVObject.transform_generation
+        # depth first search, where the first visit of a block decides its parent
+        stack = [(root, None)]
+        while stack:
+            block, parent = stack.pop()
+            if block in self.parents:
+                continue
+            self.parents[block] = parent
+            self.order.append(block)
+            children = [child for child in block.get_refs() if isinstance(child, NifFormat.classes.NiAVObject)]
+            # push in reverse, so the children are visited in order
+            stack.extend((child, block) for child in reversed(children))
+
+    def __contains__(self, block):
+        return block in self.parents
+
+    def get_parent(self, block):
+        """Return the parent of block in the tree, or None for the root."""
+        return self.parents[block]
+
+    def get_chain(self, block):
+        """Return the chain of blocks from the root to block, like root.find_chain(block)."""
+        if block not in self.parents:
+            return []
+        chain = []
+        while block is not None:
+            chain.append(block)
+            block = self.parents[block]
+        chain.reverse()
+        return chain
+
+    def get_transform(self, block):
+        """Return the transform of block relative to the root, equal to block.get_transform(root).
+
+        :param block: A NiAVObject in the tree.
+        :return: A new matrix, which can be modified freely.
+        """
+        return self._get_transform(block).get_copy()
+
+    def get_transforms(self):
+        """Return a dict mapping every NiAVObject in the tree to its transform relative to the root."""
+        return {block: self.get_transform(block) for block in self.order}
+
+    def _get_transform(self, block):
+        if self._generation != NifFormat.classes.NiAVObject.transform_generation:
+            self._transforms.clear()
+            self._generation = NifFormat.classes.NiAVObject.transform_generation
+        try:
+            return self._transforms[block]
+        except KeyError:
+            pass
+        if block not in self.parents:
+            raise ValueError(
+                'cannot find a chain of NiAVObject blocks '
+                'between %s and %s.' % (block.name, self.root.name))
+        # collect the blocks whose transform has not been cached yet, up to the root
+        missing = []
+        while block is not None and block not in self._transforms:
+            missing.append(block)
+            block = self.parents[block]
+        for block in reversed(missing):
+            transform = block.get_transform()
+            parent = self.parents[block]
+            # like get_transform, the root's own transform is left out, unless it is the block itself
+            if parent is not None and parent is not self.root:
+                transform *= self._transforms[parent]
+            self._transforms[block] = transform
+        return transform
@@ -0,0 +1,164 @@
+"""Linear blend skinning of vertices and normals, using numpy.
+
+The influences of the bones on the vertices are passed as flat arrays, with one entry
+per vertex index, bone index and weight, so they can be gathered from either the bone
+list of a NiSkinData or the partitions of a NiSkinPartition.
+"""
+
+# ***** BEGIN LICENSE BLOCK *****
+# 
+# Copyright © 2013, NIF File Format Library and Tools contributors.
+# All rights reserved.
+# 
+# Redistribution and use in source and binary forms, with or without
+# modification, are permitted provided that the following conditions
+# are met:
+# 
+#    * Redistributions of source code must retain the above copyright
+#      notice, this list of conditions and the following disclaimer.
+# 
+#    * Redistributions in binary form must reproduce the above
+#      copyright notice, this list of conditions and the following
+#      disclaimer in the documentation and/or other materials provided
+#      with the distribution.
+# 
+#    * Neither the name of the NIF File Format Library and Tools
+#      project nor the names of its contributors may be used to endorse
+#      or promote products derived from this software without specific
+#      prior written permission.
+# 
+# THIS SOFTWARE IS PROVIDED BY THE COPYRIGHT HOLDERS AND CONTRIBUTORS
+# "AS IS" AND ANY EXPRESS OR IMPLIED WARRANTIES, INCLUDING, BUT NOT
+# LIMITED TO, THE IMPLIED WARRANTIES OF MERCHANTABILITY AND FITNESS
+# FOR A PARTICULAR PURPOSE ARE DISCLAIMED. IN NO EVENT SHALL THE
+# COPYRIGHT OWNER OR CONTRIBUTORS BE LIABLE FOR ANY DIRECT, INDIRECT,
+# INCIDENTAL, SPECIAL, EXEMPLARY, OR CONSEQUENTIAL DAMAGES (INCLUDING,
+# BUT NOT LIMITED TO, PROCUREMENT OF SUBSTITUTE GOODS OR SERVICES;
+# LOSS OF USE, DATA, OR PROFITS; OR BUSINESS INTERRUPTION) HOWEVER
+# CAUSED AND ON ANY THEORY OF LIABILITY, WHETHER IN CONTRACT, STRICT
+# LIABILITY, OR TORT (INCLUDING NEGLIGENCE OR OTHERWISE) ARISING IN
+# ANY WAY OUT OF THE USE OF THIS SOFTWARE, EVEN IF ADVISED OF THE
+# POSSIBILITY OF SUCH DAMAGE.
+#
+# ***** END LICENSE BLOCK *****
+
+import numpy as np
+from numpy.lib.recfunctions import structured_to_unstructured
+
+
+def get_bone_list_influences(bone_list):
+    """Gather the influences stored in the bone list of a NiSkinData.
+
+    :param bone_list: The bone data of the skin, in the order of the skin instance's bones.
+    :return: Arrays of vertex indices, bone indices and weights.
+    """
+    vertex_indices = []
+    bone_indices = []
+    weights = []
+    for bone_index, bone_data in enumerate(bone_list):
+        bone_weights = bone_data.vertex_weights
+        vertex_indices.append(np.fromiter((w.index for w in bone_weights), dtype=np.intp, count=len(bone_weights)))
+        weights.append(np.fromiter((w.weight for w in bone_weights), dtype=np.float64, count=len(bone_weights)))
+        bone_indices.append(np.full(len(bone_weights), bone_index, dtype=np.intp))
+    return concatenate_influences(vertex_indices, bone_indices, weights)
+
+
+def get_partition_influences(partitions, num_vertices):
+    """Gather the influences stored in the partitions of a NiSkinPartition.
+
+    A vertex that appears in several partitions takes its weights from the first partition
+    that weights it. Zero weights are dropped.
+
+    :param partitions: The partitions of the skin partition.
+    :param num_vertices: The number of vertices of the skinned geometry.
+    :return: Arrays of vertex indices, bone indices into the skin instance's bones and weights.
+    """
+    weighted = np.zeros(num_vertices, dtype=bool)
+    vertex_indices = []
+    bone_indices = []
+    weights = []
+    for partition in partitions:
+        vertex_map = np.asarray(partition.vertex_map, dtype=np.intp)
+        part_weights = np.asarray(partition.vertex_weights, dtype=np.float64)
+        part_bone_indices = np.asarray(partition.bone_indices, dtype=np.intp)
+        if not len(vertex_map) or part_weights.size == 0 or part_bone_indices.size == 0:
+            continue
+        part_weights = part_weights.reshape(len(vertex_map), -1)
+        part_bone_indices = part_bone_indices.reshape(len(vertex_map), -1)
+        # the first occurrence of every vertex that no earlier partition weighted
+        unique_vertices, first = np.unique(vertex_map, return_index=True)
+        first = first[~weighted[unique_vertices]]
+        part_weights = part_weights[first]
+        mask = part_weights > 0.0
+        vertex_indices.append(np.broadcast_to(vertex_map[first, None], mask.shape)[mask])
+        # partition bone indices refer to the partition's own bone list
+        part_bones = np.asarray(partition.bones, dtype=np.intp)
+        bone_indices.append(part_bones[part_bone_indices[first]][mask])
+        weights.append(part_weights[mask])
+        weighted[vertex_map[first][mask.any(axis=1)]] = True
+    return concatenate_influences(vertex_indices, bone_indices, weights)
+
+
+def as_vectors(vectors):
+    """Convert Vector3 structs, either a record array or a list, to an (n, 3) float array."""
+    if isinstance(vectors, np.ndarray) and vectors.dtype.names:
+        return structured_to_unstructured(vectors, dtype=np.float64)
+    return np.array([(v.x, v.y, v.z) for v in vectors], dtype=np.float64).reshape(-1, 3)
+
+
+def concatenate_influences(vertex_indices, bone_indices, weights):
+    """Join lists of influence arrays, which may be empty."""
+    if not vertex_indices:
+        return np.empty(0, dtype=np.intp), np.empty(0, dtype=np.intp), np.empty(0, dtype=np.float64)
+    return np.concatenate(vertex_indices), np.concatenate(bone_indices), np.concatenate(weights)
+
+
+def skin(vertices, transforms, vertex_indices, bone_indices, weights, normals=None, rotations=None):
+    """Blend the vertices, and optionally the normals, by the weighted transforms of their bones.
+
+    Transforms use the row vector convention of the nif format, ie. a vertex v is moved to
+    v @ transform[:3, :3] + transform[3, :3].
+
+    :param vertices: (n, 3) array of vertices.
+    :param transforms: (b, 4, 4) array with the transform of every bone.
+    :param vertex_indices: Vertex index of every influence.
+    :param bone_indices: Bone index of every influence.
+    :param weights: Weight of every influence.
+    :param normals: Optional (n, 3) array of normals.
+    :param rotations: (b, 3, 3) array with the rotation of every bone, required for the normals.
+    :return: The skinned vertices, the skinned normals (None if no normals were given), and the sum
+        of the weights of every vertex.
+    """
+    vertices = np.asarray(vertices, dtype=np.float64)
+    transforms = np.asarray(transforms, dtype=np.float64)
+    num_vertices = len(vertices)
+    vertex_indices = np.asarray(vertex_indices, dtype=np.intp)
+    bone_indices = np.asarray(bone_indices, dtype=np.intp)
+    weights = np.asarray(weights, dtype=np.float64)
+    if normals is not None:
+        normals = np.asarray(normals, dtype=np.float64)
+        rotations = np.asarray(rotations, dtype=np.float64)
+
+    # transform the influences bone by bone, so no per influence matrices are needed
+    moved_vertices = np.empty((len(vertex_indices), 3))
+    moved_normals = np.empty((len(vertex_indices), 3)) if normals is not None else None
+    order = np.argsort(bone_indices, kind='stable')
+    bones, starts = np.unique(bone_indices[order], return_index=True)
+    for bone, influences in zip(bones, np.split(order, starts[1:])):
+        transform = transforms[bone]
+        influence_vertices = vertex_indices[influences]
+        moved_vertices[influences] = vertices[influence_vertices] @ transform[:3, :3] + transform[3, :3]
+        if normals is not None:
+            moved_normals[influences] = normals[influence_vertices] @ rotations[bone]
+
+    skinned_vertices = accumulate(vertex_indices, moved_vertices * weights[:, None], num_vertices)
+    skinned_normals = None
+    if normals is not None:
+        skinned_normals = accumulate(vertex_indices, moved_normals * weights[:, None], num_vertices)
+    sum_weights = np.bincount(vertex_indices, weights=weights, minlength=num_vertices)
+    return skinned_vertices, skinned_normals, sum_weights
+
+
+def accumulate(indices, values, length):
+    """Sum the rows of an (k, 3) array into the rows given by indices of a (length, 3) array."""
+    return np.stack([np.bincount(indices, weights=values[:, i], minlength=length) for i in range(3)], axis=1)
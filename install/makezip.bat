@@ -29,6 +29,11 @@ python -m pip install "PyFFI==%PYFFI_VERSION%" --target="%DEPS%"
 
 xcopy "%GENERATED_FOLDER%" "%DEPS%\nifgen" /s /q /i
 
+:: store the processed nif classes, so that the add-on doesn't process them on every start
+pushd %DEPS%
+python -c "from nifgen.formats.nif import write_type_cache; write_type_cache()"
+popd
+
 xcopy "%ROOT%"\AUTHORS.rst io_scene_niftools
 xcopy "%ROOT%"\CHANGELOG.rst io_scene_niftools
 xcopy "%ROOT%"\LICENSE.rst io_scene_niftools
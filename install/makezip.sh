@@ -35,6 +35,9 @@ python -m pip install "PyFFI==${PYFFI_VERSION}" --target="${DEPS_OUT:-${BUILD_DI
 
 echo "Copying loose files"
 cp -r "$GENERATED_FOLDER" "${DEPS_OUT:-${BUILD_DIR}/dependencies}/nifgen"
+
+echo "Generating nif type cache"
+(cd "${DEPS_OUT:-${BUILD_DIR}/dependencies}" && python -c "from nifgen.formats.nif import write_type_cache; write_type_cache()") || exit 1
 cp "${ROOT}"/AUTHORS.rst "${ADDON_OUT}"
 cp "${ROOT}"/CHANGELOG.rst "${ADDON_OUT}"
 cp "${ROOT}"/LICENSE.rst "${ADDON_OUT}"
@@ -35,6 +35,11 @@ python -m pip install "PyFFI==%PYFFI_VERSION%" --target="%DEPS%"
 
 xcopy "%GENERATED_FOLDER%" "%DEPS%\nifgen" /s /q /i
 
+:: store the processed nif classes, so that the add-on doesn't process them on every start
+pushd %DEPS%
+python -c "from nifgen.formats.nif import write_type_cache; write_type_cache()"
+popd
+
 :: Copy all obfuscated files recursively preserving structure
 if exist "%ROOT%\dist_obfuscated" (
     xcopy /e /i /y "%ROOT%\dist_obfuscated" "%DIR%\temp\io_scene_niftools" >nul 2>&1
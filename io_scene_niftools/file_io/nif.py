@@ -42,12 +42,14 @@ import os.path as path
 import nifgen.formats.nif as NifFormat
 
 from io_scene_niftools.utils.logging import NifLog, NifError
+from io_scene_niftools.utils.tracing import NifTrace, traced
 
 
 class NifFile:
     """Class to load and save a NifFile"""
 
     @staticmethod
+    @traced("read")
     def load_nif(file_path):
         """Loads a nif from the given file path"""
         NifLog.info(f"Importing {file_path}")
@@ -63,6 +65,7 @@ class NifFile:
                 NifLog.info(f"NIF file version: {version:x}")
                 NifLog.info(f"Reading {file_ext} file")
                 data = NifFormat.NifFile.from_stream(nif_stream)
+                NifTrace.count("blocks", len(data.blocks))
             elif version == -1:
                 raise NifError("Unsupported NIF version.")
             else:
@@ -45,6 +45,7 @@ from io_scene_niftools.nif_common import NifCommon
 from io_scene_niftools.utils import math
 from io_scene_niftools.utils.singleton import NifOp, NifData
 from io_scene_niftools.utils.logging import NifLog, NifError
+from io_scene_niftools.utils.tracing import NifTrace
 from io_scene_niftools.modules.nif_export import scene
 
 
@@ -91,7 +92,8 @@ class KfExport(NifCommon):
         # scale correction for the skeleton
         self.apply_scale(data, 1 / NifOp.props.scale_correction)
 
-        data.validate()
+        with NifTrace.span("validate"):
+            data.validate()
 
         # Log all blocks in the exported KF file for debugging
         NifLog.info(f"========== EXPORT KF FILE: {prefix + filebase + ext} ==========")
@@ -99,8 +101,9 @@ class KfExport(NifCommon):
         NifLog.info("========== END EXPORT KF BLOCKS ==========")
 
         kffile = os.path.join(directory, prefix + filebase + ext)
-        with open(kffile, "wb") as stream:
+        with NifTrace.span("write"), open(kffile, "wb") as stream:
             data.write(stream)
+        NifTrace.count("blocks", len(data.blocks))
 
         NifLog.info("Finished successfully")
         return {'FINISHED'}
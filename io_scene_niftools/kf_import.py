@@ -38,13 +38,20 @@
 # ***** END LICENSE BLOCK *****
 
 import os
+from concurrent.futures import ProcessPoolExecutor
+from concurrent.futures.process import BrokenProcessPool
+from contextlib import closing
+from functools import partial
+
+from nifgen.utils import keyframes
 
-from io_scene_niftools.file_io.nif import NifFile as KFFile
 from io_scene_niftools.modules.nif_import.animation.transform import TransformAnimation
 from io_scene_niftools.nif_common import NifCommon
 from io_scene_niftools.utils import math
 from io_scene_niftools.utils.singleton import NifOp
 from io_scene_niftools.utils.logging import NifLog, NifError
+from io_scene_niftools.utils.processes import get_process_context
+from io_scene_niftools.utils.tracing import NifTrace
 
 
 class KfImport(NifCommon):
@@ -68,20 +75,18 @@ class KfImport(NifCommon):
                 math.set_bone_orientation(b_armature.data.niftools.axis_forward, b_armature.data.niftools.axis_up)
                 # get nif space bind pose of armature here for all anims
                 self.transform_anim.get_bind_data(b_armature)
-            for kf_file in kf_files:
-                kfdata = KFFile.load_nif(kf_file)
-
-                # Log all blocks in the imported KF file for debugging
-                NifLog.info(f"========== IMPORT KF FILE: {os.path.basename(kf_file)} ==========")
-                self.log_kf_blocks(kfdata)
-                NifLog.info("========== END IMPORT KF BLOCKS ==========")
-
-                self.apply_scale(kfdata, NifOp.props.scale_correction)
+            NifLog.info(f"Scale Correction set to {NifOp.props.scale_correction}")
+            # close the loader if the import stops early, so it doesn't parse the remaining files
+            with closing(self.load_kf_files(kf_files)) as loaded_kf_files:
+                for kf_file, (fps, sequences) in loaded_kf_files:
+                    NifLog.info(f"Importing {kf_file}")
+                    self.log_kf_sequences(sequences)
 
-                # calculate and set frames per second
-                self.transform_anim.set_frames_per_second(kfdata.roots)
-                for kf_root in kfdata.roots:
-                    self.transform_anim.import_kf_root(kf_root, b_armature)
+                    # set frames per second
+                    self.transform_anim.set_scene_frames_per_second(fps)
+                    with NifTrace.span("animation"):
+                        for sequence in sequences:
+                            self.transform_anim.import_sequence_keys(sequence, b_armature)
 
         except NifError:
             return {'CANCELLED'}
@@ -89,79 +94,55 @@ class KfImport(NifCommon):
         NifLog.info("Finished successfully")
         return {'FINISHED'}
 
-    def log_kf_blocks(self, kfdata):
-        """Log all blocks in the KF file for debugging purposes."""
-        NifLog.info(f"KF File Version: {kfdata.version}")
-        NifLog.info(f"Number of roots: {len(kfdata.roots)}")
-        
-        for idx, root in enumerate(kfdata.roots):
-            NifLog.info(f"\nRoot Block {idx}: {type(root).__name__} - Name: '{root.name}'")
-            self._log_block_tree(root, indent=1)
-    
-    def _log_block_tree(self, block, indent=0, visited=None):
-        """Recursively log block tree structure."""
-        if visited is None:
-            visited = set()
-        
-        # Avoid infinite loops from circular references
-        block_id = id(block)
-        if block_id in visited:
-            return
-        visited.add(block_id)
-        
-        prefix = "  " * indent
-        block_type = type(block).__name__
-        
-        # Log basic block info
-        block_name = getattr(block, 'name', 'N/A')
-        NifLog.info(f"{prefix}├─ {block_type}: '{block_name}'")
-        
-        # Log important attributes based on block type
-        if hasattr(block, 'num_controlled_blocks'):
-            NifLog.info(f"{prefix}│  └─ num_controlled_blocks: {block.num_controlled_blocks}")
-        
-        if hasattr(block, 'controlled_blocks'):
-            for cb_idx, cb in enumerate(block.controlled_blocks):
-                target_name = getattr(cb, 'target_name', 'N/A')
-                node_name = getattr(cb, 'node_name', 'N/A') if hasattr(cb, 'node_name') else 'N/A'
-                NifLog.info(f"{prefix}│  └─ ControlledBlock[{cb_idx}]: target='{target_name}', node='{node_name}'")
-                
-                # Log interpolator info
-                if hasattr(cb, 'interpolator') and cb.interpolator:
-                    interp = cb.interpolator
-                    interp_type = type(interp).__name__
-                    NifLog.info(f"{prefix}│     └─ Interpolator: {interp_type}")
-                    
-                    # Log keyframe data if present
-                    if hasattr(interp, 'data') and interp.data:
-                        kfd = interp.data
-                        kfd_type = type(kfd).__name__
-                        NifLog.info(f"{prefix}│        └─ Data: {kfd_type}")
-                        
-                        if hasattr(kfd, 'num_rotation_keys'):
-                            NifLog.info(f"{prefix}│           ├─ rotation_keys: {kfd.num_rotation_keys}")
-                        if hasattr(kfd, 'translations') and hasattr(kfd.translations, 'num_keys'):
-                            NifLog.info(f"{prefix}│           ├─ translation_keys: {kfd.translations.num_keys}")
-                        if hasattr(kfd, 'scales') and hasattr(kfd.scales, 'num_keys'):
-                            NifLog.info(f"{prefix}│           └─ scale_keys: {kfd.scales.num_keys}")
-        
-        # Log text keys if present
-        if hasattr(block, 'text_keys') and block.text_keys:
-            text_keys = block.text_keys
-            if hasattr(text_keys, 'num_text_keys'):
-                NifLog.info(f"{prefix}│  └─ TextKeys: {text_keys.num_text_keys} keys")
-                if hasattr(text_keys, 'text_keys'):
-                    for tk_idx, tk in enumerate(text_keys.text_keys[:5]):  # Show first 5
-                        NifLog.info(f"{prefix}│     └─ [{tk_idx}] time={tk.time:.3f}, value='{tk.value}'")
-                    if text_keys.num_text_keys > 5:
-                        NifLog.info(f"{prefix}│     └─ ... and {text_keys.num_text_keys - 5} more")
-        
-        # Log timing info
-        if hasattr(block, 'start_time'):
-            NifLog.info(f"{prefix}│  ├─ start_time: {block.start_time}")
-        if hasattr(block, 'stop_time'):
-            NifLog.info(f"{prefix}│  ├─ stop_time: {block.stop_time}")
-        if hasattr(block, 'frequency'):
-            NifLog.info(f"{prefix}│  ├─ frequency: {block.frequency}")
-        if hasattr(block, 'cycle_type'):
-            NifLog.info(f"{prefix}│  └─ cycle_type: {block.cycle_type}")
+    def load_kf_files(self, kf_files):
+        """Parse and scale the kf files, in worker processes if there are several, and yield their extracted keys.
+
+        The keys are yielded in the order of kf_files, as soon as each file is parsed, so the animations of the first
+        files can be created while the others are still being parsed. Closing the generator cancels the files that no
+        worker has started on yet.
+        """
+        load_kf = partial(keyframes.load_kf, scale=NifOp.props.scale_correction, fps=self.transform_anim.fps)
+        num_loaded = 0
+        num_workers = min(len(kf_files), os.cpu_count() or 1)
+        if num_workers > 1:
+            executor = ProcessPoolExecutor(max_workers=num_workers, mp_context=get_process_context())
+            futures = []
+            try:
+                futures = [executor.submit(load_kf, kf_file) for kf_file in kf_files]
+                for kf_file, future in zip(kf_files, futures):
+                    yield kf_file, self.read_kf(kf_file, future.result)
+                    num_loaded += 1
+            except BrokenProcessPool:
+                NifLog.warn("Could not parse the kf files in parallel, parsing the remaining files one by one")
+            finally:
+                # don't wait for files that will not be imported, cancel_futures needs python 3.9
+                for future in futures:
+                    future.cancel()
+                executor.shutdown()
+        # without workers, eg. for a single file
+        for kf_file in kf_files[num_loaded:]:
+            yield kf_file, self.read_kf(kf_file, partial(load_kf, kf_file))
+
+    @staticmethod
+    def read_kf(kf_file, load):
+        """Return the frame rate and the sequence keys of kf_file, parsed by calling load, and trace its reading."""
+        with NifTrace.span("read"):
+            try:
+                fps, sequences, num_blocks = load()
+            except ValueError as e:
+                raise NifError(f"{kf_file}: {e}")
+        NifTrace.count("blocks", num_blocks)
+        return fps, sequences
+
+    def log_kf_sequences(self, sequences):
+        """Log the keys extracted from a KF file for debugging purposes."""
+        NifLog.info(f"Number of roots: {len(sequences)}")
+        for idx, sequence in enumerate(sequences):
+            NifLog.info(f"Root Block {idx}: {sequence.root_type} - Name: '{sequence.name}'")
+            if sequence.cycle_type is not None:
+                NifLog.info(f"  ├─ cycle_type: {sequence.cycle_type}")
+            if sequence.text_keys:
+                NifLog.info(f"  ├─ TextKeys: {len(sequence.text_keys)} keys")
+            for transform_keys in sequence.targets:
+                channels = ", ".join(f"{channel}: {len(times)}" for channel, times, keys, interp in transform_keys.channels)
+                NifLog.info(f"  └─ target='{transform_keys.node_name}' {channels}")
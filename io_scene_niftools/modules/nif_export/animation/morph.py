@@ -37,10 +37,12 @@
 #
 # ***** END LICENSE BLOCK *****
 
+import numpy as np
 from nifgen.formats.nif import classes as NifClasses
 from pyffi.formats.egm import EgmFormat
 
 from io_scene_niftools.modules.nif_export.animation import Animation
+from io_scene_niftools.utils import math
 from io_scene_niftools.utils.singleton import EGMData
 
 from io_scene_niftools.modules.nif_export.block_registry import block_store
@@ -68,8 +70,20 @@ class MorphAnimation(Animation):
             elif b_key.animation_data:
                 self.export_morph_animation(b_mesh, b_key, n_trishape, vertmap)
 
+    @staticmethod
+    def get_nif_to_blender_vertex_map(vertmap, num_vertices):
+        """Invert vertmap, which maps each blender vertex to its nif vertices, to an array of blender vertex indices"""
+        nif_to_blender = np.zeros(num_vertices, dtype=int)
+        for b_v_index, n_v_indices in enumerate(vertmap):
+            # see if this b_vert is used in the nif
+            if n_v_indices:
+                nif_to_blender[n_v_indices] = b_v_index
+        return nif_to_blender
+
     def export_egm(self, key_blocks):
         EGMData.data = EgmFormat.Data(num_vertices=len(key_blocks[0].data))
+        # note: key_blocks[0] is base b_key
+        base_coordinates = math.get_coordinates(key_blocks[0].data)
         for key_block in key_blocks:
             if key_block.name.startswith("EGM SYM"):
                 morph = EGMData.data.add_sym_morph()
@@ -78,12 +92,8 @@ class MorphAnimation(Animation):
             else:
                 continue
             NifLog.info(f"Exporting morph {key_block.name} to egm")
-            relative_vertices = []
-
-            # note: key_blocks[0] is base b_key
-            for base_vert, key_vert in zip(key_blocks[0].data, key_block.data):
-                relative_vertices.append(key_vert.co - base_vert.co)
-            morph.set_relative_vertices(relative_vertices)
+            relative_vertices = math.get_coordinates(key_block.data) - base_coordinates
+            morph.set_relative_vertices(relative_vertices.tolist())
 
     def export_morph_animation(self, b_mesh, b_key, n_trishape, vertmap):
         
@@ -113,6 +123,10 @@ class MorphAnimation(Animation):
         # TODO [morph] just guessing here, data seems to be zero always
         morph_ctrl.num_unknown_ints = len(b_key.key_blocks)
         morph_ctrl.reset_field("unknown_ints")
+
+        # every nif vertex takes the coordinates of the blender vertex it was created from
+        nif_to_blender = self.get_nif_to_blender_vertex_map(vertmap, morph_data.num_vertices)
+        base_coordinates = math.get_coordinates(b_mesh.vertices)[nif_to_blender]
         for key_block_num, key_block in enumerate(b_key.key_blocks):
             # export morphed vertices
             n_morph = morph_data.morphs[key_block_num]
@@ -120,22 +134,14 @@ class MorphAnimation(Animation):
             NifLog.info(f"Exporting n_morph {key_block.name}: vertices")
             n_morph.arg = morph_data.num_vertices
             n_morph.reset_field("vectors")
-            for b_v_index, (n_v_indices, b_vert) in enumerate(list(zip(vertmap, key_block.data))):
-                # see if this b_vert is used in the nif
-                if not n_v_indices:
-                    continue
-                # copy blender shapekey vertex
-                mv = b_vert.co.copy()
-                # make the consecutive keys relative to base shapekey
-                if key_block_num > 0:
-                    mv.x -= b_mesh.vertices[b_v_index].co.x
-                    mv.y -= b_mesh.vertices[b_v_index].co.y
-                    mv.z -= b_mesh.vertices[b_v_index].co.z
-                # update nif morph vectors
-                for n_v_index in n_v_indices:
-                    n_morph.vectors[n_v_index].x = mv.x
-                    n_morph.vectors[n_v_index].y = mv.y
-                    n_morph.vectors[n_v_index].z = mv.z
+            # copy blender shapekey vertices
+            morph_vectors = math.get_coordinates(key_block.data)[nif_to_blender]
+            # make the consecutive keys relative to base shapekey
+            if key_block_num > 0:
+                morph_vectors -= base_coordinates
+            # update nif morph vectors
+            for i, field in enumerate(("x", "y", "z")):
+                n_morph.vectors[field] = morph_vectors[:, i]
 
             # create interpolator for shape b_key (needs to be there even if there is no fcu)
             interpol = block_store.create_block("NiFloatInterpolator")
@@ -47,6 +47,7 @@ from io_scene_niftools.modules.nif_export.block_registry import block_store
 from io_scene_niftools.utils import math, consts
 from io_scene_niftools.utils.logging import NifError, NifLog
 from io_scene_niftools.utils.singleton import NifOp
+from io_scene_niftools.utils.tracing import NifTrace, traced
 from io_scene_niftools.utils.consts import QUAT, EULER, LOC, SCALE
 
 
@@ -67,6 +68,7 @@ class TransformAnimation(Animation):
             key = [k.co[1] for k in point]
             yield frame, mathutilclass(key)
 
+    @traced("animation")
     def export_kf_root(self, b_armature=None):
         """Creates and returns a KF root block and exports controllers for objects and bones"""
         scene = bpy.context.scene
@@ -142,6 +144,7 @@ class TransformAnimation(Animation):
             kf_root.target_name = targetname
         return kf_root
 
+    @traced("animation")
     def export_transforms(self, parent_block, b_obj, b_action, bone=None):
         """
         If bone == None, object level animation is exported.
@@ -266,6 +269,7 @@ class TransformAnimation(Animation):
         for frame, scale in self.iter_frame_key(scales, mathutils.Vector):
             # just use the first scale curve and assume even scale over all curves
             scale_curve.append((frame, scale[0]))
+        NifTrace.count("keys", len(quat_curve) + len(euler_curve) + len(trans_curve) + len(scale_curve))
 
         if n_kfi:
             # set the default transforms of the interpolator as the bone's bind pose
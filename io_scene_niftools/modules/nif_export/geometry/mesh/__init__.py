@@ -53,6 +53,7 @@ from io_scene_niftools.modules.nif_export.property.texture.types.nitextureprop i
 from io_scene_niftools.utils import math
 from io_scene_niftools.utils.singleton import NifOp, NifData
 from io_scene_niftools.utils.logging import NifLog, NifError
+from io_scene_niftools.utils.tracing import NifTrace, traced
 from io_scene_niftools.modules.nif_export.geometry.mesh.skin_partition import update_skin_partition
 
 
@@ -63,6 +64,7 @@ class Mesh:
         self.object_property = ObjectProperty()
         self.morph_anim = MorphAnimation()
 
+    @traced("mesh")
     def export_tri_shapes(self, b_obj, n_parent, n_root, trishape_name=None):
         """
         Export a blender object ob of the type mesh, child of nif block
@@ -230,6 +232,7 @@ class Mesh:
                     f"{len(vertex_information['POSITION'])} vertices (max 65535)"
                 )
                 raise NifError("Too many vertices. Decimate your mesh and try again.")
+            NifTrace.count("vertices", len(vertex_information['POSITION']))
             if len(triangles) > 65535:
                 NifLog.error(
                     f"[NORMAL EXPORT] Triangle limit exceeded for mesh '{b_obj.name}': "
@@ -322,61 +325,21 @@ class Mesh:
                     n_geom.skin_instance = skininst
                     NifLog.info(f"[SKIN EXPORT] Linked skin instance to geometry")
 
-                    # Vertex weights,  find weights and normalization factors
-                    vert_list = {}
-                    vert_norm = {}
-                    unweighted_vertices = []
-
-                    for bone_group in boneinfluences:
-                        b_list_weight = []
-                        b_vert_group = b_obj.vertex_groups[bone_group]
-
-                        for b_vert in eval_mesh.vertices:
-                            if len(b_vert.groups) == 0:  # check vert has weight_groups
-                                unweighted_vertices.append(b_vert.index)
-                                continue
-
-                            for g in b_vert.groups:
-                                if b_vert_group.name in boneinfluences:
-                                    if g.group == b_vert_group.index:
-                                        b_list_weight.append((b_vert.index, g.weight))
-                                        break
-
-                        vert_list[bone_group] = b_list_weight
-
-                        # create normalisation groupings
-                        for v in vert_list[bone_group]:
-                            if v[0] in vert_norm:
-                                vert_norm[v[0]] += v[1]
-                            else:
-                                vert_norm[v[0]] = v[1]
-
+                    # Vertex weights, find weights per nif vertex, normalized over the bone influences
+                    unweighted_vertices, bone_vert_weights = self.get_bone_weights(b_obj, eval_mesh, boneinfluences,
+                                                                                   v_nif_to_blend)
                     self.select_unweighted_vertices(b_obj, unweighted_vertices)
 
                     # for each bone, get the vertex weights and add its n_node to the NiSkinData
                     NifLog.info(f"[SKIN EXPORT] Processing bone weights...")
-                    NifLog.info(f"[SKIN EXPORT] Bone order for weights: {list(boneinfluences)}")
-                    for b_bone_name in boneinfluences:
-                        # find vertex weights
-                        vert_weights = {}
-                        for v in vert_list[b_bone_name]:
-                            # v[0] is the original vertex index
-                            # v[1] is the weight
-
-                            # vertex_map[v[0]] is the set of vertices (indices) to which v[0] was mapped
-                            # so we simply export the same weight as the original vertex for each new vertex
-
-                            # write the weights
-                            # extra check for multi material meshes
-                            if vertex_map[v[0]] and vert_norm[v[0]]:
-                                for vert_index in vertex_map[v[0]]:
-                                    vert_weights[vert_index] = v[1] / vert_norm[v[0]]
+                    NifLog.debug(lambda: f"[SKIN EXPORT] Bone order for weights: {list(boneinfluences)}")
+                    for b_bone_name, vert_weights in zip(boneinfluences, bone_vert_weights):
                         # add bone as influence, but only if there were actually any vertices influenced by the bone
                         if vert_weights:
                             # find bone in exported blocks
                             n_node = self.get_bone_block(b_obj_armature.data.bones[b_bone_name])
                             if n_node:
-                                NifLog.info(f"[SKIN EXPORT]   Bone '{b_bone_name}': {len(vert_weights)} vertices weighted, block name: '{n_node.name}'")
+                                NifLog.debug(f"[SKIN EXPORT]   Bone '{b_bone_name}': {len(vert_weights)} vertices weighted, block name: '{n_node.name}'")
                             else:
                                 NifLog.error(f"[SKIN EXPORT]   ERROR: Bone '{b_bone_name}' not found in exported blocks!")
                             n_geom.add_bone(n_node, vert_weights)
@@ -394,57 +357,10 @@ class Mesh:
                     NifLog.info(f"[SKIN EXPORT] Calculating skin center and radius...")
                     n_geom.update_skin_center_radius()
                     
-                    # Log final skin data summary
-                    if n_geom.skin_instance:
-                        skin_data = n_geom.skin_instance.data
-                        NifLog.info(f"[SKIN EXPORT] Final bone count: {skin_data.num_bones}")
-                        NifLog.info(f"[SKIN EXPORT] Skeleton root: '{n_geom.skin_instance.skeleton_root.name if n_geom.skin_instance.skeleton_root else 'None'}'")
-                        
-                        # CRITICAL: Verify bone order consistency
-                        NifLog.info(f"[SKIN EXPORT] ========== Bone Order Verification ==========")
-                        NifLog.info(f"[SKIN EXPORT] NiSkinInstance.bones[] order:")
-                        for i, bone_node in enumerate(n_geom.skin_instance.bones):
-                            if i < skin_data.num_bones:
-                                NifLog.info(f"[SKIN EXPORT]   [{i}] {bone_node.name}")
-                        NifLog.info(f"[SKIN EXPORT] NiSkinData.bone_list[] order:")
-                        for i, bone_data in enumerate(skin_data.bone_list):
-                            bone_name = n_geom.skin_instance.bones[i].name if i < len(n_geom.skin_instance.bones) else 'Unknown'
-                            NifLog.info(f"[SKIN EXPORT]   [{i}] {bone_name}")
-                        NifLog.info(f"[SKIN EXPORT] ========== Bone Order Verification Complete ==========")
-                        
-                        # Log skin transform data
-                        try:
-                            skin_transform = skin_data.get_transform()
-                            scale, rotation, translation = skin_transform.get_scale_rotation_translation()
-                            NifLog.info(f"[SKIN EXPORT] Skin transform:")
-                            NifLog.info(f"[SKIN EXPORT]   Translation: ({translation.x:.6f}, {translation.y:.6f}, {translation.z:.6f})")
-                            NifLog.info(f"[SKIN EXPORT]   Scale: {scale:.6f}")
-                        except Exception as e:
-                            NifLog.warn(f"[SKIN EXPORT] Could not log skin transform: {e}")
-                        
-                        # Log detailed bone data
-                        for i, bone_data in enumerate(skin_data.bone_list):
-                            bone_name = n_geom.skin_instance.bones[i].name if i < len(n_geom.skin_instance.bones) else 'Unknown'
-                            NifLog.info(f"[SKIN EXPORT]   Bone {i} ('{bone_name}'): num_vertices={bone_data.num_vertices}")
-                            
-                            # Log bone transform
-                            try:
-                                bone_transform = bone_data.get_transform()
-                                scale, rotation, translation = bone_transform.get_scale_rotation_translation()
-                                NifLog.info(f"[SKIN EXPORT]     Transform:")
-                                NifLog.info(f"[SKIN EXPORT]       Translation: ({translation.x:.6f}, {translation.y:.6f}, {translation.z:.6f})")
-                                NifLog.info(f"[SKIN EXPORT]       Scale: {scale:.6f}")
-                            except Exception as e:
-                                NifLog.warn(f"[SKIN EXPORT]     Could not log bone transform: {e}")
-                            
-                            # Log bounding sphere (center and radius)
-                            try:
-                                bound = bone_data.bounding_sphere
-                                NifLog.info(f"[SKIN EXPORT]     Bounding Sphere:")
-                                NifLog.info(f"[SKIN EXPORT]       Center: ({bound.center.x:.6f}, {bound.center.y:.6f}, {bound.center.z:.6f})")
-                                NifLog.info(f"[SKIN EXPORT]       Radius: {bound.radius:.6f}")
-                            except Exception as e:
-                                NifLog.warn(f"[SKIN EXPORT]     Could not log bounding sphere: {e}")
+                    # the order, transforms and bounds of every bone are only logged when debugging, as they take
+                    # several lines per bone
+                    if n_geom.skin_instance and NifLog.is_enabled('DEBUG'):
+                        self.log_skin_data(n_geom)
 
                     NifLog.info(f"[SKIN EXPORT] Exporting skin partition...")
                     self.export_skin_partition(b_obj, bodypartfacemap, triangles, n_geom)
@@ -663,30 +579,13 @@ class Mesh:
         # now remove duplicates
         # first exact (also sorts by blender vertex)
         loop_hashes, hash_to_matl, matl_to_hash = np.unique(loop_hashes, return_index=True, return_inverse=True, axis=0)
-        hash_to_same_hash = np.arange(len(loop_hashes), dtype=int)
-        hash_to_nif_vert = np.arange(len(loop_hashes), dtype=int)
+        matl_to_hash = matl_to_hash.reshape(-1)
         # then inexact (if epsilon is not 0)
         if NifOp.props.epsilon > 0:
-
-            current_vert = -1
-            max_nif_vert = -1
-            for hash_index, loop_hash in enumerate(loop_hashes):
-                if loop_hash[0] != current_vert:
-                    current_vert = loop_hash[0]
-                    current_hash_start = hash_index
-
-                nif_vert_index = max_nif_vert + 1
-                for comp_index in range(current_hash_start, hash_index):
-                    comp_loop_hash = loop_hashes[comp_index]
-                    if any(np.abs(comp_loop_hash - loop_hash) > NifOp.props.epsilon):
-                        # this hash is different, but others may be the same
-                        continue
-                    else:
-                        nif_vert_index = hash_to_nif_vert[comp_index]
-                        hash_to_same_hash[hash_index] = comp_index
-                        break
-                hash_to_nif_vert[hash_index] = nif_vert_index
-                max_nif_vert = max((nif_vert_index, max_nif_vert))
+            hash_to_same_hash, hash_to_nif_vert = self.weld_loop_hashes(loop_hashes, NifOp.props.epsilon)
+        else:
+            hash_to_same_hash = np.arange(len(loop_hashes), dtype=int)
+            hash_to_nif_vert = np.arange(len(loop_hashes), dtype=int)
 
         # finally, use the mapping from blender to nif to create the triangles
         # first get the actual triangles in an array
@@ -703,9 +602,7 @@ class Mesh:
         blend_triangles = blend_triangles[mattri_to_looptri]
         tri_to_poly = tri_to_poly[mattri_to_looptri]
         # go from loop indices to nif vertices
-        # [TODO] possibly optimize later
-        for i in range(len(blend_triangles)):
-            blend_triangles[i] = hash_to_nif_vert[matl_to_hash[loop_to_matl[blend_triangles[i]]]]
+        blend_triangles = hash_to_nif_vert[matl_to_hash[loop_to_matl[blend_triangles]]]
         # sort the triangles on polygon index to keep the original order
         tri_sort = np.argsort(tri_to_poly, axis=0)
         tri_to_poly = tri_to_poly[tri_sort]
@@ -730,6 +627,45 @@ class Mesh:
 
         return blend_triangles, tri_to_poly, data_dict, loop_to_vert[matl_to_loop[nif_to_matl]]
 
+    @staticmethod
+    def weld_loop_hashes(loop_hashes, epsilon):
+        """Merges the loop hashes of the same blender vertex that differ by at most epsilon in every component. Every
+        hash is merged into the first earlier hash it matches.
+
+        :param loop_hashes: Unique loop hashes, sorted on their first column (the blender vertex)
+        :type loop_hashes: np.ndarray
+        :param epsilon: Maximal difference per component for hashes to be merged
+        :type epsilon: float
+
+        :return: for every hash the hash that starts its merge chain, and its nif vertex index
+        :rtype: tuple(np.ndarray, np.ndarray)
+        """
+        n_hashes = len(loop_hashes)
+        hash_indices = np.arange(n_hashes, dtype=int)
+        hash_to_same_hash = hash_indices.copy()
+        if n_hashes == 0:
+            return hash_to_same_hash, hash_indices
+        # only hashes of the same blender vertex can be merged, and those are next to each other
+        is_group_start = np.ones(n_hashes, dtype=bool)
+        is_group_start[1:] = loop_hashes[1:, 0] != loop_hashes[:-1, 0]
+        hash_offsets = hash_indices - np.maximum.accumulate(np.where(is_group_start, hash_indices, 0))
+        # compare every hash with the hash offset places before it in its group, in one go per offset
+        # larger offsets overwrite the smaller ones, so the first matching hash wins
+        for offset in range(1, hash_offsets.max() + 1):
+            compared = np.flatnonzero(hash_offsets >= offset)
+            comp_indices = compared - offset
+            is_same = ~np.any(np.abs(loop_hashes[compared] - loop_hashes[comp_indices]) > epsilon, axis=1)
+            hash_to_same_hash[compared[is_same]] = comp_indices[is_same]
+        # the matched hash may have been merged itself, so follow the chains to their start
+        while True:
+            chain_starts = hash_to_same_hash[hash_to_same_hash]
+            if np.array_equal(chain_starts, hash_to_same_hash):
+                break
+            hash_to_same_hash = chain_starts
+        # number the nif vertices in the order of the hashes that start a chain
+        hash_to_nif_vert = (np.cumsum(hash_to_same_hash == hash_indices) - 1)[hash_to_same_hash]
+        return hash_to_same_hash, hash_to_nif_vert
+
     def set_geom_data(self, n_geom, triangles, vertex_information, b_uv_layers):
         if isinstance(n_geom, NifClasses.BSTriShape):
             self.set_bs_geom_data(n_geom, triangles, vertex_information, b_uv_layers)
@@ -862,6 +798,61 @@ class Mesh:
         # set triangles stitch strips for civ4
         n_geom.data.set_triangles(triangles, stitchstrips=NifOp.props.stitch_strips)
 
+    @staticmethod
+    def log_skin_data(n_geom):
+        """Log the bone order of the skin instance and data, and the skin transform and the transform and bounds of
+        every bone"""
+        skin_data = n_geom.skin_instance.data
+        NifLog.debug(f"[SKIN EXPORT] Final bone count: {skin_data.num_bones}")
+        NifLog.debug(f"[SKIN EXPORT] Skeleton root: '{n_geom.skin_instance.skeleton_root.name if n_geom.skin_instance.skeleton_root else 'None'}'")
+
+        # CRITICAL: Verify bone order consistency
+        NifLog.debug(f"[SKIN EXPORT] ========== Bone Order Verification ==========")
+        NifLog.debug(f"[SKIN EXPORT] NiSkinInstance.bones[] order:")
+        for i, bone_node in enumerate(n_geom.skin_instance.bones):
+            if i < skin_data.num_bones:
+                NifLog.debug(f"[SKIN EXPORT]   [{i}] {bone_node.name}")
+        NifLog.debug(f"[SKIN EXPORT] NiSkinData.bone_list[] order:")
+        for i, bone_data in enumerate(skin_data.bone_list):
+            bone_name = n_geom.skin_instance.bones[i].name if i < len(n_geom.skin_instance.bones) else 'Unknown'
+            NifLog.debug(f"[SKIN EXPORT]   [{i}] {bone_name}")
+        NifLog.debug(f"[SKIN EXPORT] ========== Bone Order Verification Complete ==========")
+
+        # Log skin transform data
+        try:
+            skin_transform = skin_data.get_transform()
+            scale, rotation, translation = skin_transform.get_scale_rotation_translation()
+            NifLog.debug(f"[SKIN EXPORT] Skin transform:")
+            NifLog.debug(f"[SKIN EXPORT]   Translation: ({translation.x:.6f}, {translation.y:.6f}, {translation.z:.6f})")
+            NifLog.debug(f"[SKIN EXPORT]   Scale: {scale:.6f}")
+        except Exception as e:
+            NifLog.warn(f"[SKIN EXPORT] Could not log skin transform: {e}")
+
+        # Log detailed bone data
+        for i, bone_data in enumerate(skin_data.bone_list):
+            bone_name = n_geom.skin_instance.bones[i].name if i < len(n_geom.skin_instance.bones) else 'Unknown'
+            NifLog.debug(f"[SKIN EXPORT]   Bone {i} ('{bone_name}'): num_vertices={bone_data.num_vertices}")
+
+            # Log bone transform
+            try:
+                bone_transform = bone_data.get_transform()
+                scale, rotation, translation = bone_transform.get_scale_rotation_translation()
+                NifLog.debug(f"[SKIN EXPORT]     Transform:")
+                NifLog.debug(f"[SKIN EXPORT]       Translation: ({translation.x:.6f}, {translation.y:.6f}, {translation.z:.6f})")
+                NifLog.debug(f"[SKIN EXPORT]       Scale: {scale:.6f}")
+            except Exception as e:
+                NifLog.warn(f"[SKIN EXPORT]     Could not log bone transform: {e}")
+
+            # Log bounding sphere (center and radius)
+            try:
+                bound = bone_data.bounding_sphere
+                NifLog.debug(f"[SKIN EXPORT]     Bounding Sphere:")
+                NifLog.debug(f"[SKIN EXPORT]       Center: ({bound.center.x:.6f}, {bound.center.y:.6f}, {bound.center.z:.6f})")
+                NifLog.debug(f"[SKIN EXPORT]       Radius: {bound.radius:.6f}")
+            except Exception as e:
+                NifLog.warn(f"[SKIN EXPORT]     Could not log bounding sphere: {e}")
+
+    @traced("skin")
     def export_skin_partition(self, b_obj, bodypartfacemap, triangles, n_geom):
         """Attaches a skin partition to n_geom if needed"""
         game = bpy.context.scene.niftools_scene.game
@@ -920,12 +911,12 @@ class Mesh:
                 NifLog.info(f"[SKIN PARTITION] ========== Partition Summary ==========")
                 NifLog.info(f"[SKIN PARTITION] Number of partitions: {skin_part.num_partitions}")
                 for p_idx, partition in enumerate(skin_part.partitions):
-                    NifLog.info(f"[SKIN PARTITION] Partition {p_idx}:")
-                    NifLog.info(f"[SKIN PARTITION]   Num bones: {partition.num_bones}")
-                    NifLog.info(f"[SKIN PARTITION]   Num vertices: {partition.num_vertices}")
-                    NifLog.info(f"[SKIN PARTITION]   Num triangles: {partition.num_triangles}")
-                    NifLog.info(f"[SKIN PARTITION]   Num weights per vertex: {partition.num_weights_per_vertex}")
-                    NifLog.info(f"[SKIN PARTITION]   Bones: {list(partition.bones[:partition.num_bones])}")
+                    NifLog.debug(f"[SKIN PARTITION] Partition {p_idx}:")
+                    NifLog.debug(f"[SKIN PARTITION]   Num bones: {partition.num_bones}")
+                    NifLog.debug(f"[SKIN PARTITION]   Num vertices: {partition.num_vertices}")
+                    NifLog.debug(f"[SKIN PARTITION]   Num triangles: {partition.num_triangles}")
+                    NifLog.debug(f"[SKIN PARTITION]   Num weights per vertex: {partition.num_weights_per_vertex}")
+                    NifLog.debug(lambda: f"[SKIN PARTITION]   Bones: {list(partition.bones[:partition.num_bones])}")
                     # Validate weights
                     invalid_weights = 0
                     invalid_indices = 0
@@ -943,6 +934,7 @@ class Mesh:
                         NifLog.warn(f"[SKIN PARTITION]   Found {invalid_indices} invalid bone indices")
                 NifLog.info(f"[SKIN PARTITION] ========== Partition Complete ==========")
 
+    @traced("skin")
     def update_bind_position(self, n_geom, n_root, b_obj_armature):
         """Transfer the Blender bind position to the nif bind position.
         Sets the NiSkinData overall transform to the inverse of the geometry transform
@@ -998,7 +990,7 @@ class Mesh:
                 # LEGACY: Simpler convention used by older Gamebryo builds
                 # Just use the bone's transform relative to skeleton root
                 skindata.bone_list[i].set_transform(bone.get_transform(n_root).get_inverse())
-                NifLog.info(f"[SKIN EXPORT] Bone {i} ('{bone_name}'): Using legacy bind convention")
+                NifLog.debug(f"[SKIN EXPORT] Bone {i} ('{bone_name}'): Using legacy bind convention")
             else:
                 # MODERN: More complex convention (Skyrim, newer builds)
                 # Compose with geometry transform
@@ -1006,10 +998,80 @@ class Mesh:
                 # We need Bone->World, so multiply by SkelRoot->World
                 n_bind_global = n_bind * skelroot.get_transform()
                 skindata.bone_list[i].set_transform((n_bind_global * geomtransform).get_inverse(fast=False))
-                NifLog.info(f"[SKIN EXPORT] Bone {i} ('{bone_name}'): Using modern bind convention")
+                NifLog.debug(f"[SKIN EXPORT] Bone {i} ('{bone_name}'): Using modern bind convention")
 
         b_obj_armature.data.pose_position = old_position
 
+    @staticmethod
+    @traced("skin")
+    def get_bone_weights(b_obj, b_mesh, bone_names, v_nif_to_blend):
+        """Gathers the weights of the vertex groups in bone_names in a single pass over the vertices of b_mesh and
+        normalizes them per vertex.
+
+        :param b_obj: The object that owns the vertex groups
+        :param b_mesh: The (evaluated) mesh of b_obj
+        :param bone_names: The names of the vertex groups that influence the mesh, in bone order
+        :param v_nif_to_blend: The blender vertex of every nif vertex
+        :return: the blender vertices without any vertex group, and for every bone a dict mapping the influenced nif
+        vertices to their weights
+        :rtype: tuple(list(int), list(dict(int, float)))
+        """
+        n_verts = len(b_mesh.vertices)
+        group_to_bone = np.full(len(b_obj.vertex_groups), -1, dtype=int)
+        for bone_index, bone_name in enumerate(bone_names):
+            group_to_bone[b_obj.vertex_groups[bone_name].index] = bone_index
+
+        # sparse vertex x bone matrix, as (vertex, group, weight) triplets
+        unweighted_vertices = []
+        triplet_verts = []
+        triplet_groups = []
+        triplet_weights = []
+        for b_vert in b_mesh.vertices:
+            groups = b_vert.groups
+            if len(groups) == 0:
+                unweighted_vertices.append(b_vert.index)
+                continue
+            for g in groups:
+                triplet_verts.append(b_vert.index)
+                triplet_groups.append(g.group)
+                triplet_weights.append(g.weight)
+        triplet_verts = np.array(triplet_verts, dtype=int)
+        triplet_bones = group_to_bone[np.array(triplet_groups, dtype=int)]
+        triplet_weights = np.array(triplet_weights, dtype=float)
+        # only keep the groups that are bones
+        is_bone = triplet_bones >= 0
+        triplet_verts = triplet_verts[is_bone]
+        triplet_bones = triplet_bones[is_bone]
+        triplet_weights = triplet_weights[is_bone]
+
+        # normalize over the bones, skip vertices whose weights add up to 0
+        vert_norm = np.bincount(triplet_verts, weights=triplet_weights, minlength=n_verts)
+        is_normalized = vert_norm[triplet_verts] != 0
+        triplet_verts = triplet_verts[is_normalized]
+        triplet_bones = triplet_bones[is_normalized]
+        triplet_weights = triplet_weights[is_normalized] / vert_norm[triplet_verts]
+
+        # every blender vertex may have been split into several nif vertices (or none, for other materials)
+        v_nif_to_blend = np.asarray(v_nif_to_blend, dtype=int)
+        nif_sorted = np.argsort(v_nif_to_blend, kind="stable")
+        vert_nif_counts = np.bincount(v_nif_to_blend, minlength=n_verts)
+        vert_nif_starts = np.cumsum(vert_nif_counts) - vert_nif_counts
+        triplet_counts = vert_nif_counts[triplet_verts]
+        # repeat every triplet for each of its nif vertices
+        nif_weights = np.repeat(triplet_weights, triplet_counts)
+        nif_bones = np.repeat(triplet_bones, triplet_counts)
+        offsets = np.arange(len(nif_weights)) - np.repeat(np.cumsum(triplet_counts) - triplet_counts, triplet_counts)
+        nif_verts = nif_sorted[np.repeat(vert_nif_starts[triplet_verts], triplet_counts) + offsets]
+
+        # split per bone, keeping the vertices in order of their blender vertex
+        bone_order = np.argsort(nif_bones, kind="stable")
+        bone_starts = np.searchsorted(nif_bones[bone_order], np.arange(len(bone_names) + 1))
+        nif_verts = nif_verts[bone_order].tolist()
+        nif_weights = nif_weights[bone_order].tolist()
+        bone_vert_weights = [dict(zip(nif_verts[start:end], nif_weights[start:end]))
+                             for start, end in zip(bone_starts[:-1], bone_starts[1:])]
+        return unweighted_vertices, bone_vert_weights
+
     def get_bone_block(self, b_bone):
         """For a blender bone, return the corresponding nif node from the blocks that have already been exported"""
         for n_block, b_obj in block_store.block_to_obj.items():
@@ -36,11 +36,112 @@
 #
 # ***** END LICENSE BLOCK *****
 
-from itertools import repeat
 import logging
+import numpy as np
 from nifgen.utils.vertex_cache import get_cache_optimized_triangles, stable_stripify
 from nifgen.formats.nif import classes as NifClasses
 
+
+def _bit_count(mask):
+    return bin(mask).count("1")
+
+
+def _bits(mask):
+    """Yields the indices of the set bits of mask"""
+    while mask:
+        low_bit = mask & -mask
+        yield low_bit.bit_length() - 1
+        mask ^= low_bit
+
+
+def get_triangle_bone_masks(triangles, weights):
+    """Returns the triangle-bone incidence matrix, with every row packed into an int: bit i of the mask of a triangle
+    is set if bone i influences any of its vertices."""
+    vertex_masks = [0] * len(weights)
+    for v, weight in enumerate(weights):
+        for bonenum, boneweight in weight:
+            vertex_masks[v] |= 1 << bonenum
+    return [vertex_masks[v_1] | vertex_masks[v_2] | vertex_masks[v_3] for v_1, v_2, v_3 in triangles]
+
+
+def create_partitions(triangles, trianglepartmap, weights, maxbonesperpartition):
+    """Split triangles into partitions with at most maxbonesperpartition bones by greedy region growing.
+
+    Every partition starts from the first triangle that isn't in a partition yet. It then absorbs all triangles of
+    the same body part whose bones it already has, and grows into the adjacent triangle that adds the fewest new bones,
+    until no adjacent triangle fits anymore.
+
+    :param triangles: List of (v_1, v_2, v_3) vertex indices.
+    :param trianglepartmap: Partition index of every triangle, triangles with different indices never share a
+        partition.
+    :param weights: List of [bonenum, weight] pairs per vertex.
+    :param maxbonesperpartition: Maximum number of bones in each partition. Every triangle must fit.
+    :return: List of partitions as [set of bones, list of triangles, partition index].
+    """
+    num_triangles = len(triangles)
+    triangle_masks = get_triangle_bone_masks(triangles, weights)
+    # adjacency graph: the triangles that use each vertex
+    vertex_triangles = [[] for _ in range(len(weights))]
+    for tri_index, tri in enumerate(triangles):
+        for v in tri:
+            vertex_triangles[v].append(tri_index)
+    # group the triangles of each body part by bone mask, and the masks by bone, so all triangles whose bones are in
+    # a partition can be found from the bones that were added to it
+    mask_triangles = {}
+    bone_masks = {}
+    for tri_index, (partindex, mask) in enumerate(zip(trianglepartmap, triangle_masks)):
+        part_mask_triangles = mask_triangles.setdefault(partindex, {})
+        if mask not in part_mask_triangles:
+            part_mask_triangles[mask] = []
+            part_bone_masks = bone_masks.setdefault(partindex, {})
+            for bonenum in _bits(mask):
+                part_bone_masks.setdefault(bonenum, set()).add(mask)
+        part_mask_triangles[mask].append(tri_index)
+
+    assigned = [False] * num_triangles
+    parts = []
+    for seed in range(num_triangles):
+        if assigned[seed]:
+            continue
+        partindex = trianglepartmap[seed]
+        part_mask_triangles = mask_triangles[partindex]
+        part_bone_masks = bone_masks[partindex]
+        part_mask = 0
+        part_triangles = []
+        candidates = set()
+        new_mask = triangle_masks[seed]
+        while True:
+            new_bones = new_mask & ~part_mask
+            part_mask |= new_mask
+            # absorb all triangles whose bones are all in the partition, they must contain one of the new bones
+            # (or no bones at all) as the others were absorbed before
+            absorbed_masks = [0] if 0 in part_mask_triangles else []
+            for bonenum in _bits(new_bones):
+                absorbed_masks.extend(mask for mask in part_bone_masks[bonenum] if not mask & ~part_mask)
+            for mask in absorbed_masks:
+                if mask not in part_mask_triangles:
+                    # shares several new bones, so it was already absorbed
+                    continue
+                for bonenum in _bits(mask):
+                    part_bone_masks[bonenum].discard(mask)
+                for tri_index in part_mask_triangles.pop(mask):
+                    assigned[tri_index] = True
+                    part_triangles.append(triangles[tri_index])
+                    for v in triangles[tri_index]:
+                        candidates.update(vertex_triangles[v])
+            # only keep the adjacent triangles that still fit, their bone count can only increase
+            num_bones = _bit_count(part_mask)
+            candidates = {tri_index for tri_index in candidates
+                          if not assigned[tri_index] and trianglepartmap[tri_index] == partindex
+                          and _bit_count(part_mask | triangle_masks[tri_index]) <= maxbonesperpartition}
+            if not candidates or num_bones >= maxbonesperpartition:
+                break
+            # grow into the triangle that adds the fewest bones
+            tri_index = min(candidates, key=lambda tri_index: (_bit_count(triangle_masks[tri_index] & ~part_mask), tri_index))
+            new_mask = triangle_masks[tri_index]
+        parts.append([set(_bits(part_mask)), part_triangles, partindex])
+    return parts
+
 def update_skin_partition(self,
                         maxbonesperpartition=4, maxbonespervertex=4,
                         verbose=0, stripify=True, stitchstrips=False,
@@ -82,10 +183,6 @@ def update_skin_partition(self,
     """
     logger = logging.getLogger("nifgen.nif.nitribasedgeom")
 
-    # if trianglepartmap not specified, map everything to index 0
-    if trianglepartmap is None:
-        trianglepartmap = repeat(0)
-
     # shortcuts relevant blocks
     if not self.skin_instance:
         # no skin, nothing to do
@@ -139,6 +236,12 @@ def update_skin_partition(self,
 
     if triangles is None:
         triangles = geomdata.get_triangles()
+    triangles = [tuple(tri) for tri in np.asarray(triangles, dtype=int).reshape((-1, 3)).tolist()]
+    # if trianglepartmap not specified, map everything to index 0
+    if trianglepartmap is None:
+        trianglepartmap = [0] * len(triangles)
+    else:
+        trianglepartmap = np.asarray(trianglepartmap).tolist()
 
     for tri in triangles:
         while True:
@@ -200,78 +303,7 @@ def update_skin_partition(self,
 
     # split triangles into partitions
     logger.info("Creating partitions")
-    parts = []
-    # keep creating partitions as long as there are triangles left
-    while len(triangles) > 0:
-        # create a partition
-        part = [set(), [], None] # bones, triangles, partition index
-        usedverts = set()
-        addtriangles = True
-        # keep adding triangles to it as long as the flag is set
-        while addtriangles:
-            # newtriangles is a list of triangles that have not been added to
-            # the partition, similar for newtrianglepartmap
-            newtriangles = []
-            newtrianglepartmap = []
-            for tri, partindex in zip(triangles, trianglepartmap):
-                # find the bones influencing this triangle
-                tribones = []
-                for t in tri:
-                    tribones.extend([
-                        bonenum for bonenum, boneweight in weights[t]])
-                tribones = set(tribones)
-                # if part has no bones,
-                # or if part has all bones of tribones and index coincides
-                # then add this triangle to this part
-                if ((not part[0])
-                    or ((part[0] >= tribones) and (part[2] == partindex))):
-                    part[0] |= tribones
-                    part[1].append(tri)
-                    usedverts |= set(tri)
-                    # if part was empty, assign it the index
-                    if part[2] is None:
-                        part[2] = partindex
-                else:
-                    newtriangles.append(tri)
-                    newtrianglepartmap.append(partindex)
-            triangles = newtriangles
-            trianglepartmap = newtrianglepartmap
-
-            # if we have room left in the partition
-            # then add adjacent triangles
-            addtriangles = False
-            newtriangles = []
-            newtrianglepartmap = []
-            if len(part[0]) < maxbonesperpartition:
-                for tri, partindex in zip(triangles, trianglepartmap):
-                    # if triangle is adjacent, and has same index
-                    # then check if it can be added to the partition
-                    if (usedverts & set(tri)) and (part[2] == partindex):
-                        # find the bones influencing this triangle
-                        tribones = []
-                        for t in tri:
-                            tribones.extend([
-                                bonenum for bonenum, boneweight in weights[t]])
-                        tribones = set(tribones)
-                        # and check if we exceed the maximum number of allowed
-                        # bones
-                        if len(part[0] | tribones) <= maxbonesperpartition:
-                            part[0] |= tribones
-                            part[1].append(tri)
-                            usedverts |= set(tri)
-                            # signal another try in adding triangles to
-                            # the partition
-                            addtriangles = True
-                        else:
-                            newtriangles.append(tri)
-                            newtrianglepartmap.append(partindex)
-                    else:
-                        newtriangles.append(tri)
-                        newtrianglepartmap.append(partindex)
-                triangles = newtriangles
-                trianglepartmap = newtrianglepartmap
-
-        parts.append(part)
+    parts = create_partitions(triangles, trianglepartmap, weights, maxbonesperpartition)
 
     logger.info("Created %i small partitions." % len(parts))
 
@@ -448,7 +480,7 @@ def update_skin_partition(self,
             triangles, stitchstrips=stitchstrips)
         triangles_size = 3 * len(triangles)
         strips_size = len(strips) + sum(len(strip) for strip in strips)
-        vertices = []
+        vertex_indices = {}
         # decide whether to use strip or triangles as primitive
         if stripify is None:
             stripifyblock = (
@@ -467,8 +499,8 @@ def update_skin_partition(self,
             for strip in strips:
                 numtriangles += len(strip) - 2
                 for t in strip:
-                    if t not in vertices:
-                        vertices.append(t)
+                    if t not in vertex_indices:
+                        vertex_indices[t] = len(vertex_indices)
         else:
             numtriangles = len(triangles)
             # get sorted list of vertices
@@ -476,8 +508,9 @@ def update_skin_partition(self,
             # by triangle
             for tri in triangles:
                 for t in tri:
-                    if t not in vertices:
-                        vertices.append(t)
+                    if t not in vertex_indices:
+                        vertex_indices[t] = len(vertex_indices)
+        vertices = list(vertex_indices)
         # set all the data
         skinpartblock.num_vertices = len(vertices)
         skinpartblock.num_triangles = numtriangles
@@ -527,7 +560,7 @@ def update_skin_partition(self,
             skinpartblock.reset_field("strips")
             for i, strip in enumerate(strips):
                 for j, v in enumerate(strip):
-                    skinpartblock.strips[i][j] = vertices.index(v)
+                    skinpartblock.strips[i][j] = vertex_indices[v]
         else:
             skinpartblock.has_faces = True
             # clear strip lengths array
@@ -536,9 +569,9 @@ def update_skin_partition(self,
             skinpartblock.reset_field("strips")
             skinpartblock.reset_field("triangles")
             for i, (v_1,v_2,v_3) in enumerate(triangles):
-                skinpartblock.triangles[i].v_1 = vertices.index(v_1)
-                skinpartblock.triangles[i].v_2 = vertices.index(v_2)
-                skinpartblock.triangles[i].v_3 = vertices.index(v_3)
+                skinpartblock.triangles[i].v_1 = vertex_indices[v_1]
+                skinpartblock.triangles[i].v_2 = vertex_indices[v_2]
+                skinpartblock.triangles[i].v_3 = vertex_indices[v_3]
         skinpartblock.has_bone_indices = True
         skinpartblock.reset_field("bone_indices")
         for i, v in enumerate(vertices):
@@ -50,6 +50,7 @@ from io_scene_niftools.modules.nif_export.property.object import ObjectDataPrope
 from io_scene_niftools.modules.nif_export.block_registry import block_store
 from io_scene_niftools.utils import math
 from io_scene_niftools.utils.logging import NifLog
+from io_scene_niftools.utils.tracing import traced
 
 # dictionary of names, to map NIF blocks to correct Blender names
 DICT_NAMES = {}
@@ -249,6 +250,7 @@ class Object:
 
         return node
 
+    @traced("collision")
     def export_collision(self, b_obj, n_parent):
         """Main function for adding collision object b_obj to a node.
         Returns True if this object is exported as a collision"""
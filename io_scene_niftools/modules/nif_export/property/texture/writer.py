@@ -39,16 +39,20 @@
 
 import os.path
 import struct
+from concurrent.futures.process import BrokenProcessPool
+
 import numpy as np
 
 import bpy
 from nifgen.formats.nif import classes as NifClasses
+from nifgen.utils import dds
 
 import io_scene_niftools.utils.logging
 from io_scene_niftools.modules.nif_export.block_registry import block_store
 from io_scene_niftools.utils import math
 from io_scene_niftools.utils.singleton import NifOp
 from io_scene_niftools.utils.logging import NifLog
+from io_scene_niftools.utils.processes import get_process_context
 from io_scene_niftools.utils.singleton import NifData
 
 
@@ -140,7 +144,7 @@ class TextureWriter:
 
         source_path = None
         target_fourcc = None
-        # if embedding requested, delegate to compact helpers that wrap texconv and DDS parsing
+        # if embedding requested, delegate to compact helpers that wrap DDS encoding and parsing
         if embed:
             try:
                 # Resolve any source texture path (png, tga, jpg, dds, etc.)
@@ -150,43 +154,7 @@ class TextureWriter:
                     srctex.use_external = True
                 else:
                     source_path = bpy.path.abspath(tex_path)
-                    # Determine format based on node property or alpha usage
-                    target_fourcc = 'AUTO'
-
-                    # Check if the node itself has a specific format set
-                    if isinstance(n_texture, bpy.types.ShaderNodeTexImage) and hasattr(n_texture, "niftools"):
-                        pixel_format = n_texture.niftools.pixel_format
-                        mapping = {
-                            'FMT_RGB': 'R8G8B8A8_UNORM',
-                            'FMT_RGBA': 'R8G8B8A8_UNORM',
-                            'FMT_PAL': 'R8_UNORM',
-                            'FMT_PALA': 'R8G8_UNORM',
-                            'FMT_DXT1': 'DXT1',
-                            'FMT_DXT3': 'DXT3',
-                            'FMT_DXT5': 'DXT5',
-                            'FMT_RGB24NONINT': 'R8G8B8A8_UNORM',
-                            'FMT_BUMP': 'BC5_UNORM',
-                            'FMT_BUMPLUMA': 'BC5_UNORM',
-                            'FMT_RENDERSPEC': 'BC7_UNORM',
-                            'FMT_1CH': 'R8_UNORM',
-                            'FMT_2CH': 'R8G8_UNORM',
-                            'FMT_3CH': 'R8G8B8A8_UNORM',
-                            'FMT_4CH': 'R8G8B8A8_UNORM',
-                            'FMT_DEPTH_STENCIL': 'AUTO',
-                            'FMT_UNKNOWN': 'AUTO',
-                            'AUTO': 'AUTO'
-                        }
-                        target_fourcc = mapping.get(pixel_format, 'AUTO')
-
-                    if target_fourcc == 'AUTO':
-                        if TextureWriter._is_transparency_used(n_texture):
-                            target_fourcc = 'DXT5'
-                            NifLog.info(f"Transparency detected in '{getattr(n_texture, 'name', 'texture')}', using DXT5.")
-                        else:
-                            target_fourcc = 'DXT1'
-                            NifLog.info(f"No transparency detected in '{getattr(n_texture, 'name', 'texture')}', using DXT1.")
-                    else:
-                        NifLog.info(f"Using override format '{target_fourcc}' for '{getattr(n_texture, 'name', 'texture')}'.")
+                    target_fourcc = TextureWriter._get_target_fourcc(n_texture)
             except Exception as ex:
                 NifLog.warn(f"Failed to resolve texture path for embedding: {ex}. Falling back to external reference.")
                 srctex.use_external = True
@@ -211,7 +179,7 @@ class TextureWriter:
         if embed and not srctex.use_external and source_path and target_fourcc:
             try:
                 # Convert to appropriate DXT format before embedding
-                data, header = TextureWriter._convert_with_texconv_cached(source_path, desired_fourcc=target_fourcc)
+                data, header = TextureWriter._convert_texture_cached(source_path, desired_fourcc=target_fourcc)
                 pix = TextureWriter._build_nipixeldata_from_dds(data, header)
 
                 # Preserve filename/name; then attach pixel data
@@ -354,6 +322,49 @@ class TextureWriter:
             NifLog.debug(f"Texture '{n_texture.name}' has Alpha set to '{alpha_mode}', using DXT5.")
             return True
 
+    @staticmethod
+    def _get_target_fourcc(n_texture):
+        """Return the format to embed the texture of a node in: the pixel format set on the node, else DXT5 if its
+        alpha is used for transparency and DXT1 if not."""
+        # Determine format based on node property or alpha usage
+        target_fourcc = 'AUTO'
+
+        # Check if the node itself has a specific format set
+        if isinstance(n_texture, bpy.types.ShaderNodeTexImage) and hasattr(n_texture, "niftools"):
+            pixel_format = n_texture.niftools.pixel_format
+            mapping = {
+                'FMT_RGB': 'R8G8B8A8_UNORM',
+                'FMT_RGBA': 'R8G8B8A8_UNORM',
+                'FMT_PAL': 'R8_UNORM',
+                'FMT_PALA': 'R8G8_UNORM',
+                'FMT_DXT1': 'DXT1',
+                'FMT_DXT3': 'DXT3',
+                'FMT_DXT5': 'DXT5',
+                'FMT_RGB24NONINT': 'R8G8B8A8_UNORM',
+                'FMT_BUMP': 'BC5_UNORM',
+                'FMT_BUMPLUMA': 'BC5_UNORM',
+                'FMT_RENDERSPEC': 'BC7_UNORM',
+                'FMT_1CH': 'R8_UNORM',
+                'FMT_2CH': 'R8G8_UNORM',
+                'FMT_3CH': 'R8G8B8A8_UNORM',
+                'FMT_4CH': 'R8G8B8A8_UNORM',
+                'FMT_DEPTH_STENCIL': 'AUTO',
+                'FMT_UNKNOWN': 'AUTO',
+                'AUTO': 'AUTO'
+            }
+            target_fourcc = mapping.get(pixel_format, 'AUTO')
+
+        if target_fourcc == 'AUTO':
+            if TextureWriter._is_transparency_used(n_texture):
+                target_fourcc = 'DXT5'
+                NifLog.info(f"Transparency detected in '{getattr(n_texture, 'name', 'texture')}', using DXT5.")
+            else:
+                target_fourcc = 'DXT1'
+                NifLog.info(f"No transparency detected in '{getattr(n_texture, 'name', 'texture')}', using DXT1.")
+        else:
+            NifLog.info(f"Using override format '{target_fourcc}' for '{getattr(n_texture, 'name', 'texture')}'.")
+        return target_fourcc
+
     @staticmethod
     def _resolve_texture_path(n_texture, filename):
         """Resolve a usable source texture path (any format). Prefers DDS but will return
@@ -425,7 +436,7 @@ class TextureWriter:
             raise ValueError('Not a DDS file')
         header = data[4:128]
         dwSize, dwFlags, dwHeight, dwWidth, dwPitchOrLinearSize, dwDepth, dwMipMapCount = struct.unpack('<7I', header[0:28])
-        pf = header[76:108]
+        pf = header[72:104]
         (pfSize, pfFlags, pfFourCC, pfRGBBitCount, pfRMask, pfGMask, pfBMask, pfAMask) = struct.unpack('<II4sI4I', pf)
         fourcc = pfFourCC.decode('ascii', errors='ignore').strip('\x00').strip()
         payload_offset = 128
@@ -531,18 +542,107 @@ class TextureWriter:
         return data, header
 
     @staticmethod
-    def _convert_with_texconv_cached(src_path, desired_fourcc='DXT1'):
+    def _load_image_pixels(src_path):
+        """Return the pixels of an image file as a (height, width, channels) float array, top row first."""
+        img = None
+        for cand in bpy.data.images:
+            cand_path = bpy.path.abspath(getattr(cand, "filepath", ""))
+            if cand_path and os.path.normcase(cand_path) == os.path.normcase(src_path):
+                img = cand
+                break
+        loaded_here = img is None
+        if loaded_here:
+            img = bpy.data.images.load(src_path, check_existing=True)
+        try:
+            width, height = img.size
+            if not width or not height:
+                raise ValueError(f"Image '{os.path.basename(src_path)}' has no pixel data")
+            pixels = np.empty(width * height * img.channels, dtype=np.float32)
+            img.pixels.foreach_get(pixels)
+        finally:
+            if loaded_here:
+                bpy.data.images.remove(img)
+        # blender stores the bottom row first, dds the top row
+        return pixels.reshape(height, width, -1)[::-1]
+
+    @staticmethod
+    def _convert_with_encoder(src_path, desired_fourcc='DXT1'):
+        src = bpy.path.abspath(src_path)
+        if src.lower().endswith('.dds'):
+            # keep a source that is already in the right format as is, including its own mipmaps
+            data = TextureWriter._read_file_bytes(src)
+            header = TextureWriter._parse_dds_header(data)
+            if header['fourcc'] == desired_fourcc:
+                NifLog.info(f"Embedding '{src}' without conversion, it is already {desired_fourcc}")
+                return data, header
+        pixels = TextureWriter._load_image_pixels(src)
+        # only generate mipmaps when they are embedded
+        mipmaps = not getattr(NifOp.props, 'embed_only_base_mipmap', True)
+        NifLog.info(f"Encoding '{src}' to {desired_fourcc}")
+        data = dds.encode_dds(pixels, desired_fourcc, mipmaps=mipmaps)
+        header = TextureWriter._parse_dds_header(data)
+        NifLog.info(f"Encode succeeded. New DDS fourcc='{header['fourcc']}', size={header['width']}x{header['height']}")
+        return data, header
+
+    @staticmethod
+    def _convert_texture_cached(src_path, desired_fourcc='DXT1'):
         src = bpy.path.abspath(src_path)
         cache_key = (src, desired_fourcc)
         cached = TextureWriter._embed_cache.get(cache_key)
         if cached:
-            NifLog.info(f"Reusing cached texconv output for '{src}' ({desired_fourcc})")
+            NifLog.info(f"Reusing cached DDS for '{src}' ({desired_fourcc})")
             data, header = cached
             return data, dict(header)
-        data, header = TextureWriter._convert_with_texconv(src, desired_fourcc=desired_fourcc)
+        # encode the common formats directly, texconv is only needed for the others
+        if desired_fourcc in dds.FORMATS:
+            data, header = TextureWriter._convert_with_encoder(src, desired_fourcc=desired_fourcc)
+        else:
+            data, header = TextureWriter._convert_with_texconv(src, desired_fourcc=desired_fourcc)
         TextureWriter._embed_cache[cache_key] = (data, dict(header))
         return data, header
 
+    @staticmethod
+    def encode_textures(b_objs):
+        """Encode the images of the texture nodes in the materials of b_objs that are embedded with the built in
+        encoder, in worker processes, and store them in the embed cache for export_source_texture."""
+        sources = {}
+        for b_obj in b_objs:
+            for b_slot in getattr(b_obj, "material_slots", ()):
+                b_mat = b_slot.material
+                if not b_mat or not b_mat.use_nodes:
+                    continue
+                for n_texture in b_mat.node_tree.nodes:
+                    if not isinstance(n_texture, bpy.types.ShaderNodeTexImage):
+                        continue
+                    tex_path = TextureWriter._resolve_texture_path(n_texture, None)
+                    # dds sources are often embedded as they are, so leave them to export_source_texture
+                    if not tex_path or tex_path.lower().endswith('.dds'):
+                        continue
+                    key = (bpy.path.abspath(tex_path), TextureWriter._get_target_fourcc(n_texture))
+                    if key[1] in dds.FORMATS and key not in TextureWriter._embed_cache:
+                        sources[key] = None
+        # blender's images can only be read in this process
+        images = {}
+        for src, fourcc in sources:
+            try:
+                images[src, fourcc] = TextureWriter._load_image_pixels(src)
+            except Exception as ex:
+                NifLog.warn(f"Could not read '{src}' for encoding: {ex}")
+        if len(images) < 2:
+            # nothing to gain from workers
+            return
+        mipmaps = not getattr(NifOp.props, 'embed_only_base_mipmap', True)
+        NifLog.info(f"Encoding {len(images)} textures in parallel")
+        try:
+            encoded = dds.encode_dds_batch(list(images.values()), [fourcc for src, fourcc in images], mipmaps=mipmaps,
+                                           max_workers=min(len(images), os.cpu_count() or 1),
+                                           mp_context=get_process_context())
+        except (BrokenProcessPool, OSError) as ex:
+            NifLog.warn(f"Could not encode the textures in parallel, encoding them one by one: {ex}")
+            return
+        for key, data in zip(images, encoded):
+            TextureWriter._embed_cache[key] = (data, TextureWriter._parse_dds_header(data))
+
     @staticmethod
     def _build_nipixeldata_from_dds(data, header):
         fourcc_to_fmt = {
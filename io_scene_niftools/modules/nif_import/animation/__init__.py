@@ -37,8 +37,10 @@
 #
 # ***** END LICENSE BLOCK *****
 import bpy
+import numpy as np
 
 from nifgen.formats.nif import classes as NifClasses
+from nifgen.utils import keyframes
 
 from io_scene_niftools.utils.logging import NifLog
 from io_scene_niftools.utils.consts import QUAT, EULER, LOC, SCALE
@@ -58,14 +60,7 @@ class Animation:
     @staticmethod
     def get_controller_data(ctrl):
         """Return data for ctrl, look in interpolator (for newer games) or directly on ctrl"""
-        if hasattr(ctrl, 'interpolator') and ctrl.interpolator:
-            data = ctrl.interpolator.data
-        else:
-            data = ctrl.data
-        # these have their data set as a KeyGroup on data
-        if isinstance(data, (NifClasses.NiBoolData, NifClasses.NiFloatData, NifClasses.NiPosData)):
-            return data.data
-        return data
+        return keyframes.get_controller_data(ctrl)
 
     @staticmethod
     def get_keys_values(items):
@@ -163,24 +158,27 @@ class Animation:
         """
         Create needed fcurves and add a list of keys to an action.
         """
-        samples = [round(t * self.fps) for t in times]
+        samples = np.round(np.asarray(times, dtype=float) * self.fps)
         assert len(samples) == len(keys)
         # get interpolation enum representation
         ipo = bpy.types.Keyframe.bl_rna.properties['interpolation'].enum_items[interp].value
-        interpolations = [ipo for _ in range(len(samples))]
+        interpolations = np.full(len(samples), ipo, dtype=np.int32)
         # import the keys
         try:
             fcurves = self.create_fcurves(b_action, key_type, key_range, flags, bone_name, key_name)
             if len(key_range) == 1:
                 # flat key - make it zippable
                 key_per_fcurve = [keys]
+            elif isinstance(keys, np.ndarray):
+                key_per_fcurve = keys.T
             else:
                 key_per_fcurve = zip(*keys)
             for fcurve, fcu_keys in zip(fcurves, key_per_fcurve):
                 # add new points
-                fcurve.keyframe_points.add(count=len(fcu_keys))
+                fcurve.keyframe_points.add(count=len(samples))
                 # populate points with keys for this curve
-                fcurve.keyframe_points.foreach_set("co", [x for co in zip(samples, fcu_keys) for x in co])
+                co = np.column_stack((samples, np.asarray(fcu_keys, dtype=float).ravel()))
+                fcurve.keyframe_points.foreach_set("co", co.astype(np.float32).ravel())
                 fcurve.keyframe_points.foreach_set("interpolation", interpolations)
                 # update
                 fcurve.update()
@@ -189,65 +187,25 @@ class Animation:
             NifLog.warn(f"Could not add fcurve '{key_type}' to '{b_action.name}', already added before?")
 
     # import animation groups
-    def import_text_keys(self, n_block, b_action):
-        """Gets and imports a NiTextKeyExtraData"""
-        if isinstance(n_block, NifClasses.NiControllerSequence):
-            txk = n_block.text_keys
-        else:
-            txk = n_block.find(block_type=NifClasses.NiTextKeyExtraData)
-        self.import_text_key_extra_data(txk, b_action)
-
-    def import_text_key_extra_data(self, txk, b_action):
-        """Stores the text keys as pose markers in a blender action."""
-        if txk and b_action:
-            for key in txk.text_keys:
-                newkey = key.value.replace('\r\n', '/').rstrip('/')
-                frame = round(key.time * self.fps)
+    def import_text_keys(self, text_keys, b_action):
+        """Stores the (time, value) text keys of a sequence as pose markers in a blender action."""
+        if text_keys and b_action:
+            for time, value in text_keys:
+                newkey = value.replace('\r\n', '/').rstrip('/')
+                frame = round(time * self.fps)
                 marker = b_action.pose_markers.new(newkey)
                 marker.frame = frame
 
     def set_frames_per_second(self, roots):
         """Scan all blocks and set a reasonable number for fps to this class and the scene."""
-        # find all key times
-        key_times = []
-        for root in roots:
-            for kfd in root.tree(block_type=NifClasses.NiKeyframeData):
-                key_times.extend(key.time for key in kfd.translations.keys)
-                key_times.extend(key.time for key in kfd.scales.keys)
-                key_times.extend(key.time for key in kfd.quaternion_keys)
-                for dimension in kfd.xyz_rotations:
-                    key_times.extend(key.time for key in dimension.keys)
-
-            for kfi in root.tree(block_type=NifClasses.NiBSplineInterpolator):
-                if not kfi.basis_data:
-                    # skip bsplines without basis data (eg bowidle.kf in Oblivion)
-                    continue
-                key_times.extend(
-                    point * (kfi.stop_time - kfi.start_time)
-                    / (kfi.basis_data.num_control_points - 2)
-                    for point in range(kfi.basis_data.num_control_points - 2))
-
-            for uv_data in root.tree(block_type=NifClasses.NiUVData):
-                for uv_group in uv_data.uv_groups:
-                    key_times.extend(key.time for key in uv_group.keys)
-
-        # not animated, return a reasonable default
-        if not key_times:
-            return
+        self.set_scene_frames_per_second(keyframes.get_frames_per_second(roots, self.fps))
 
-        # calculate fps
-        key_times = sorted(set(key_times))
-        fps = self.fps
-        lowest_diff = sum(abs(int(time * fps + 0.5) - (time * fps)) for time in key_times)
-
-        # for test_fps in range(1,120): #disabled, used for testing
-        for test_fps in [20, 24, 25, 30, 35]:
-            diff = sum(abs(int(time * test_fps + 0.5) - (time * test_fps)) for time in key_times)
-            if diff < lowest_diff:
-                lowest_diff = diff
-                fps = test_fps
+    def set_scene_frames_per_second(self, fps):
+        """Set fps to this class and the scene, unless it is None because nothing is animated."""
+        # not animated, keep the current fps
+        if fps is None:
+            return
         NifLog.info(f"Animation estimated at {fps} frames per second.")
         self.fps = fps
         bpy.context.scene.render.fps = fps
         bpy.context.scene.frame_set(0)
-
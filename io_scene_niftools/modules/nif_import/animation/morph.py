@@ -38,7 +38,7 @@
 # ***** END LICENSE BLOCK *****
 
 import bpy
-import mathutils
+import numpy as np
 from nifgen.formats.nif import classes as NifClasses
 
 from io_scene_niftools.modules.nif_import import animation
@@ -80,7 +80,7 @@ class MorphAnimation(Animation):
                 sk_basis = b_obj.shape_key_add(name=key_name)
 
                 # get base vectors and import all morphs
-                base_verts = morph.vectors
+                base_verts = math.struct_array_to_float(morph.vectors)
 
                 shape_action = self.create_action(b_obj.data.shape_keys, f"{b_obj.name}-Morphs")
                 
@@ -92,9 +92,9 @@ class MorphAnimation(Animation):
                         key_name = f'Key {morph_i}'
                     NifLog.info(f"Inserting key '{key_name}'")
                     # get vectors
-                    morph_verts = morph.vectors
-                    self.morph_mesh(b_mesh, base_verts, morph_verts)
+                    morph_verts = math.struct_array_to_float(morph.vectors)
                     shape_key = b_obj.shape_key_add(name=key_name, from_mix=False)
+                    self.morph_mesh(shape_key, base_verts, morph_verts)
 
                     # find the keys
                     # older versions store keys in the morph_data
@@ -149,8 +149,8 @@ class MorphAnimation(Animation):
     def import_egm_morphs(self, b_obj):
         """Import all EGM morphs as shape keys for blender object."""
         b_mesh = b_obj.data
-        sym_morphs = [list(morph.get_relative_vertices()) for morph in EGMData.data.sym_morphs]
-        asym_morphs = [list(morph.get_relative_vertices()) for morph in EGMData.data.asym_morphs]
+        sym_morphs = [self.get_egm_relative_vertices(morph) for morph in EGMData.data.sym_morphs]
+        asym_morphs = [self.get_egm_relative_vertices(morph) for morph in EGMData.data.asym_morphs]
 
         # insert base key at frame 1, using absolute keys
         sk_basis = b_obj.shape_key_add(name="Basis")
@@ -159,23 +159,28 @@ class MorphAnimation(Animation):
         morphs = ([(morph, f"EGM SYM {i}") for i, morph in enumerate(sym_morphs)] +
                   [(morph, f"EGM ASYM {i}") for i, morph in enumerate(asym_morphs)])
 
-        base_verts = [v.co for v in b_mesh.vertices]
+        base_verts = math.get_coordinates(b_mesh.vertices)
         for morph_verts, key_name in morphs:
-            # convert tuples into vector here so we can simply add in morph_mesh()
-            for b_v_index, (bv, mv) in enumerate(zip(base_verts, morph_verts)):
-                b_mesh.vertices[b_v_index].co = bv + mathutils.Vector(mv)
-            b_obj.shape_key_add(name=key_name, from_mix=False)
-
-    def morph_mesh(self, b_mesh, baseverts, morphverts):
-        """Transform a mesh to be in the shape given by morphverts."""
+            shape_key = b_obj.shape_key_add(name=key_name, from_mix=False)
+            self.morph_mesh(shape_key, base_verts, morph_verts)
+
+    @staticmethod
+    def get_egm_relative_vertices(morph):
+        """Decode the vertex offsets of an EGM morph to a (n, 3) float array."""
+        # same as morph.get_relative_vertices(), but scaling all vertices at once
+        offsets = np.array([(vert.x, vert.y, vert.z) for vert in morph.vertices], dtype=float).reshape((-1, 3))
+        return offsets * morph.scale
+
+    def morph_mesh(self, shape_key, baseverts, morphverts):
+        """Transform a shape key to be in the shape given by morphverts."""
         # for each vertex calculate the key position from base
         # pos + delta offset
         # length check disabled
         # as sometimes, oddly, the morph has more vertices...
-        # assert(len(baseverts) == len(morphverts))
-        for b_v_index, (bv, mv) in enumerate(zip(baseverts, morphverts)):
-            # pyffi vector3
-            v = bv + mv
-            # if applytransform:
-            # v *= transform
-            b_mesh.vertices[b_v_index].co = v.as_tuple()
+        # vertices that the morph does not cover keep the position they were added with
+        coordinates = math.get_coordinates(shape_key.data)
+        num_morphed = min(len(coordinates), len(baseverts), len(morphverts))
+        coordinates[:num_morphed] = baseverts[:num_morphed] + morphverts[:num_morphed]
+        # if applytransform:
+        # coordinates = coordinates @ transform
+        shape_key.data.foreach_set('co', coordinates.reshape(-1))
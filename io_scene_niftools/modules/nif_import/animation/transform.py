@@ -38,50 +38,60 @@
 # ***** END LICENSE BLOCK *****
 
 import bpy
-import mathutils
-import time
+import numpy as np
 
-from functools import singledispatch
-from bisect import bisect_left
 from nifgen.formats.nif import classes as NifClasses
+from nifgen.utils import keyframes
 
 from io_scene_niftools.modules.nif_import.animation import Animation
 from io_scene_niftools.modules.nif_import.object import block_registry
 from io_scene_niftools.utils import math
 from io_scene_niftools.utils.logging import NifLog
+from io_scene_niftools.utils.tracing import NifTrace, traced
 from io_scene_niftools.utils.consts import QUAT, EULER, LOC, SCALE
 
 
-def as_b_quat(n_val):
-    return mathutils.Quaternion([n_val.w, n_val.x, n_val.y, n_val.z])
+def as_b_quat(n_vals):
+    return math.struct_array_to_float(n_vals).reshape(-1, 4)
 
 
-def as_b_loc(n_val):
-    return mathutils.Vector([n_val.x, n_val.y, n_val.z])
+def as_b_loc(n_vals):
+    return math.struct_array_to_float(n_vals).reshape(-1, 3)
 
 
-def as_b_scale(n_val):
-    return n_val, n_val, n_val
+def as_b_scale(n_vals):
+    return np.repeat(np.asarray(n_vals, dtype=float).reshape(-1, 1), 3, axis=1)
 
 
-def as_b_euler(n_val):
-    return mathutils.Euler(n_val)
+def as_b_euler(n_vals):
+    return np.asarray(n_vals, dtype=float).reshape(-1, 3)
 
 
-def correct_loc(key, n_bind_rot_inv, n_bind_trans):
-    return math.import_keymat(n_bind_rot_inv, mathutils.Matrix.Translation(key - n_bind_trans)).to_translation()
+# the correctors apply math.import_keymat to all keys of a channel at once
+def correct_loc(keys, n_bind_rot_inv, n_bind_trans):
+    rot = np.array((math.correction @ n_bind_rot_inv).to_3x3())
+    return (keys - np.array(n_bind_trans)) @ rot.T
 
 
-def correct_quat(key, n_bind_rot_inv, n_bind_trans):
-    return math.import_keymat(n_bind_rot_inv, key.to_matrix().to_4x4()).to_quaternion()
+def correct_quat(keys, n_bind_rot_inv, n_bind_trans):
+    pre = np.array((math.correction @ n_bind_rot_inv).to_quaternion())
+    post = np.array(math.correction_inv.to_quaternion())
+    norms = np.linalg.norm(keys, axis=1, keepdims=True)
+    keys = np.divide(keys, norms, out=np.zeros_like(keys), where=norms > 0)
+    quats = math.quat_multiply(math.quat_multiply(pre, keys), post)
+    # like Matrix.to_quaternion, keep w positive
+    quats[quats[:, 0] < 0] *= -1
+    return quats
 
 
-def correct_euler(key, n_bind_rot_inv, n_bind_trans):
-    return math.import_keymat(n_bind_rot_inv, key.to_matrix().to_4x4()).to_euler()
+def correct_euler(keys, n_bind_rot_inv, n_bind_trans):
+    pre = np.array((math.correction @ n_bind_rot_inv).to_3x3())
+    post = np.array(math.correction_inv.to_3x3())
+    return math.matrix_to_euler(pre @ math.euler_to_matrix(keys) @ post)
 
 
-def correct_scale(key, n_bind_rot_inv, n_bind_trans):
-    return key
+def correct_scale(keys, n_bind_rot_inv, n_bind_trans):
+    return keys
 
 
 key_lut = {
@@ -92,33 +102,17 @@ key_lut = {
 }
 
 
-def interpolate(x_out, x_in, y_in):
-    """
-    sample (x_in I y_in) at x coordinates x_out
-    """
-    y_out = []
-    intervals = zip(x_in, x_in[1:], y_in, y_in[1:])
-    slopes = [(y2 - y1) / (x2 - x1) for x1, x2, y1, y2 in intervals]
-    # if we had just one input, slope will be 0 for constant extrapolation
-    if not slopes:
-        slopes = [0, ]
-    for x in x_out:
-        i = bisect_left(x_in, x) - 1
-        # clamp to valid range
-        i = max(min(i, len(slopes) - 1), 0)
-        y_out.append(y_in[i] + slopes[i] * (x - x_in[i]))
-    return y_out
+# the key types of the channels of nifgen.utils.keyframes.TransformKeys
+channel_key_types = {
+    "translation": LOC,
+    "rotation": QUAT,
+    "euler": EULER,
+    "scale": SCALE,
+}
 
 
 class TransformAnimation(Animation):
 
-    def __init__(self):
-        super().__init__()
-        self.import_kf_root = singledispatch(self.import_kf_root)
-        self.import_kf_root.register(NifClasses.NiControllerSequence, self.import_controller_sequence)
-        self.import_kf_root.register(NifClasses.NiSequenceStreamHelper, self.import_sequence_stream_helper)
-        self.import_kf_root.register(NifClasses.NiSequenceData, self.import_sequence_data)
-
     def get_bind_data(self, b_armature):
         """Get the required bind data of an armature. Used by standalone KF import and export. """
         self.bind_data = {}
@@ -140,82 +134,33 @@ class TransformAnimation(Animation):
                 return bpy.data.objects[b_name]
 
     def import_kf_root(self, kf_root, b_armature_obj):
-        """Base method to warn user that this root type is not supported"""
-        NifLog.warn(f"Unknown KF root block found : {kf_root.name}")
-        NifLog.warn(f"This type isn't currently supported: {type(kf_root)}")
-
-    def import_generic_kf_root(self, kf_root):
-        NifLog.debug(f'Importing {type(kf_root)}...')
-        return kf_root.name
-
-    def import_sequence_data(self, kf_root, b_armature_obj):
-        b_action_name = self.import_generic_kf_root(kf_root)
-        actions = set()
-        for evaluator in kf_root.evaluators:
-            b_target = self.get_target(b_armature_obj, evaluator.node_name)
-            actions.add(self.import_keyframe_controller(evaluator, b_armature_obj, b_target, b_action_name))
-        for b_action in actions:
-            if b_action:
-                self.import_text_keys(kf_root, b_action)
-                if kf_root.cycle_type:
-                    extend = self.get_extend_from_cycle_type(kf_root.cycle_type)
-                    self.set_extrapolation(extend, b_action.fcurves)
-
-    def import_sequence_stream_helper(self, kf_root, b_armature_obj):
-        b_action_name = self.import_generic_kf_root(kf_root)
-        actions = set()
-        # import parallel trees of extra datas and keyframe controllers
-        extra = kf_root.extra_data
-        controller = kf_root.controller
-        textkeys = None
-        while extra and controller:
-            # textkeys in the stack do not specify node names, import as markers
-            while isinstance(extra, NifClasses.NiTextKeyExtraData):
-                textkeys = extra
-                extra = extra.next_extra_data
-
-            # grabe the node name from string data
-            if isinstance(extra, NifClasses.NiStringExtraData):
-                b_target = self.get_target(b_armature_obj, extra.string_data)
-                actions.add(self.import_keyframe_controller(controller, b_armature_obj, b_target, b_action_name))
-            # grab next pair of extra and controller
-            extra = extra.next_extra_data
-            controller = controller.next_controller
-        for b_action in actions:
-            if b_action:
-                self.import_text_key_extra_data(textkeys, b_action)
-
-    def import_controller_sequence(self, kf_root, b_armature_obj):
-        b_action_name = self.import_generic_kf_root(kf_root)
+        """Import the keys of a NiControllerSequence, NiSequenceStreamHelper or NiSequenceData"""
+        self.import_sequence_keys(keyframes.get_sequence_keys(kf_root, self.fps), b_armature_obj)
+
+    def import_sequence_keys(self, sequence, b_armature_obj):
+        """Import the keys extracted from a kf root block as actions"""
+        if not sequence.is_supported:
+            NifLog.warn(f"Unknown KF root block found : {sequence.name}")
+            NifLog.warn(f"This type isn't currently supported: {sequence.root_type}")
+            return
+        NifLog.debug(f'Importing {sequence.root_type}...')
+        b_action_name = sequence.name
         actions = set()
-        for controlledblock in kf_root.controlled_blocks:
-            # get bone name
-            # todo [pyffi] fixed get_node_name() is up, make release and clean up here
-            # ZT2 - old way is not supported by pyffi's get_node_name()
-            n_name = controlledblock.target_name
-            # fallout (node_name) & Loki (StringPalette)
-            if not n_name:
-                n_name = controlledblock.get_node_name()
-            b_target = self.get_target(b_armature_obj, n_name)
+        for transform_keys in sequence.targets:
+            b_target = self.get_target(b_armature_obj, transform_keys.node_name)
             # todo - temporarily disabled! should become a custom property on both object and pose bone, ideally
             # import bone priority
             # b_target.niftools.priority = controlledblock.priority
-            # fallout, Loki
-            kfc = controlledblock.interpolator
-            if not kfc:
-                # ZT2
-                kfc = controlledblock.controller
-            if kfc:
-                actions.add(self.import_keyframe_controller(kfc, b_armature_obj, b_target, b_action_name))
+            actions.add(self.import_transform_keys(transform_keys, b_armature_obj, b_target, b_action_name))
         for b_action in actions:
             if b_action:
-                self.import_text_keys(kf_root, b_action)
-                # Store cycle_type as custom property for export
-                if hasattr(kf_root, 'cycle_type'):
-                    b_action["nif_cycle_type"] = int(kf_root.cycle_type)
+                self.import_text_keys(sequence.text_keys, b_action)
+                if sequence.cycle_type is not None:
+                    # Store cycle_type as custom property for export
+                    b_action["nif_cycle_type"] = sequence.cycle_type
                 # fallout: set global extrapolation mode here (older versions have extrapolation per controller)
-                if kf_root.cycle_type:
-                    extend = self.get_extend_from_cycle_type(kf_root.cycle_type)
+                if sequence.cycle_type:
+                    extend = self.get_extend_from_cycle_type(sequence.cycle_type)
                     self.set_extrapolation(extend, b_action.fcurves)
 
     def import_keyframe_controller(self, n_kfc, b_armature, b_target, b_action_name):
@@ -227,24 +172,27 @@ class TransformAnimation(Animation):
         b_action_name: name of the action that should be used; the actual imported name may differ due to suffixes
         """
         # the target may not exist in the scene, in which case it is None here
+        if not b_target:
+            return
+        transform_keys = keyframes.get_transform_keys(n_kfc, b_target.name, self.fps)
+        return self.import_transform_keys(transform_keys, b_armature, b_target, b_action_name)
+
+    def import_transform_keys(self, transform_keys, b_armature, b_target, b_action_name):
+        """
+        Imports the keys extracted from a keyframe controller as fcurves in an action, which is created if necessary.
+        transform_keys: nifgen.utils.keyframes.TransformKeys
+        b_armature: either None or Object (blender armature)
+        b_target: either Object or PoseBone
+        b_action_name: name of the action that should be used; the actual imported name may differ due to suffixes
+        """
+        # the target may not exist in the scene, in which case it is None here
         if not b_target:
             return
         NifLog.debug(f'Importing keyframe controller for {b_target.name}')
-        
-        # Check if this interpolator has any actual keyframe data
-        has_keyframe_data = False
-        n_kfd = self.get_controller_data(n_kfc)
-        if n_kfd and isinstance(n_kfd, NifClasses.NiKeyframeData):
-            has_keyframe_data = (n_kfd.num_rotation_keys > 0 or 
-                                 (hasattr(n_kfd.translations, 'num_keys') and n_kfd.translations.num_keys > 0) or
-                                 (hasattr(n_kfd.scales, 'num_keys') and n_kfd.scales.num_keys > 0))
-        elif n_kfd and isinstance(n_kfd, NifClasses.NiTransformData):
-            has_keyframe_data = (n_kfd.num_rotation_keys > 0 or 
-                                 (hasattr(n_kfd.translations, 'num_keys') and n_kfd.translations.num_keys > 0) or
-                                 (hasattr(n_kfd.scales, 'num_keys') and n_kfd.scales.num_keys > 0))
 
         # fallout, Loki - we set extrapolation according to the root NiControllerSequence.cycle_type
-        flags = None
+        # ZT2 - the flags of every kfc hold its extrapolation
+        flags = transform_keys.flags
         n_bind_rot_inv = n_bind_trans = None
 
         # create or get the action
@@ -260,7 +208,7 @@ class TransformAnimation(Animation):
             bone_name = None
         
         # If no keyframe data, create bind pose keys so bone is included in export
-        if not has_keyframe_data:
+        if not transform_keys.has_keys:
             NifLog.debug(f'No keyframe data for {b_target.name}, creating bind pose keys')
             # Create a single keyframe at frame 0 with bind pose (identity transform)
             # This ensures the bone is exported even without animation
@@ -280,78 +228,32 @@ class TransformAnimation(Animation):
                             fcu.keyframe_points.insert(0, 1.0)
             return b_action
 
-        # B-spline curve import
-        if isinstance(n_kfc, NifClasses.NiBSplineInterpolator):
-            # Bsplines are Bezier curves
-            interp = "BEZIER"
-            if isinstance(n_kfc, NifClasses.NiBSplineCompFloatInterpolator):
-                # used by WLP2 (tiger.kf), but only for non-LocRotScale data
-                # eg. bone stretching - see controlledblock.get_variable_1()
-                # do not support this for now, no good representation in Blender
-                # pyffi lacks support for this, but the following gets float keys
-                # keys = list(kfc._getCompKeys(kfc.offset, 1, kfc.bias, kfc.multiplier))
-                return
-            times = list(n_kfc.get_times())
-            keys = [NifClasses.Vector3.from_value(tuple_key) for tuple_key in n_kfc.get_translations()]
-            self.import_keys(LOC, b_action, bone_name, times, keys, flags, interp, n_bind_rot_inv, n_bind_trans)
-            keys = [NifClasses.Quaternion.from_value(tuple_key) for tuple_key in n_kfc.get_rotations()]
-            self.import_keys(QUAT, b_action, bone_name, times, keys, flags, interp, n_bind_rot_inv, n_bind_trans)
-            keys = list(n_kfc.get_scales())
-            self.import_keys(SCALE, b_action, bone_name, times, keys, flags, interp, n_bind_rot_inv, n_bind_trans)
-            return b_action
-        elif isinstance(n_kfc, NifClasses.NiMultiTargetTransformController):
-            # not sure what this is used for
+        # eg. B-spline float interpolators, no good representation in Blender
+        if not transform_keys.is_supported:
             return
-        n_kfd = self.get_controller_data(n_kfc)
-        # ZT2 - get extrapolation for every kfc
-        if isinstance(n_kfc, NifClasses.NiKeyframeController):
-            flags = n_kfc.flags
-        if isinstance(n_kfd, NifClasses.NiKeyframeData):
-            if n_kfd.rotation_type == 4:
-                b_target.rotation_mode = "XYZ"
-                # euler keys need not be sampled at the same time in KFs
-                # but we need complete key sets to do the space conversion
-                # so perform linear interpolation to import all keys properly
-
-                # get all the times and keys for each coordinate
-                times_keys = [self.get_keys_values(euler.keys) for euler in n_kfd.xyz_rotations]
-                # the unique time stamps we have to sample all curves at
-                times_all = sorted(set(times_keys[0][0] + times_keys[1][0] + times_keys[2][0]))
-                # todo - this assumes that all three channels are keyframed, but it seems like this need not be the case
-                # resample each coordinate for all times
-                keys_res = [interpolate(times_all, times, keys) for times, keys in times_keys]
-                # for eulers, the actual interpolation type is apparently stored per channel
-                interp = self.get_b_interp_from_n_interp(n_kfd.xyz_rotations[0].interpolation)
-                self.import_keys(EULER, b_action, bone_name, times_all, zip(*keys_res), flags, interp, n_bind_rot_inv, n_bind_trans)
-            else:
-                b_target.rotation_mode = "QUATERNION"
-                times, keys = self.get_keys_values(n_kfd.quaternion_keys)
-                interp = self.get_b_interp_from_n_interp(n_kfd.rotation_type)
-                self.import_keys(QUAT, b_action, bone_name, times, keys, flags, interp, n_bind_rot_inv, n_bind_trans)
-            times, keys = self.get_keys_values(n_kfd.scales.keys)
-            interp = self.get_b_interp_from_n_interp(n_kfd.scales.interpolation)
-            self.import_keys(SCALE, b_action, bone_name, times, keys, flags, interp, n_bind_rot_inv, n_bind_trans)
-
-            times, keys = self.get_keys_values(n_kfd.translations.keys)
-            interp = self.get_b_interp_from_n_interp(n_kfd.translations.interpolation)
-            self.import_keys(LOC, b_action, bone_name, times, keys, flags, interp, n_bind_rot_inv, n_bind_trans)
-
+        if transform_keys.rotation_mode:
+            b_target.rotation_mode = transform_keys.rotation_mode
+        for channel, times, keys, n_interp in transform_keys.channels:
+            interp = self.get_b_interp_from_n_interp(n_interp)
+            self.import_keys(channel_key_types[channel], b_action, bone_name, times, keys, flags, interp, n_bind_rot_inv, n_bind_trans)
         return b_action
 
     def import_keys(self, key_type, b_action, bone_name, times, keys, flags, interp, n_bind_rot_inv, n_bind_trans):
         """Imports key frames according to the specified key_type"""
-        if not keys:
+        if not len(keys):
             return
         # look up conventions by key type
         key_func, key_corrector, key_dim = key_lut[key_type]
         NifLog.debug(f'{key_type} keys...')
-        # convert nif keys to proper key type for blender
-        keys = [key_func(val) for val in keys]
+        NifTrace.count("keys", len(keys))
+        # convert nif keys to an array of blender keys
+        keys = key_func(keys)
         # correct for bone space if target is an armature bone
         if bone_name:
-            keys = [key_corrector(key, n_bind_rot_inv, n_bind_trans) for key in keys]
+            keys = key_corrector(keys, n_bind_rot_inv, n_bind_trans)
         self.add_keys(b_action, key_type, range(key_dim), flags, times, keys, interp, bone_name=bone_name)
 
+    @traced("animation")
     def import_transforms(self, n_block, b_obj, bone_name=None):
         """Loads an animation attached to a nif block."""
         # find keyframe controller
@@ -365,6 +267,7 @@ class TransformAnimation(Animation):
             else:
                 self.import_keyframe_controller(n_kfc, None, b_obj, f"{b_obj.name}_Anim")
 
+    @traced("animation")
     def import_controller_manager(self, n_block, b_obj, b_armature):
         ctrlm = n_block.controller
         if ctrlm and isinstance(ctrlm, NifClasses.NiControllerManager):
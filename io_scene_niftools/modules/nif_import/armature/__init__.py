@@ -44,6 +44,7 @@ import bpy
 from bpy_extras.io_utils import orientation_helper
 import mathutils
 from nifgen.formats.nif import classes as NifClasses
+from nifgen.utils.scenegraph import SceneGraphIndex
 
 
 import io_scene_niftools.utils.logging
@@ -64,9 +65,17 @@ class Armature:
         self.name_to_block = {}
         self.pose_store = {}
         self.bind_store = {}
+        # parents and cached armature space transforms of the armature's tree
+        self.scene_graph = None
         self.skinned = False
         self.n_armature = None
 
+    def get_armature_transform(self, n_block, n_root):
+        """Get the nif armature space matrix of a block, ie. its transform relative to n_root"""
+        if self.scene_graph is None or self.scene_graph.root is not n_root:
+            self.scene_graph = SceneGraphIndex(n_root)
+        return self.scene_graph.get_transform(n_block)
+
     def store_pose_matrices(self, n_node, n_root):
         """Stores the nif armature space matrix of a node tree"""
         # check that n_block is indeed a bone
@@ -74,7 +83,7 @@ class Armature:
             return None
         NifLog.debug(f"Storing pose matrix for {n_node.name}")
         # calculate the transform relative to root, ie. turn nif local into nif armature space
-        self.pose_store[n_node] = n_node.get_transform(n_root)
+        self.pose_store[n_node] = self.get_armature_transform(n_node, n_root)
         # move down the hierarchy
         for n_child in n_node.children:
             self.store_pose_matrices(n_child, n_root)
@@ -96,7 +105,7 @@ class Armature:
         # this gives a straight rest pose for MW too
         # return n_bone.get_transform().get_inverse(fast=False) * geom.skin_instance.data.get_transform().get_inverse(fast=False)
         # however, this conflicts with send_geometries_to_bind_position for MW meshes, so stick to this now
-        return inv_bind.get_inverse(fast=False) * geom.get_transform(n_root)
+        return inv_bind.get_inverse(fast=False) * self.get_armature_transform(geom, n_root)
 
     def bones_iter(self, skin_instance):
         # might want to make sure that bone_list includes no dupes too to avoid breaking the first mesh
@@ -130,7 +139,7 @@ class Armature:
                         diff = (bonedata.get_transform()
                                 * self.bind_store[bonenode]
                                 # * geom.skin_instance.data.get_transform())  use this if relative to skin instead of geom
-                                * geom.get_transform(n_armature).get_inverse(fast=False))
+                                * self.get_armature_transform(geom, n_armature).get_inverse(fast=False))
                         # there is a difference between the two geometries' bind poses
                         if not diff.is_identity():
                             NifLog.debug(f"Fixing {geom.name} bind position")
@@ -144,20 +153,20 @@ class Armature:
                             if isinstance(geom, NifClasses.BSDynamicTriShape):
                                 vertices = geom.vertices
                             else:
-                                vertices = [vert_data.vertex for vert_data in vertex_data]
+                                vertices = vertex_data["vertex"]
 
-                            normals = [vert_data.normal for vert_data in vertex_data]
+                            normals = vertex_data["normal"]
                         else:
                             vertices = geom.data.vertices
                             normals = geom.data.normals
                         # BSDynamicTriShape uses Vector4 to store vertices with a 0 W component, which would
                         # nullify translation when multiplied by a Matrix44. Hence, first conversion to three-component
                         # vector
-                        np_vertices = np.array(vertices, dtype=float)[:,:3]
+                        np_vertices = math.struct_array_to_float(vertices)[:,:3]
                         np_vertices = np.pad(np_vertices, (0, 1), constant_values=1.0)
                         np_diff = np.array(diff.as_list())
                         np_vertices = np_vertices @ np_diff
-                        np_normals = np.array(normals, dtype=float)
+                        np_normals = math.struct_array_to_float(normals)
                         np_diff33 = np.array(diff.get_matrix_33().as_list())
                         np_normals = np_normals @ np_diff33
                         # assign the transformed values back
@@ -183,7 +192,9 @@ class Armature:
             if n_child_node not in self.bind_store and n_child_node in self.pose_store:
                 NifLog.debug(f"Calculating bind pose for non-skeletal bone {n_child_node.name}")
                 # get matrices for n_node (the parent) - fallback to getter if it is not in the store
-                n_armature_pose = self.pose_store.get(n_node, n_node.get_transform(n_root))
+                n_armature_pose = self.pose_store.get(n_node)
+                if n_armature_pose is None:
+                    n_armature_pose = self.get_armature_transform(n_node, n_root)
                 # get bind of parent node or pose if it has no bind pose
                 n_armature_bind = self.bind_store.get(n_node, n_armature_pose)
 
@@ -221,6 +232,7 @@ class Armature:
         # store the original pose & bind matrices for all nodes
         self.pose_store = {}
         self.bind_store = {}
+        self.scene_graph = SceneGraphIndex(n_armature)
         self.store_pose_matrices(n_armature, n_armature)
         self.store_bind_matrices(n_armature)
 
@@ -245,16 +257,39 @@ class Armature:
                     self.transform_anim.import_transforms(n_block, b_armature_obj, bone_name)
 
         # import pose
-        for b_name, n_block in self.name_to_block.items():
-            n_pose = self.pose_store[n_block]
-            b_pose_bone = b_armature_obj.pose.bones[b_name]
-            n_bind = math.nifformat_to_mathutils_matrix(n_pose)
-            b_pose_bone.matrix = math.nif_bind_to_blender_bind(n_bind)
-            # force update is required after each pbone to ensure the transforms are set properly in blender
-            bpy.context.view_layer.update()
+        self.import_pose(b_armature_obj)
 
         return b_armature_obj
 
+    def import_pose(self, b_armature_obj):
+        """Pose all bones from their stored nif armature space matrices, with a single update at the end"""
+        b_pose_bones = b_armature_obj.pose.bones
+        # the armature space pose matrix of each bone, to get its children's pose relative to it
+        b_pose_matrices = {}
+        # walk the hierarchy so that parents are posed before their children
+        b_bones = [b_bone for b_bone in b_armature_obj.data.bones if not b_bone.parent]
+        while b_bones:
+            b_bone = b_bones.pop()
+            b_bones.extend(b_bone.children)
+            if b_bone.parent:
+                parent_matrices = {"parent_matrix": b_pose_matrices[b_bone.parent.name],
+                                   "parent_matrix_local": b_bone.parent.matrix_local}
+            else:
+                parent_matrices = {}
+            n_block = self.name_to_block.get(b_bone.name)
+            if n_block:
+                n_pose = math.nifformat_to_mathutils_matrix(self.pose_store[n_block])
+                b_pose_matrix = math.nif_bind_to_blender_bind(n_pose)
+                # convert from armature space to the bone's local space, without evaluating the parent pose
+                b_pose_bones[b_bone.name].matrix_basis = b_bone.convert_local_to_pose(
+                    b_pose_matrix, b_bone.matrix_local, invert=True, **parent_matrices)
+            else:
+                # bones without a nif block (eg. NiMesh bones) stay in rest position
+                b_pose_matrix = b_bone.convert_local_to_pose(
+                    mathutils.Matrix.Identity(4), b_bone.matrix_local, **parent_matrices)
+            b_pose_matrices[b_bone.name] = b_pose_matrix
+        bpy.context.view_layer.update()
+
     def create_bone(self, bone_name, bind_key, b_armature_data, b_parent_bone=None):
         """Adds a bone to the armature in edit mode."""
         # create a new bone
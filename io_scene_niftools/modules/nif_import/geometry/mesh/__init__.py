@@ -51,6 +51,7 @@ from io_scene_niftools.modules.nif_import.property.geometry.mesh import MeshProp
 from io_scene_niftools.utils import math
 from io_scene_niftools.utils.singleton import NifOp
 from io_scene_niftools.utils.logging import NifLog, NifError
+from io_scene_niftools.utils.tracing import NifTrace, traced
 
 
 class Mesh:
@@ -62,6 +63,7 @@ class Mesh:
         self.morph_anim = MorphAnimation()
         self.mesh_prop_processor = MeshPropertyProcessor()
 
+    @traced("mesh")
     def import_mesh(self, n_block, b_obj):
         """Creates and returns a raw mesh, or appends geometry data to group_mesh.
 
@@ -90,14 +92,14 @@ class Mesh:
                 # for BSDynamicTriShapes, the vertex data is stored in 4-component vertices
                 vertices = [(vertex.x, vertex.y, vertex.z) for vertex in n_block.vertices]
             elif vertex_attributes.vertex:
-                vertices = [vertex.vertex for vertex in vertex_data]
+                vertices = math.struct_array_to_float(vertex_data["vertex"])
             triangles = n_block.get_triangles()
             if vertex_attributes.u_vs:
-                uvs = [[vertex.uv for vertex in vertex_data]]
+                uvs = [vertex_data["uv"]]
             if vertex_attributes.vertex_colors:
-                vertex_colors = [NifClasses.Color4.from_value(tuple(c / 255.0 for c in vertex.vertex_colors)) for vertex in vertex_data]
+                vertex_colors = math.struct_array_to_float(vertex_data["vertex_colors"]) / 255.0
             if vertex_attributes.normals:
-                normals = [vertex.normal for vertex in vertex_data]
+                normals = vertex_data["normal"]
         elif isinstance(n_block, NifClasses.NiMesh):
             # if it has a displaylist then the vertex data is encoded differently
             displaylist_data = n_block.geomdata_by_name("DISPLAYLIST", False, False)
@@ -106,7 +108,7 @@ class Mesh:
                 vertices_info, triangles, weights = displaylist.extract_mesh_data(n_block)
                 vertices = vertices_info[0]
                 normals = vertices_info[1]
-                vertex_colors = [NifClasses.Color4.from_value(color) for color in vertices_info[2]]
+                vertex_colors = math.struct_array_to_float(vertices_info[2])
                 uvs = vertices_info[3]
             else:
                 # get the data from the associated nidatastreams based on the description in the component semantics
@@ -118,13 +120,13 @@ class Mesh:
                 if len(vertex_colors) == 0:
                     vertex_colors = None
                 else:
-                    vertex_colors = [NifClasses.Color4.from_value(color) for color in vertex_colors]
+                    vertex_colors = math.struct_array_to_float(vertex_colors)
                 normals = n_block.geomdata_by_name("NORMAL", sep_datastreams=False)
                 normals.extend(n_block.geomdata_by_name("NORMAL_BP", sep_datastreams=False))
             if len(uvs) == 0:
                 uvs = None
             else:
-                uvs = [[NifClasses.TexCoord.from_value(tex_coord) for tex_coord in uv_coords] for uv_coords in uvs]
+                uvs = [math.struct_array_to_float(uv_coords) for uv_coords in uvs]
             if len(normals) == 0:
                 normals = None
         elif isinstance(n_block, NifClasses.NiTriBasedGeom):
@@ -133,7 +135,7 @@ class Mesh:
             n_tri_data = n_block.data
             if not n_tri_data:
                 raise io_scene_niftools.utils.logging.NifError(f"No shape data in {node_name}")
-            vertices = n_tri_data.vertices
+            vertices = math.struct_array_to_float(n_tri_data.vertices)
             triangles = n_block.get_triangles()
             uvs = n_tri_data.uv_sets
             if n_tri_data.has_vertex_colors:
@@ -142,6 +144,7 @@ class Mesh:
                 normals = n_tri_data.normals
 
         # create raw mesh from vertices and triangles
+        NifTrace.count("vertices", len(vertices))
         b_mesh.from_pydata(vertices, [], triangles)
         b_mesh.update()
 
@@ -156,7 +159,7 @@ class Mesh:
             Vertex.map_vertex_colors(b_mesh, vertex_colors)
         if normals is not None:
             # for some cases, normals can be four-component structs instead of 3, discard the 4th.
-            Vertex.map_normals(b_mesh, np.array(normals)[:, :3])
+            Vertex.map_normals(b_mesh, math.struct_array_to_float(normals)[:, :3])
 
         self.mesh_prop_processor.process_property_list(n_block, b_obj)
 
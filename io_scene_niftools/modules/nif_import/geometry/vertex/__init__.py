@@ -41,32 +41,47 @@ import numpy as np
 
 import bpy
 
+from io_scene_niftools.utils import math
 from io_scene_niftools.utils.singleton import NifOp
 
 
 class Vertex:
 
+    @staticmethod
+    def get_loop_vertex_indices(b_mesh):
+        """Return the index of the vertex of every loop of the mesh as an array."""
+        loop_vertex_indices = np.empty(len(b_mesh.loops), dtype=np.int32)
+        b_mesh.loops.foreach_get("vertex_index", loop_vertex_indices)
+        return loop_vertex_indices
+
     @staticmethod
     def map_vertex_colors(b_mesh, vertex_colors):
+        """Import per vertex colors, given as Color4 structs or an (n, 4) float array."""
+        vertex_colors = math.struct_array_to_float(vertex_colors, dtype=np.float32)
         # in Blender 3.2, vertex_colors was deprecated (https://wiki.blender.org/wiki/Reference/Release_Notes/3.2/Python_API)
         # so use Color attribute instead when 3.2 or greater
         if bpy.app.version >= (3, 2, 0):
             b_mesh.color_attributes.new(name="RGBA",type="FLOAT_COLOR",domain="POINT")
-            b_mesh.color_attributes[-1].data.foreach_set("color", [channel for color in vertex_colors for channel in color])
+            b_mesh.color_attributes[-1].data.foreach_set("color", vertex_colors.ravel())
         else:
             b_mesh.vertex_colors.new(name="RGBA")
-            b_mesh.vertex_colors[-1].data.foreach_set("color", [channel for col in [vertex_colors[loop.vertex_index] for loop in b_mesh.loops] for channel in (col.r, col.g, col.b, col.a)])
+            b_mesh.vertex_colors[-1].data.foreach_set("color", vertex_colors[Vertex.get_loop_vertex_indices(b_mesh)].ravel())
 
     @staticmethod
     def map_uv_layer(b_mesh, uv_sets):
         """ UV coordinates, NIF files only support 'sticky' UV coordinates, and duplicates vertices to emulate hard edges and UV seam.
             So whenever a hard edge or a UV seam is present the mesh, vertices are duplicated.
-            Blender only must duplicate vertices for hard edges; duplicating for UV seams would introduce unnecessary hard edges."""
+            Blender only must duplicate vertices for hard edges; duplicating for UV seams would introduce unnecessary hard edges.
+            Every uv set is given as TexCoord structs or an (n, 2) float array."""
 
+        loop_vertex_indices = Vertex.get_loop_vertex_indices(b_mesh)
         # "sticky" UV coordinates: these are transformed in Blender UV's
         for uv_i, uv_set in enumerate(uv_sets):
+            uvs = math.struct_array_to_float(uv_set, dtype=np.float32)
+            # build a new array, the converted uvs may be a view of the nif data
+            uvs = np.column_stack((uvs[:, 0], 1.0 - uvs[:, 1]))
             b_mesh.uv_layers.new(name=f"UV{uv_i}")
-            b_mesh.uv_layers[-1].data.foreach_set("uv", [coord for uv in [uv_set[loop.vertex_index] for loop in b_mesh.loops] for coord in (uv.u, 1.0 - uv.v)])
+            b_mesh.uv_layers[-1].data.foreach_set("uv", uvs[loop_vertex_indices].ravel())
 
     @staticmethod
     def map_normals(b_mesh, normals):
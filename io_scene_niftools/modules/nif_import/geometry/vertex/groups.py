@@ -42,67 +42,19 @@ from itertools import chain
 
 from nifgen.formats.nif import classes as NifClasses
 from nifgen.formats.nif.nimesh.structs.DisplayList import DisplayList
+from nifgen.utils import skinning
 
 from io_scene_niftools.modules.nif_import.object.block_registry import block_store, get_bone_name_for_blender
 from io_scene_niftools.utils import math as nif_math
 from io_scene_niftools.utils.logging import NifLog
+from io_scene_niftools.utils.tracing import traced
 
 
 class VertexGroup:
     """Class that maps weighted vertices to specific groups"""
 
     @staticmethod
-    def get_skin_deformation_from_partition(n_geom):
-        """ Workaround because pyffi does not support this skinning method """
-
-        # todo [pyffi] integrate this into pyffi!!!
-        #              so that NiGeometry.get_skin_deformation() deals with this as intended
-
-        # mostly a copy from pyffi...
-        skin_inst = n_geom.skin_instance
-        skin_data = skin_inst.data
-        skin_partition = skin_inst.skin_partition
-        skel_root = skin_inst.skeleton_root
-        vertices = [NifClasses.Vector3() for _ in range(n_geom.data.num_vertices)]
-
-        # ignore normals for now, not needed for import
-        sum_weights = [0.0 for _ in range(n_geom.data.num_vertices)]
-        skin_offset = skin_data.get_transform()
-
-        # store one transform per bone
-        bone_transforms = []
-        for i, bone_block in enumerate(skin_inst.bones):
-            bone_data = skin_data.bone_list[i]
-            bone_offset = bone_data.get_transform()
-            bone_matrix = bone_block.get_transform(skel_root)
-            transform = bone_offset * bone_matrix * skin_offset
-            bone_transforms.append(transform)
-
-        # now the actual unique bit
-        for block in skin_partition.partitions:
-            # create all vgroups for this block's bones
-            block_bone_transforms = [bone_transforms[i] for i in block.bones]
-
-            # go over each vert in this block
-            for vert_index, vertex_weights, bone_indices in zip(block.vertex_map, block.vertex_weights, block.bone_indices):
-                # skip verts that were already processed in an earlier block
-                if sum_weights[vert_index] != 0:
-                    continue
-
-                # go over all 4 weight / bone pairs and transform this vert
-                for weight, b_i in zip(vertex_weights, bone_indices):
-                    if weight > 0:
-                        transform = block_bone_transforms[b_i]
-                        vertices[vert_index] += weight * (n_geom.data.vertices[vert_index] * transform)
-                        sum_weights[vert_index] += weight
-
-        for i, s in enumerate(sum_weights):
-            if abs(s - 1.0) > 0.01:
-                print(f"Vertex {i:d} has weights not summing to one: {sum_weights['i']:d}")
-
-        return vertices
-
-    @staticmethod
+    @traced("skin")
     def apply_skin_deformation(n_data):
         """ Process all geometries in NIF tree to apply their skin """
         # get all geometries with skin
@@ -122,18 +74,17 @@ class VertexGroup:
             NifLog.info(f'[SKIN IMPORT]   Number of bones: {len(skininst.bones)}')
             if skindata.has_vertex_weights:
                 NifLog.info(f'[SKIN IMPORT]   Using standard vertex weights deformation')
-                vertices = n_geom.get_skin_deformation()[0]
             else:
-                NifLog.info("[SKIN IMPORT]   PyFFI does not support this type of skinning, using partition workaround...")
-                vertices = VertexGroup.get_skin_deformation_from_partition(n_geom)
+                NifLog.info("[SKIN IMPORT]   No vertex weights in skin data, using the weights of the skin partition")
+            vertices = n_geom.get_skin_deformation()[0]
 
             # finally we can actually set the data
-            for vold, vnew in zip(n_geom.data.vertices, vertices):
-                vold.x = vnew.x
-                vold.y = vnew.y
-                vold.z = vnew.z
+            n_vertices = n_geom.data.vertices
+            for i, field in enumerate(("x", "y", "z")):
+                n_vertices[field] = vertices[:, i]
 
     @classmethod
+    @traced("skin")
     def import_skin(cls, ni_block, b_obj):
         """Import a NiSkinInstance and its contents as vertex groups"""
         NifLog.info(f"[SKIN IMPORT] ========== Importing Skin for '{ni_block.name}' ==========")
@@ -144,52 +95,58 @@ class VertexGroup:
         NifLog.info(f"[SKIN IMPORT] Skeleton root: '{skin_inst.skeleton_root.name if skin_inst.skeleton_root else 'None'}'")
         NifLog.info(f"[SKIN IMPORT] Number of bones: {len(skin_inst.bones)}")
         
+        # the transforms and weights of every bone are only logged when debugging, as they take several lines per bone
+        if NifLog.is_enabled('DEBUG'):
+            cls.log_skin_data(skin_inst, skin_data)
+        bone_weights_map = cls.get_bone_weights(ni_block)
+        NifLog.info(f"[SKIN IMPORT] Found {len(bone_weights_map)} bones with weights")
+        if NifLog.is_enabled('DEBUG'):
+            for bone_name, (v_indices, weights) in bone_weights_map.items():
+                NifLog.debug(f"[SKIN IMPORT]   Bone '{bone_name}': {len(v_indices)} vertices weighted")
+        
+        cls.set_bone_weights(bone_weights_map, b_obj)
+        face_maps = cls.get_face_maps(ni_block)
+        if face_maps:
+            NifLog.info(f"[SKIN IMPORT] Found {len(face_maps)} face maps (body parts)")
+        cls.set_face_maps(face_maps, b_obj)
+        NifLog.info(f"[SKIN IMPORT] ========== Skin Import Complete ==========")
+
+    @staticmethod
+    def log_skin_data(skin_inst, skin_data):
+        """Log the skin transform and the transform and bounds of every bone"""
         # Log skin transform data
         try:
             skin_transform = skin_data.get_transform()
             scale, rotation, translation = skin_transform.get_scale_rotation_translation()
-            NifLog.info(f"[SKIN IMPORT] Skin transform:")
-            NifLog.info(f"[SKIN IMPORT]   Translation: ({translation.x:.6f}, {translation.y:.6f}, {translation.z:.6f})")
-            NifLog.info(f"[SKIN IMPORT]   Scale: {scale:.6f}")
+            NifLog.debug(f"[SKIN IMPORT] Skin transform:")
+            NifLog.debug(f"[SKIN IMPORT]   Translation: ({translation.x:.6f}, {translation.y:.6f}, {translation.z:.6f})")
+            NifLog.debug(f"[SKIN IMPORT]   Scale: {scale:.6f}")
         except Exception as e:
             NifLog.warn(f"[SKIN IMPORT] Could not log skin transform: {e}")
         
         # Log bone data
         for i, bone_data in enumerate(skin_data.bone_list):
             bone_name = skin_inst.bones[i].name if i < len(skin_inst.bones) else 'Unknown'
-            NifLog.info(f"[SKIN IMPORT]   Bone {i} ('{bone_name}'): num_vertices={bone_data.num_vertices}")
+            NifLog.debug(f"[SKIN IMPORT]   Bone {i} ('{bone_name}'): num_vertices={bone_data.num_vertices}")
             
             # Log bone transform
             try:
                 bone_transform = bone_data.get_transform()
                 scale, rotation, translation = bone_transform.get_scale_rotation_translation()
-                NifLog.info(f"[SKIN IMPORT]     Transform:")
-                NifLog.info(f"[SKIN IMPORT]       Translation: ({translation.x:.6f}, {translation.y:.6f}, {translation.z:.6f})")
-                NifLog.info(f"[SKIN IMPORT]       Scale: {scale:.6f}")
+                NifLog.debug(f"[SKIN IMPORT]     Transform:")
+                NifLog.debug(f"[SKIN IMPORT]       Translation: ({translation.x:.6f}, {translation.y:.6f}, {translation.z:.6f})")
+                NifLog.debug(f"[SKIN IMPORT]       Scale: {scale:.6f}")
             except Exception as e:
                 NifLog.warn(f"[SKIN IMPORT]     Could not log bone transform: {e}")
             
             # Log bounding sphere (center and radius)
             try:
                 bound = bone_data.bounding_sphere
-                NifLog.info(f"[SKIN IMPORT]     Bounding Sphere:")
-                NifLog.info(f"[SKIN IMPORT]       Center: ({bound.center.x:.6f}, {bound.center.y:.6f}, {bound.center.z:.6f})")
-                NifLog.info(f"[SKIN IMPORT]       Radius: {bound.radius:.6f}")
+                NifLog.debug(f"[SKIN IMPORT]     Bounding Sphere:")
+                NifLog.debug(f"[SKIN IMPORT]       Center: ({bound.center.x:.6f}, {bound.center.y:.6f}, {bound.center.z:.6f})")
+                NifLog.debug(f"[SKIN IMPORT]       Radius: {bound.radius:.6f}")
             except Exception as e:
                 NifLog.warn(f"[SKIN IMPORT]     Could not log bounding sphere: {e}")
-        
-        # Log vertex weights
-        bone_weights_map = cls.get_bone_weights(ni_block)
-        NifLog.info(f"[SKIN IMPORT] Found {len(bone_weights_map)} bones with weights")
-        for bone_name, weights in bone_weights_map.items():
-            NifLog.info(f"[SKIN IMPORT]   Bone '{bone_name}': {len(weights)} vertices weighted")
-        
-        cls.set_bone_weights(bone_weights_map, b_obj)
-        face_maps = cls.get_face_maps(ni_block)
-        if face_maps:
-            NifLog.info(f"[SKIN IMPORT] Found {len(face_maps)} face maps (body parts)")
-        cls.set_face_maps(face_maps, b_obj)
-        NifLog.info(f"[SKIN IMPORT] ========== Skin Import Complete ==========")
 
     @staticmethod
     def get_bone_weights(ni_block):
@@ -197,11 +154,10 @@ class VertexGroup:
 
         :param ni_block: NiObject from which to take the weights
         :type ni_block: NifClasses.NiAVObject
-        :return: dictionary mapping bone name to vertex indices and weights
-        :rtype: dict(str, list(tuple(int, float)))
+        :return: dictionary mapping bone name to an array of vertex indices and an array of their weights
+        :rtype: dict(str, tuple(numpy.ndarray, numpy.ndarray))
 
         """
-        bone_weights_map = {}
         if isinstance(ni_block, NifClasses.NiMesh):
             if ni_block.has_extra_em_data:
                 # only for Epic Mickey nifs for now
@@ -214,16 +170,14 @@ class VertexGroup:
                     weight_indices = displaylist.extract_mesh_data(ni_block)[2]
                 else:
                     weight_indices = ni_block.extra_em_data.vertex_to_weight_map
-                bone_indices = np.zeros((len(weight_indices), 3), dtype=int)
-                bone_weights = np.zeros((len(weight_indices), 3), dtype=float)
-                for i, set_index in enumerate(weight_indices):
-                    weight = bone_weights_set[set_index]
-                    bone_indices[i] = weight.bone_indices
-                    bone_weights[i] = weight.weights
+                weight_indices = np.asarray(weight_indices, dtype=int)
+                set_bone_indices = np.array([weight.bone_indices for weight in bone_weights_set], dtype=int).reshape(-1, 3)
+                set_bone_weights = np.array([weight.weights for weight in bone_weights_set], dtype=float).reshape(-1, 3)
+                bone_indices = set_bone_indices[weight_indices]
+                bone_weights = set_bone_weights[weight_indices]
                 bone_names = [get_bone_name_for_blender(str(i)) for i in range(len(ni_block.extra_em_data.bone_transforms))]
             else:
-                bone_indices = []
-                bone_weights = chain.from_iterable(ni_block.geomdata_by_name('BLENDWEIGHT'))
+                bone_weights = np.array(list(chain.from_iterable(ni_block.geomdata_by_name('BLENDWEIGHT'))), dtype=float)
 
                 # assume there's only on SkinningMeshModifier
                 skin_modifier = [block for block in ni_block.modifiers if isinstance(block, NifClasses.NiSkinningMeshModifier)][0]
@@ -232,91 +186,90 @@ class VertexGroup:
                 bone_palettes = ni_block.geomdata_by_name('BONE_PALETTE', sep_datastreams=False, sep_regions=True)
                 bone_index_datas = ni_block.geomdata_by_name('BLENDINDICES', sep_datastreams=False, sep_regions=True)
 
-                for palette, index_datas in zip(bone_palettes, bone_index_datas):
-                    bone_indices.extend([[palette[i] for i in indices] for indices in index_datas])
+                # map the indices of every region to the skin modifier's bones through the region's palette
+                bone_indices = [np.asarray(palette, dtype=int)[np.asarray(index_datas, dtype=int)]
+                                for palette, index_datas in zip(bone_palettes, bone_index_datas) if len(index_datas)]
+                bone_indices = np.concatenate(bone_indices) if bone_indices else np.empty((0, 0), dtype=int)
+            return VertexGroup.group_weights_by_bone(bone_names, *VertexGroup.get_row_influences(bone_indices, bone_weights))
+
+        skininst = ni_block.skin_instance
+        if not skininst:
+            return {}
+        NifLog.info(f"[SKIN IMPORT] Processing NiSkinInstance for '{ni_block.name}'")
+        NifLog.info(f"[SKIN IMPORT] Skeleton root: '{skininst.skeleton_root.name if skininst.skeleton_root else 'None'}'")
+        skindata = skininst.data
+        bones = skininst.bones
+        NifLog.info(f"[SKIN IMPORT] Number of bones: {len(bones)}")
+        NifLog.info(f"[SKIN IMPORT] Has vertex weights: {skindata.has_vertex_weights}")
+        # empty bones get no vertex group (see pyffi issue #3114079)
+        bone_names = [block_store.import_name(n_bone) if n_bone else None for n_bone in bones]
+
+        if isinstance(skininst, NifClasses.BSSkinInstance):
+            vertex_data = ni_block.vertex_data
+            if isinstance(vertex_data, np.ndarray) and vertex_data.dtype.names:
+                bone_weights = vertex_data["bone_weights"]
+                bone_indices = vertex_data["bone_indices"]
+            else:
+                bone_weights = np.array([vert.bone_weights for vert in vertex_data], dtype=float)
+                bone_indices = np.array([vert.bone_indices for vert in vertex_data], dtype=int)
+            influences = VertexGroup.get_row_influences(bone_indices, bone_weights)
+
+        # the usual case
+        elif skindata.has_vertex_weights:
+            NifLog.info(f"[SKIN IMPORT] Processing standard vertex weights...")
+            for idx, (group_name, bone_data) in enumerate(zip(bone_names, skindata.bone_list)):
+                if group_name is None:
+                    NifLog.warn(f"[SKIN IMPORT]   Bone index {idx}: Empty bone (None), skipping")
+                else:
+                    NifLog.info(f"[SKIN IMPORT]   Bone index {idx}: '{group_name}' with {len(bone_data.vertex_weights)} vertex weights")
+            influences = skinning.get_bone_list_influences(skindata.bone_list)
 
-            for name in bone_names:
-                bone_weights_map[name] = []
+        # WLP2 - hides the weights in the partition
+        else:
+            partitions = skininst.skin_partition.partitions
+            influences = skinning.get_partition_influences(partitions, ni_block.data.num_vertices)
+            # only the bones of the partitions get a vertex group
+            partition_bones = set(int(i) for block in partitions for i in block.bones)
+            bone_names = [name if i in partition_bones else None for i, name in enumerate(bone_names)]
+        return VertexGroup.group_weights_by_bone(bone_names, *influences)
 
-            # add every vertex to the corresponding groups
-            for i, (weights, indices) in enumerate(zip(bone_weights, bone_indices)):
-                for w, b_i in zip(weights, indices):
-                    # weights and indices is not necessarily equally long - luckily zip limits to the shortest
-                    if b_i >= 0 and w > 0:
-                        group_name = bone_names[b_i]
-                        bone_weights_map[group_name].append((i, w))
+    @staticmethod
+    def get_row_influences(bone_indices, bone_weights):
+        """Flatten per vertex rows of bone indices and weights to arrays of vertex index, bone index and weight.
+        The rows of weights and indices are not necessarily equally long, so only their shared columns are used."""
+        bone_indices = np.asarray(bone_indices, dtype=int)
+        bone_weights = np.asarray(bone_weights, dtype=float)
+        num_vertices = min(len(bone_indices), len(bone_weights))
+        if num_vertices == 0:
+            return skinning.concatenate_influences([], [], [])
+        columns = min(bone_indices.shape[1], bone_weights.shape[1])
+        bone_indices = bone_indices[:num_vertices, :columns]
+        bone_weights = bone_weights[:num_vertices, :columns]
+        vertex_indices = np.broadcast_to(np.arange(num_vertices)[:, None], bone_indices.shape)
+        return vertex_indices.ravel(), bone_indices.ravel(), bone_weights.ravel()
 
-        else:
-            skininst = ni_block.skin_instance
-            if skininst:
-                NifLog.info(f"[SKIN IMPORT] Processing NiSkinInstance for '{ni_block.name}'")
-                NifLog.info(f"[SKIN IMPORT] Skeleton root: '{skininst.skeleton_root.name if skininst.skeleton_root else 'None'}'")
-                skindata = skininst.data
-                bones = skininst.bones
-                NifLog.info(f"[SKIN IMPORT] Number of bones: {len(bones)}")
-                NifLog.info(f"[SKIN IMPORT] Has vertex weights: {skindata.has_vertex_weights}")
-                
-                # Log skin transform
-                skin_transform = skindata.get_transform()
-                NifLog.info(f"[SKIN IMPORT] Skin transform (Matrix44): {type(skin_transform).__name__}")
-                if isinstance(skininst, NifClasses.BSSkinInstance):
-                    bone_names = [None for _ in bones]
-                    for idx, n_bone in enumerate(bones):
-                        if not n_bone:
-                            continue
-
-                        group_name = block_store.import_name(n_bone)
-                        if group_name not in bone_weights_map:
-                            bone_weights_map[group_name] = []
-                        bone_names[idx] = group_name
-                    for name in bone_names:
-                        if name:
-                            bone_weights_map[name] = []
-
-                    for i, (weights, indices) in enumerate([(vert.bone_weights, vert.bone_indices) for vert in ni_block.vertex_data]):
-                        for w, b_i in zip(weights, indices):
-                            if b_i  >= 0 and w > 0:
-                                group_name = bone_names[b_i]
-                                bone_weights_map[group_name].append((i, w))
-
-                # the usual case
-                elif skindata.has_vertex_weights:
-                    NifLog.info(f"[SKIN IMPORT] Processing standard vertex weights...")
-                    bone_weights = skindata.bone_list
-                    for idx, n_bone in enumerate(bones):
-                        # skip empty bones (see pyffi issue #3114079)
-                        if not n_bone:
-                            NifLog.warn(f"[SKIN IMPORT]   Bone index {idx}: Empty bone (None), skipping")
-                            continue
-
-                        vertex_weights = bone_weights[idx].vertex_weights
-                        group_name = block_store.import_name(n_bone)
-                        NifLog.info(f"[SKIN IMPORT]   Bone index {idx}: '{group_name}' with {len(vertex_weights)} vertex weights")
-                        if group_name not in bone_weights_map:
-                            bone_weights_map[group_name] = []
-    
-                        for skinWeight in vertex_weights:
-                            vert = skinWeight.index
-                            weight = skinWeight.weight
-                            bone_weights_map[group_name].append((vert, weight))
-
-                # WLP2 - hides the weights in the partition
-                else:
-                    skin_partition = skininst.skin_partition
-                    for block in skin_partition.partitions:
-                        # create all vgroups for this block's bones
-                        bone_names = [block_store.import_name(bones[i]) for i in block.bones]
-                        for group_name in bone_names:
-                            bone_weights_map[group_name] = []
-    
-                        # go over each vert in this block
-                        for vert, vertex_weights, bone_indices in zip(block.vertex_map, block.vertex_weights, block.bone_indices):
-    
-                            # assign this vert's 4 weights to its 4 vgroups (at max)
-                            for w, b_i in zip(vertex_weights, bone_indices):
-                                if w > 0:
-                                    group_name = bone_names[b_i]
-                                    bone_weights_map[group_name].append((vert, w))
+    @staticmethod
+    def group_weights_by_bone(bone_names, vertex_indices, bone_indices, weights):
+        """Split arrays of influences into the vertex indices and weights of every named bone.
+        Every named bone gets an entry, even without weights. Influences of unnamed bones, invalid bone indices
+        and zero weights are dropped."""
+        bone_weights_map = {name: (np.empty(0, dtype=int), np.empty(0, dtype=float)) for name in bone_names if name}
+        # invalid bone indices are mapped to a trailing unnamed bone
+        named = np.array([bool(name) for name in bone_names] + [False], dtype=bool)
+        bone_indices = np.asarray(bone_indices, dtype=int)
+        bone_indices = np.where((bone_indices >= 0) & (bone_indices < len(bone_names)), bone_indices, len(bone_names))
+        keep = named[bone_indices] & (np.asarray(weights) > 0)
+        vertex_indices = np.asarray(vertex_indices)[keep]
+        bone_indices = bone_indices[keep]
+        weights = np.asarray(weights)[keep]
+
+        order = np.argsort(bone_indices, kind="stable")
+        bones, starts = np.unique(bone_indices[order], return_index=True)
+        for bone, influences in zip(bones, np.split(order, starts[1:])):
+            # several bones may import under the same name
+            v_indices, v_weights = bone_weights_map[bone_names[bone]]
+            bone_weights_map[bone_names[bone]] = (np.concatenate((v_indices, vertex_indices[influences])),
+                                                  np.concatenate((v_weights, weights[influences])))
         return bone_weights_map
 
     @staticmethod
@@ -324,21 +277,24 @@ class VertexGroup:
         """Set the bone weights on the object
 
         :param bone_weights: dictionary mapping bone name to vertex indices and weights
-        :type bone_weights: dict(str, list(tuple(int, float)))
+        :type bone_weights: dict(str, tuple(numpy.ndarray, numpy.ndarray))
         :param b_obj: Blender object to which to add the vertex groups
         :type b_obj: bpy.types.Object
         :return: None
         :rtype: NoneType
 
         """
-        for bone_name, index_weights in bone_weights.items():
+        for bone_name, (v_indices, weights) in bone_weights.items():
             if bone_name not in b_obj.vertex_groups:
                 v_group = b_obj.vertex_groups.new(name=bone_name)
             else:
                 v_group = b_obj.vertex_groups[bone_name]
-            for (v_index, weight) in index_weights:
-                # conversion from numpy.uint16 to int necessary because Blender doesn't accept them
-                v_group.add([int(v_index)], weight, 'REPLACE')
+            # add all vertices that share a weight in a single call
+            values, inverse, counts = np.unique(weights, return_inverse=True, return_counts=True)
+            grouped_indices = np.split(np.asarray(v_indices)[np.argsort(inverse, kind="stable")], np.cumsum(counts)[:-1])
+            for weight, indices in zip(values, grouped_indices):
+                # conversion from numpy integers to int necessary because Blender doesn't accept them
+                v_group.add(indices.tolist(), float(weight), 'REPLACE')
 
     @staticmethod
     def get_face_maps(ni_block):
@@ -59,6 +59,7 @@ from io_scene_niftools.nif_common import NifCommon
 from io_scene_niftools.utils import math, consts
 from io_scene_niftools.utils.singleton import NifOp, EGMData, NifData
 from io_scene_niftools.utils.logging import NifLog, NifError
+from io_scene_niftools.utils.tracing import NifTrace
 
 
 # main export class
@@ -185,6 +186,9 @@ class NifExport(NifCommon):
                     NifLog.warn(f"Non-uniform scaling not supported.\n"
                                 f"Workaround: apply size and rotation (CTRL-A) on '{b_obj.name}'.")
 
+            if getattr(NifOp.props, "embed_textures", False) and getattr(NifOp.props, "embed_textures_in_parallel", False):
+                TextureWriter.encode_textures(self.exportable_objects)
+
             b_armature = math.get_armature()
             # some scenes may not have an armature, so nothing to do here
             if b_armature:
@@ -309,7 +313,8 @@ class NifExport(NifCommon):
                 for block in block_store.block_to_obj:
                     if isinstance(block, NifClasses.BhkMoppBvTreeShape):
                         NifLog.info("Generating mopp...")
-                        block.update_mopp()
+                        with NifTrace.span("mopp"):
+                            block.update_mopp()
                         # print "=== DEBUG: MOPP TREE ==="
                         # block.parse_mopp(verbose = True)
                         # print "=== END OF MOPP TREE ==="
@@ -340,9 +345,11 @@ class NifExport(NifCommon):
             elif bpy.context.scene.niftools_scene.game == 'HOWLING_SWORD':
                 data.modification = "jmihs1"
 
-            data.validate()
-            with open(niffile, "wb") as stream:
+            with NifTrace.span("validate"):
+                data.validate()
+            with NifTrace.span("write"), open(niffile, "wb") as stream:
                 data.write(stream)
+            NifTrace.count("blocks", len(data.blocks))
 
             # export egm file:
             # -----------------
@@ -62,6 +62,7 @@ from io_scene_niftools.nif_common import NifCommon
 from io_scene_niftools.utils import math
 from io_scene_niftools.utils.singleton import NifOp, NifData
 from io_scene_niftools.utils.logging import NifLog, NifError
+from io_scene_niftools.utils.tracing import NifTrace, traced
 
 
 class NifImport(NifCommon):
@@ -98,12 +99,13 @@ class NifImport(NifCommon):
                 self.transform_anim.set_frames_per_second(NifData.data.roots)
 
             # merge skeleton roots and transform geometry into the rest pose
-            if NifOp.props.merge_skeleton_roots:
-                nifgen.spells.nif.fix.SpellMergeSkeletonRoots(data=NifData.data).recurse()
-            if NifOp.props.send_geoms_to_bind_pos:
-                nifgen.spells.nif.fix.SpellSendGeometriesToBindPosition(data=NifData.data).recurse()
-            if NifOp.props.send_detached_geoms_to_node_pos:
-                nifgen.spells.nif.fix.SpellSendDetachedGeometriesToNodePosition(data=NifData.data).recurse()
+            with NifTrace.span("skeleton merge"):
+                if NifOp.props.merge_skeleton_roots:
+                    nifgen.spells.nif.fix.SpellMergeSkeletonRoots(data=NifData.data).recurse()
+                if NifOp.props.send_geoms_to_bind_pos:
+                    nifgen.spells.nif.fix.SpellSendGeometriesToBindPosition(data=NifData.data).recurse()
+                if NifOp.props.send_detached_geoms_to_node_pos:
+                    nifgen.spells.nif.fix.SpellSendDetachedGeometriesToNodePosition(data=NifData.data).recurse()
             if NifOp.props.apply_skin_deformation:
                 VertexGroup.apply_skin_deformation(NifData.data)
 
@@ -177,6 +179,7 @@ class NifImport(NifCommon):
         else:
             NifLog.warn(f"Skipped unsupported root block type '{root_block.__class__}' (corrupted nif?).")
 
+    @traced("collision")
     def import_collision(self, n_node):
         """ Imports a NiNode's collision_object, if present"""
         if n_node.collision_object:
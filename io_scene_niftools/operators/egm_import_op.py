@@ -42,7 +42,7 @@ from bpy_extras.io_utils import ImportHelper
 
 from io_scene_niftools import egm_import
 from io_scene_niftools.operators.common_op import CommonDevOperator, CommonEgm, CommonScale
-from io_scene_niftools.utils.decorators import register_classes, unregister_classes
+from io_scene_niftools.utils.decorators import flush_log, trace_operator, register_classes, unregister_classes
 from io_scene_niftools.license_check import require_license
 
 
@@ -55,6 +55,8 @@ class EgmImportOperator(Operator, ImportHelper, CommonScale, CommonEgm, CommonDe
     # How the nif import operators is labelled in the user interface.
     bl_label = "Import EGM"
 
+    @flush_log
+    @trace_operator
     @require_license
     def execute(self, context):
         """Execute the import operators: first constructs a
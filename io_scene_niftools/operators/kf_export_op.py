@@ -43,7 +43,7 @@ from bpy_extras.io_utils import ExportHelper
 
 from io_scene_niftools.kf_export import KfExport
 from io_scene_niftools.operators.common_op import CommonDevOperator, CommonScale, CommonKf
-from io_scene_niftools.utils.decorators import register_classes, unregister_classes
+from io_scene_niftools.utils.decorators import flush_log, trace_operator, register_classes, unregister_classes
 from io_scene_niftools.license_check import require_license
 
 
@@ -79,6 +79,8 @@ class KfExportOperator(Operator, ExportHelper, CommonDevOperator, CommonScale, C
         description="How the animation should cycle when it reaches the end",
         default='CYCLE_CLAMP')
 
+    @flush_log
+    @trace_operator
     @require_license
     def execute(self, context):
         """Execute the export operators: first constructs a
@@ -43,7 +43,7 @@ from bpy_extras.io_utils import ImportHelper
 
 from io_scene_niftools.kf_import import KfImport
 from io_scene_niftools.operators.common_op import CommonDevOperator, CommonScale, CommonKf
-from io_scene_niftools.utils.decorators import register_classes, unregister_classes
+from io_scene_niftools.utils.decorators import flush_log, trace_operator, register_classes, unregister_classes
 from io_scene_niftools.license_check import require_license
 
 
@@ -58,6 +58,8 @@ class KfImportOperator(Operator, ImportHelper, CommonDevOperator, CommonScale, C
 
     files: bpy.props.CollectionProperty(type=PropertyGroup)
 
+    @flush_log
+    @trace_operator
     @require_license
     def execute(self, context):
         """Execute the import operators: first constructs a
@@ -43,7 +43,7 @@ from bpy_extras.io_utils import ExportHelper
 
 from io_scene_niftools.nif_export import NifExport
 from io_scene_niftools.operators.common_op import CommonDevOperator, CommonNif, CommonScale
-from io_scene_niftools.utils.decorators import register_classes, unregister_classes
+from io_scene_niftools.utils.decorators import flush_log, trace_operator, register_classes, unregister_classes
 from io_scene_niftools.license_check import require_license
 
 
@@ -141,6 +141,12 @@ class NifExportOperator(Operator, ExportHelper, CommonDevOperator, CommonNif, Co
         description="If enabled, only embed the top-level (largest) mip. Disable to embed all mipmaps from the source DDS.",
         default=False)
 
+    # When embedding, encode all textures up front in several processes
+    embed_textures_in_parallel: bpy.props.BoolProperty(
+        name="Encode Textures in Parallel",
+        description="Encode the textures to embed in worker processes, one per CPU, before the meshes are exported",
+        default=False)
+
     # Zone4: Append ToonRamp shader texture
     apply_toonramp: bpy.props.BoolProperty(
         name="Apply ToonRamp",
@@ -165,6 +171,8 @@ class NifExportOperator(Operator, ExportHelper, CommonDevOperator, CommonNif, Co
     def draw(self, context):
         pass
 
+    @flush_log
+    @trace_operator
     @require_license
     def execute(self, context):
         """Execute the export operators: first constructs a
@@ -147,6 +147,7 @@ class OperatorExportOptimisePanel(OperatorSetting, Panel):
         layout.prop(operator, "embed_textures")
         if operator.embed_textures:
             layout.prop(operator, "embed_only_base_mipmap")
+            layout.prop(operator, "embed_textures_in_parallel")
         layout.prop(operator, "optimise_materials")
         layout.prop(operator, "sep_tangent_space")
 
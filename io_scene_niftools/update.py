@@ -92,6 +92,22 @@ class UpdaterPreferences(bpy.types.AddonPreferences):
         default="",
         subtype='FILE_PATH',
     )
+    trace_path: bpy.props.StringProperty(
+        name="Trace Output Path",
+        description="Write the timings and counters of every import/export stage to this file or folder "
+                    "(leave empty to only log them at debug level)",
+        default="",
+        subtype='FILE_PATH',
+    )
+    trace_format: bpy.props.EnumProperty(
+        items=(
+            ('JSON', "JSON", "Spans, totals per stage and counters"),
+            ('CHROME', "Chrome Trace", "Chrome trace event format, for chrome://tracing or Perfetto"),
+        ),
+        name="Trace Format",
+        description="Format of the written traces",
+        default='JSON',
+    )
 
     def draw(self, context):
         layout = self.layout
@@ -108,6 +124,8 @@ class UpdaterPreferences(bpy.types.AddonPreferences):
         box.label(text="Performance")
         box.prop(self, "export_profile_enable")
         box.prop(self, "export_profile_path")
+        box.prop(self, "trace_path")
+        box.prop(self, "trace_format")
 
     # Alternate draw function, which is more condensed and can be
     # placed within an existing draw function. Only contains:
@@ -38,10 +38,14 @@
 # ***** END LICENSE BLOCK *****
 
 import functools
+import os
+import time
 
+import bpy
 from bpy.utils import register_class, unregister_class
 
 from io_scene_niftools.utils.logging import NifLog
+from io_scene_niftools.utils.tracing import NifTrace
 
 
 def overload_method(*types):
@@ -73,6 +77,62 @@ def overload_method(*types):
 overload_method.registry = {}
 
 
+def flush_log(func):
+    """Reports the messages buffered by NifLog once func is done. Use this on the execute method of import/export
+    operators."""
+
+    @functools.wraps(func)
+    def wrapper(*args, **kwargs):
+        try:
+            return func(*args, **kwargs)
+        finally:
+            NifLog.flush()
+
+    return wrapper
+
+
+def _get_trace_settings():
+    """Return the path and format to write traces to, from the addon preferences or the NIFTOOLS_TRACE_PATH and
+    NIFTOOLS_TRACE_FORMAT environment variables. The path is empty if traces should not be written."""
+    trace_path = os.environ.get("NIFTOOLS_TRACE_PATH", "")
+    trace_format = os.environ.get("NIFTOOLS_TRACE_FORMAT", "JSON")
+    addon_name = __package__.split(".")[0] if __package__ else "io_scene_niftools"
+    addon = bpy.context.preferences.addons.get(addon_name)
+    if addon and getattr(addon.preferences, "trace_path", ""):
+        trace_path = bpy.path.abspath(addon.preferences.trace_path)
+        trace_format = addon.preferences.trace_format
+    return trace_path, trace_format
+
+
+def trace_operator(func):
+    """Traces the stages of an import/export operator run, and writes the trace if a trace path is set. Use this on
+    the execute method of import/export operators."""
+
+    @functools.wraps(func)
+    def wrapper(self, *args, **kwargs):
+        NifTrace.start(self.bl_idname)
+        try:
+            with NifTrace.span("total"):
+                return func(self, *args, **kwargs)
+        finally:
+            for line in NifTrace.get_summary():
+                NifLog.debug(f"Trace: {line}")
+            trace_path, trace_format = _get_trace_settings()
+            if trace_path:
+                # tracing must never replace the result or the error of the operator
+                try:
+                    if trace_path.endswith(os.sep) or os.path.isdir(trace_path):
+                        os.makedirs(trace_path, exist_ok=True)
+                        trace_path = os.path.join(trace_path, f"{self.bl_idname}_{int(time.time())}.json")
+                    NifTrace.write(trace_path, trace_format)
+                except OSError as e:
+                    NifLog.warn(f"Could not write the trace to {trace_path}: {e}")
+                else:
+                    NifLog.info(f"Trace written to {trace_path}")
+
+    return wrapper
+
+
 def register_classes(cls_list, mod_name):
     NifLog.debug(f"Registering Classes for module: {mod_name}")
     for clz in cls_list:
@@ -41,6 +41,8 @@ import logging
 
 from io_scene_niftools.utils.consts import LOGGER_PYFFI, LOGGER_PLUGIN
 
+logger = logging.getLogger(LOGGER_PLUGIN)
+
 
 class _MockOperator:
     """A default implementation of the report function in the case where the operator has not been initialised."""
@@ -50,28 +52,56 @@ class _MockOperator:
 
 
 class NifLog:
-    """A simple custom exception class for export errors. This module require initialisation of an operator reference to function."""  
+    """A simple custom exception class for export errors. This module require initialisation of an operator reference to function.
+
+    Messages are only formatted and reported if the plugin logger is enabled for their level. Instead of a string, a
+    message may be a callable that returns it, so that expensive messages are only built when they are logged.
+    Debug and info messages are reported to the operator as a single summary by :meth:`flush`, warnings and errors
+    are reported immediately."""  
     
     # Injectable operator reference used to perform reporting, default to simple logging
     op = _MockOperator()
 
+    # debug and info messages waiting to be reported by flush, and the number that did not fit in the summary
+    buffered_reports = []
+    skipped_reports = 0
+    max_buffered_reports = 100
+
+    @staticmethod
+    def is_enabled(level):
+        """Whether messages of level, eg. 'DEBUG', are logged."""
+        return logger.isEnabledFor(getattr(logging, level))
+
+    @staticmethod
+    def buffer_report(message):
+        if len(NifLog.buffered_reports) < NifLog.max_buffered_reports:
+            NifLog.buffered_reports.append(message)
+        else:
+            NifLog.skipped_reports += 1
+
     @staticmethod
     def debug(message):
         """Report a debug message."""
-        NifLog.op.report({'DEBUG'}, str(message))
-        logging.getLogger("niftools").debug(str(message))
+        if logger.isEnabledFor(logging.DEBUG):
+            message = format_message(message)
+            NifLog.buffer_report(message)
+            logger.debug(message)
 
     @staticmethod
     def info(message):
         """Report an informative message."""
-        NifLog.op.report({'INFO'}, str(message))
-        logging.getLogger("niftools").info(str(message))
+        if logger.isEnabledFor(logging.INFO):
+            message = format_message(message)
+            NifLog.buffer_report(message)
+            logger.info(message)
 
     @staticmethod
     def warn(message):
         """Report a warning message."""
-        NifLog.op.report({'WARNING'}, str(message))
-        logging.getLogger("niftools").warning(str(message))
+        if logger.isEnabledFor(logging.WARNING):
+            message = format_message(message)
+            NifLog.op.report({'WARNING'}, message)
+            logger.warning(message)
 
     @staticmethod
     def error(message):
@@ -86,13 +116,28 @@ class NifLog:
 
             The :ref:`error reporting <dev-design-error-reporting>` design.
         """
+        message = format_message(message)
         NifLog.op.report({'ERROR'}, message)
-        logging.getLogger("niftools").error(str(message))
+        logger.error(message)
         return {'FINISHED'}
+
+    @staticmethod
+    def flush():
+        """Report the buffered debug and info messages to the operator as one summary. To be called when the operator
+        is done."""
+        if NifLog.buffered_reports:
+            lines = NifLog.buffered_reports
+            if NifLog.skipped_reports:
+                lines.append(f"... and {NifLog.skipped_reports} more messages, see the console")
+            NifLog.op.report({'INFO'}, "\n".join(lines))
+        NifLog.buffered_reports = []
+        NifLog.skipped_reports = 0
     
     @staticmethod
     def init(operator):
         NifLog.op = operator
+        NifLog.buffered_reports = []
+        NifLog.skipped_reports = 0
 
         niftools_level_num = getattr(logging, operator.properties.plugin_log_level)
         logging.getLogger(LOGGER_PLUGIN).setLevel(niftools_level_num)
@@ -101,6 +146,13 @@ class NifLog:
         logging.getLogger(LOGGER_PYFFI).setLevel(pyffi_level_num)
 
 
+def format_message(message):
+    """Return message as a string, calling it first if it is a callable."""
+    if callable(message):
+        message = message()
+    return str(message)
+
+
 class NifError(Exception):
     """A simple custom exception class for export errors."""
     def __init__(self, msg):
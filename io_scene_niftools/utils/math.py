@@ -39,6 +39,8 @@
 import bpy
 from bpy_extras.io_utils import axis_conversion
 import mathutils
+import numpy as np
+from numpy.lib.recfunctions import structured_to_unstructured
 from nifgen.formats.nif import classes as NifClasses
 
 from io_scene_niftools.utils.logging import NifLog
@@ -80,6 +82,48 @@ def export_keymat(rest_rot, key_matrix, bone):
         return rest_rot @ key_matrix
 
 
+def quat_multiply(a, b):
+    """Hamilton product of quaternions in (w, x, y, z) order, broadcast over (..., 4) arrays."""
+    aw, ax, ay, az = np.moveaxis(np.asarray(a, dtype=float), -1, 0)
+    bw, bx, by, bz = np.moveaxis(np.asarray(b, dtype=float), -1, 0)
+    return np.stack((aw * bw - ax * bx - ay * by - az * bz,
+                     aw * bx + ax * bw + ay * bz - az * by,
+                     aw * by - ax * bz + ay * bw + az * bx,
+                     aw * bz + ax * by - ay * bx + az * bw), axis=-1)
+
+
+def euler_to_matrix(eulers):
+    """Convert an (n, 3) array of XYZ euler angles to (n, 3, 3) rotation matrices, like mathutils.Euler.to_matrix."""
+    eulers = np.asarray(eulers, dtype=float)
+    (cx, cy, cz), (sx, sy, sz) = np.cos(eulers).T, np.sin(eulers).T
+    matrices = np.empty((len(eulers), 3, 3))
+    matrices[:, 0] = np.stack((cy * cz, sy * sx * cz - cx * sz, sy * cx * cz + sx * sz), axis=-1)
+    matrices[:, 1] = np.stack((cy * sz, sy * sx * sz + cx * cz, sy * cx * sz - sx * cz), axis=-1)
+    matrices[:, 2] = np.stack((-sy, cy * sx, cy * cx), axis=-1)
+    return matrices
+
+
+def matrix_to_euler(matrices):
+    """Convert (n, 3, 3) rotation matrices to XYZ euler angles.
+    Like mathutils.Matrix.to_euler, of the two possible solutions the one with the smallest angles is returned."""
+    matrices = np.asarray(matrices, dtype=float)
+    cy = np.hypot(matrices[:, 0, 0], matrices[:, 1, 0])
+    euler1 = np.stack((np.arctan2(matrices[:, 2, 1], matrices[:, 2, 2]),
+                       np.arctan2(-matrices[:, 2, 0], cy),
+                       np.arctan2(matrices[:, 1, 0], matrices[:, 0, 0])), axis=-1)
+    euler2 = np.stack((np.arctan2(-matrices[:, 2, 1], -matrices[:, 2, 2]),
+                       np.arctan2(-matrices[:, 2, 0], -cy),
+                       np.arctan2(-matrices[:, 1, 0], -matrices[:, 0, 0])), axis=-1)
+    # gimbal lock, the x and z axes coincide
+    locked = cy <= 16.0 * np.finfo(np.float32).eps
+    euler1[locked] = np.stack((np.arctan2(-matrices[locked, 1, 2], matrices[locked, 1, 1]),
+                               np.arctan2(-matrices[locked, 2, 0], cy[locked]),
+                               np.zeros(np.count_nonzero(locked))), axis=-1)
+    euler2[locked] = euler1[locked]
+    use_second = np.abs(euler1).sum(axis=1) > np.abs(euler2).sum(axis=1)
+    return np.where(use_second[:, None], euler2, euler1)
+
+
 def _get_bone_bind(bone):
     """Get a nif local-space matrix from a blender bone. """
     bind = bone.matrix_local @ correction
@@ -113,6 +157,26 @@ def import_matrix(n_block, relative_to=None):
     return nifformat_to_mathutils_matrix(n_block.get_transform(relative_to))
 
 
+def struct_array_to_float(structs, dtype=float):
+    """Converts nif structs (eg. Vector3, TexCoord, Color4) to a float array with one column per field.
+    Works on the numpy record arrays nifgen uses for arrays of fixed-layout structs, on plain numeric arrays, as well as
+    on lists of structs. For record arrays whose fields already have the requested dtype, the result is a view of
+    structs, so it must not be modified in place."""
+    if isinstance(structs, np.ndarray) and structs.dtype.names:
+        return structured_to_unstructured(structs, dtype=dtype)
+    if isinstance(structs, np.ndarray) and structs.dtype != object:
+        # already a plain numeric array
+        return structs.astype(dtype)
+    return np.array([tuple(struct) for struct in structs], dtype=dtype)
+
+
+def get_coordinates(b_vertices):
+    """Get the coordinates of mesh vertices or shape key points as a (n, 3) float array."""
+    coordinates = np.zeros((len(b_vertices), 3), dtype=float)
+    b_vertices.foreach_get('co', coordinates.reshape((-1, 1)))
+    return coordinates
+
+
 def decompose_srt(b_matrix):
     """Decompose Blender transform matrix as a scale, 4x4 rotation matrix, and translation vector."""
 
@@ -0,0 +1,149 @@
+""" Nif Utilities, traces the stages of import and export runs"""
+
+# ***** BEGIN LICENSE BLOCK *****
+# 
+# Copyright © 2016, NIF File Format Library and Tools contributors.
+# All rights reserved.
+# 
+# Redistribution and use in source and binary forms, with or without
+# modification, are permitted provided that the following conditions
+# are met:
+# 
+#    * Redistributions of source code must retain the above copyright
+#      notice, this list of conditions and the following disclaimer.
+# 
+#    * Redistributions in binary form must reproduce the above
+#      copyright notice, this list of conditions and the following
+#      disclaimer in the documentation and/or other materials provided
+#      with the distribution.
+# 
+#    * Neither the name of the NIF File Format Library and Tools
+#      project nor the names of its contributors may be used to endorse
+#      or promote products derived from this software without specific
+#      prior written permission.
+# 
+# THIS SOFTWARE IS PROVIDED BY THE COPYRIGHT HOLDERS AND CONTRIBUTORS
+# "AS IS" AND ANY EXPRESS OR IMPLIED WARRANTIES, INCLUDING, BUT NOT
+# LIMITED TO, THE IMPLIED WARRANTIES OF MERCHANTABILITY AND FITNESS
+# FOR A PARTICULAR PURPOSE ARE DISCLAIMED. IN NO EVENT SHALL THE
+# COPYRIGHT OWNER OR CONTRIBUTORS BE LIABLE FOR ANY DIRECT, INDIRECT,
+# INCIDENTAL, SPECIAL, EXEMPLARY, OR CONSEQUENTIAL DAMAGES (INCLUDING,
+# BUT NOT LIMITED TO, PROCUREMENT OF SUBSTITUTE GOODS OR SERVICES;
+# LOSS OF USE, DATA, OR PROFITS; OR BUSINESS INTERRUPTION) HOWEVER
+# CAUSED AND ON ANY THEORY OF LIABILITY, WHETHER IN CONTRACT, STRICT
+# LIABILITY, OR TORT (INCLUDING NEGLIGENCE OR OTHERWISE) ARISING IN
+# ANY WAY OUT OF THE USE OF THIS SOFTWARE, EVEN IF ADVISED OF THE
+# POSSIBILITY OF SUCH DAMAGE.
+#
+import functools
+import json
+import time
+from contextlib import contextmanager
+
+
+class NifTrace:
+    """Records named spans and counters of an operator run. Unlike profiling, this is cheap enough to stay enabled,
+    so the stages of every run can be compared. This module require initialisation by :meth:`start` to function."""
+
+    name = ""
+    start_time = 0.0
+    # (name, start, duration, depth, nested) of every finished span, in order of completion, where nested is True if
+    # the span ran within another span of the same name
+    spans = []
+    counters = {}
+    active = {}
+    depth = 0
+
+    @staticmethod
+    def start(name):
+        """Clear the spans and counters of the previous run."""
+        NifTrace.name = name
+        NifTrace.start_time = time.perf_counter()
+        NifTrace.spans = []
+        NifTrace.counters = {}
+        NifTrace.active = {}
+        NifTrace.depth = 0
+
+    @staticmethod
+    @contextmanager
+    def span(name):
+        """Time the enclosed code as a span called name."""
+        start = time.perf_counter()
+        nested = NifTrace.active.get(name, 0) > 0
+        NifTrace.active[name] = NifTrace.active.get(name, 0) + 1
+        NifTrace.depth += 1
+        try:
+            yield
+        finally:
+            NifTrace.depth -= 1
+            NifTrace.active[name] -= 1
+            NifTrace.spans.append(
+                (name, start - NifTrace.start_time, time.perf_counter() - start, NifTrace.depth, nested))
+
+    @staticmethod
+    def count(name, amount=1):
+        """Add amount to the counter called name."""
+        NifTrace.counters[name] = NifTrace.counters.get(name, 0) + amount
+
+    @staticmethod
+    def get_totals():
+        """Return {span name: (calls, total duration)}, where the duration of spans nested in a span of the same name
+        is only counted once."""
+        totals = {}
+        for name, start, duration, depth, nested in NifTrace.spans:
+            calls, total = totals.get(name, (0, 0.0))
+            totals[name] = (calls + 1, total if nested else total + duration)
+        return totals
+
+    @staticmethod
+    def get_summary():
+        """Return a line per span name with its calls and total duration, slowest first, followed by the counters."""
+        totals = sorted(NifTrace.get_totals().items(), key=lambda item: item[1][1], reverse=True)
+        lines = [f"{name}: {total:.3f}s in {calls} calls" for name, (calls, total) in totals]
+        lines.extend(f"{name}: {value}" for name, value in NifTrace.counters.items())
+        return lines
+
+    @staticmethod
+    def to_json():
+        """Return the trace as a json serializable dict of the spans, their totals and the counters."""
+        return {
+            "name": NifTrace.name,
+            "spans": [{"name": name, "start": start, "duration": duration, "depth": depth}
+                      for name, start, duration, depth, nested in NifTrace.spans],
+            "totals": {name: {"calls": calls, "duration": total}
+                       for name, (calls, total) in NifTrace.get_totals().items()},
+            "counters": dict(NifTrace.counters),
+        }
+
+    @staticmethod
+    def to_chrome_trace():
+        """Return the trace in the Chrome trace event format, which chrome://tracing and Perfetto can open."""
+        events = [{"name": "process_name", "ph": "M", "pid": 1, "args": {"name": NifTrace.name}}]
+        end = 0.0
+        for name, start, duration, depth, nested in NifTrace.spans:
+            events.append({"name": name, "ph": "X", "pid": 1, "tid": 1, "ts": start * 1e6, "dur": duration * 1e6})
+            end = max(end, start + duration)
+        if NifTrace.counters:
+            events.append({"name": "counters", "ph": "C", "pid": 1, "ts": end * 1e6, "args": dict(NifTrace.counters)})
+        return {"traceEvents": events, "displayTimeUnit": "ms"}
+
+    @staticmethod
+    def write(file_path, trace_format='JSON'):
+        """Write the trace to file_path, as 'JSON' or as a 'CHROME' trace."""
+        data = NifTrace.to_chrome_trace() if trace_format == 'CHROME' else NifTrace.to_json()
+        with open(file_path, "w") as stream:
+            json.dump(data, stream, indent=1)
+
+
+def traced(name):
+    """Decorator that times every call of the decorated function as a span called name."""
+
+    def decorator(func):
+        @functools.wraps(func)
+        def wrapper(*args, **kwargs):
+            with NifTrace.span(name):
+                return func(*args, **kwargs)
+
+        return wrapper
+
+    return decorator
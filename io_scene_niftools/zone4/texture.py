@@ -6,6 +6,7 @@ import bpy
 import numpy as np
 import io_scene_niftools
 from nifgen.formats.nif import classes as NifClasses
+from nifgen.utils import dds
 
 from io_scene_niftools.modules.nif_export.block_registry import block_store
 from io_scene_niftools.modules.nif_export.property.texture import TextureWriter
@@ -25,30 +26,33 @@ def _resolve_toonramp_source_path():
     return candidates[0]
 
 
-def _rgb24_from_image(img):
+def _rgb24_from_image(img, mipmaps=False):
+    """Return the RGB24 payload of an image, with each row padded to a multiple of 4 bytes,
+    and the (width, height, offset, size) of each mipmap level in it."""
     width, height = img.size
-    pixels = img.pixels[:]
+    pixels = np.empty(len(img.pixels), dtype=np.float32)
     if len(pixels) < width * height * 4:
         raise ValueError("Image pixel buffer is incomplete")
-
-    pitch = ((width * 3 + 3) // 4) * 4
-    rows = []
-    for y in range(height):
-        row = bytearray(width * 3)
-        for x in range(width):
-            idx = (y * width + x) * 4
-            r = min(255, max(0, int(round(pixels[idx] * 255.0))))
-            g = min(255, max(0, int(round(pixels[idx + 1] * 255.0))))
-            b = min(255, max(0, int(round(pixels[idx + 2] * 255.0))))
-            base = x * 3
-            row[base:base + 3] = bytes((r, g, b))
-        if pitch > width * 3:
-            row.extend(b"\x00" * (pitch - width * 3))
-        rows.append(bytes(row))
-    return b"".join(rows), pitch
-
-
-def _build_nipixeldata_from_rgb24(payload, width, height, pitch):
+    img.pixels.foreach_get(pixels)
+    pixels = pixels[:width * height * 4].reshape(height, width, 4)[:, :, :3]
+
+    levels = dds.get_mipmaps(pixels) if mipmaps else [pixels]
+    chunks = []
+    mip_entries = []
+    offset = 0
+    for level in levels:
+        level_height, level_width = level.shape[:2]
+        rgb = np.rint(np.clip(level, 0.0, 1.0).astype(np.float64) * 255.0).astype(np.uint8)
+        rgb = rgb.reshape(level_height, level_width * 3)
+        pitch = ((level_width * 3 + 3) // 4) * 4
+        chunk = np.pad(rgb, ((0, 0), (0, pitch - level_width * 3))).tobytes()
+        chunks.append(chunk)
+        mip_entries.append((level_width, level_height, offset, len(chunk)))
+        offset += len(chunk)
+    return b"".join(chunks), mip_entries
+
+
+def _build_nipixeldata_from_rgb24(payload, mip_entries):
     pix = NifClasses.NiPixelData(NifData.data)
 
     try:
@@ -81,16 +85,16 @@ def _build_nipixeldata_from_rgb24(payload, width, height, pitch):
         pix.old_fast_compare[:] = [96, 8, -126, 0, 0, 8, 16, 0]
 
     try:
-        pix.num_mipmaps = 1
+        pix.num_mipmaps = len(mip_entries)
     except Exception:
         pass
     try:
         pix.reset_field('mipmaps')
-        m = pix.mipmaps[0]
-        m.width = width
-        m.height = height
-        m.offset = 0
-        m.num_pixels = len(payload)
+        for m, (width, height, offset, size) in zip(pix.mipmaps, mip_entries):
+            m.width = width
+            m.height = height
+            m.offset = offset
+            m.num_pixels = size
     except Exception:
         pass
 
@@ -180,8 +184,9 @@ def _build_toonramp_source(toonramp_src):
             if not img.has_data or img.size[0] == 0 or img.size[1] == 0:
                 raise ValueError(f"Image '{os.path.basename(abs_source)}' has no pixel data")
 
-            rgb_payload, rgb_pitch = _rgb24_from_image(img)
-            pix = _build_nipixeldata_from_rgb24(rgb_payload, img.size[0], img.size[1], rgb_pitch)
+            embed_mipmaps = not getattr(NifOp.props, 'embed_only_base_mipmap', True)
+            rgb_payload, mip_entries = _rgb24_from_image(img, mipmaps=embed_mipmaps)
+            pix = _build_nipixeldata_from_rgb24(rgb_payload, mip_entries)
 
             try:
                 srctex.pixel_data = pix
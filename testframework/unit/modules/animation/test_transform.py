@@ -0,0 +1,104 @@
+"""Unit testing that the batch key correctors match the per key import_keymat conversion"""
+
+
+# ***** BEGIN LICENSE BLOCK *****
+#
+# Copyright © 2016, NIF File Format Library and Tools contributors.
+# All rights reserved.
+#
+# Redistribution and use in source and binary forms, with or without
+# modification, are permitted provided that the following conditions
+# are met:
+#
+#    * Redistributions of source code must retain the above copyright
+#      notice, this list of conditions and the following disclaimer.
+#
+#    * Redistributions in binary form must reproduce the above
+#      copyright notice, this list of conditions and the following
+#      disclaimer in the documentation and/or other materials provided
+#      with the distribution.
+#
+#    * Neither the name of the NIF File Format Library and Tools
+#      project nor the names of its contributors may be used to endorse
+#      or promote products derived from this software without specific
+#      prior written permission.
+#
+# THIS SOFTWARE IS PROVIDED BY THE COPYRIGHT HOLDERS AND CONTRIBUTORS
+# "AS IS" AND ANY EXPRESS OR IMPLIED WARRANTIES, INCLUDING, BUT NOT
+# LIMITED TO, THE IMPLIED WARRANTIES OF MERCHANTABILITY AND FITNESS
+# FOR A PARTICULAR PURPOSE ARE DISCLAIMED. IN NO EVENT SHALL THE
+# COPYRIGHT OWNER OR CONTRIBUTORS BE LIABLE FOR ANY DIRECT, INDIRECT,
+# INCIDENTAL, SPECIAL, EXEMPLARY, OR CONSEQUENTIAL DAMAGES (INCLUDING,
+# BUT NOT LIMITED TO, PROCUREMENT OF SUBSTITUTE GOODS OR SERVICES;
+# LOSS OF USE, DATA, OR PROFITS; OR BUSINESS INTERRUPTION) HOWEVER
+# CAUSED AND ON ANY THEORY OF LIABILITY, WHETHER IN CONTRACT, STRICT
+# LIABILITY, OR TORT (INCLUDING NEGLIGENCE OR OTHERWISE) ARISING IN
+# ANY WAY OUT OF THE USE OF THIS SOFTWARE, EVEN IF ADVISED OF THE
+# POSSIBILITY OF SUCH DAMAGE.
+#
+# ***** END LICENSE BLOCK *****
+
+import mathutils
+import nose
+import numpy as np
+
+from io_scene_niftools.modules.nif_import.animation import transform
+from io_scene_niftools.utils import math
+
+# mathutils works in single precision
+TOLERANCE = 1e-5
+# bone orientations used by the supported games
+ORIENTATIONS = (("Y", "Z"), ("X", "Y"), ("Z", "-X"))
+
+
+class TestKeyCorrection:
+    """Tests correct_loc, correct_quat and correct_euler against import_keymat for each bone orientation"""
+
+    @classmethod
+    def setup_class(cls):
+        rng = np.random.default_rng(0)
+        cls.n_bind_rot_inv = mathutils.Quaternion(rng.normal(size=4)).normalized().to_matrix().to_4x4().inverted()
+        cls.n_bind_trans = mathutils.Vector(rng.normal(size=3))
+        cls.locs = rng.normal(size=(50, 3))
+        quats = rng.normal(size=(50, 4))
+        cls.quats = quats / np.linalg.norm(quats, axis=1, keepdims=True)
+        cls.eulers = rng.uniform(-np.pi, np.pi, size=(50, 3))
+
+    @classmethod
+    def teardown_class(cls):
+        math.correction = None
+        math.correction_inv = None
+
+    def keymat(self, key_matrix):
+        return math.import_keymat(self.n_bind_rot_inv, key_matrix)
+
+    def test_correct_loc(self):
+        for orientation in ORIENTATIONS:
+            math.set_bone_orientation(*orientation)
+            expected = [self.keymat(mathutils.Matrix.Translation(mathutils.Vector(key) - self.n_bind_trans)).to_translation()
+                        for key in self.locs]
+            locs = transform.correct_loc(self.locs, self.n_bind_rot_inv, self.n_bind_trans)
+            nose.tools.assert_true(np.allclose(locs, expected, atol=TOLERANCE))
+
+    def test_correct_quat(self):
+        for orientation in ORIENTATIONS:
+            math.set_bone_orientation(*orientation)
+            expected = np.array([self.keymat(mathutils.Quaternion(key).to_matrix().to_4x4()).to_quaternion()
+                                 for key in self.quats])
+            expected[expected[:, 0] < 0] *= -1
+            quats = transform.correct_quat(self.quats, self.n_bind_rot_inv, self.n_bind_trans)
+            nose.tools.assert_true(np.all(quats[:, 0] >= 0))
+            nose.tools.assert_true(np.allclose(quats, expected, atol=TOLERANCE))
+
+    def test_correct_quat_unnormalized(self):
+        math.set_bone_orientation(*ORIENTATIONS[1])
+        quats = transform.correct_quat(self.quats * 3.0, self.n_bind_rot_inv, self.n_bind_trans)
+        expected = transform.correct_quat(self.quats, self.n_bind_rot_inv, self.n_bind_trans)
+        nose.tools.assert_true(np.allclose(quats, expected))
+
+    def test_correct_euler(self):
+        for orientation in ORIENTATIONS:
+            math.set_bone_orientation(*orientation)
+            expected = [self.keymat(mathutils.Euler(key).to_matrix().to_4x4()).to_euler() for key in self.eulers]
+            eulers = transform.correct_euler(self.eulers, self.n_bind_rot_inv, self.n_bind_trans)
+            nose.tools.assert_true(np.allclose(eulers, expected, atol=TOLERANCE))
@@ -0,0 +1,175 @@
+"""Unit testing that the B-spline evaluation and the B-spline interpolators"""
+
+# ***** BEGIN LICENSE BLOCK *****
+#
+# Copyright © 2016, NIF File Format Library and Tools contributors.
+# All rights reserved.
+#
+# Redistribution and use in source and binary forms, with or without
+# modification, are permitted provided that the following conditions
+# are met:
+#
+#    * Redistributions of source code must retain the above copyright
+#      notice, this list of conditions and the following disclaimer.
+#
+#    * Redistributions in binary form must reproduce the above
+#      copyright notice, this list of conditions and the following
+#      disclaimer in the documentation and/or other materials provided
+#      with the distribution.
+#
+#    * Neither the name of the NIF File Format Library and Tools
+#      project nor the names of its contributors may be used to endorse
+#      or promote products derived from this software without specific
+#      prior written permission.
+#
+# THIS SOFTWARE IS PROVIDED BY THE COPYRIGHT HOLDERS AND CONTRIBUTORS
+# "AS IS" AND ANY EXPRESS OR IMPLIED WARRANTIES, INCLUDING, BUT NOT
+# LIMITED TO, THE IMPLIED WARRANTIES OF MERCHANTABILITY AND FITNESS
+# FOR A PARTICULAR PURPOSE ARE DISCLAIMED. IN NO EVENT SHALL THE
+# COPYRIGHT OWNER OR CONTRIBUTORS BE LIABLE FOR ANY DIRECT, INDIRECT,
+# INCIDENTAL, SPECIAL, EXEMPLARY, OR CONSEQUENTIAL DAMAGES (INCLUDING,
+# BUT NOT LIMITED TO, PROCUREMENT OF SUBSTITUTE GOODS OR SERVICES;
+# LOSS OF USE, DATA, OR PROFITS; OR BUSINESS INTERRUPTION) HOWEVER
+# CAUSED AND ON ANY THEORY OF LIABILITY, WHETHER IN CONTRACT, STRICT
+# LIABILITY, OR TORT (INCLUDING NEGLIGENCE OR OTHERWISE) ARISING IN
+# ANY WAY OUT OF THE USE OF THIS SOFTWARE, EVEN IF ADVISED OF THE
+# POSSIBILITY OF SUCH DAMAGE.
+#
+# ***** END LICENSE BLOCK *****
+
+import nose
+import numpy as np
+
+from nifgen.formats.nif import NifFile, classes
+from nifgen.formats.nif.versions import set_game, games
+from nifgen.utils import bspline
+
+
+class TestBSplineBasis:
+    """Tests the basis functions and the evaluation of open uniform B-splines"""
+
+    @classmethod
+    def setup_class(cls):
+        cls.rng = np.random.default_rng(1)
+        cls.parameters = np.concatenate(([0.0, 1.0], cls.rng.random(50)))
+
+    def test_partition_of_unity(self):
+        """The basis functions sum to one everywhere on the curve, for any number of control points"""
+        for num_control_points in range(1, 10):
+            basis = bspline.get_basis(num_control_points, self.parameters)
+            nose.tools.assert_equal(basis.shape, (len(self.parameters), num_control_points))
+            nose.tools.assert_true(np.all(basis >= 0.0))
+            nose.tools.assert_true(np.allclose(basis.sum(axis=1), 1.0))
+
+    def test_endpoint_interpolation(self):
+        """The curve starts at the first and ends at the last control point"""
+        for num_control_points in range(1, 10):
+            control_points = self.rng.random((num_control_points, 3))
+            start, end = bspline.evaluate(control_points, [0.0, 1.0])
+            nose.tools.assert_true(np.allclose(start, control_points[0]))
+            nose.tools.assert_true(np.allclose(end, control_points[-1]))
+
+    def test_degree_reduction(self):
+        """With fewer than 4 control points, the degree is lowered to a single Bezier segment"""
+        t = self.parameters[:, None]
+        # a single control point is constant
+        p0, p1, p2, p3 = self.rng.random((4, 3))
+        nose.tools.assert_true(np.allclose(bspline.evaluate([p0], self.parameters), np.tile(p0, (len(t), 1))))
+        # two control points are linear
+        nose.tools.assert_true(np.allclose(bspline.evaluate([p0, p1], self.parameters), (1 - t) * p0 + t * p1))
+        # three control points are a quadratic Bezier curve
+        quadratic = (1 - t) ** 2 * p0 + 2 * (1 - t) * t * p1 + t ** 2 * p2
+        nose.tools.assert_true(np.allclose(bspline.evaluate([p0, p1, p2], self.parameters), quadratic))
+        # four control points are a cubic Bezier curve
+        cubic = (1 - t) ** 3 * p0 + 3 * (1 - t) ** 2 * t * p1 + 3 * (1 - t) * t ** 2 * p2 + t ** 3 * p3
+        nose.tools.assert_true(np.allclose(bspline.evaluate([p0, p1, p2, p3], self.parameters), cubic))
+
+    def test_parameters_are_clamped(self):
+        """Parameters outside of the curve evaluate to its ends"""
+        control_points = self.rng.random((6, 2))
+        nose.tools.assert_true(np.allclose(bspline.evaluate(control_points, [-0.5, 1.5]),
+                                           bspline.evaluate(control_points, [0.0, 1.0])))
+
+
+class TestBSplineInterpolators:
+    """Tests the decoding and sampling of the control points of B-spline interpolators"""
+
+    @classmethod
+    def setup_class(cls):
+        cls.nif = NifFile()
+        set_game(cls.nif, games.OBLIVION)
+        NifFile.update_globals(cls.nif)
+        cls.rng = np.random.default_rng(2)
+
+    def create_data(self, float_control_points=(), compact_control_points=()):
+        n_data = classes.NiBSplineData(self.nif)
+        n_data.num_float_control_points = len(float_control_points)
+        n_data.reset_field("float_control_points")
+        n_data.float_control_points[:] = float_control_points
+        n_data.num_compact_control_points = len(compact_control_points)
+        n_data.reset_field("compact_control_points")
+        n_data.compact_control_points[:] = compact_control_points
+        return n_data
+
+    def create_basis(self, num_control_points):
+        n_basis = classes.NiBSplineBasisData(self.nif)
+        n_basis.num_control_points = num_control_points
+        return n_basis
+
+    def test_comp_array(self):
+        """get_comp_array decodes the same values as get_comp_data"""
+        shorts = self.rng.integers(-32767, 32768, 24)
+        n_data = self.create_data(compact_control_points=shorts)
+        for offset, num_elements, element_size, bias, multiplier in ((0, 8, 3, 0.5, 2.0), (4, 5, 4, -1.0, 0.25)):
+            comp_data = list(n_data.get_comp_data(offset, num_elements, element_size, bias, multiplier))
+            comp_array = n_data.get_comp_array(offset, num_elements, element_size, bias, multiplier)
+            nose.tools.assert_equal(comp_array.shape, (num_elements, element_size))
+            nose.tools.assert_true(np.allclose(comp_array, comp_data))
+
+    def test_float_array(self):
+        """get_float_array gets the same values as get_float_data"""
+        floats = self.rng.random(12).astype(np.float32)
+        n_data = self.create_data(float_control_points=floats)
+        nose.tools.assert_true(np.allclose(n_data.get_float_array(3, 3, 3), list(n_data.get_float_data(3, 3, 3))))
+
+    def test_sample_transform(self):
+        """Sampling a transform interpolator evaluates the spline from its start to its stop time"""
+        num_control_points = 6
+        translations = self.rng.random((num_control_points, 3))
+        rotations = self.rng.random((num_control_points, 4)) + 0.5
+        n_ipo = classes.NiBSplineTransformInterpolator(self.nif)
+        n_ipo.start_time = 1.0
+        n_ipo.stop_time = 3.0
+        n_ipo.basis_data = self.create_basis(num_control_points)
+        n_ipo.spline_data = self.create_data(float_control_points=np.concatenate((translations.ravel(),
+                                                                                  rotations.ravel())))
+        n_ipo.translation_handle = 0
+        n_ipo.rotation_handle = translations.size
+        times = n_ipo.get_sample_times(30)
+        nose.tools.assert_equal(len(times), 61)
+        nose.tools.assert_equal((times[0], times[-1]), (1.0, 3.0))
+        sampled = n_ipo.sample_translations(times)
+        nose.tools.assert_true(np.allclose(sampled, bspline.evaluate(translations, (times - 1.0) / 2.0), atol=1e-6))
+        nose.tools.assert_true(np.allclose(sampled[[0, -1]], translations[[0, -1]], atol=1e-6))
+        # rotations are normalized
+        sampled = n_ipo.sample_rotations(times)
+        nose.tools.assert_true(np.allclose(np.linalg.norm(sampled, axis=1), 1.0))
+        # the scale is not animated
+        nose.tools.assert_is_none(n_ipo.sample_scales(times))
+
+    def test_sample_comp_transform(self):
+        """A compressed transform interpolator samples its decompressed control points"""
+        num_control_points = 5
+        shorts = self.rng.integers(-32767, 32768, num_control_points)
+        n_ipo = classes.NiBSplineCompTransformInterpolator(self.nif)
+        n_ipo.start_time = 0.0
+        n_ipo.stop_time = 1.0
+        n_ipo.basis_data = self.create_basis(num_control_points)
+        n_ipo.spline_data = self.create_data(compact_control_points=shorts)
+        n_ipo.scale_handle = 0
+        n_ipo.scale_offset = 1.0
+        n_ipo.scale_half_range = 0.5
+        scales = 1.0 + shorts * (0.5 / 32767.0)
+        nose.tools.assert_true(np.allclose(n_ipo.get_scale_control_points()[:, 0], scales))
+        nose.tools.assert_true(np.allclose(n_ipo.sample_scales([0.0, 0.5, 1.0]),
+                                           bspline.evaluate(scales[:, None], [0.0, 0.5, 1.0])[:, 0]))
@@ -0,0 +1,101 @@
+"""Unit testing that the mopp generation of bhkMoppBvTreeShape"""
+
+# ***** BEGIN LICENSE BLOCK *****
+#
+# Copyright © 2016, NIF File Format Library and Tools contributors.
+# All rights reserved.
+#
+# Redistribution and use in source and binary forms, with or without
+# modification, are permitted provided that the following conditions
+# are met:
+#
+#    * Redistributions of source code must retain the above copyright
+#      notice, this list of conditions and the following disclaimer.
+#
+#    * Redistributions in binary form must reproduce the above
+#      copyright notice, this list of conditions and the following
+#      disclaimer in the documentation and/or other materials provided
+#      with the distribution.
+#
+#    * Neither the name of the NIF File Format Library and Tools
+#      project nor the names of its contributors may be used to endorse
+#      or promote products derived from this software without specific
+#      prior written permission.
+#
+# THIS SOFTWARE IS PROVIDED BY THE COPYRIGHT HOLDERS AND CONTRIBUTORS
+# "AS IS" AND ANY EXPRESS OR IMPLIED WARRANTIES, INCLUDING, BUT NOT
+# LIMITED TO, THE IMPLIED WARRANTIES OF MERCHANTABILITY AND FITNESS
+# FOR A PARTICULAR PURPOSE ARE DISCLAIMED. IN NO EVENT SHALL THE
+# COPYRIGHT OWNER OR CONTRIBUTORS BE LIABLE FOR ANY DIRECT, INDIRECT,
+# INCIDENTAL, SPECIAL, EXEMPLARY, OR CONSEQUENTIAL DAMAGES (INCLUDING,
+# BUT NOT LIMITED TO, PROCUREMENT OF SUBSTITUTE GOODS OR SERVICES;
+# LOSS OF USE, DATA, OR PROFITS; OR BUSINESS INTERRUPTION) HOWEVER
+# CAUSED AND ON ANY THEORY OF LIABILITY, WHETHER IN CONTRACT, STRICT
+# LIABILITY, OR TORT (INCLUDING NEGLIGENCE OR OTHERWISE) ARISING IN
+# ANY WAY OUT OF THE USE OF THIS SOFTWARE, EVEN IF ADVISED OF THE
+# POSSIBILITY OF SUCH DAMAGE.
+#
+# ***** END LICENSE BLOCK *****
+
+from unittest import mock
+
+import nose
+
+from nifgen.formats.nif import NifFile, classes
+from nifgen.formats.nif.versions import set_game, games
+from nifgen.utils.mopp import compileMoppOriginScaleCodeWelding
+
+CUBE_VERTICES = [(1, 1, 1), (0, 0, 0), (0, 0, 1), (0, 1, 0),
+                 (1, 0, 1), (0, 1, 1), (1, 1, 0), (1, 0, 0)]
+CUBE_TRIANGLES = [(0, 4, 6), (1, 6, 7), (2, 1, 4), (3, 1, 2),
+                  (0, 2, 4), (4, 1, 7), (6, 4, 7), (3, 0, 6),
+                  (0, 3, 5), (3, 2, 5), (2, 0, 5), (1, 3, 6)]
+COMPILER = "nifgen.formats.nif.bshavok.niobjects.BhkMoppBvTreeShape.compileMoppOriginScaleCodeWelding"
+
+
+class TestMoppGeneration:
+    """Tests update_mopp_welding on packed shapes with one and with two sub shapes"""
+
+    @classmethod
+    def setup_class(cls):
+        cls.nif = NifFile()
+        set_game(cls.nif, games.OBLIVION)
+        NifFile.update_globals(cls.nif)
+
+    def create_mopp(self, materials):
+        """Create a mopp on a packed shape with a cube per material, side by side along x"""
+        n_mopp = classes.BhkMoppBvTreeShape(self.nif)
+        n_shape = classes.BhkPackedNiTriStripsShape(self.nif)
+        n_mopp.shape = n_shape
+        for i, material in enumerate(materials):
+            vertices = [(x + 2 * i, y, z) for x, y, z in CUBE_VERTICES]
+            n_shape.add_shape(CUBE_TRIANGLES, [(0, 0, 1)] * len(CUBE_TRIANGLES), vertices, 1, material)
+        return n_mopp
+
+    @staticmethod
+    def get_geometry(n_mopp):
+        data = n_mopp.shape.data
+        vertices = [vert.as_tuple() for vert in data.vertices]
+        triangles = [(hktri.triangle.v_1, hktri.triangle.v_2, hktri.triangle.v_3) for hktri in data.triangles]
+        return vertices, triangles
+
+    def test_single_sub_shape(self):
+        """A single sub shape is compiled in process"""
+        n_mopp = self.create_mopp([0])
+        n_mopp.update_mopp_welding()
+        origin, scale, mopp, welding_infos = compileMoppOriginScaleCodeWelding(*self.get_geometry(n_mopp))
+        nose.tools.assert_equal(list(n_mopp.mopp_code.data), mopp)
+        nose.tools.assert_equal(n_mopp.mopp_code.offset.w, scale)
+        nose.tools.assert_equal([hktri.welding_info for hktri in n_mopp.shape.data.triangles], welding_infos)
+        ids, triangles = n_mopp.parse_mopp()
+        nose.tools.assert_equal(set(triangles), set(range(len(CUBE_TRIANGLES))))
+
+    def test_two_sub_shapes(self):
+        """Sub shapes with different materials are not compiled in process, and every triangle stays reachable"""
+        n_mopp = self.create_mopp([0, 5])
+        with mock.patch(COMPILER, wraps=compileMoppOriginScaleCodeWelding) as compiler:
+            n_mopp.update_mopp_welding()
+        nose.tools.assert_false(compiler.called)
+        nose.tools.assert_equal(n_mopp.mopp_code.data_size, len(n_mopp.mopp_code.data))
+        ids, triangles = n_mopp.parse_mopp()
+        nose.tools.assert_equal(set(triangles), set(range(2 * len(CUBE_TRIANGLES))))
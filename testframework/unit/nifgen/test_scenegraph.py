@@ -0,0 +1,132 @@
+"""Unit testing that the scene graph index of nifgen matches the transforms of NiAVObject"""
+
+
+# ***** BEGIN LICENSE BLOCK *****
+#
+# Copyright © 2016, NIF File Format Library and Tools contributors.
+# All rights reserved.
+#
+# Redistribution and use in source and binary forms, with or without
+# modification, are permitted provided that the following conditions
+# are met:
+#
+#    * Redistributions of source code must retain the above copyright
+#      notice, this list of conditions and the following disclaimer.
+#
+#    * Redistributions in binary form must reproduce the above
+#      copyright notice, this list of conditions and the following
+#      disclaimer in the documentation and/or other materials provided
+#      with the distribution.
+#
+#    * Neither the name of the NIF File Format Library and Tools
+#      project nor the names of its contributors may be used to endorse
+#      or promote products derived from this software without specific
+#      prior written permission.
+#
+# THIS SOFTWARE IS PROVIDED BY THE COPYRIGHT HOLDERS AND CONTRIBUTORS
+# "AS IS" AND ANY EXPRESS OR IMPLIED WARRANTIES, INCLUDING, BUT NOT
+# LIMITED TO, THE IMPLIED WARRANTIES OF MERCHANTABILITY AND FITNESS
+# FOR A PARTICULAR PURPOSE ARE DISCLAIMED. IN NO EVENT SHALL THE
+# COPYRIGHT OWNER OR CONTRIBUTORS BE LIABLE FOR ANY DIRECT, INDIRECT,
+# INCIDENTAL, SPECIAL, EXEMPLARY, OR CONSEQUENTIAL DAMAGES (INCLUDING,
+# BUT NOT LIMITED TO, PROCUREMENT OF SUBSTITUTE GOODS OR SERVICES;
+# LOSS OF USE, DATA, OR PROFITS; OR BUSINESS INTERRUPTION) HOWEVER
+# CAUSED AND ON ANY THEORY OF LIABILITY, WHETHER IN CONTRACT, STRICT
+# LIABILITY, OR TORT (INCLUDING NEGLIGENCE OR OTHERWISE) ARISING IN
+# ANY WAY OUT OF THE USE OF THIS SOFTWARE, EVEN IF ADVISED OF THE
+# POSSIBILITY OF SUCH DAMAGE.
+#
+# ***** END LICENSE BLOCK *****
+
+import os
+
+import nose
+import numpy as np
+
+from nifgen.formats.nif import NifFile, classes
+from nifgen.utils.scenegraph import SceneGraphIndex
+
+NIF_PATH = os.path.join(os.path.dirname(__file__), "..", "..", "..", "todo", "old_nifs", "bb_skinf_br.nif")
+
+
+class TestSceneGraphIndex:
+    """Tests SceneGraphIndex against find_chain and get_transform on a skinned nif"""
+
+    def load(self):
+        """Read the nif, so every test starts from the transforms in the file"""
+        self.nif = NifFile.from_path(NIF_PATH)
+        self.root = self.nif.roots[0]
+        self.blocks = [block for block in self.nif.blocks
+                       if isinstance(block, classes.NiAVObject) and self.root.find_chain(block)]
+        return SceneGraphIndex(self.root)
+
+    def assert_transforms_equal(self, index):
+        for block in self.blocks:
+            nose.tools.assert_true(np.allclose(index.get_transform(block).as_list(),
+                                               block.get_transform(self.root).as_list(), atol=1e-6))
+
+    def get_moved_transform(self, block):
+        """Return the transform of block, rotated, scaled and moved by the transform of another block"""
+        other = max(self.blocks, key=lambda other: abs(other.get_transform().get_translation().as_list()[0]))
+        return block.get_transform() * other.get_transform()
+
+    def test_chains(self):
+        """The chain to every block matches find_chain"""
+        index = self.load()
+        for block in self.nif.blocks:
+            if isinstance(block, classes.NiAVObject):
+                nose.tools.assert_equal(index.get_chain(block), self.root.find_chain(block))
+            nose.tools.assert_equal(block in index, block in self.blocks)
+        nose.tools.assert_is_none(index.get_parent(self.root))
+
+    def test_unreachable_block(self):
+        """Blocks that are not under the root have no transform relative to it"""
+        index = self.load()
+        unreachable = [block for block in self.nif.blocks
+                       if isinstance(block, classes.NiAVObject) and block not in self.blocks]
+        nose.tools.assert_true(unreachable)
+        for block in unreachable:
+            nose.tools.assert_raises(ValueError, block.get_transform, self.root)
+            nose.tools.assert_raises(ValueError, index.get_transform, block)
+
+    def test_shared_block(self):
+        """A block under two nodes gets the parent of the chain that find_chain finds first"""
+        index = self.load()
+        shared = max(self.blocks, key=lambda block: len(index.get_chain(block)))
+        shared_id = self.nif.blocks.index(shared)
+        node_ids = [self.nif.blocks.index(block) for block in index.order
+                    if isinstance(block, classes.NiNode) and block not in index.get_chain(shared)]
+        # add the block to a node that is visited before its parent, and to one that is visited after it
+        for node_id in (node_ids[0], node_ids[-1]):
+            self.load()
+            shared = self.nif.blocks[shared_id]
+            self.nif.blocks[node_id].add_child(shared)
+            index = SceneGraphIndex(self.root)
+            nose.tools.assert_equal(index.get_chain(shared), self.root.find_chain(shared))
+            self.assert_transforms_equal(index)
+
+    def test_transforms(self):
+        """The transforms match get_transform relative to the root, whose own transform is left out"""
+        index = self.load()
+        self.root.set_transform(self.get_moved_transform(self.root))
+        self.assert_transforms_equal(index)
+        nose.tools.assert_true(index.get_transform(self.root).as_list() == self.root.get_transform().as_list())
+
+    def test_set_transform(self):
+        """Changing the transform of a block drops the cached transforms"""
+        index = self.load()
+        self.assert_transforms_equal(index)
+        # a block in the middle of the tree, so the transforms of its descendants change too
+        parent = max((block for block in self.blocks if block is not self.root),
+                     key=lambda block: len([other for other in self.blocks if index.get_parent(other) is block]))
+        parent.set_transform(self.get_moved_transform(parent))
+        self.assert_transforms_equal(index)
+
+    def test_returns_copies(self):
+        """Modifying a returned transform does not change the cache"""
+        index = self.load()
+        block = self.blocks[-1]
+        transform = index.get_transform(block)
+        transform.set_identity()
+        nose.tools.assert_true(np.allclose(index.get_transform(block).as_list(),
+                                           block.get_transform(self.root).as_list()))
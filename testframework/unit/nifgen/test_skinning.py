@@ -0,0 +1,188 @@
+"""Unit testing that the numpy skinning of NiGeometry matches skinning every vertex on its own"""
+
+
+# ***** BEGIN LICENSE BLOCK *****
+#
+# Copyright © 2016, NIF File Format Library and Tools contributors.
+# All rights reserved.
+#
+# Redistribution and use in source and binary forms, with or without
+# modification, are permitted provided that the following conditions
+# are met:
+#
+#    * Redistributions of source code must retain the above copyright
+#      notice, this list of conditions and the following disclaimer.
+#
+#    * Redistributions in binary form must reproduce the above
+#      copyright notice, this list of conditions and the following
+#      disclaimer in the documentation and/or other materials provided
+#      with the distribution.
+#
+#    * Neither the name of the NIF File Format Library and Tools
+#      project nor the names of its contributors may be used to endorse
+#      or promote products derived from this software without specific
+#      prior written permission.
+#
+# THIS SOFTWARE IS PROVIDED BY THE COPYRIGHT HOLDERS AND CONTRIBUTORS
+# "AS IS" AND ANY EXPRESS OR IMPLIED WARRANTIES, INCLUDING, BUT NOT
+# LIMITED TO, THE IMPLIED WARRANTIES OF MERCHANTABILITY AND FITNESS
+# FOR A PARTICULAR PURPOSE ARE DISCLAIMED. IN NO EVENT SHALL THE
+# COPYRIGHT OWNER OR CONTRIBUTORS BE LIABLE FOR ANY DIRECT, INDIRECT,
+# INCIDENTAL, SPECIAL, EXEMPLARY, OR CONSEQUENTIAL DAMAGES (INCLUDING,
+# BUT NOT LIMITED TO, PROCUREMENT OF SUBSTITUTE GOODS OR SERVICES;
+# LOSS OF USE, DATA, OR PROFITS; OR BUSINESS INTERRUPTION) HOWEVER
+# CAUSED AND ON ANY THEORY OF LIABILITY, WHETHER IN CONTRACT, STRICT
+# LIABILITY, OR TORT (INCLUDING NEGLIGENCE OR OTHERWISE) ARISING IN
+# ANY WAY OUT OF THE USE OF THIS SOFTWARE, EVEN IF ADVISED OF THE
+# POSSIBILITY OF SUCH DAMAGE.
+#
+# ***** END LICENSE BLOCK *****
+
+import os
+
+import nose
+import numpy as np
+
+from nifgen.formats.nif import NifFile, classes
+
+NIF_PATH = os.path.join(os.path.dirname(__file__), "..", "..", "..", "todo", "old_nifs", "bb_skinf_br.nif")
+
+
+def transform_point(point, matrix):
+    """Move a point by a 4x4 matrix in the row vector convention of the nif format"""
+    return [sum(point[k] * matrix[k][j] for k in range(3)) + matrix[3][j] for j in range(3)]
+
+
+def rotate_vector(vector, matrix):
+    return [sum(vector[k] * matrix[k][j] for k in range(3)) for j in range(3)]
+
+
+def get_reference_deformation(geom):
+    """Skin every vertex on its own, like get_skin_deformation did before it used numpy"""
+    skininst = geom.skin_instance
+    skindata = skininst.data
+    skin_offset = skindata.get_transform()
+    bone_transforms = []
+    for bone_block, bonedata in zip(skininst.bones, skindata.bone_list):
+        transform = bonedata.get_transform() * bone_block.get_transform(skininst.skeleton_root) * skin_offset
+        scale, rotation, translation = transform.get_scale_rotation_translation()
+        bone_transforms.append((transform.as_list(), rotation.as_list()))
+    old_vertices = [(v.x, v.y, v.z) for v in geom.data.vertices]
+    old_normals = [(n.x, n.y, n.z) for n in geom.data.normals]
+    vertices = [[0.0, 0.0, 0.0] for i in range(len(old_vertices))]
+    normals = [[0.0, 0.0, 0.0] for i in range(len(old_vertices))]
+    sumweights = [0.0] * len(old_vertices)
+
+    def add_influence(index, bone, weight):
+        transform, rotation = bone_transforms[bone]
+        for i, value in enumerate(transform_point(old_vertices[index], transform)):
+            vertices[index][i] += weight * value
+        for i, value in enumerate(rotate_vector(old_normals[index], rotation)):
+            normals[index][i] += weight * value
+        sumweights[index] += weight
+
+    if skindata.has_vertex_weights:
+        for bone, bonedata in enumerate(skindata.bone_list):
+            for skinweight in bonedata.vertex_weights:
+                add_influence(skinweight.index, bone, skinweight.weight)
+    else:
+        for block in skininst.skin_partition.partitions:
+            for vert_index, vertex_weights, bone_indices in zip(block.vertex_map, block.vertex_weights, block.bone_indices):
+                # skip verts that were already processed in an earlier block
+                if sumweights[vert_index] != 0.0:
+                    continue
+                for weight, bone_index in zip(vertex_weights, bone_indices):
+                    if weight > 0.0:
+                        add_influence(vert_index, block.bones[bone_index], weight)
+    return vertices, normals
+
+
+def set_partitions(geom, partitions):
+    """Replace the skin partition of geom by partitions of (vertices, weights), where weights maps each vertex to a
+    list of (bone, weight) pairs, and make get_skin_deformation read the weights from it"""
+    skininst = geom.skin_instance
+    skinpart = classes.NiSkinPartition(skininst.context)
+    skinpart.num_partitions = len(partitions)
+    skinpart.reset_field("partitions")
+    for block, (vertices, weights) in zip(skinpart.partitions, partitions):
+        bones = sorted({bone for vertex in vertices for bone, weight in weights[vertex]})
+        block.num_vertices = len(vertices)
+        block.num_bones = len(bones)
+        block.num_weights_per_vertex = 4
+        block.reset_field("bones")
+        for i, bone in enumerate(bones):
+            block.bones[i] = bone
+        block.has_vertex_map = True
+        block.reset_field("vertex_map")
+        block.has_vertex_weights = True
+        block.reset_field("vertex_weights")
+        block.has_bone_indices = True
+        block.reset_field("bone_indices")
+        for i, vertex in enumerate(vertices):
+            block.vertex_map[i] = vertex
+            # pad with zero weights, which must be ignored
+            vertex_weights = (weights[vertex] + [(bones[0], 0.0)] * 4)[:4]
+            for j, (bone, weight) in enumerate(vertex_weights):
+                block.bone_indices[i][j] = bones.index(bone)
+                block.vertex_weights[i][j] = weight
+    skininst.skin_partition = skinpart
+    skininst.data.has_vertex_weights = False
+
+
+def pose(bones):
+    """Rotate and move every bone by a different amount, as the skinning transforms are the identity in the bind pose"""
+    for i, bone in enumerate(bones):
+        angle = 0.3 * (i + 1)
+        offset = classes.Matrix44()
+        offset.set_rows((np.cos(angle), np.sin(angle), 0.0, 0.0), (-np.sin(angle), np.cos(angle), 0.0, 0.0),
+                        (0.0, 0.0, 1.0, 0.0), (float(i), 0.5, -float(i), 1.0))
+        bone.set_transform(offset * bone.get_transform())
+
+
+class TestSkinDeformation:
+    """Tests get_skin_deformation against skinning every vertex on its own"""
+
+    def load(self):
+        nif = NifFile.from_path(NIF_PATH)
+        geoms = [block for block in nif.blocks if isinstance(block, classes.NiGeometry) and block.is_skin()]
+        pose({bone for geom in geoms for bone in geom.skin_instance.bones})
+        return geoms
+
+    def assert_deformation_equal(self, geom):
+        vertices, normals = geom.get_skin_deformation()
+        ref_vertices, ref_normals = get_reference_deformation(geom)
+        nose.tools.assert_equal(vertices.shape, (geom.data.num_vertices, 3))
+        nose.tools.assert_true(np.allclose(vertices, ref_vertices, atol=1e-5))
+        nose.tools.assert_true(np.allclose(normals, ref_normals, atol=1e-5))
+
+    def test_bone_list(self):
+        """The weights of the skin data are used when it has them"""
+        geoms = self.load()
+        nose.tools.assert_true(geoms)
+        for geom in geoms:
+            nose.tools.assert_true(geom.skin_instance.data.has_vertex_weights)
+            self.assert_deformation_equal(geom)
+
+    def test_partitions(self):
+        """Without weights in the skin data, every vertex takes the weights of the first partition that weights it"""
+        geom = max(self.load(), key=lambda geom: len(geom.skin_instance.bones))
+        num_vertices = geom.data.num_vertices
+        weights = [[] for i in range(num_vertices)]
+        for bone, bonedata in enumerate(geom.skin_instance.data.bone_list):
+            for skinweight in bonedata.vertex_weights:
+                weights[skinweight.index].append((bone, skinweight.weight))
+        # keep the 4 largest weights, like a partition does
+        weights = [sorted(vertex_weights, key=lambda bone_weight: -bone_weight[1])[:4] for vertex_weights in weights]
+        # the partitions overlap, and the second one binds the shared vertices to a single other bone
+        first = list(range(0, 2 * num_vertices // 3))
+        second = list(range(num_vertices // 3, num_vertices))
+        second_weights = list(weights)
+        for vertex in range(num_vertices // 3, 2 * num_vertices // 3):
+            second_weights[vertex] = [((weights[vertex][0][0] + 1) % len(geom.skin_instance.bones), 1.0)]
+        set_partitions(geom, [(first, weights), (second, second_weights)])
+        nose.tools.assert_equal(geom.skin_instance.skin_partition.num_partitions, 2)
+        self.assert_deformation_equal(geom)
+        # the other bone of the second partition is ignored for the shared vertices
+        vertices, normals = geom.get_skin_deformation()
+        set_partitions(geom, [(first, weights), (second, weights)])
+        nose.tools.assert_true(np.allclose(geom.get_skin_deformation()[0], vertices))
@@ -0,0 +1,101 @@
+"""Unit testing that the numpy rotation helpers match mathutils"""
+
+
+# ***** BEGIN LICENSE BLOCK *****
+#
+# Copyright © 2016, NIF File Format Library and Tools contributors.
+# All rights reserved.
+#
+# Redistribution and use in source and binary forms, with or without
+# modification, are permitted provided that the following conditions
+# are met:
+#
+#    * Redistributions of source code must retain the above copyright
+#      notice, this list of conditions and the following disclaimer.
+#
+#    * Redistributions in binary form must reproduce the above
+#      copyright notice, this list of conditions and the following
+#      disclaimer in the documentation and/or other materials provided
+#      with the distribution.
+#
+#    * Neither the name of the NIF File Format Library and Tools
+#      project nor the names of its contributors may be used to endorse
+#      or promote products derived from this software without specific
+#      prior written permission.
+#
+# THIS SOFTWARE IS PROVIDED BY THE COPYRIGHT HOLDERS AND CONTRIBUTORS
+# "AS IS" AND ANY EXPRESS OR IMPLIED WARRANTIES, INCLUDING, BUT NOT
+# LIMITED TO, THE IMPLIED WARRANTIES OF MERCHANTABILITY AND FITNESS
+# FOR A PARTICULAR PURPOSE ARE DISCLAIMED. IN NO EVENT SHALL THE
+# COPYRIGHT OWNER OR CONTRIBUTORS BE LIABLE FOR ANY DIRECT, INDIRECT,
+# INCIDENTAL, SPECIAL, EXEMPLARY, OR CONSEQUENTIAL DAMAGES (INCLUDING,
+# BUT NOT LIMITED TO, PROCUREMENT OF SUBSTITUTE GOODS OR SERVICES;
+# LOSS OF USE, DATA, OR PROFITS; OR BUSINESS INTERRUPTION) HOWEVER
+# CAUSED AND ON ANY THEORY OF LIABILITY, WHETHER IN CONTRACT, STRICT
+# LIABILITY, OR TORT (INCLUDING NEGLIGENCE OR OTHERWISE) ARISING IN
+# ANY WAY OUT OF THE USE OF THIS SOFTWARE, EVEN IF ADVISED OF THE
+# POSSIBILITY OF SUCH DAMAGE.
+#
+# ***** END LICENSE BLOCK *****
+
+import math
+
+import mathutils
+import nose
+import numpy as np
+
+from io_scene_niftools.utils import math as nif_math
+
+# mathutils works in single precision
+TOLERANCE = 1e-5
+
+
+def random_quaternions(rng, n):
+    quats = rng.normal(size=(n, 4))
+    return quats / np.linalg.norm(quats, axis=1, keepdims=True)
+
+
+def gimbal_locked_eulers(rng, n):
+    """Euler angles whose y rotation of +/- 90 degrees makes the x and z axes coincide"""
+    eulers = rng.uniform(-math.pi, math.pi, size=(n, 3))
+    eulers[:, 1] = np.where(np.arange(n) % 2, math.pi / 2, -math.pi / 2)
+    return eulers
+
+
+class TestRotationHelpers:
+    """Tests quat_multiply, euler_to_matrix and matrix_to_euler against their mathutils counterparts"""
+
+    @classmethod
+    def setup_class(cls):
+        rng = np.random.default_rng(0)
+        cls.quats_a = random_quaternions(rng, 100)
+        cls.quats_b = random_quaternions(rng, 100)
+        cls.eulers = rng.uniform(-math.pi, math.pi, size=(100, 3))
+        cls.locked_eulers = gimbal_locked_eulers(rng, 20)
+
+    def test_quat_multiply(self):
+        expected = [mathutils.Quaternion(a) @ mathutils.Quaternion(b) for a, b in zip(self.quats_a, self.quats_b)]
+        nose.tools.assert_true(np.allclose(nif_math.quat_multiply(self.quats_a, self.quats_b), expected, atol=TOLERANCE))
+
+    def test_quat_multiply_broadcast(self):
+        expected = [mathutils.Quaternion(self.quats_a[0]) @ mathutils.Quaternion(b) for b in self.quats_b]
+        nose.tools.assert_true(np.allclose(nif_math.quat_multiply(self.quats_a[0], self.quats_b), expected, atol=TOLERANCE))
+
+    def test_euler_to_matrix(self):
+        for eulers in (self.eulers, self.locked_eulers):
+            expected = [mathutils.Euler(euler).to_matrix() for euler in eulers]
+            nose.tools.assert_true(np.allclose(nif_math.euler_to_matrix(eulers), expected, atol=TOLERANCE))
+
+    def test_matrix_to_euler(self):
+        matrices = [mathutils.Quaternion(quat).to_matrix() for quat in self.quats_a]
+        expected = [matrix.to_euler() for matrix in matrices]
+        nose.tools.assert_true(np.allclose(nif_math.matrix_to_euler(matrices), expected, atol=TOLERANCE))
+
+    def test_matrix_to_euler_gimbal_lock(self):
+        matrices = nif_math.euler_to_matrix(self.locked_eulers)
+        expected = [mathutils.Matrix(matrix).to_euler() for matrix in matrices]
+        eulers = nif_math.matrix_to_euler(matrices)
+        nose.tools.assert_true(np.allclose(eulers, expected, atol=TOLERANCE))
+        # the z rotation is folded into x, and the matrices survive the round trip
+        nose.tools.assert_true(np.all(eulers[:, 2] == 0))
+        nose.tools.assert_true(np.allclose(nif_math.euler_to_matrix(eulers), matrices, atol=TOLERANCE))
@@ -0,0 +1,121 @@
+"""Benchmark of the skin partitioner against the previous, rescanning implementation.
+
+Run it with blender's python, eg.
+blender --background --factory-startup --python testframework/utils/benchmark_skin_partition.py
+"""
+
+import time
+import unittest
+
+from io_scene_niftools.modules.nif_export.geometry.mesh.skin_partition import create_partitions
+
+
+def create_partitions_by_rescanning(triangles, trianglepartmap, weights, maxbonesperpartition):
+    """The partitioning of update_skin_partition before the region growing engine, kept as a reference"""
+    parts = []
+    # keep creating partitions as long as there are triangles left
+    while len(triangles) > 0:
+        # create a partition
+        part = [set(), [], None]  # bones, triangles, partition index
+        usedverts = set()
+        addtriangles = True
+        # keep adding triangles to it as long as the flag is set
+        while addtriangles:
+            newtriangles = []
+            newtrianglepartmap = []
+            for tri, partindex in zip(triangles, trianglepartmap):
+                tribones = set(bonenum for t in tri for bonenum, boneweight in weights[t])
+                if (not part[0]) or ((part[0] >= tribones) and (part[2] == partindex)):
+                    part[0] |= tribones
+                    part[1].append(tri)
+                    usedverts |= set(tri)
+                    if part[2] is None:
+                        part[2] = partindex
+                else:
+                    newtriangles.append(tri)
+                    newtrianglepartmap.append(partindex)
+            triangles = newtriangles
+            trianglepartmap = newtrianglepartmap
+
+            addtriangles = False
+            newtriangles = []
+            newtrianglepartmap = []
+            if len(part[0]) < maxbonesperpartition:
+                for tri, partindex in zip(triangles, trianglepartmap):
+                    if (usedverts & set(tri)) and (part[2] == partindex):
+                        tribones = set(bonenum for t in tri for bonenum, boneweight in weights[t])
+                        if len(part[0] | tribones) <= maxbonesperpartition:
+                            part[0] |= tribones
+                            part[1].append(tri)
+                            usedverts |= set(tri)
+                            addtriangles = True
+                        else:
+                            newtriangles.append(tri)
+                            newtrianglepartmap.append(partindex)
+                    else:
+                        newtriangles.append(tri)
+                        newtrianglepartmap.append(partindex)
+                triangles = newtriangles
+                trianglepartmap = newtrianglepartmap
+        parts.append(part)
+    return parts
+
+
+def create_skinned_grid(size, bones_per_side, maxbonespervertex=4, num_body_parts=2):
+    """Create a size x size vertex grid, weighted to a grid of bones, and split into body parts along x"""
+    bone_centers = [((i + 0.5) / bones_per_side, (j + 0.5) / bones_per_side)
+                    for i in range(bones_per_side) for j in range(bones_per_side)]
+    weights = []
+    for y in range(size):
+        for x in range(size):
+            u, v = x / (size - 1), y / (size - 1)
+            distances = sorted(((u - bu) ** 2 + (v - bv) ** 2, bonenum)
+                               for bonenum, (bu, bv) in enumerate(bone_centers))[:maxbonespervertex]
+            influences = [[bonenum, 1.0 / (distance + 0.001)] for distance, bonenum in distances]
+            total = sum(boneweight for bonenum, boneweight in influences)
+            weights.append([[bonenum, boneweight / total] for bonenum, boneweight in influences])
+    triangles = []
+    trianglepartmap = []
+    for y in range(size - 1):
+        for x in range(size - 1):
+            v = y * size + x
+            triangles.append((v, v + 1, v + size))
+            triangles.append((v + 1, v + size + 1, v + size))
+            trianglepartmap.extend([x * num_body_parts // (size - 1)] * 2)
+    return triangles, trianglepartmap, weights
+
+
+class TestSkinPartitionBenchmark(unittest.TestCase):
+
+    maxbonesperpartition = 18
+
+    def check_parts(self, parts, triangles, trianglepartmap, weights):
+        """Check that the partitions contain every triangle once and respect the constraints"""
+        partitioned = sorted(tri for part in parts for tri in part[1])
+        self.assertEqual(partitioned, sorted(triangles))
+        tri_partindex = dict(zip(triangles, trianglepartmap))
+        for bones, part_triangles, partindex in parts:
+            self.assertLessEqual(len(bones), self.maxbonesperpartition)
+            for tri in part_triangles:
+                self.assertEqual(tri_partindex[tri], partindex)
+                self.assertLessEqual({bonenum for t in tri for bonenum, boneweight in weights[t]}, bones)
+
+    def test_benchmark(self):
+        for size, bones_per_side in ((20, 4), (50, 6), (100, 8)):
+            triangles, trianglepartmap, weights = create_skinned_grid(size, bones_per_side)
+            start = time.perf_counter()
+            parts = create_partitions(triangles, trianglepartmap, weights, self.maxbonesperpartition)
+            duration = time.perf_counter() - start
+            start = time.perf_counter()
+            reference_parts = create_partitions_by_rescanning(triangles, trianglepartmap, weights,
+                                                              self.maxbonesperpartition)
+            reference_duration = time.perf_counter() - start
+            print(f"{len(triangles)} triangles, {bones_per_side ** 2} bones: "
+                  f"{len(parts)} partitions in {duration:.3f}s, "
+                  f"previously {len(reference_parts)} partitions in {reference_duration:.3f}s")
+            self.check_parts(parts, triangles, trianglepartmap, weights)
+            self.check_parts(reference_parts, triangles, trianglepartmap, weights)
+
+
+if __name__ == "__main__":
+    unittest.main(argv=[__file__], exit=False)